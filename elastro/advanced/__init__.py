@@ -1,7 +1,17 @@
 """Advanced features for the Elasticsearch module."""
 
+from elastro.advanced.aggregations import (
+    AggregationBuilder,
+    CompositeAggregationBuilder,
+)
+from elastro.advanced.composite import CompositePaginator
 from elastro.advanced.query_builder import QueryBuilder
-from elastro.advanced.aggregations import AggregationBuilder
 from elastro.advanced.scroll import ScrollHelper
 
-__all__ = ["QueryBuilder", "AggregationBuilder", "ScrollHelper"]
+__all__ = [
+    "QueryBuilder",
+    "AggregationBuilder",
+    "CompositeAggregationBuilder",
+    "CompositePaginator",
+    "ScrollHelper",
+]
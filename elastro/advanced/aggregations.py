@@ -1,7 +1,60 @@
 """Aggregation builder for Elasticsearch aggregations."""
 
+import re
 from typing import Any, Dict, List, Optional, Union
 
+# Units accepted by ``calendar_interval``; anything else is a fixed interval.
+CALENDAR_INTERVALS = {
+    "minute",
+    "1m",
+    "hour",
+    "1h",
+    "day",
+    "1d",
+    "week",
+    "1w",
+    "month",
+    "1M",
+    "quarter",
+    "1q",
+    "year",
+    "1y",
+}
+
+# Units that only exist as calendar intervals; fixed_interval rejects them.
+_CALENDAR_ONLY_UNITS = {"w", "M", "q", "y"}
+_INTERVAL_PATTERN = re.compile(r"^(\d+)([a-zA-Z]+)$")
+
+
+def date_interval(interval: str) -> Dict[str, str]:
+    """Map an interval to ``calendar_interval`` or ``fixed_interval``.
+
+    The legacy ``interval`` parameter is deprecated since Elasticsearch 7.2
+    and rejected by 8.x, so single calendar units (``day``, ``1M``, ...) are
+    sent as ``calendar_interval`` and multiples (``7d``, ``30m``) as
+    ``fixed_interval``.
+
+    Args:
+        interval: Interval expression (e.g. 'day', '1M', '12h')
+
+    Returns:
+        A dict with either a ``calendar_interval`` or ``fixed_interval`` key
+
+    Raises:
+        ValueError: If the interval is a multiple of a calendar-only unit
+            (e.g. '2M', '2w'), which neither parameter accepts
+    """
+    if interval in CALENDAR_INTERVALS:
+        return {"calendar_interval": interval}
+    match = _INTERVAL_PATTERN.match(interval)
+    if match and match.group(2) in _CALENDAR_ONLY_UNITS:
+        raise ValueError(
+            f"Invalid date interval '{interval}': weeks, months, quarters and "
+            f"years only support a single unit (1{match.group(2)}); use a fixed "
+            "interval in days instead"
+        )
+    return {"fixed_interval": interval}
+
 
 class AggregationBuilder:
     """Builder for Elasticsearch aggregation DSL.
@@ -35,21 +88,108 @@ class AggregationBuilder:
         self._aggregations[name] = {"terms": agg}
         return self
 
+    def partitioned_terms(
+        self,
+        name: str,
+        field: str,
+        partition: int,
+        num_partitions: int,
+        size: int = 10000,
+        min_doc_count: Optional[int] = None,
+    ) -> "AggregationBuilder":
+        """Add a terms aggregation restricted to one hash partition of the terms.
+
+        Args:
+            name: Name of the aggregation
+            field: Field to aggregate on
+            partition: Partition number to return (0-based)
+            num_partitions: Total number of partitions
+            size: Maximum number of buckets to return for this partition
+            min_doc_count: Minimum number of documents required to form a bucket
+
+        Returns:
+            Self for method chaining
+        """
+        if not 0 <= partition < num_partitions:
+            raise ValueError("partition must be between 0 and num_partitions - 1")
+
+        self.terms(name, field, size=size, min_doc_count=min_doc_count)
+        self._aggregations[name]["terms"]["include"] = {
+            "partition": partition,
+            "num_partitions": num_partitions,
+        }
+        return self
+
+    def composite(
+        self,
+        name: str,
+        sources: Union["CompositeAggregationBuilder", List[Dict[str, Any]]],
+        size: Optional[int] = None,
+        after: Optional[Dict[str, Any]] = None,
+    ) -> "AggregationBuilder":
+        """Add a composite aggregation.
+
+        Args:
+            name: Name of the aggregation
+            sources: A CompositeAggregationBuilder or a raw list of sources
+            size: Number of buckets per page (defaults to the builder's size,
+                or 1000 for raw sources)
+            after: ``after_key`` of the previous page
+
+        Returns:
+            Self for method chaining
+        """
+        if isinstance(sources, CompositeAggregationBuilder):
+            # Override on the generated dict so the caller's builder is untouched
+            aggregation = sources.to_aggregation()
+            if size is not None:
+                aggregation["composite"]["size"] = size
+            if after:
+                aggregation["composite"]["after"] = after
+            self._aggregations[name] = aggregation
+            return self
+
+        agg: Dict[str, Any] = {
+            "sources": sources,
+            "size": size if size is not None else 1000,
+        }
+        if after:
+            agg["after"] = after
+        self._aggregations[name] = {"composite": agg}
+        return self
+
     def date_histogram(
-        self, name: str, field: str, interval: str, format: Optional[str] = None
+        self,
+        name: str,
+        field: str,
+        interval: Optional[str] = None,
+        format: Optional[str] = None,
+        calendar_interval: Optional[str] = None,
+        fixed_interval: Optional[str] = None,
     ) -> "AggregationBuilder":
         """Add a date_histogram aggregation.
 
         Args:
             name: Name of the aggregation
             field: Date field to aggregate on
-            interval: Time interval (e.g. 'day', 'month', '1h')
+            interval: Time interval (e.g. 'day', 'month', '1h', '7d'); mapped to
+                ``calendar_interval`` or ``fixed_interval`` automatically
             format: Date format pattern
+            calendar_interval: Explicit calendar-aware interval
+            fixed_interval: Explicit fixed-length interval
 
         Returns:
             Self for method chaining
         """
-        agg = {"field": field, "interval": interval}
+        agg: Dict[str, Any] = {"field": field}
+        if calendar_interval:
+            agg["calendar_interval"] = calendar_interval
+        elif fixed_interval:
+            agg["fixed_interval"] = fixed_interval
+        elif interval:
+            agg.update(date_interval(interval))
+        else:
+            raise ValueError("date_histogram requires an interval")
         if format:
             agg["format"] = format
 
@@ -78,7 +218,8 @@ class AggregationBuilder:
         Args:
             name: Name of the aggregation
             field: Numeric field to aggregate on
-            ranges: List of range definitions (e.g. [{"to": 50}, {"from": 50, "to": 100}])
+            ranges: List of range definitions
+                (e.g. [{"to": 50}, {"from": 50, "to": 100}])
 
         Returns:
             Self for method chaining
@@ -176,3 +317,143 @@ class AggregationBuilder:
             The complete aggregations as a dictionary
         """
         return self._aggregations
+
+
+class CompositeAggregationBuilder:
+    """Builder for the body of a composite aggregation.
+
+    Composite aggregations page through every bucket combination of their
+    value sources in a stable order, using ``after_key`` as the cursor.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty composite aggregation."""
+        self._sources: List[Dict[str, Dict[str, Any]]] = []
+        self._size = 1000
+        self._after: Optional[Dict[str, Any]] = None
+        self._sub_aggregations: Dict[str, Dict[str, Any]] = {}
+
+    def _add_source(
+        self,
+        name: str,
+        source_type: str,
+        source: Dict[str, Any],
+        order: Optional[str],
+        missing_bucket: bool,
+    ) -> "CompositeAggregationBuilder":
+        if order:
+            source["order"] = order
+        if missing_bucket:
+            source["missing_bucket"] = True
+        self._sources.append({name: {source_type: source}})
+        return self
+
+    def terms(
+        self,
+        name: str,
+        field: str,
+        order: Optional[str] = None,
+        missing_bucket: bool = False,
+    ) -> "CompositeAggregationBuilder":
+        """Add a terms value source.
+
+        Args:
+            name: Name of the source in bucket keys
+            field: Field to take values from
+            order: 'asc' or 'desc'
+            missing_bucket: Include documents without a value as a null key
+
+        Returns:
+            Self for method chaining
+        """
+        return self._add_source(name, "terms", {"field": field}, order, missing_bucket)
+
+    def histogram(
+        self,
+        name: str,
+        field: str,
+        interval: float,
+        order: Optional[str] = None,
+        missing_bucket: bool = False,
+    ) -> "CompositeAggregationBuilder":
+        """Add a histogram value source.
+
+        Args:
+            name: Name of the source in bucket keys
+            field: Numeric field to bucket
+            interval: Numeric interval for the buckets
+            order: 'asc' or 'desc'
+            missing_bucket: Include documents without a value as a null key
+
+        Returns:
+            Self for method chaining
+        """
+        source = {"field": field, "interval": interval}
+        return self._add_source(name, "histogram", source, order, missing_bucket)
+
+    def date_histogram(
+        self,
+        name: str,
+        field: str,
+        interval: str,
+        format: Optional[str] = None,
+        order: Optional[str] = None,
+        missing_bucket: bool = False,
+    ) -> "CompositeAggregationBuilder":
+        """Add a date_histogram value source.
+
+        Args:
+            name: Name of the source in bucket keys
+            field: Date field to bucket
+            interval: Time interval (mapped to calendar or fixed interval)
+            format: Date format pattern for the keys
+            order: 'asc' or 'desc'
+            missing_bucket: Include documents without a value as a null key
+
+        Returns:
+            Self for method chaining
+        """
+        source: Dict[str, Any] = {"field": field, **date_interval(interval)}
+        if format:
+            source["format"] = format
+        return self._add_source(name, "date_histogram", source, order, missing_bucket)
+
+    def size(self, size: int) -> "CompositeAggregationBuilder":
+        """Set the number of buckets returned per page."""
+        self._size = size
+        return self
+
+    def after(
+        self, after_key: Optional[Dict[str, Any]]
+    ) -> "CompositeAggregationBuilder":
+        """Set the ``after_key`` to resume from."""
+        self._after = after_key
+        return self
+
+    def sub_aggregations(
+        self, builder: AggregationBuilder
+    ) -> "CompositeAggregationBuilder":
+        """Compute the given aggregations inside every composite bucket."""
+        self._sub_aggregations = builder.to_dict()
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the composite aggregation body to a dictionary.
+
+        Returns:
+            The ``composite`` aggregation body
+        """
+        if not self._sources:
+            raise ValueError("Composite aggregation requires at least one source")
+
+        body: Dict[str, Any] = {"sources": list(self._sources), "size": self._size}
+        if self._after:
+            body["after"] = self._after
+        return body
+
+    def to_aggregation(self) -> Dict[str, Any]:
+        """Return the full aggregation (composite body plus sub-aggregations)."""
+        agg: Dict[str, Any] = {"composite": self.to_dict()}
+        if self._sub_aggregations:
+            agg["aggs"] = self._sub_aggregations
+        return agg
@@ -0,0 +1,191 @@
+"""Paginators for composite and partitioned terms aggregations."""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, Generator, Iterator, List, Optional, Union
+
+from elasticsearch import Elasticsearch
+
+from elastro.advanced.aggregations import (
+    AggregationBuilder,
+    CompositeAggregationBuilder,
+)
+from elastro.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PARTITION_WORKERS = 4
+
+
+class CompositePaginator:
+    """Helper for walking every bucket of a high-cardinality aggregation.
+
+    Composite aggregations are paged with their ``after_key`` so that only one
+    page of buckets is held in memory at a time. Partitioned terms
+    aggregations split the terms into hash partitions that are fetched
+    concurrently.
+    """
+
+    def __init__(self, client: Elasticsearch) -> None:
+        """Initialize the paginator.
+
+        Args:
+            client: Elasticsearch client instance
+        """
+        self._client = client
+
+    def iter_pages(
+        self,
+        index: str,
+        composite: Union[CompositeAggregationBuilder, Dict[str, Any]],
+        query: Optional[Dict[str, Any]] = None,
+        name: str = "composite",
+        size: Optional[int] = None,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Run a composite aggregation and yield one response page at a time.
+
+        Args:
+            index: Index name(s) to search
+            composite: Composite builder or a full ``{"composite": ...}`` aggregation
+            query: Optional query restricting the aggregated documents
+            name: Name of the aggregation in the request
+            size: Buckets per page (overrides the builder's size)
+
+        Yields:
+            The aggregation result of each page (``buckets`` and ``after_key``)
+        """
+        if isinstance(composite, CompositeAggregationBuilder):
+            aggregation = composite.to_aggregation()
+        else:
+            aggregation = dict(composite)
+        source = dict(aggregation["composite"])
+        if size is not None:
+            source["size"] = size
+
+        after = source.pop("after", None)
+        while True:
+            page_source = dict(source)
+            if after:
+                page_source["after"] = after
+            body: Dict[str, Any] = {
+                "size": 0,
+                "aggs": {name: {**aggregation, "composite": page_source}},
+            }
+            if query:
+                body["query"] = query
+
+            resp = self._client.search(index=index, body=body)
+            result = resp.get("aggregations", {}).get(name, {})
+            buckets = result.get("buckets", [])
+            if not buckets:
+                return
+
+            yield result
+
+            # A short page is not the last one: buckets can be dropped after
+            # the page is filled (e.g. by a bucket_selector sub-aggregation)
+            after = result.get("after_key")
+            if not after:
+                return
+
+    def iter_buckets(
+        self,
+        index: str,
+        composite: Union[CompositeAggregationBuilder, Dict[str, Any]],
+        query: Optional[Dict[str, Any]] = None,
+        name: str = "composite",
+        size: Optional[int] = None,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Yield every bucket of a composite aggregation lazily.
+
+        Args:
+            index: Index name(s) to search
+            composite: Composite builder or a full ``{"composite": ...}`` aggregation
+            query: Optional query restricting the aggregated documents
+            name: Name of the aggregation in the request
+            size: Buckets per page (overrides the builder's size)
+
+        Yields:
+            Composite buckets, in the aggregation's sort order
+        """
+        pages = self.iter_pages(index, composite, query=query, name=name, size=size)
+        for page in pages:
+            yield from page["buckets"]
+
+    def partitioned_terms(
+        self,
+        index: str,
+        field: str,
+        num_partitions: int,
+        size: int = 10000,
+        query: Optional[Dict[str, Any]] = None,
+        sub_aggregations: Optional[AggregationBuilder] = None,
+        max_workers: int = DEFAULT_PARTITION_WORKERS,
+        name: str = "partitioned_terms",
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the buckets of a terms aggregation split into partitions.
+
+        Partitions are requested concurrently by a bounded thread pool and
+        their buckets are yielded in partition order as each one completes.
+
+        Args:
+            index: Index name(s) to search
+            field: Field to aggregate on
+            num_partitions: Number of hash partitions to split the terms into
+            size: Maximum number of buckets per partition
+            query: Optional query restricting the aggregated documents
+            sub_aggregations: Aggregations to compute inside every bucket
+            max_workers: Maximum number of concurrent partition requests
+            name: Name of the aggregation in the request
+
+        Returns:
+            Iterator over terms buckets of all partitions
+        """
+        if num_partitions < 1:
+            raise ValueError("num_partitions must be at least 1")
+
+        def fetch(partition: int) -> List[Dict[str, Any]]:
+            builder = AggregationBuilder().partitioned_terms(
+                name, field, partition, num_partitions, size=size
+            )
+            if sub_aggregations is not None:
+                builder.nested_agg(name, sub_aggregations)
+            body: Dict[str, Any] = {"size": 0, "aggs": builder.to_dict()}
+            if query:
+                body["query"] = query
+
+            resp = self._client.search(index=index, body=body)
+            result = resp.get("aggregations", {}).get(name, {})
+            if result.get("sum_other_doc_count"):
+                logger.warning(
+                    f"Partition {partition}/{num_partitions} of '{field}' has more "
+                    f"than {size} terms; increase num_partitions or size"
+                )
+            return result.get("buckets", [])
+
+        return self._iter_partitions(fetch, num_partitions, max_workers)
+
+    @staticmethod
+    def _iter_partitions(
+        fetch: Any, num_partitions: int, max_workers: int
+    ) -> Generator[Dict[str, Any], None, None]:
+        workers = max(1, min(max_workers, num_partitions))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        # Keep at most ``workers`` partitions in flight so that a slow consumer
+        # does not leave every partition's buckets buffered in memory.
+        partitions = iter(range(num_partitions))
+        pending: Deque["Future[Any]"] = deque(
+            executor.submit(fetch, partition)
+            for partition in islice(partitions, workers)
+        )
+        try:
+            while pending:
+                buckets = pending.popleft().result()
+                next_partition = next(partitions, None)
+                if next_partition is not None:
+                    pending.append(executor.submit(fetch, next_partition))
+                yield from buckets
+        finally:
+            # Stop scheduling remaining partitions if the consumer stops early
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -12,8 +12,8 @@ if len(sys.argv) >= 3 and sys.argv[1] == "doc" and sys.argv[2] == "search":
     # Only use the fast path if '--help' is not requested
     if "--help" not in sys.argv and "-h" not in sys.argv:
         try:
-            import xmlrpc.client
             import socket
+            import xmlrpc.client
 
             # Set a very short timeout so we fallback to heavy CLI if daemon is offline
             socket.setdefaulttimeout(0.05)
@@ -32,13 +32,9 @@ if len(sys.argv) >= 3 and sys.argv[1] == "doc" and sys.argv[2] == "search":
 # --- END FAST PATH INTERCEPTOR ---
 
 import os
-import json
-import yaml
+from typing import Optional
+
 import rich_click as click
-from typing import Dict, Any, Optional, List, Union
-from rich.console import Console
-from rich.table import Table
-from rich import box
 
 from elastro.cli.art import ELASTRO_ART
 
@@ -58,61 +54,65 @@ else:
     click.rich_click.HEADER_TEXT = ELASTRO_ART
 
 from elastro import __version__
-from elastro.config import load_config, get_config
-from elastro.core.client import ElasticsearchClient
 
 # Import command groups
-from elastro.cli.commands.index import (
-    create_index,
-    get_index,
-    index_exists,
-    update_index,
-    delete_index,
-    open_index,
-    close_index,
-    list_indices,
-    find_indices,
-    index_wizard,
-    fix_indices,
-)
-from elastro.cli.commands.document import (
-    index_document,
-    bulk_index,
-    get_document,
-    search_documents,
-    update_document,
-    delete_document,
-    bulk_delete,
+from elastro.cli.commands.cluster import cluster_group
+from elastro.cli.commands.config import (
+    get_config_value,
+    init_config,
+    list_config,
+    set_config_value,
 )
 from elastro.cli.commands.datastream import (
     create_datastream,
-    list_datastreams,
-    get_datastream,
     delete_datastream,
+    get_datastream,
+    list_datastreams,
     rollover_datastream,
 )
-from elastro.cli.commands.config import (
-    get_config_value,
-    set_config_value,
-    list_config,
-    init_config,
+from elastro.cli.commands.document import (
+    bulk_delete,
+    bulk_index,
+    delete_by_query,
+    delete_document,
+    get_document,
+    index_document,
+    search_documents,
+    update_by_query,
+    update_document,
 )
-from elastro.cli.commands.utils import health, templates as utils_templates, aliases
-from elastro.cli.commands.template import template_group
+from elastro.cli.commands.esql import esql_group
+from elastro.cli.commands.health import health_group
 from elastro.cli.commands.ilm import ilm_group
-from elastro.cli.commands.snapshot import snapshot_group
-from elastro.cli.commands.cluster import cluster_group
-from elastro.cli.commands.security import security_group
-from elastro.cli.commands.tasks import tasks_group
+from elastro.cli.commands.index import (
+    close_index,
+    create_index,
+    delete_index,
+    find_indices,
+    fix_indices,
+    get_index,
+    index_exists,
+    index_wizard,
+    list_indices,
+    open_index,
+    update_index,
+)
 from elastro.cli.commands.ingest import ingest_group
+from elastro.cli.commands.memory import memory_group
 from elastro.cli.commands.ml import ml_group
-from elastro.cli.commands.script import script_group
 from elastro.cli.commands.painless_commands import painless_group
+from elastro.cli.commands.script import script_group
+from elastro.cli.commands.security import security_group
+from elastro.cli.commands.snapshot import snapshot_group
+from elastro.cli.commands.stats import stats
+from elastro.cli.commands.tasks import tasks_group
 from elastro.cli.commands.telemetry import telemetry_group
-from elastro.cli.commands.memory import memory_group
+from elastro.cli.commands.template import template_group
 from elastro.cli.commands.tools import tools_group
-from elastro.cli.commands.esql import esql_group
-from elastro.cli.commands.health import health_group
+from elastro.cli.commands.utils import aliases, health
+from elastro.cli.commands.utils import templates as utils_templates
+from elastro.config import load_config
+from elastro.core.client import NODE_SELECTORS, TRANSPORT_OPTIONS, ElasticsearchClient
 
 # Register Top-Level Groups
 
@@ -136,6 +136,33 @@ from elastro.cli.commands.health import health_group
 @click.option(
     "--verbose", "-v", help="Enable verbose output", is_flag=True, default=False
 )
+@click.option(
+    "--compress/--no-compress",
+    default=None,
+    help="Gzip request bodies (elasticsearch.http_compress)",
+)
+@click.option(
+    "--sniff/--no-sniff",
+    default=None,
+    help="Discover cluster nodes on start and after node failures",
+)
+@click.option(
+    "--sniff-interval",
+    type=click.FloatRange(min=0),
+    help=(
+        "Minimum seconds between node sniffs (elasticsearch.min_delay_between_sniffing)"
+    ),
+)
+@click.option(
+    "--connections-per-node",
+    type=click.IntRange(min=1),
+    help="HTTP connections pooled per node (elasticsearch.connections_per_node)",
+)
+@click.option(
+    "--node-selector",
+    type=click.Choice(list(NODE_SELECTORS)),
+    help="How requests are spread across nodes (elasticsearch.node_selector)",
+)
 @click.version_option(version=__version__)
 @click.pass_context
 def cli(
@@ -145,6 +172,11 @@ def cli(
     host: tuple,
     output: str,
     verbose: bool,
+    compress: Optional[bool],
+    sniff: Optional[bool],
+    sniff_interval: Optional[float],
+    connections_per_node: Optional[int],
+    node_selector: Optional[str],
 ) -> None:
     """
     Elasticsearch management CLI.
@@ -152,6 +184,34 @@ def cli(
     This CLI provides commands for managing Elasticsearch indices, documents, and
     datastreams.
     """
+    # Embedding callers (the GUI server's in-process executor) pass a pooled,
+    # already configured client as ctx.obj. Keep it, and leave the
+    # process-wide configuration alone: load_config would replace the
+    # server's own, and connection options cannot apply to that client.
+    # Output format is read from the root context by format_output.
+    if isinstance(ctx.obj, ElasticsearchClient):
+        connection_options = {
+            "--config": config,
+            "--profile": profile if profile != "default" else None,
+            "--host": host,
+            "--compress/--no-compress": compress,
+            "--sniff/--no-sniff": sniff,
+            "--sniff-interval": sniff_interval,
+            "--connections-per-node": connections_per_node,
+            "--node-selector": node_selector,
+        }
+        rejected = [
+            name
+            for name, value in connection_options.items()
+            if value not in (None, ())
+        ]
+        if rejected:
+            raise click.UsageError(
+                f"{', '.join(rejected)} cannot be used here; commands run on "
+                "the selected cluster's connection"
+            )
+        return
+
     # Load configuration
     cfg = load_config(config, profile)
 
@@ -165,6 +225,19 @@ def cli(
     if verbose:
         cfg["cli"]["verbose"] = verbose
 
+    es_cfg = cfg["elasticsearch"]
+    if compress is not None:
+        es_cfg["http_compress"] = compress
+    if sniff is not None:
+        es_cfg["sniff_on_start"] = sniff
+        es_cfg["sniff_on_node_failure"] = sniff
+    if sniff_interval is not None:
+        es_cfg["min_delay_between_sniffing"] = sniff_interval
+    if connections_per_node is not None:
+        es_cfg["connections_per_node"] = connections_per_node
+    if node_selector is not None:
+        es_cfg["node_selector"] = node_selector
+
     # Initialize client
     client = ElasticsearchClient(
         hosts=cfg["elasticsearch"]["hosts"],
@@ -172,16 +245,19 @@ def cli(
         timeout=cfg["elasticsearch"]["timeout"],
         retry_on_timeout=cfg["elasticsearch"]["retry_on_timeout"],
         max_retries=cfg["elasticsearch"]["max_retries"],
+        transport={key: es_cfg.get(key) for key in TRANSPORT_OPTIONS},
     )
 
-    # Establish connection
+    # Establish connection. Lazy: the first request verifies it, which saves
+    # a ping round-trip on every short-lived command.
     try:
-        client.connect()
+        client.connect(lazy=True)
     except Exception as e:
         if verbose:
             click.echo(f"Failed to connect to Elasticsearch: {e}", err=True)
-        # We don't exit here because some commands might not need connection (e.g. config),
-        # but most do. For now, let's let individual commands fail if they need connection,
+        # We don't exit here because some commands might not need connection
+        # (e.g. config), but most do. For now, let's let individual commands
+        # fail if they need connection,
         # or better, just Log it. client.connect() raises ConnectionError.
         # Actually, if we fail to connect, most commands will fail.
         # Let's print a warning but continue, as 'config' commands shouldn't fail.
@@ -229,6 +305,8 @@ doc.add_command(search_documents)
 doc.add_command(update_document)
 doc.add_command(delete_document)
 doc.add_command(bulk_delete)
+doc.add_command(delete_by_query)
+doc.add_command(update_by_query)
 
 
 @cli.group()
@@ -275,9 +353,9 @@ utils.add_command(health)
 utils.add_command(utils_templates)
 utils.add_command(aliases)
 
+from elastro.cli.commands.daemon import daemon_group
 from elastro.cli.commands.gui import gui
 from elastro.cli.commands.rag import rag_group
-from elastro.cli.commands.daemon import daemon_group
 
 # Register Top-Level Groups
 cli.add_command(template_group)
@@ -298,6 +376,7 @@ cli.add_command(rag_group)
 cli.add_command(daemon_group)
 cli.add_command(esql_group)
 cli.add_command(health_group)
+cli.add_command(stats)
 
 
 def main() -> None:
@@ -4,45 +4,47 @@ Command handlers for the CLI.
 This module contains the implementations of the CLI commands.
 """
 
-from elastro.cli.commands.index import (
-    create_index,
-    get_index,
-    index_exists,
-    update_index,
-    delete_index,
-    open_index,
-    close_index,
-    list_indices,
-    find_indices,
-    index_wizard,
+from elastro.cli.commands.config import (
+    get_config_value,
+    init_config,
+    list_config,
+    set_config_value,
+)
+from elastro.cli.commands.datastream import (
+    create_datastream,
+    delete_datastream,
+    get_datastream,
+    list_datastreams,
+    rollover_datastream,
 )
 from elastro.cli.commands.document import (
-    index_document,
+    bulk_delete,
     bulk_index,
+    delete_by_query,
+    delete_document,
     get_document,
+    index_document,
     search_documents,
+    update_by_query,
     update_document,
-    delete_document,
-    bulk_delete,
-)
-from elastro.cli.commands.datastream import (
-    create_datastream,
-    list_datastreams,
-    get_datastream,
-    delete_datastream,
-    rollover_datastream,
 )
-from elastro.cli.commands.config import (
-    get_config_value,
-    set_config_value,
-    list_config,
-    init_config,
+from elastro.cli.commands.index import (
+    close_index,
+    create_index,
+    delete_index,
+    find_indices,
+    get_index,
+    index_exists,
+    index_wizard,
+    list_indices,
+    open_index,
+    update_index,
 )
-from elastro.cli.commands.utils import health, templates, aliases
+from elastro.cli.commands.memory import memory_group
 from elastro.cli.commands.painless_commands import painless_group
 from elastro.cli.commands.telemetry import telemetry_group
-from elastro.cli.commands.memory import memory_group
 from elastro.cli.commands.tools import tools_group
+from elastro.cli.commands.utils import aliases, health, templates
 
 __all__ = [
     # Index commands
@@ -64,6 +66,8 @@ __all__ = [
     "update_document",
     "delete_document",
     "bulk_delete",
+    "delete_by_query",
+    "update_by_query",
     # Datastream commands
     "create_datastream",
     "list_datastreams",
@@ -2,13 +2,15 @@
 Configuration management commands for the CLI.
 """
 
-import rich_click as click
+import copy
 import json
 import os
+from typing import Any, Dict
+
+import rich_click as click
 import yaml
-import copy
-from typing import Dict, Any, Union
-from elastro.config import get_config, save_config, default_config
+
+from elastro.config import default_config, get_config, save_config
 
 CONFIG_PATH = os.path.expanduser("~/.elastic/config.yaml")
 
@@ -161,7 +163,8 @@ def init_config(force: bool, profile: str) -> None:
 
     if config_exists and not force:
         click.echo(
-            "Configuration file already exists. Use --force to overwrite or launch the wizard."
+            "Configuration file already exists. "
+            "Use --force to overwrite or launch the wizard."
         )
         if not click.confirm("Do you want to overwrite it and run the wizard?"):
             return
@@ -177,7 +180,7 @@ def init_config(force: bool, profile: str) -> None:
     if profile != "default":
         # Check if we are merging into existing config
         if config_exists:
-            existing = get_config(profile=profile)  # Takes care of loading base config
+            get_config(profile=profile)  # Takes care of loading base config
             # Load raw current config to be safe
             if os.path.exists(CONFIG_PATH):
                 with open(CONFIG_PATH, "r") as f:
@@ -207,14 +210,16 @@ def run_config_wizard() -> Dict[str, Any]:
     """Run interactive wizard to build configuration."""
     from rich.console import Console
     from rich.panel import Panel
-    from rich.prompt import Prompt, Confirm
+    from rich.prompt import Confirm, Prompt
+
     from elastro.core.client import ElasticsearchClient
-    from elastro.core.errors import ConnectionError, AuthenticationError
+    from elastro.core.errors import AuthenticationError, ConnectionError
 
     console = Console()
     console.print(
         Panel(
-            "🧙 [bold blue]Elastro Configuration Wizard[/]\nLet's get you connected to Elasticsearch.",
+            "🧙 [bold blue]Elastro Configuration Wizard[/]\n"
+            "Let's get you connected to Elasticsearch.",
             border_style="blue",
         )
     )
@@ -222,7 +227,9 @@ def run_config_wizard() -> Dict[str, Any]:
     # 1. Hosts
     console.print("\n[bold]1. Cluster Connection:[/bold]")
     console.print(
-        "Provide the HTTP(S) address of your Elasticsearch cluster. Multiple coordinates can be provided (comma-separated) for round-robin load balancing."
+        "Provide the HTTP(S) address of your Elasticsearch cluster. "
+        "Multiple coordinates can be provided (comma-separated) "
+        "for round-robin load balancing."
     )
     default_host = "http://localhost:9200"
     hosts_input = Prompt.ask("🔌 [bold]Elasticsearch Host[/]", default=default_host)
@@ -231,7 +238,8 @@ def run_config_wizard() -> Dict[str, Any]:
     # 2. Authentication
     console.print("\n🔑 [bold]2. Authentication[/]")
     console.print(
-        "Select how Elastro should authenticate with the cluster. API Keys are recommended for production environments."
+        "Select how Elastro should authenticate with the cluster. "
+        "API Keys are recommended for production environments."
     )
     auth_type = Prompt.ask(
         "   Method", choices=["basic", "api_key", "none"], default="none"
@@ -253,7 +261,8 @@ def run_config_wizard() -> Dict[str, Any]:
         client = ElasticsearchClient(
             hosts=hosts, auth=auth, verify_certs=False, use_config=False
         )
-        client.connect()
+        # info() is the first request, so it also verifies the connection
+        client.connect(lazy=True)
         info = client.get_client().info()
         version = info.get("version", {}).get("number", "Unknown")
         cluster_name = info.get("cluster_name", "Unknown")
@@ -6,6 +6,7 @@ Daemon management commands.
 
 import sys
 import urllib.request
+from typing import Optional
 
 import rich_click as click
 
@@ -23,7 +24,12 @@ def daemon_group() -> None:
 @click.option(
     "--host", type=str, default="127.0.0.1", help="Host to bind the daemon to"
 )
-def start(port: int, host: str) -> None:
+@click.option(
+    "--cache/--no-cache",
+    default=None,
+    help="Cache repeated search results (overrides elasticsearch.search_cache.enabled)",
+)
+def start(port: int, host: str, cache: Optional[bool]) -> None:
     """
     Start the Fast-Path CLI Daemon.
 
@@ -34,7 +40,7 @@ def start(port: int, host: str) -> None:
         from elastro.core.daemon import start_daemon
 
         click.echo(f"Starting Elastro Daemon on {host}:{port}...")
-        start_daemon(host=host, port=port)
+        start_daemon(host=host, port=port, search_cache=cache)
     except ImportError as e:
         click.echo(f"Failed to load daemon dependencies: {e}", err=True)
         sys.exit(1)
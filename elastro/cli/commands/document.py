@@ -2,16 +2,33 @@
 Document management commands for the CLI.
 """
 
-import rich_click as click
+import asyncio
 import json
 import sys
-from typing import Optional, Tuple, Any
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, TypeVar
+
+import rich_click as click
+
+from elastro.cli.completion import complete_indices
+from elastro.cli.output import format_output
 from elastro.core.client import ElasticsearchClient
 from elastro.core.document import DocumentManager
-from elastro.core.errors import OperationError
+from elastro.core.errors import OperationError, ValidationError
 from elastro.core.query_builder import QueryBuilder
-from elastro.cli.output import format_output
-from elastro.cli.completion import complete_indices
+
+T = TypeVar("T")
+
+
+def _run_async(client: ElasticsearchClient, operation: Awaitable[T]) -> T:
+    """Run an async manager call, then release the shared async client pool."""
+
+    async def _runner() -> T:
+        try:
+            return await operation
+        finally:
+            await client.aclose()
+
+    return asyncio.run(_runner())
 
 
 @click.command("index", no_args_is_help=True)
@@ -27,7 +44,8 @@ def index_document(
     """
     Index a document.
 
-    Indexes a single JSON document. You can provide the document body via a file or standard input.
+    Indexes a single JSON document. You can provide the document body via a file
+    or standard input.
 
     Examples:
 
@@ -97,7 +115,7 @@ def bulk_index(client: ElasticsearchClient, index: str, file: Any) -> None:
         exit(1)
 
     try:
-        result = document_manager.bulk_index(index, documents)
+        result = _run_async(client, document_manager.bulk_index(index, documents))
         output = format_output(result)
         click.echo(output)
         click.echo(f"Bulk indexing completed: {len(documents)} documents processed.")
@@ -106,15 +124,51 @@ def bulk_index(client: ElasticsearchClient, index: str, file: Any) -> None:
         exit(1)
 
 
+def _read_ids(file: Any) -> List[str]:
+    """Read document IDs from a JSON array or newline-delimited file."""
+    content = file.read()
+    if content.lstrip().startswith("["):
+        try:
+            ids = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise click.BadParameter(
+                f"IDs file is not valid JSON: {e}", param_hint="'--ids-file'"
+            )
+        if not isinstance(ids, list):
+            raise click.BadParameter("IDs file must contain a JSON array")
+        return [str(doc_id) for doc_id in ids]
+    return [line.strip() for line in content.splitlines() if line.strip()]
+
+
 @click.command("get", no_args_is_help=True)
 @click.argument("index", type=str, shell_complete=complete_indices)
-@click.argument("id", type=str)
+@click.argument("id", type=str, required=False)
+@click.option(
+    "--ids-file",
+    type=click.File("r"),
+    help="File of IDs to fetch in batches (JSON array or one per line, '-' for stdin)",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=1000,
+    show_default=True,
+    help="IDs per _mget request when using --ids-file",
+)
 @click.pass_obj
-def get_document(client: ElasticsearchClient, index: str, id: str) -> None:
+def get_document(
+    client: ElasticsearchClient,
+    index: str,
+    id: Optional[str],
+    ids_file: Any,
+    chunk_size: int,
+) -> None:
     """
     Get a document by ID.
 
-    Retrieves a single document source and metadata.
+    Retrieves a single document source and metadata. With --ids-file, fetches
+    many documents using batched, parallel multi-get requests; results keep
+    the order of the input IDs and missing or failed IDs are reported per item.
 
     Examples:
 
@@ -122,11 +176,28 @@ def get_document(client: ElasticsearchClient, index: str, id: str) -> None:
     ```bash
     elastro doc get my-logs 123
     ```
+
+    Get many documents from a file of IDs:
+    ```bash
+    elastro doc get my-logs --ids-file ./ids.txt
+    ```
     """
+    if not id and not ids_file:
+        click.echo("Error: Provide a document ID or --ids-file", err=True)
+        exit(1)
+
     document_manager = DocumentManager(client)
 
     try:
-        result = document_manager.get(index, id)
+        if ids_file:
+            ids = _read_ids(ids_file)
+            if not ids:
+                click.echo("Error: IDs file contains no document IDs", err=True)
+                exit(1)
+            result: Any = document_manager.get_many(index, ids, chunk_size=chunk_size)
+        else:
+            assert id is not None  # checked above: an ID or --ids-file is required
+            result = document_manager.get(index, id)
         output = format_output(result)
         click.echo(output)
     except OperationError as e:
@@ -383,10 +454,175 @@ def bulk_delete(
     document_manager = DocumentManager(client)
 
     try:
-        result = document_manager.bulk_delete(index, ids)
+        result = _run_async(client, document_manager.bulk_delete(index, ids))
         output = format_output(result)
         click.echo(output)
         click.echo(f"Bulk deletion completed: {len(ids)} documents processed.")
     except OperationError as e:
         click.echo(f"Error in bulk deletion: {str(e)}", err=True)
         exit(1)
+
+
+def _by_query_options(func: Any) -> Any:
+    """Shared options for the delete-by-query / update-by-query commands."""
+    options = [
+        click.option(
+            "--slices",
+            default="auto",
+            show_default=True,
+            help="Parallel slices ('auto' = one per shard)",
+        ),
+        click.option(
+            "--requests-per-second",
+            type=float,
+            default=None,
+            help="Throttle in sub-requests per second (default: unthrottled)",
+        ),
+        click.option(
+            "--no-wait",
+            is_flag=True,
+            help="Submit the task and return its ID without waiting",
+        ),
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+def _load_body(file: Any) -> Any:
+    try:
+        return json.load(file)
+    except json.JSONDecodeError as e:
+        raise click.BadParameter(
+            f"Body file is not valid JSON: {e}", param_hint="'--file'"
+        )
+
+
+def _run_by_query(
+    client: ElasticsearchClient,
+    action: str,
+    index: str,
+    body: Dict[str, Any],
+    slices: str,
+    requests_per_second: Optional[float],
+    no_wait: bool,
+) -> None:
+    from elastro.cli.commands.tasks import follow_task
+    from elastro.core.task_runner import TaskRunner
+
+    # Never default to match_all: a body without a query would touch every
+    # document in the index
+    if not isinstance(body, dict) or not body.get("query"):
+        raise click.UsageError(
+            "The body file must contain a 'query' key; use "
+            '{"query": {"match_all": {}}} to match every document'
+        )
+    runner = TaskRunner(client)
+    query = body["query"]
+    submit_kwargs: Dict[str, Any] = {
+        "slices": int(slices) if slices.isdigit() else slices,
+        "requests_per_second": requests_per_second,
+    }
+    if "script" in body:
+        submit_kwargs["script"] = body["script"]
+
+    try:
+        task_id = runner.submit(action, index, query, **submit_kwargs)
+        if no_wait:
+            click.echo(format_output({"task": task_id}))
+            click.echo(
+                f"Track with 'elastro tasks watch {task_id}'; "
+                f"change speed with 'elastro tasks rethrottle {task_id} -r N'.",
+                err=True,
+            )
+            return
+        result = follow_task(runner, task_id, action)
+        click.echo(format_output(result.to_dict()))
+    except (OperationError, ValidationError) as e:
+        click.echo(f"Error running {action}: {str(e)}", err=True)
+        exit(1)
+
+
+@click.command("delete-by-query", no_args_is_help=True)
+@click.argument("index", type=str, shell_complete=complete_indices)
+@click.option(
+    "--file",
+    type=click.File("r"),
+    required=True,
+    help="Path to query body file with a 'query' key (use '-' for stdin)",
+)
+@_by_query_options
+@click.pass_obj
+def delete_by_query(
+    client: ElasticsearchClient,
+    index: str,
+    file: Any,
+    slices: str,
+    requests_per_second: Optional[float],
+    no_wait: bool,
+) -> None:
+    """
+    Delete all documents matching a query, server-side.
+
+    Runs as a sliced background task with live progress. Use --no-wait to
+    return immediately with the task ID.
+
+    Examples:
+
+    Delete old events, throttled:
+    ```bash
+    elastro doc delete-by-query my-logs --file ./old_events.json \
+        --requests-per-second 500
+    ```
+    """
+    _run_by_query(
+        client,
+        "delete_by_query",
+        index,
+        _load_body(file),
+        slices,
+        requests_per_second,
+        no_wait,
+    )
+
+
+@click.command("update-by-query", no_args_is_help=True)
+@click.argument("index", type=str, shell_complete=complete_indices)
+@click.option(
+    "--file",
+    type=click.File("r"),
+    required=True,
+    help="Path to body file with 'query' and optional 'script' (use '-' for stdin)",
+)
+@_by_query_options
+@click.pass_obj
+def update_by_query(
+    client: ElasticsearchClient,
+    index: str,
+    file: Any,
+    slices: str,
+    requests_per_second: Optional[float],
+    no_wait: bool,
+) -> None:
+    """
+    Update all documents matching a query, server-side.
+
+    Runs as a sliced background task with live progress. Use --no-wait to
+    return immediately with the task ID.
+
+    Examples:
+
+    Apply a script to matching documents:
+    ```bash
+    elastro doc update-by-query my-logs --file ./mark_archived.json
+    ```
+    """
+    _run_by_query(
+        client,
+        "update_by_query",
+        index,
+        _load_body(file),
+        slices,
+        requests_per_second,
+        no_wait,
+    )
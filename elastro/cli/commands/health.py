@@ -4,6 +4,7 @@ from typing import Callable, Optional, Tuple
 
 import rich_click as click
 
+from elastro.cli.output import format_output
 from elastro.core.client import ElasticsearchClient
 from elastro.core.errors import OperationError
 from elastro.core.logger import get_logger
@@ -19,10 +20,9 @@ from elastro.health.exit_policy import (
 from elastro.health.formatters.render import render_assessment
 from elastro.health.manager import HealthManager
 from elastro.health.models import AssessmentReport, FindingStatus
-from elastro.cli.output import format_output
+from elastro.health.remediation.catalog import CATALOG_ACTION_IDS
 from elastro.health.remediation.display import render_fix_run_result
 from elastro.health.remediation.dry_run import remediation_result_payload
-from elastro.health.remediation.catalog import CATALOG_ACTION_IDS
 from elastro.health.remediation.fix import run_health_fix
 from elastro.health.remediation.models import FixRunResult
 
@@ -883,6 +883,13 @@ def health_nodes(
     default=False,
     help="Explain shard allocation (optionally for --index)",
 )
+@click.option(
+    "--rows",
+    "include_rows",
+    is_flag=True,
+    default=False,
+    help="Include every shard row in the output (large on big clusters)",
+)
 @click.option(
     "--overshard-mb",
     type=float,
@@ -904,6 +911,7 @@ def health_shards(
     index: Optional[str],
     analyze: bool,
     explain: bool,
+    include_rows: bool,
     overshard_mb: float,
     undershard_gb: float,
     fail_on: str,
@@ -944,6 +952,7 @@ def health_shards(
             "index": index,
             "overshard_threshold_mb": overshard_mb,
             "undershard_threshold_gb": undershard_gb,
+            "include_shard_rows": include_rows,
         },
     )
 
@@ -979,9 +988,14 @@ def health_shards(
             "unassigned_shards": analysis.get("unassigned_count", 0),
             "index": index,
         }
+        rows = result.data.get("shards", [])
         if output_fmt == "table":
             click.echo(format_shard_analyze_summary(analysis))
+            if include_rows:
+                click.echo(format_output(rows, output_format="table"))
         else:
+            if include_rows:
+                summary["shards"] = rows
             click.echo(format_output(summary, output_format=output_fmt))
 
     exit_code = resolve_exit_code(
@@ -2,8 +2,10 @@
 Memory command group for Elastro CLI.
 """
 
-import rich_click as click
 from datetime import datetime, timezone
+from typing import Optional
+
+import rich_click as click
 
 from elastro.core.client import ElasticsearchClient
 
@@ -77,7 +79,7 @@ def search_memory(
     """
     index_name = "agent_semantic_memory"
 
-    from typing import Dict, Any, List
+    from typing import Any, Dict, List
 
     bool_clause: Dict[str, List[Any]] = {
         "must": [
@@ -108,7 +110,8 @@ def search_memory(
                 continue
             source = hit.get("_source", {})
             click.echo(
-                f"\n[{source.get('note_type', 'unknown').upper()}] {source.get('subject', 'Untitled')} ({hit.get('_id', '')})"
+                f"\n[{source.get('note_type', 'unknown').upper()}] "
+                f"{source.get('subject', 'Untitled')} ({hit.get('_id', '')})"
             )
             click.echo(f"  {source.get('content', '')}")
             if source.get("tags"):
@@ -123,37 +126,48 @@ def search_memory(
 
 @memory_group.command("prune")
 @click.option("--days", default=7, help="Number of days to retain tactical notes")
+@click.option(
+    "--requests-per-second",
+    type=float,
+    default=None,
+    help="Throttle the server-side delete (default: unthrottled)",
+)
 @click.pass_obj
 def prune_memory(
     client: ElasticsearchClient,
     days: int,
+    requests_per_second: Optional[float],
 ) -> None:
     """
     Prune 'tactical' memory notes older than the specified threshold.
     """
     index_name = "agent_semantic_memory"
 
-    from datetime import datetime, timezone, timedelta
+    from datetime import datetime, timedelta, timezone
+
+    from elastro.core.document import DocumentManager
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
     cutoff_str = cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
 
     delete_query = {
-        "query": {
-            "bool": {
-                "must": [
-                    {"term": {"note_type": "tactical"}},
-                    {"range": {"timestamp": {"lt": cutoff_str}}},
-                ]
-            }
+        "bool": {
+            "must": [
+                {"term": {"note_type": "tactical"}},
+                {"range": {"timestamp": {"lt": cutoff_str}}},
+            ]
         }
     }
 
     try:
-        response = client.client.delete_by_query(index=index_name, body=delete_query)
-        deleted = response.get("deleted", 0)
+        progress = DocumentManager(client).delete_by_query(
+            index_name,
+            delete_query,
+            requests_per_second=requests_per_second,
+        )
         click.secho(
-            f">> Pruned {deleted} tactical memory notes older than {days} days.",
+            f">> Pruned {progress.deleted} tactical memory notes "
+            f"older than {days} days.",
             fg="green",
         )
     except Exception as e:
@@ -190,7 +204,7 @@ def wake_memory(
     """
     index_name = index
 
-    from typing import Dict, Any, List
+    from typing import Any, Dict, List
 
     # Core textual RAG retrieval
     fields = ["subject^3", "content", "tags"]
@@ -270,7 +284,8 @@ def wake_memory(
             score = hit.get("_score", 0.0)
             title = source.get("subject") or source.get("file_path") or "Untitled"
             click.echo(f"\n[STIMULATED] {title} (Score: {score:.2f})")
-            # Only print first ~200 chars of content if in codebase rag to simulate 50 token limit
+            # Only print first ~200 chars of content if in codebase rag to
+            # simulate 50 token limit
             content = str(source.get("content", ""))
             displayed_content = (
                 content[:200] + "..."
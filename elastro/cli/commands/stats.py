@@ -0,0 +1,150 @@
+"""
+Transport statistics commands.
+"""
+
+import json
+import xmlrpc.client
+from typing import Any, Dict, Optional, cast
+
+import rich_click as click
+from rich.console import Console
+from rich.table import Table
+
+from elastro.core.client import ElasticsearchClient
+from elastro.core.metrics import get_metrics
+from elastro.core.resilience import get_resilience
+
+
+def _format_bytes(value: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024  # type: ignore[assignment]
+    return str(value)
+
+
+def _render(console: Console, snapshot: Dict[str, Any], source: str) -> None:
+    table = Table(
+        title=f"Transport stats ({source})",
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Endpoint")
+    table.add_column("Calls", justify="right")
+    table.add_column("Errors", justify="right")
+    table.add_column("Retries", justify="right")
+    table.add_column("Sent", justify="right")
+    table.add_column("Received", justify="right")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p99 ms", justify="right")
+    table.add_column("Max ms", justify="right")
+    table.add_column("Node p50 ms", justify="right")
+    table.add_column("Client ms", justify="right")
+
+    for endpoint in snapshot.get("endpoints", []):
+        latency = endpoint["latency_ms"]
+        table.add_row(
+            endpoint["endpoint"],
+            str(endpoint["count"]),
+            str(endpoint["errors"]),
+            str(endpoint["retries"]),
+            _format_bytes(endpoint["bytes_out"]),
+            _format_bytes(endpoint["bytes_in"]),
+            f"{latency['p50']:.2f}",
+            f"{latency['p99']:.2f}",
+            f"{latency['max']:.2f}",
+            f"{endpoint['node_latency_ms']['p50']:.2f}",
+            f"{endpoint['client_overhead_ms']:.2f}",
+        )
+
+    console.print(table)
+    console.print(
+        f"{snapshot.get('requests', 0)} requests, {snapshot.get('errors', 0)} errors, "
+        f"{snapshot.get('retries', 0)} retries. 'Node' is time waiting on the "
+        "cluster (network + server); 'Client' is the mean time spent in elastro."
+    )
+
+    resilience = snapshot.get("resilience") or {}
+    budget = resilience.get("retry_budget")
+    if budget:
+        console.print(
+            f"Retry budget: {budget['tokens']:.0f}/{budget['capacity']:.0f} tokens, "
+            f"{budget['granted']} retries granted, {budget['denied']} denied"
+        )
+    for host, breaker in (resilience.get("circuit_breakers") or {}).items():
+        style = "green" if breaker["state"] == "closed" else "bold red"
+        console.print(
+            f"Circuit {host}: [{style}]{breaker['state']}[/{style}] "
+            f"(opened {breaker['times_opened']} times)"
+        )
+
+
+@click.command("stats")
+@click.option(
+    "--port", type=int, default=9201, help="Port of the daemon to read stats from"
+)
+@click.option(
+    "--probe",
+    type=int,
+    default=0,
+    help="Run N requests from this process and report their stats instead",
+)
+@click.option("--index", "-i", help="Index to search when probing (default: info)")
+@click.option("--reset", is_flag=True, help="Clear the stats after reading them")
+@click.option("--output", "-o", type=click.Choice(["table", "json"]), default="table")
+@click.pass_obj
+def stats(
+    client: ElasticsearchClient,
+    port: int,
+    probe: int,
+    index: Optional[str],
+    reset: bool,
+    output: str,
+) -> None:
+    """
+    Show per-API request counts, bytes and latency percentiles.
+
+    By default the stats come from the running daemon ('elastro daemon
+    start'), which accumulates them across every request it serves. Use
+    --probe to time N requests from this process instead.
+    """
+    console = Console()
+
+    if probe > 0:
+        metrics = get_metrics()
+        metrics.reset()
+        # Rebuild the connection with the instrumented client classes
+        client.disconnect()
+        client.metrics = True
+        client.connect(lazy=True)
+        es = client.client
+        try:
+            for _ in range(probe):
+                if index:
+                    es.search(index=index, size=0)
+                else:
+                    es.info()
+        except Exception as e:
+            console.print(f"[bold red]Probe failed:[/bold red] {str(e)}")
+        snapshot = metrics.snapshot()
+        snapshot["resilience"] = get_resilience().snapshot()
+        source = f"probe of {probe} requests"
+    else:
+        try:
+            proxy = xmlrpc.client.ServerProxy(
+                f"http://127.0.0.1:{port}", allow_none=True
+            )
+            snapshot = json.loads(cast(str, proxy.transport_stats(reset)))
+        except Exception as e:
+            console.print(
+                "[bold red]Could not read stats from the daemon on port "
+                f"{port}:[/bold red] {str(e)}"
+            )
+            console.print("Start it with 'elastro daemon start' or use --probe N.")
+            raise SystemExit(1)
+        source = f"daemon :{port}"
+
+    if output == "json":
+        click.echo(json.dumps(snapshot, indent=2))
+    else:
+        _render(console, snapshot, source)
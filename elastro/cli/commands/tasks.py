@@ -2,11 +2,15 @@
 Tasks management commands.
 """
 
+from typing import Optional
+
 import rich_click as click
 from rich.console import Console
+from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from elastro.core.client import ElasticsearchClient
+from elastro.core.task_runner import TaskProgress, TaskRunner
 
 
 @click.group(name="tasks")
@@ -91,7 +95,87 @@ def cancel_task(client: ElasticsearchClient, task_id: str) -> None:
             console.print(res["node_failures"])
         else:
             console.print(
-                f"[bold green]Successfully requested cancellation for: {task_id}[/bold green]"
+                "[bold green]Successfully requested cancellation for: "
+                f"{task_id}[/bold green]"
             )
     except Exception as e:
         console.print(f"[bold red]Cancellation Error:[/bold red] {str(e)}")
+
+
+def follow_task(
+    runner: TaskRunner,
+    task_id: str,
+    action: str = "",
+    poll_interval: float = 2.0,
+    console: Optional[Console] = None,
+) -> TaskProgress:
+    """Wait for a by-query task while rendering a live progress bar."""
+    console = console or Console(stderr=True)
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[bold blue]{task.completed}/{task.total} docs"),
+        console=console,
+    ) as progress:
+        bar = progress.add_task(f"Task {task_id}", total=None)
+
+        def _update(snapshot: TaskProgress) -> None:
+            progress.update(
+                bar,
+                total=snapshot.total or None,
+                completed=snapshot.processed,
+            )
+
+        return runner.wait(
+            task_id, action, poll_interval=poll_interval, on_progress=_update
+        )
+
+
+@tasks_group.command(name="watch")
+@click.argument("task_id")
+@click.option(
+    "--interval", type=float, default=2.0, help="Seconds between progress polls"
+)
+@click.pass_obj
+def watch_task(client: ElasticsearchClient, task_id: str, interval: float) -> None:
+    """
+    Follow a delete-by-query or update-by-query task until it finishes.
+
+    TASK_ID must be in format <node_id>:<task_id>.
+    """
+    console = Console()
+    try:
+        result = follow_task(TaskRunner(client), task_id, poll_interval=interval)
+        console.print(result.to_dict())
+    except Exception as e:
+        console.print(f"[bold red]Task Error:[/bold red] {str(e)}")
+
+
+@tasks_group.command(name="rethrottle")
+@click.argument("task_id")
+@click.option(
+    "--requests-per-second",
+    "-r",
+    type=float,
+    required=True,
+    help="New throttle in sub-requests per second (-1 to unthrottle)",
+)
+@click.pass_obj
+def rethrottle_task(
+    client: ElasticsearchClient, task_id: str, requests_per_second: float
+) -> None:
+    """
+    Change the throttle of a running delete-by-query or update-by-query task.
+
+    TASK_ID must be in format <node_id>:<task_id>.
+    """
+    console = Console()
+    try:
+        TaskRunner(client).rethrottle(task_id, requests_per_second)
+        console.print(
+            f"[bold green]Rethrottled {task_id} to {requests_per_second} rps"
+            "[/bold green]"
+        )
+    except Exception as e:
+        console.print(f"[bold red]Rethrottle Error:[/bold red] {str(e)}")
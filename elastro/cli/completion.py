@@ -1,5 +1,5 @@
-import rich_click as click
-from typing import List, Optional, Any
+from typing import Any, List, Optional
+
 from elastro.config import load_config
 from elastro.core.client import ElasticsearchClient
 
@@ -18,7 +18,7 @@ def get_quick_client() -> Optional[ElasticsearchClient]:
             retry_on_timeout=False,
             max_retries=0,
         )
-        client.connect()
+        client.connect(lazy=True)
         return client
     except Exception:
         return None
@@ -32,7 +32,8 @@ def complete_indices(ctx: Any, param: Any, incomplete: str) -> List[str]:
 
     try:
         # Use simple wildcard search for indices
-        # expand_wildcards='all' ensures we see hidden ones if needed, but maybe 'open' is better
+        # expand_wildcards='all' ensures we see hidden ones if needed,
+        # but maybe 'open' is better
         # We fetch names matching incomplete*
         # Using cat.indices or get_alias is faster than search
         # client.client is the raw library client
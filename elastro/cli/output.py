@@ -1,13 +1,23 @@
 import json
-import yaml
+from io import StringIO
 from typing import Any, Optional, cast
+
+import click
+import yaml
+from rich import box
 from rich.console import Console
 from rich.table import Table
-from rich import box
-from io import StringIO
+
 from elastro.config import get_config
 
 
+def _context_output_format() -> Optional[str]:
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return None
+    return cast(Optional[str], ctx.find_root().params.get("output"))
+
+
 def format_output(data: Any, output_format: Optional[str] = None) -> str:
     """
     Format output data based on the specified format.
@@ -19,12 +29,14 @@ def format_output(data: Any, output_format: Optional[str] = None) -> str:
     Returns:
         Formatted string or None (if printing directly)
     """
-    # If output_format not provided, try to get from config
+    # If output_format not provided, use the root command's --output, then config
+    if not output_format:
+        output_format = _context_output_format()
     if not output_format:
         try:
             config = get_config()
             output_format = config.get("cli", {}).get("output_format", "json")
-        except:
+        except Exception:
             output_format = "json"
 
     if output_format == "json":
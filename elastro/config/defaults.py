@@ -10,6 +10,50 @@ DEFAULT_HOSTS = ["http://localhost:9200"]
 DEFAULT_TIMEOUT = 30
 DEFAULT_RETRY_ON_TIMEOUT = True
 DEFAULT_MAX_RETRIES = 3
+# Skip the verifying ping on connect; the first request checks the connection
+DEFAULT_LAZY_CONNECT = False
+# Record per-API request counts, bytes and latency histograms (``elastro stats``)
+DEFAULT_METRICS = False
+
+# Default transport settings (the elasticsearch-py defaults). Enable
+# http_compress to gzip request bodies, which pays off for bulk traffic over
+# slow or metered links.
+DEFAULT_HTTP_COMPRESS = False
+DEFAULT_CONNECTIONS_PER_NODE = 10
+DEFAULT_SNIFF_ON_START = False
+DEFAULT_SNIFF_ON_NODE_FAILURE = False
+DEFAULT_SNIFF_BEFORE_REQUESTS = False
+DEFAULT_SNIFF_TIMEOUT = 0.5
+DEFAULT_MIN_DELAY_BETWEEN_SNIFFING = 10.0
+DEFAULT_NODE_SELECTOR = "round_robin"  # or "random"
+
+# Retry budget (token bucket, one per client) and per-host circuit breaker
+# (shared by every client in the process); opt-in
+DEFAULT_RESILIENCE = {
+    "enabled": False,
+    "retry_budget": 20,  # retries that can be spent in a burst
+    "retry_refill_rate": 2.0,  # retry tokens regained per second
+    "backoff_base": 0.1,
+    "backoff_max": 5.0,
+    "failure_threshold": 5,  # consecutive 429/5xx/connection failures
+    "reset_timeout": 1.0,  # seconds open before a half-open probe
+    "max_reset_timeout": 30.0,
+}
+
+# Default pool settings for the shared async client
+DEFAULT_ASYNC_POOL = {
+    "connections_per_node": 10,
+    "keepalive_timeout": 30,
+}
+
+# Default search result cache settings (opt-in)
+DEFAULT_SEARCH_CACHE = {
+    "enabled": False,
+    "max_entries": 1000,
+    "max_bytes": 64 * 1024 * 1024,
+    "ttl_seconds": 60,
+    "validate_interval": 1.0,
+}
 
 # Default index settings
 DEFAULT_INDEX_SETTINGS = {
@@ -35,6 +79,19 @@ DEFAULT_CONFIG = {
         "timeout": DEFAULT_TIMEOUT,
         "retry_on_timeout": DEFAULT_RETRY_ON_TIMEOUT,
         "max_retries": DEFAULT_MAX_RETRIES,
+        "lazy_connect": DEFAULT_LAZY_CONNECT,
+        "metrics": DEFAULT_METRICS,
+        "http_compress": DEFAULT_HTTP_COMPRESS,
+        "connections_per_node": DEFAULT_CONNECTIONS_PER_NODE,
+        "sniff_on_start": DEFAULT_SNIFF_ON_START,
+        "sniff_on_node_failure": DEFAULT_SNIFF_ON_NODE_FAILURE,
+        "sniff_before_requests": DEFAULT_SNIFF_BEFORE_REQUESTS,
+        "sniff_timeout": DEFAULT_SNIFF_TIMEOUT,
+        "min_delay_between_sniffing": DEFAULT_MIN_DELAY_BETWEEN_SNIFFING,
+        "node_selector": DEFAULT_NODE_SELECTOR,
+        "resilience": DEFAULT_RESILIENCE,
+        "async_pool": DEFAULT_ASYNC_POOL,
+        "search_cache": DEFAULT_SEARCH_CACHE,
         "auth": {
             "type": None,  # "api_key", "basic"
             "username": None,
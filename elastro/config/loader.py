@@ -5,14 +5,16 @@ This module provides functionality for loading and managing configuration from
 files and environment variables.
 """
 
-import os
-import yaml
 import json
+import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Dict, Optional
+
+import yaml
 from dotenv import load_dotenv
-from elastro.core.errors import ConfigurationError
+
 from elastro.config.defaults import DEFAULT_CONFIG
+from elastro.core.errors import ConfigurationError
 
 # Load environment variables from .env file
 load_dotenv()
@@ -178,6 +180,15 @@ def _load_from_env(config: Dict[str, Any]) -> Dict[str, Any]:
     # Well-known compound tokens that must NOT be split on underscores.
     # Order matters: longer tokens must appear before shorter prefixes.
     _compound_tokens = [
+        "min_delay_between_sniffing",
+        "sniff_before_requests",
+        "sniff_on_node_failure",
+        "sniff_on_start",
+        "sniff_timeout",
+        "connections_per_node",
+        "node_selector",
+        "http_compress",
+        "keepalive_timeout",
         "retry_on_timeout",
         "verify_certs",
         "ssl_show_warn",
@@ -186,6 +197,20 @@ def _load_from_env(config: Dict[str, Any]) -> Dict[str, Any]:
         "api_key",
         "cloud_id",
         "auth_type",
+        "async_pool",
+        "lazy_connect",
+        "search_cache",
+        "max_entries",
+        "max_bytes",
+        "ttl_seconds",
+        "validate_interval",
+        "retry_budget",
+        "retry_refill_rate",
+        "backoff_base",
+        "backoff_max",
+        "failure_threshold",
+        "max_reset_timeout",
+        "reset_timeout",
     ]
 
     for env_var, value in os.environ.items():
@@ -356,7 +381,8 @@ def save_config(
     Args:
         config: Configuration to save
         path: Path to the configuration file (optional)
-        profile: Configuration profile to use (not used in simple save for now, assumes config is full structure)
+        profile: Configuration profile to use (not used in simple save for now,
+            assumes config is full structure)
     """
     # Use default path if not provided
     if not path:
@@ -5,11 +5,12 @@ This package contains the core components for interacting with Elasticsearch.
 """
 
 from elastro.core.client import ElasticsearchClient
-from elastro.core.index import IndexManager
-from elastro.core.document import DocumentManager
 from elastro.core.datastream import DatastreamManager
-from elastro.core.validation import Validator
+from elastro.core.document import DocumentManager
 from elastro.core.document_bulk import BulkDocumentManager
+from elastro.core.index import IndexManager
+from elastro.core.task_runner import TaskProgress, TaskRunner
+from elastro.core.validation import Validator
 
 __all__ = [
     "ElasticsearchClient",
@@ -18,4 +19,6 @@ __all__ = [
     "DatastreamManager",
     "Validator",
     "BulkDocumentManager",
+    "TaskRunner",
+    "TaskProgress",
 ]
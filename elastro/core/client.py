@@ -4,19 +4,60 @@ Elasticsearch client module.
 This module provides the core client for connecting to Elasticsearch.
 """
 
-from typing import Dict, List, Optional, Union, Any
-from elasticsearch import Elasticsearch, AsyncElasticsearch
+import asyncio
+from typing import Any, Dict, List, Optional, Union
+
+from elastic_transport import (
+    AiohttpHttpNode,
+    AsyncTransport,
+    Transport,
+    Urllib3HttpNode,
+)
+from elasticsearch import AsyncElasticsearch, Elasticsearch
 from elasticsearch.exceptions import (
-    ConnectionError as ESConnectionError,
     AuthenticationException,
     TransportError,
 )
-from elastro.core.errors import ConnectionError, AuthenticationError, OperationError
+from elasticsearch.exceptions import (
+    ConnectionError as ESConnectionError,
+)
+
 from elastro.config import get_config
+from elastro.core.errors import (
+    AuthenticationError,
+    ConfigurationError,
+    ConnectionError,
+    OperationError,
+)
 from elastro.core.logger import get_logger
+from elastro.core.metrics import (
+    InstrumentedAiohttpHttpNode,
+    InstrumentedAsyncElasticsearch,
+    InstrumentedElasticsearch,
+    InstrumentedUrllib3HttpNode,
+)
+from elastro.core.resilience import (
+    circuit_breaking_node_class,
+    retry_budget_transport,
+)
+from elastro.core.search_cache import SearchCache
 
 logger = get_logger(__name__)
 
+# Transport settings read from the ``elasticsearch`` config section
+TRANSPORT_OPTIONS = (
+    "http_compress",
+    "connections_per_node",
+    "sniff_on_start",
+    "sniff_on_node_failure",
+    "sniff_before_requests",
+    "sniff_timeout",
+    "min_delay_between_sniffing",
+    "node_selector",
+)
+
+NODE_SELECTORS = ("round_robin", "random")
+
 
 class ElasticsearchClient:
     """
@@ -38,6 +79,12 @@ class ElasticsearchClient:
         password: Optional[str] = None,
         api_key: Optional[str] = None,
         verify_certs: Optional[bool] = None,
+        async_pool: Optional[Dict[str, Any]] = None,
+        search_cache: Optional[Dict[str, Any]] = None,
+        lazy_connect: Optional[bool] = None,
+        transport: Optional[Dict[str, Any]] = None,
+        metrics: Optional[bool] = None,
+        resilience: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ):
         """
@@ -54,6 +101,24 @@ class ElasticsearchClient:
             password: Elasticsearch password (alternative to auth)
             api_key: Elasticsearch API key (alternative to auth)
             verify_certs: Whether to verify SSL certificates
+            async_pool: Connection pool settings for the shared async client
+                (``connections_per_node``, ``keepalive_timeout``)
+            search_cache: Search result cache settings (``enabled``,
+                ``max_entries``, ``max_bytes``, ``ttl_seconds``,
+                ``validate_interval``); the cache is off unless enabled
+            lazy_connect: Skip the ping in ``connect()`` and verify the
+                connection on the first real request instead
+            transport: Transport tuning (``http_compress``,
+                ``connections_per_node``, ``sniff_on_start``,
+                ``sniff_on_node_failure``, ``sniff_before_requests``,
+                ``sniff_timeout``, ``min_delay_between_sniffing``,
+                ``node_selector``)
+            metrics: Record per-API request metrics in the process-wide
+                registry (see ``elastro.core.metrics.get_metrics``)
+            resilience: Per-client retry budget and shared per-host circuit
+                breaker settings (``enabled``, ``retry_budget``, ``retry_refill_rate``,
+                ``backoff_base``, ``backoff_max``, ``failure_threshold``,
+                ``reset_timeout``, ``max_reset_timeout``)
             **kwargs: Additional parameters to pass to the Elasticsearch client
         """
         if use_config:
@@ -81,6 +146,30 @@ class ElasticsearchClient:
                 if verify_certs is not None
                 else es_config.get("verify_certs", True)
             )
+            self.async_pool = dict(es_config.get("async_pool") or {})
+            self.async_pool.update(async_pool or {})
+            cache_settings = dict(es_config.get("search_cache") or {})
+            cache_settings.update(search_cache or {})
+            self.lazy_connect = (
+                lazy_connect
+                if lazy_connect is not None
+                else bool(es_config.get("lazy_connect", False))
+            )
+            self.transport = {
+                key: es_config[key]
+                for key in TRANSPORT_OPTIONS
+                if es_config.get(key) is not None
+            }
+            self.transport.update(
+                {k: v for k, v in (transport or {}).items() if v is not None}
+            )
+            self.metrics = (
+                metrics
+                if metrics is not None
+                else bool(es_config.get("metrics", False))
+            )
+            self.resilience = dict(es_config.get("resilience") or {})
+            self.resilience.update(resilience or {})
         else:
             # Use only explicitly provided parameters
             self.hosts = hosts
@@ -89,6 +178,12 @@ class ElasticsearchClient:
             self.retry_on_timeout = retry_on_timeout
             self.max_retries = max_retries
             self.verify_certs = verify_certs if verify_certs is not None else True
+            self.async_pool = dict(async_pool or {})
+            cache_settings = dict(search_cache or {})
+            self.lazy_connect = bool(lazy_connect)
+            self.transport = dict(transport or {})
+            self.metrics = bool(metrics)
+            self.resilience = dict(resilience or {})
 
         # Handle direct username/password/api_key parameters
         if username and password:
@@ -107,6 +202,12 @@ class ElasticsearchClient:
         self.client_kwargs = kwargs
         self._client: Optional[Elasticsearch] = None
         self._connected = False
+        # False while a lazily connected client has not completed a request
+        self._verified = False
+        self._async_client: Optional[AsyncElasticsearch] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Opt-in cache shared by every manager built on this client
+        self.search_cache = SearchCache.from_config(cache_settings)
 
         logger.debug(f"Initialized ElasticsearchClient with hosts: {self.hosts}")
 
@@ -144,7 +245,8 @@ class ElasticsearchClient:
             # Additional SSL settings when verify_certs is False
             if self.verify_certs is False:
                 logger.warning(
-                    "SSL certificate verification is disabled. This is not secure for production."
+                    "SSL certificate verification is disabled. "
+                    "This is not secure for production."
                 )
                 import urllib3
 
@@ -152,6 +254,8 @@ class ElasticsearchClient:
                 client_params["ssl_assert_hostname"] = False
                 client_params["ssl_show_warn"] = False
 
+        client_params.update(self._get_transport_params())
+
         # Add client kwargs
         client_params.update(self.client_kwargs)
 
@@ -178,17 +282,55 @@ class ElasticsearchClient:
 
         return client_params
 
-    def connect(self) -> None:
+    def _get_transport_params(self) -> Dict[str, Any]:
+        """Translate the transport settings into Elasticsearch client parameters."""
+        params: Dict[str, Any] = {}
+        for key, value in self.transport.items():
+            if value is None:
+                continue
+            if key not in TRANSPORT_OPTIONS:
+                raise ConfigurationError(f"Unknown transport option: {key}")
+            if key == "node_selector":
+                if value not in NODE_SELECTORS:
+                    raise ConfigurationError(
+                        f"Invalid node_selector '{value}', expected one of "
+                        f"{', '.join(NODE_SELECTORS)}"
+                    )
+                params["node_selector_class"] = value
+            else:
+                params[key] = value
+        return params
+
+    def connect(self, lazy: Optional[bool] = None) -> None:
         """
         Establish connection to Elasticsearch.
 
+        In lazy mode the client is built without the verifying ``ping()``;
+        the first real request doubles as the health check and connection or
+        authentication failures on it are raised as ``ConnectionError`` /
+        ``AuthenticationError``.
+
+        Args:
+            lazy: Override the ``lazy_connect`` setting for this connection
+
         Raises:
             ConnectionError: If unable to connect to Elasticsearch
             AuthenticationError: If authentication fails
         """
+        if lazy is None:
+            lazy = self.lazy_connect
         logger.info(f"Connecting to Elasticsearch at {self.hosts}...")
 
         client_params = self._get_client_params()
+        if self.metrics:
+            client_params.setdefault("node_class", InstrumentedUrllib3HttpNode)
+        transport_class = self._apply_resilience(
+            client_params, Transport, Urllib3HttpNode
+        )
+        if lazy:
+            transport_class = _first_request_verifying_transport(self, transport_class)
+        if transport_class is not Transport:
+            client_params["transport_class"] = transport_class
 
         # Prepare safe loggable params
         log_params = client_params.copy()
@@ -203,18 +345,27 @@ class ElasticsearchClient:
             log_auth["api_key"] = "******"
 
         logger.info(
-            f"Connecting with params: hosts={client_params.get('hosts')}, auth={log_auth}, basic_auth={log_params.get('basic_auth')}"
+            f"Connecting with params: hosts={client_params.get('hosts')}, "
+            f"auth={log_auth}, basic_auth={log_params.get('basic_auth')}"
         )
 
         try:
-            self._client = Elasticsearch(**client_params)
+            es_class = InstrumentedElasticsearch if self.metrics else Elasticsearch
+            self._client = es_class(**client_params)
             assert self._client is not None
+            if lazy:
+                self.lazy_connect = True
+                self._verified = False
+                self._connected = True
+                logger.info("Connected lazily; verifying on first request")
+                return
             # Verify connection by making a ping request
             ping_result = self._client.ping()
             if not ping_result:
                 logger.error("Ping failed during connection attempt")
                 raise ConnectionError("Failed to connect to Elasticsearch")
             self._connected = True
+            self._verified = True
             logger.info("Successfully connected to Elasticsearch")
         except ESConnectionError as e:
             self._connected = False
@@ -241,6 +392,7 @@ class ElasticsearchClient:
             logger.info("Disconnected from Elasticsearch")
         self._client = None
         self._connected = False
+        self._verified = False
 
     def get_client(self) -> Elasticsearch:
         """
@@ -256,24 +408,138 @@ class ElasticsearchClient:
             raise ConnectionError("Client is not connected. Call connect() first.")
         return self._client
 
+    def _apply_resilience(
+        self, client_params: Dict[str, Any], transport: type, node: type
+    ) -> type:
+        """
+        Wrap the node class in the circuit breaker when resilience is enabled.
+
+        Returns the transport class to use: the retry budget transport built
+        on ``transport``, or whatever ``client_params`` already asks for.
+        """
+        transport_class = client_params.get("transport_class", transport)
+        if self.resilience.get("enabled") and "transport_class" not in client_params:
+            transport_class = retry_budget_transport(transport, self.resilience)
+            node_class = client_params.get("node_class", node)
+            if isinstance(node_class, type):
+                client_params["node_class"] = circuit_breaking_node_class(
+                    node_class, self.resilience
+                )
+        return transport_class
+
+    def _get_async_client_params(self) -> Dict[str, Any]:
+        """Generate the AsyncElasticsearch parameters, including pool tuning.
+
+        Metrics and resilience apply to the async client as they do to the
+        synchronous one.
+        """
+        client_params = self._get_client_params()
+
+        # The async pool size wins over the sync transport setting
+        connections_per_node = self.async_pool.get("connections_per_node")
+        if (
+            connections_per_node is not None
+            and "connections_per_node" not in self.client_kwargs
+        ):
+            client_params["connections_per_node"] = int(connections_per_node)
+
+        if "node_class" not in client_params:
+            node_class: type = (
+                InstrumentedAiohttpHttpNode if self.metrics else AiohttpHttpNode
+            )
+            keepalive_timeout = self.async_pool.get("keepalive_timeout")
+            if keepalive_timeout is not None:
+                node_class = (
+                    _keepalive_aiohttp_node_class(float(keepalive_timeout), node_class)
+                    or node_class
+                )
+            if node_class is not AiohttpHttpNode:
+                client_params["node_class"] = node_class
+
+        transport_class = self._apply_resilience(
+            client_params, AsyncTransport, AiohttpHttpNode
+        )
+        if transport_class is not AsyncTransport:
+            client_params["transport_class"] = transport_class
+        return client_params
+
     def get_async_client(self) -> AsyncElasticsearch:
         """
-        Get a new AsyncElasticsearch client instance using the same connection parameters.
+        Get the shared AsyncElasticsearch client for this connection.
+
+        The client is created lazily on first use and reused by every async
+        caller so that pooled TCP/TLS connections survive between requests.
+        Because aiohttp sessions are bound to an event loop, a fresh client is
+        built when called from a different running loop; the previous client
+        is closed on its own loop if that loop is still running. Callers must
+        not close the returned client themselves; use ``aclose()`` (or
+        ``async with client:``) to release it.
 
         Returns:
             AsyncElasticsearch client instance
         """
-        return AsyncElasticsearch(**self._get_client_params())
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if self._async_client is not None:
+            if self._async_loop is None or loop is None or self._async_loop is loop:
+                if self._async_loop is None:
+                    self._async_loop = loop
+                return self._async_client
+            logger.debug("Event loop changed; creating a new async client")
+            self._discard_async_client()
+
+        es_class = (
+            InstrumentedAsyncElasticsearch if self.metrics else AsyncElasticsearch
+        )
+        self._async_client = es_class(**self._get_async_client_params())
+        self._async_loop = loop
+        return self._async_client
+
+    def _discard_async_client(self) -> None:
+        """Drop the async client of another event loop, closing it there."""
+        async_client, loop = self._async_client, self._async_loop
+        self._async_client = None
+        self._async_loop = None
+        if async_client is None or loop is None:
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(async_client.close(), loop)
+        else:
+            # A stopped loop can no longer run the session's close
+            logger.debug("Previous event loop is gone; dropping its async client")
+
+    async def aclose(self) -> None:
+        """Close the shared async client and release its connection pool."""
+        async_client = self._async_client
+        self._async_client = None
+        self._async_loop = None
+        if async_client is not None:
+            await async_client.close()
+            logger.debug("Closed async Elasticsearch client")
+
+    async def __aenter__(self) -> "ElasticsearchClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     def is_connected(self) -> bool:
         """
         Check if the client is connected to Elasticsearch.
 
+        Lazily connected clients report the last known state without a
+        round-trip; it turns False once a request fails to connect.
+
         Returns:
             True if connected, False otherwise
         """
         if self._client is None:
             return False
+        if self.lazy_connect:
+            return self._connected
 
         try:
             return self._client.ping()
@@ -348,3 +614,79 @@ class ElasticsearchClient:
         if self._client is None:
             raise ConnectionError("Client is not connected. Call connect() first.")
         return self._client
+
+
+def _first_request_verifying_transport(
+    owner: ElasticsearchClient, base: type = Transport
+) -> type:
+    """
+    Build a transport class that verifies a lazy connection on first use.
+
+    Until one request has completed, connection failures and 401 responses
+    are raised as elastro ``ConnectionError`` / ``AuthenticationError`` and
+    mark ``owner`` as disconnected; afterwards requests pass straight through.
+    The state lives on ``owner`` because ``Elasticsearch.options()`` clones
+    share the transport but not client attributes.
+    """
+
+    class FirstRequestVerifyingTransport(base):  # type: ignore[misc, valid-type]
+        def perform_request(self, *args: Any, **kwargs: Any) -> Any:
+            if owner._verified:
+                return super().perform_request(*args, **kwargs)
+
+            try:
+                response = super().perform_request(*args, **kwargs)
+            except ESConnectionError as e:
+                owner._connected = False
+                logger.error(f"Connection failed: {str(e)}")
+                raise ConnectionError(f"Failed to connect to Elasticsearch: {str(e)}")
+
+            if response.meta.status == 401:
+                owner._connected = False
+                logger.error("Authentication failed on first request")
+                raise AuthenticationError(
+                    f"Authentication failed: HTTP 401 from {response.meta.node.host}"
+                )
+
+            owner._verified = True
+            logger.debug("Lazy connection verified by first request")
+            return response
+
+    return FirstRequestVerifyingTransport
+
+
+def _keepalive_aiohttp_node_class(
+    keepalive_timeout: float, base: type = AiohttpHttpNode
+) -> Optional[type]:
+    """
+    Build an aiohttp node class with a custom keep-alive timeout.
+
+    ``elastic_transport`` does not expose the aiohttp connector settings, so
+    the session factory of ``base`` is overridden to tune how long idle pooled
+    connections are kept open. Returns None when aiohttp is not installed.
+    """
+    try:
+        import aiohttp
+    except ImportError:
+        return None
+
+    class KeepAliveAiohttpHttpNode(base):  # type: ignore[misc, valid-type]
+        def _create_aiohttp_session(self) -> None:
+            # ``base`` is only known at runtime, so read the loop dynamically
+            loop = getattr(self, "_loop", None) or asyncio.get_running_loop()
+            self._loop = loop
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                skip_auto_headers=("accept", "accept-encoding", "user-agent"),
+                auto_decompress=True,
+                loop=loop,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self._connections_per_node,
+                    keepalive_timeout=keepalive_timeout,
+                    use_dns_cache=True,
+                    ssl=self._ssl_context or False,
+                ),
+            )
+
+    return KeepAliveAiohttpHttpNode
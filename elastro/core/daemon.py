@@ -5,29 +5,38 @@ Maintains a persistent Elasticsearch client for sub-millisecond agentic queries.
 """
 
 import argparse
-from typing import List, Optional
+import json
+from typing import Any, Dict, List, Optional
 from xmlrpc.server import SimpleXMLRPCServer
 
 from elastro.cli.output import format_output
 from elastro.config.loader import get_config
 from elastro.core.client import ElasticsearchClient
 from elastro.core.document import DocumentManager
+from elastro.core.metrics import get_metrics
 from elastro.core.query_builder import QueryBuilder
+from elastro.core.resilience import get_resilience
 
 
 class ElastroRPCService:
-    def __init__(self) -> None:
+    def __init__(self, search_cache: Optional[bool] = None) -> None:
         self.client: Optional[ElasticsearchClient] = None
+        self._search_cache = search_cache
         self._connect()
 
     def _connect(self) -> None:
         config = get_config()
+        # None leaves elasticsearch.search_cache.enabled from the config in charge
+        cache_settings = (
+            {"enabled": self._search_cache} if self._search_cache is not None else None
+        )
         self.client = ElasticsearchClient(
             hosts=config["elasticsearch"]["hosts"],
             auth=config["elasticsearch"].get("auth"),
             timeout=config["elasticsearch"].get("timeout", 30),
             retry_on_timeout=config["elasticsearch"].get("retry_on_timeout", True),
             max_retries=config["elasticsearch"].get("max_retries", 3),
+            search_cache=cache_settings,
         )
         self.client.connect()
 
@@ -36,6 +45,20 @@ class ElastroRPCService:
             return self.client.is_connected()
         return False
 
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return search cache counters, or an empty dict when caching is off."""
+        if self.client and self.client.search_cache:
+            return self.client.search_cache.stats()
+        return {}
+
+    def transport_stats(self, reset: bool = False) -> str:
+        """Return per-API transport metrics as JSON (byte totals overflow XML-RPC ints)."""
+        snapshot = get_metrics().snapshot()
+        snapshot["resilience"] = get_resilience().snapshot()
+        if reset:
+            get_metrics().reset()
+        return json.dumps(snapshot)
+
     def fast_path_search(self, args: List[str]) -> str:
         if not self.client:
             return "Error: Elasticsearch client not connected in daemon."
@@ -69,6 +92,7 @@ class ElastroRPCService:
         )
 
         parser.add_argument("--output", "-o", type=str, default="json")
+        parser.add_argument("--no-cache", action="store_true", dest="no_cache")
 
         try:
             parsed, _ = parser.parse_known_args(args)
@@ -101,7 +125,10 @@ class ElastroRPCService:
 
         try:
             results = doc_manager.search(
-                getattr(parsed, "index", ""), query_body, options
+                getattr(parsed, "index", ""),
+                query_body,
+                options,
+                use_cache=not getattr(parsed, "no_cache", False),
             )
             output_format = getattr(parsed, "output", "json")
             output_str = format_output(results, output_format=output_format)
@@ -110,10 +137,12 @@ class ElastroRPCService:
             return f"Daemon search error: {str(e)}"
 
 
-def start_daemon(host: str = "127.0.0.1", port: int = 9201) -> None:
+def start_daemon(
+    host: str = "127.0.0.1", port: int = 9201, search_cache: Optional[bool] = None
+) -> None:
     """Start the Elastro XML-RPC daemon server."""
     server = SimpleXMLRPCServer((host, port), allow_none=True)
-    server.register_instance(ElastroRPCService())
+    server.register_instance(ElastroRPCService(search_cache=search_cache))
     print(f"Starting Elastro XML-RPC Daemon on {host}:{port}...", flush=True)
     try:
         server.serve_forever()
@@ -4,16 +4,77 @@ Document management module.
 This module provides functionality for managing Elasticsearch documents.
 """
 
-from typing import Dict, Any, Optional, List, cast
-import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
 from elasticsearch import helpers
-from elastro.core.client import ElasticsearchClient
+
 from elastro.core.base import BaseManager
-from elastro.core.errors import DocumentError, ValidationError, OperationError
+from elastro.core.errors import DocumentError, OperationError, ValidationError
 from elastro.core.logger import get_logger
+from elastro.core.search_cache import FINGERPRINT_FILTER_PATH, SearchCache
+from elastro.core.task_runner import TaskProgress, TaskRunner
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Defaults for batched lookups. mget chunks are cheap per item, msearch
+# chunks each carry a full query so they are kept smaller.
+DEFAULT_MGET_CHUNK_SIZE = 1000
+DEFAULT_MSEARCH_CHUNK_SIZE = 100
+DEFAULT_BATCH_WORKERS = 4
+
+# Defaults for thread-pooled sync bulk
+DEFAULT_BULK_CHUNK_SIZE = 500
+DEFAULT_BULK_QUEUE_SIZE = 4
+DEFAULT_MAX_COLLECTED_ERRORS = 100
+
+
+class BulkErrorCollector:
+    """
+    Bounded collector for per-item bulk failures.
+
+    Keeps at most ``max_errors`` failed items for reporting while still
+    counting every failure, so memory stays flat on very large bulk runs.
+    """
+
+    def __init__(self, max_errors: int = DEFAULT_MAX_COLLECTED_ERRORS) -> None:
+        self.max_errors = max_errors
+        self.success_count = 0
+        self.error_count = 0
+        self.errors: List[Dict[str, Any]] = []
+
+    def add(self, ok: bool, item: Dict[str, Any]) -> None:
+        if ok:
+            self.success_count += 1
+            return
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(item)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "success_count": self.success_count,
+            "error_count": self.error_count,
+            "errors": self.errors,
+            "errors_truncated": self.error_count > len(self.errors),
+        }
+
 
 class DocumentManager(BaseManager):
     """
@@ -61,8 +122,10 @@ class DocumentManager(BaseManager):
             self._ensure_connected()
 
             logger.debug(f"Indexing document into '{index}' with ID '{id}'")
-            # Execute the index operation with explicit cast to Any to bypass kwargs mapping checks
+            # Execute the index operation with explicit cast to Any to bypass
+            # kwargs mapping checks
             response = cast(Any, self._client.get_client()).index(**params)
+            self._invalidate_cache(index)
             return self._handle_response(response)
         except Exception as e:
             logger.error(f"Failed to index document info '{index}': {str(e)}")
@@ -113,6 +176,7 @@ class DocumentManager(BaseManager):
             logger.info(f"Bulk indexing {len(actions)} documents into '{index}'...")
 
             self._ensure_connected()
+            # Shared pooled client; its lifecycle is owned by ElasticsearchClient
             async_client = self._client.get_async_client()
             try:
                 success_count, errors = await helpers.async_bulk(
@@ -123,7 +187,8 @@ class DocumentManager(BaseManager):
                     raise_on_error=True,
                 )
             finally:
-                await async_client.close()
+                # Part of the batch may have been written even if it failed
+                self._invalidate_cache(index)
 
             logger.info(f"Bulk index complete: {success_count} successful")
 
@@ -173,7 +238,7 @@ class DocumentManager(BaseManager):
                     raise_on_error=True,
                 )
             finally:
-                await async_client.close()
+                self._invalidate_cache(index)
 
             return {
                 "success_count": success_count,
@@ -255,6 +320,7 @@ class DocumentManager(BaseManager):
                     body=body,
                     refresh="true" if refresh else "false",
                 )
+                self._invalidate_cache(index)
                 return self._handle_response(response)
             else:
                 # For full document updates, just index it again
@@ -290,24 +356,77 @@ class DocumentManager(BaseManager):
             response = self._client.get_client().delete(
                 index=index, id=id, refresh="true" if refresh else "false"
             )
+            self._invalidate_cache(index)
             return self._handle_response(response)
         except Exception as e:
             logger.error(f"Failed to delete document '{id}': {str(e)}")
             raise DocumentError(f"Failed to delete document: {str(e)}")
 
+    def _search_cache(self) -> Optional[SearchCache]:
+        """Return the client's search cache, if one is enabled."""
+        cache = getattr(self._client, "search_cache", None)
+        return cache if isinstance(cache, SearchCache) else None
+
+    def _invalidate_cache(self, index: str) -> None:
+        """Drop cached searches over an index after writing to it."""
+        cache = self._search_cache()
+        if cache is not None:
+            cache.invalidate(index)
+
+    def _index_fingerprint(self, index: str) -> Any:
+        """Read the per-shard refresh and sequence-number counters of an index."""
+        self._ensure_connected()
+        return self._handle_response(
+            self._client.get_client().indices.stats(
+                index=index,
+                metric="refresh",
+                level="shards",
+                filter_path=FINGERPRINT_FILTER_PATH,
+            )
+        )
+
+    @staticmethod
+    def _build_search_body(
+        query: Dict[str, Any], options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build a search request body from a query and search options."""
+        # Check if query already has "query" key at top level to avoid double wrapping
+        if query and "query" in query and len(query) == 1:
+            # It might be a full body with just query
+            body = query.copy()
+        elif query:
+            body = {"query": query}
+        else:
+            body = {"query": {"match_all": {}}}
+
+        # Add search options if provided
+        if options:
+            for key, value in options.items():
+                if key in ["size", "from", "sort", "track_total_hits"]:
+                    body[key] = value
+                elif key in ["_source", "aggs", "aggregations", "highlight"]:
+                    body[key] = value
+
+        return body
+
     def search(
         self,
         index: str,
         query: Dict[str, Any],
         options: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
     ) -> Any:
         """
         Search for documents.
 
+        Responses are served from the client's search cache when one is
+        enabled (``elasticsearch.search_cache.enabled``).
+
         Args:
             index: Name of the index
             query: Elasticsearch query DSL
             options: Additional search options like size, from, sort, etc.
+            use_cache: Set to False to bypass the search cache for this call
 
         Returns:
             Search results
@@ -319,36 +438,281 @@ class DocumentManager(BaseManager):
         if not query:
             raise ValidationError("Query cannot be empty")
 
-        # Prepare search body
-        # Check if query already has "query" key at top level to avoid double wrapping
-        if query and "query" in query and len(query) == 1:
-            # It might be a full body with just query
-            body = query.copy()
-        elif query:
-            body = {"query": query}
-        else:
-            body = {"query": {"match_all": {}}}
-
-        # Add search options if provided
-        if options:
-            for key, value in options.items():
-                if key in ["size", "from", "sort", "track_total_hits"]:
-                    body[key] = value
-                elif key in ["_source", "aggs", "aggregations", "highlight"]:
-                    body[key] = value
-
+        body = self._build_search_body(query, options)
         search_params = {"index": index, "body": body}
 
+        cache = self._search_cache() if use_cache else None
+        if cache is not None:
+            try:
+                fingerprint = cache.fingerprint(
+                    index, lambda: self._index_fingerprint(index)
+                )
+            except Exception as e:
+                # The probe is only a freshness check; without it the
+                # cache cannot be trusted, but the search itself can still run.
+                logger.warning(
+                    f"Could not fingerprint '{index}', searching uncached: {str(e)}"
+                )
+                cache = None
         try:
+            if cache is not None:
+                key = cache.make_key(index, body)
+                cached = cache.get(key, fingerprint)
+                if cached is not None:
+                    logger.debug(f"Search cache hit for '{index}'")
+                    return cached
+
             logger.debug(f"Searching index '{index}'...")
             self._ensure_connected()
             # Explicit cast to Any allows flexible kwargs passed from builders
             response = cast(Any, self._client.get_client()).search(**search_params)
-            return self._handle_response(response)
+            result = self._handle_response(response)
+            if cache is not None:
+                cache.put(key, index, result, fingerprint)
+            return result
         except Exception as e:
             logger.error(f"Failed to search documents in '{index}': {str(e)}")
             raise DocumentError(f"Failed to search documents: {str(e)}")
 
+    # ------------------------------------------------------------------
+    # Batched lookups
+    # Split large ID / query lists into chunks, send the chunks in
+    # parallel and stitch the per-item results back in input order.
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _run_chunks(
+        items: Sequence[T],
+        chunk_size: int,
+        max_workers: int,
+        fetch: Callable[[Sequence[T]], List[Dict[str, Any]]],
+        on_error: Callable[[T, Exception], Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Run ``fetch`` over fixed-size chunks of ``items`` in a thread pool.
+
+        A failed chunk does not fail the whole call: every item in it gets
+        the per-item error produced by ``on_error`` instead.
+        """
+        chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+        def _fetch_chunk(chunk: Sequence[T]) -> List[Dict[str, Any]]:
+            try:
+                return fetch(chunk)
+            except Exception as e:
+                logger.error(f"Batched request for {len(chunk)} items failed: {e}")
+                return [on_error(item, e) for item in chunk]
+
+        workers = max(1, min(max_workers, len(chunks)))
+        if workers == 1:
+            chunk_results = [_fetch_chunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # map() yields in submission order, which keeps output aligned
+                chunk_results = list(executor.map(_fetch_chunk, chunks))
+
+        return [item for chunk in chunk_results for item in chunk]
+
+    def mget(
+        self,
+        index: str,
+        ids: List[str],
+        source: Optional[Union[bool, List[str]]] = None,
+        chunk_size: int = DEFAULT_MGET_CHUNK_SIZE,
+        max_workers: int = DEFAULT_BATCH_WORKERS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get many documents by ID with chunked, parallel ``_mget`` requests.
+
+        Args:
+            index: Name of the index
+            ids: Document IDs to fetch
+            source: ``_source`` filter (True/False or list of fields)
+            chunk_size: Maximum number of IDs per ``_mget`` request
+            max_workers: Maximum number of chunks in flight at once
+
+        Returns:
+            One entry per requested ID, in input order. Each entry is the
+            ``_mget`` doc (``found`` True/False), or carries an ``error`` key
+            if the lookup for that ID failed.
+
+        Raises:
+            ValidationError: If input validation fails
+        """
+        if not index:
+            raise ValidationError("Index name cannot be empty")
+        if not ids or not isinstance(ids, list):
+            raise ValidationError("IDs must be a non-empty list")
+        if chunk_size < 1:
+            raise ValidationError("chunk_size must be a positive integer")
+
+        self._ensure_connected()
+        es = self._client.get_client()
+
+        def _fetch(chunk: Sequence[str]) -> List[Dict[str, Any]]:
+            params: Dict[str, Any] = {"index": index, "ids": list(chunk)}
+            if source is not None:
+                params["_source"] = source
+            response = self._handle_response(es.mget(**params))
+            return list(response.get("docs", []))
+
+        def _on_error(doc_id: str, error: Exception) -> Dict[str, Any]:
+            return {
+                "_index": index,
+                "_id": doc_id,
+                "error": {"type": "request_failed", "reason": str(error)},
+            }
+
+        logger.debug(f"Fetching {len(ids)} documents from '{index}' via mget")
+        return self._run_chunks(ids, chunk_size, max_workers, _fetch, _on_error)
+
+    get_many = mget
+
+    def msearch(
+        self,
+        index: str,
+        queries: List[Dict[str, Any]],
+        options: Optional[Dict[str, Any]] = None,
+        chunk_size: int = DEFAULT_MSEARCH_CHUNK_SIZE,
+        max_workers: int = DEFAULT_BATCH_WORKERS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run many searches with chunked, parallel ``_msearch`` requests.
+
+        Args:
+            index: Name of the index (or pattern) searched by every query
+            queries: Elasticsearch query DSL bodies, as accepted by ``search``
+            options: Search options applied to every query (size, sort, ...)
+            chunk_size: Maximum number of searches per ``_msearch`` request
+            max_workers: Maximum number of chunks in flight at once
+
+        Returns:
+            One search response per query, in input order. Failed searches
+            are returned as ``{"error": {...}}`` entries.
+
+        Raises:
+            ValidationError: If input validation fails
+        """
+        if not index:
+            raise ValidationError("Index name cannot be empty")
+        if not queries or not isinstance(queries, list):
+            raise ValidationError("Queries must be a non-empty list")
+        if chunk_size < 1:
+            raise ValidationError("chunk_size must be a positive integer")
+
+        bodies = [self._build_search_body(query, options) for query in queries]
+
+        self._ensure_connected()
+        es = self._client.get_client()
+
+        def _fetch(chunk: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            searches: List[Dict[str, Any]] = []
+            for body in chunk:
+                searches.append({"index": index})
+                searches.append(body)
+            response = self._handle_response(es.msearch(searches=searches))
+            return list(response.get("responses", []))
+
+        def _on_error(body: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+            return {"error": {"type": "request_failed", "reason": str(error)}}
+
+        logger.debug(f"Running {len(bodies)} searches on '{index}' via msearch")
+        return self._run_chunks(bodies, chunk_size, max_workers, _fetch, _on_error)
+
+    search_many = msearch
+
+    # ------------------------------------------------------------------
+    # Server-side by-query operations
+    # Run as sliced background tasks so large cleanups execute in parallel
+    # on the cluster instead of being paged through the client.
+    # ------------------------------------------------------------------
+
+    def delete_by_query(
+        self,
+        index: str,
+        query: Dict[str, Any],
+        slices: Union[int, str] = "auto",
+        requests_per_second: Optional[float] = None,
+        refresh: bool = False,
+        wait_for_completion: bool = True,
+        on_progress: Optional[Callable[[TaskProgress], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> TaskProgress:
+        """
+        Delete all documents matching a query as a server-side task.
+
+        Args:
+            index: Name of the index (or pattern)
+            query: Elasticsearch query DSL
+            slices: Number of parallel slices, or ``"auto"``
+            requests_per_second: Throttle (None for unthrottled)
+            refresh: Whether to refresh the index when done
+            wait_for_completion: Poll until done; if False return right after
+                submission with only ``task_id`` set
+            on_progress: Called with each progress snapshot while waiting
+            timeout: Maximum seconds to wait (the task keeps running)
+
+        Returns:
+            Task progress snapshot (final when waiting)
+        """
+        self._invalidate_cache(index)
+        return TaskRunner(self._client).run(
+            "delete_by_query",
+            index,
+            query,
+            wait_for_completion=wait_for_completion,
+            on_progress=on_progress,
+            timeout=timeout,
+            slices=slices,
+            requests_per_second=requests_per_second,
+            refresh=refresh,
+        )
+
+    def update_by_query(
+        self,
+        index: str,
+        query: Dict[str, Any],
+        script: Optional[Dict[str, Any]] = None,
+        slices: Union[int, str] = "auto",
+        requests_per_second: Optional[float] = None,
+        refresh: bool = False,
+        wait_for_completion: bool = True,
+        on_progress: Optional[Callable[[TaskProgress], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> TaskProgress:
+        """
+        Update all documents matching a query as a server-side task.
+
+        Args:
+            index: Name of the index (or pattern)
+            query: Elasticsearch query DSL
+            script: Painless script applied to each document (None to just
+                reindex in place, e.g. to pick up mapping changes)
+            slices: Number of parallel slices, or ``"auto"``
+            requests_per_second: Throttle (None for unthrottled)
+            refresh: Whether to refresh the index when done
+            wait_for_completion: Poll until done; if False return right after
+                submission with only ``task_id`` set
+            on_progress: Called with each progress snapshot while waiting
+            timeout: Maximum seconds to wait (the task keeps running)
+
+        Returns:
+            Task progress snapshot (final when waiting)
+        """
+        self._invalidate_cache(index)
+        return TaskRunner(self._client).run(
+            "update_by_query",
+            index,
+            query,
+            wait_for_completion=wait_for_completion,
+            on_progress=on_progress,
+            timeout=timeout,
+            script=script,
+            slices=slices,
+            requests_per_second=requests_per_second,
+            refresh=refresh,
+        )
+
     # ------------------------------------------------------------------
     # Synchronous bulk operations
     # Absorbed from the former BulkDocumentManager. These use the raw
@@ -356,7 +720,14 @@ class DocumentManager(BaseManager):
     # ------------------------------------------------------------------
 
     def bulk_index_sync(
-        self, index: str, documents: List[Dict[str, Any]], refresh: bool = False
+        self,
+        index: str,
+        documents: List[Dict[str, Any]],
+        refresh: bool = False,
+        thread_count: Optional[int] = None,
+        queue_size: int = DEFAULT_BULK_QUEUE_SIZE,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_errors: int = DEFAULT_MAX_COLLECTED_ERRORS,
     ) -> Dict[str, Any]:
         """
         Synchronously index multiple documents in bulk.
@@ -372,9 +743,15 @@ class DocumentManager(BaseManager):
             index: Name of the target index.
             documents: List of document dicts.
             refresh: Whether to refresh the index immediately after the operation.
+            thread_count: When set, send ``chunk_size`` chunks from this many
+                threads (see ``parallel_bulk_sync``) instead of one request.
+            queue_size: Chunks buffered ahead of the worker threads.
+            chunk_size: Documents per bulk request in threaded mode.
+            max_errors: Failed items kept in the threaded-mode summary.
 
         Returns:
-            Dict containing the raw Elasticsearch bulk response.
+            Dict containing the raw Elasticsearch bulk response, or the
+            ``parallel_bulk_sync`` summary when ``thread_count`` is set.
 
         Raises:
             ValidationError: If input validation fails.
@@ -387,6 +764,16 @@ class DocumentManager(BaseManager):
         if not all(isinstance(doc, dict) for doc in documents):
             raise ValidationError("All documents must be dictionaries")
 
+        if thread_count is not None:
+            return self.parallel_bulk_sync(
+                self._index_actions(index, documents),
+                refresh_index=index if refresh else None,
+                thread_count=thread_count,
+                queue_size=queue_size,
+                chunk_size=chunk_size,
+                max_errors=max_errors,
+            )
+
         try:
             operations: List[Dict[str, Any]] = []
             for doc in documents:
@@ -402,19 +789,29 @@ class DocumentManager(BaseManager):
                 operations.append(doc_copy)
 
             self._ensure_connected()
-            return self._handle_response(
-                self._client.get_client().bulk(
-                    operations=operations,
-                    refresh="true" if refresh else "false",
+            try:
+                return self._handle_response(
+                    self._client.get_client().bulk(
+                        operations=operations,
+                        refresh="true" if refresh else "false",
+                    )
                 )
-            )
+            finally:
+                self._invalidate_cache(index)
         except (ValidationError, DocumentError):
             raise
         except Exception as e:
             raise DocumentError(f"Failed to bulk index documents: {str(e)}")
 
     def bulk_delete_sync(
-        self, index: str, ids: List[str], refresh: bool = False
+        self,
+        index: str,
+        ids: List[str],
+        refresh: bool = False,
+        thread_count: Optional[int] = None,
+        queue_size: int = DEFAULT_BULK_QUEUE_SIZE,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_errors: int = DEFAULT_MAX_COLLECTED_ERRORS,
     ) -> Dict[str, Any]:
         """
         Synchronously delete multiple documents in bulk.
@@ -423,9 +820,15 @@ class DocumentManager(BaseManager):
             index: Name of the target index.
             ids: List of document IDs to delete.
             refresh: Whether to refresh the index immediately after the operation.
+            thread_count: When set, send ``chunk_size`` chunks from this many
+                threads (see ``parallel_bulk_sync``) instead of one request.
+            queue_size: Chunks buffered ahead of the worker threads.
+            chunk_size: IDs per bulk request in threaded mode.
+            max_errors: Failed items kept in the threaded-mode summary.
 
         Returns:
-            Dict containing the raw Elasticsearch bulk response.
+            Dict containing the raw Elasticsearch bulk response, or the
+            ``parallel_bulk_sync`` summary when ``thread_count`` is set.
 
         Raises:
             ValidationError: If input validation fails.
@@ -436,19 +839,156 @@ class DocumentManager(BaseManager):
         if not ids or not isinstance(ids, list):
             raise ValidationError("IDs must be a non-empty list")
 
+        if thread_count is not None:
+            actions = (
+                {"_op_type": "delete", "_index": index, "_id": doc_id} for doc_id in ids
+            )
+            return self.parallel_bulk_sync(
+                actions,
+                refresh_index=index if refresh else None,
+                thread_count=thread_count,
+                queue_size=queue_size,
+                chunk_size=chunk_size,
+                max_errors=max_errors,
+            )
+
         try:
             operations: List[Dict[str, Any]] = []
             for doc_id in ids:
                 operations.append({"delete": {"_index": index, "_id": doc_id}})
 
             self._ensure_connected()
-            return self._handle_response(
-                self._client.get_client().bulk(
-                    operations=operations,
-                    refresh="true" if refresh else "false",
+            try:
+                return self._handle_response(
+                    self._client.get_client().bulk(
+                        operations=operations,
+                        refresh="true" if refresh else "false",
+                    )
                 )
-            )
+            finally:
+                self._invalidate_cache(index)
         except (ValidationError, DocumentError):
             raise
         except Exception as e:
             raise DocumentError(f"Failed to bulk delete documents: {str(e)}")
+
+    # ------------------------------------------------------------------
+    # Thread-pooled sync bulk
+    # Chunks are built lazily from the action iterable and sent from a
+    # pool of threads, so sync callers get near-async throughput.
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _index_actions(
+        index: str, documents: Iterable[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield index actions without mutating the caller's documents."""
+        for doc in documents:
+            doc_copy = doc.copy()
+            doc_id = doc_copy.pop("_id", None)
+            action: Dict[str, Any] = {"_index": index, "_source": doc_copy}
+            if doc_id:
+                action["_id"] = doc_id
+            yield action
+
+    def stream_bulk_sync(
+        self,
+        actions: Iterable[Dict[str, Any]],
+        thread_count: int = DEFAULT_BATCH_WORKERS,
+        queue_size: int = DEFAULT_BULK_QUEUE_SIZE,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> Iterator[Tuple[bool, Dict[str, Any]]]:
+        """
+        Send bulk actions from a thread pool, yielding per-item results.
+
+        Results are yielded chunk by chunk as each bulk request completes;
+        item failures are yielded as ``(False, item)`` instead of raising.
+
+        Args:
+            actions: Iterable of bulk actions (``helpers.bulk`` format)
+            thread_count: Number of threads sending chunks
+            queue_size: Chunks buffered ahead of the worker threads
+            chunk_size: Actions per bulk request
+
+        Yields:
+            ``(ok, item)`` tuples, one per action
+
+        Raises:
+            ValidationError: If thread_count, queue_size or chunk_size is invalid
+            DocumentError: If a bulk request fails outright
+        """
+        if thread_count < 1 or queue_size < 1 or chunk_size < 1:
+            raise ValidationError(
+                "thread_count, queue_size and chunk_size must be positive integers"
+            )
+
+        self._ensure_connected()
+        try:
+            yield from helpers.parallel_bulk(
+                self._client.get_client(),
+                actions,
+                thread_count=thread_count,
+                queue_size=queue_size,
+                chunk_size=chunk_size,
+                raise_on_error=False,
+            )
+        except Exception as e:
+            raise DocumentError(f"Parallel bulk request failed: {str(e)}")
+
+    def parallel_bulk_sync(
+        self,
+        actions: Iterable[Dict[str, Any]],
+        refresh_index: Optional[str] = None,
+        thread_count: int = DEFAULT_BATCH_WORKERS,
+        queue_size: int = DEFAULT_BULK_QUEUE_SIZE,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_errors: int = DEFAULT_MAX_COLLECTED_ERRORS,
+        on_item: Optional[Callable[[bool, Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run bulk actions from a thread pool and summarise the results.
+
+        Args:
+            actions: Iterable of bulk actions (``helpers.bulk`` format)
+            refresh_index: Index to refresh once after all chunks complete
+                (refreshing per chunk would defeat the parallelism)
+            thread_count: Number of threads sending chunks
+            queue_size: Chunks buffered ahead of the worker threads
+            chunk_size: Actions per bulk request
+            max_errors: Maximum failed items kept in the summary
+            on_item: Called with ``(ok, item)`` for every result as it arrives
+
+        Returns:
+            Dict with ``success_count``, ``error_count`` and up to
+            ``max_errors`` failed items in ``errors``
+        """
+        collector = BulkErrorCollector(max_errors)
+        written: Set[str] = set()
+        try:
+            for ok, item in self.stream_bulk_sync(
+                actions,
+                thread_count=thread_count,
+                queue_size=queue_size,
+                chunk_size=chunk_size,
+            ):
+                collector.add(ok, item)
+                for result in item.values():
+                    if isinstance(result, dict) and result.get("_index"):
+                        written.add(result["_index"])
+                if on_item is not None:
+                    on_item(ok, item)
+        finally:
+            for written_index in written:
+                self._invalidate_cache(written_index)
+
+        if refresh_index:
+            try:
+                self._client.get_client().indices.refresh(index=refresh_index)
+            except Exception as e:
+                raise DocumentError(f"Failed to refresh '{refresh_index}': {str(e)}")
+
+        logger.info(
+            f"Parallel bulk complete: {collector.success_count} successful, "
+            f"{collector.error_count} failed"
+        )
+        return collector.to_dict()
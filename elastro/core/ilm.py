@@ -4,8 +4,8 @@ ILM (Index Lifecycle Management) module.
 This module provides functionality for managing Index Lifecycle Policies.
 """
 
-from typing import Dict, List, Any, Optional
-from elastro.core.client import ElasticsearchClient
+from typing import Any, Dict, List, Optional
+
 from elastro.core.base import BaseManager
 from elastro.core.errors import OperationError, ValidationError
 from elastro.core.logger import get_logger
@@ -85,7 +85,8 @@ class IlmManager(BaseManager):
 
         try:
             logger.info(f"Creating/Updating ILM policy '{name}'")
-            # If the user passed the full wrapper {"policy": {...}}, unwrap it or pass as is?
+            # If the user passed the full wrapper {"policy": {...}}, unwrap it
+            # or pass as is?
             # put_lifecycle expects 'policy' arg to contain phases.
             # Usually strict JSON is {"policy": {"phases": ...}}
 
@@ -149,6 +150,52 @@ class IlmManager(BaseManager):
             logger.error(f"Failed to explain lifecycle for '{index}': {str(e)}")
             raise OperationError(f"Failed to explain lifecycle for '{index}': {str(e)}")
 
+    def explain_lifecycles(
+        self,
+        index: str = "*",
+        *,
+        only_managed: bool = False,
+        only_errors: bool = False,
+        filter_path: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Explain the lifecycle state of every index matching an expression.
+
+        Args:
+            index: Index name, comma-separated list or wildcard pattern (default: "*")
+            only_managed: Only return indices managed by an ILM policy
+            only_errors: Only return indices in the ERROR step
+            filter_path: Optional response filter, e.g. "indices.*.step"
+
+        Returns:
+            Explanations keyed by index name
+        """
+        if not index:
+            raise ValidationError("Index expression is required")
+
+        try:
+            logger.debug(
+                f"Explaining lifecycles for '{index}' "
+                f"(only_managed={only_managed}, only_errors={only_errors})"
+            )
+            self._ensure_connected()
+            params: Dict[str, Any] = {"index": index}
+            if only_managed:
+                params["only_managed"] = True
+            if only_errors:
+                params["only_errors"] = True
+            if filter_path:
+                params["filter_path"] = filter_path
+            response = self._client.get_client().ilm.explain_lifecycle(**params)
+            body = self._handle_response(response)
+            indices = body.get("indices") if isinstance(body, dict) else None
+            return dict(indices) if isinstance(indices, dict) else {}
+        except Exception as e:
+            logger.error(f"Failed to explain lifecycles for '{index}': {str(e)}")
+            raise OperationError(
+                f"Failed to explain lifecycles for '{index}': {str(e)}"
+            )
+
     def start_ilm(self) -> bool:
         """Start ILM service."""
         try:
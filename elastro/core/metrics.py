@@ -0,0 +1,393 @@
+"""
+Transport metrics module.
+
+This module records per-API request metrics for the synchronous and async
+clients: call and error counts, retries, request/response bytes, and HDR-style
+latency histograms for both the whole call and the time spent waiting on the
+node (network plus cluster). The gap between the two is time spent in the
+client (serialization, deserialization and retry bookkeeping).
+
+Metrics are kept in one process-wide registry (``get_metrics()``) so that
+every client built in a process, including the pooled sync and async clients
+of the GUI server, reports into the same place.
+"""
+
+import contextvars
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from elastic_transport import AiohttpHttpNode, Urllib3HttpNode
+from elastic_transport.client_utils import DEFAULT
+from elasticsearch import AsyncElasticsearch, Elasticsearch
+
+# Sub-buckets per power of two; 64 gives ~1.6% relative precision.
+_SUB_BUCKET_BITS = 6
+_SUB_BUCKET_HALF = 1 << _SUB_BUCKET_BITS
+_SUB_BUCKET_COUNT = _SUB_BUCKET_HALF * 2
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+
+    Values are recorded in microseconds. Values below 128us are counted
+    exactly; above that every power-of-two range is split into 64 equal
+    sub-buckets, so any reported value is within ~1.6% of the true value
+    while memory stays proportional to the number of distinct buckets hit.
+    """
+
+    def __init__(self) -> None:
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    @staticmethod
+    def _bucket(value: int) -> int:
+        if value < _SUB_BUCKET_COUNT:
+            return value
+        shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+        return (
+            _SUB_BUCKET_COUNT
+            + (shift - 1) * _SUB_BUCKET_HALF
+            + ((value >> shift) - _SUB_BUCKET_HALF)
+        )
+
+    @staticmethod
+    def _bucket_value(bucket: int) -> int:
+        """Return the highest value that maps to a bucket."""
+        if bucket < _SUB_BUCKET_COUNT:
+            return bucket
+        offset = bucket - _SUB_BUCKET_COUNT
+        shift = offset // _SUB_BUCKET_HALF + 1
+        sub = offset % _SUB_BUCKET_HALF + _SUB_BUCKET_HALF
+        return ((sub + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """Record one latency sample."""
+        value = max(0, int(seconds * 1_000_000))
+        bucket = self._bucket(value)
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total_us += value
+        if self.min_us is None or value < self.min_us:
+            self.min_us = value
+        if value > self.max_us:
+            self.max_us = value
+
+    def percentile(self, percentile: float) -> float:
+        """Return the latency in milliseconds at the given percentile."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(round(percentile / 100.0 * self.count)))
+        seen = 0
+        for bucket in sorted(self._counts):
+            seen += self._counts[bucket]
+            if seen >= rank:
+                return min(self._bucket_value(bucket), self.max_us) / 1000.0
+        return self.max_us / 1000.0
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the samples of another histogram to this one."""
+        for bucket, count in other._counts.items():
+            self._counts[bucket] = self._counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None and (
+            self.min_us is None or other.min_us < self.min_us
+        ):
+            self.min_us = other.min_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_us / self.count / 1000.0 if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {
+            "min": (self.min_us or 0) / 1000.0,
+            "mean": round(self.mean_ms, 3),
+            "max": self.max_us / 1000.0,
+        }
+        for p in PERCENTILES:
+            result[f"p{p:g}"] = self.percentile(p)
+        return result
+
+
+@dataclass
+class EndpointStats:
+    """Aggregated metrics for one API endpoint (e.g. ``search``, ``bulk``)."""
+
+    endpoint: str
+    count: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    node_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "endpoint": self.endpoint,
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "latency_ms": self.latency.to_dict(),
+            "node_latency_ms": self.node_latency.to_dict(),
+            # Mean time spent in the client rather than waiting on the node
+            "client_overhead_ms": round(
+                max(0.0, self.latency.mean_ms - self.node_latency.mean_ms), 3
+            ),
+        }
+
+
+@dataclass
+class _CallRecord:
+    """Node-level counters for the API call running in the current context."""
+
+    attempts: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    node_seconds: float = 0.0
+
+
+_current_call: "contextvars.ContextVar[Optional[_CallRecord]]" = contextvars.ContextVar(
+    "elastro_current_call", default=None
+)
+
+
+class TransportMetrics:
+    """Thread-safe registry of per-endpoint request metrics."""
+
+    def __init__(self) -> None:
+        self._endpoints: Dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def record(
+        self,
+        endpoint: str,
+        seconds: float,
+        error: bool = False,
+        attempts: int = 1,
+        bytes_out: int = 0,
+        bytes_in: int = 0,
+        node_seconds: Optional[float] = None,
+    ) -> None:
+        """Record one completed API call."""
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = EndpointStats(endpoint)
+            stats.count += 1
+            if error:
+                stats.errors += 1
+            stats.retries += max(0, attempts - 1)
+            stats.bytes_out += bytes_out
+            stats.bytes_in += bytes_in
+            stats.latency.record(seconds)
+            if node_seconds is not None:
+                stats.node_latency.record(node_seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all metrics plus totals as plain dicts."""
+        with self._lock:
+            endpoints: List[Dict[str, Any]] = [
+                stats.to_dict()
+                for stats in sorted(
+                    self._endpoints.values(), key=lambda s: s.count, reverse=True
+                )
+            ]
+            total = LatencyHistogram()
+            for stats in self._endpoints.values():
+                total.merge(stats.latency)
+        return {
+            "since": self.started_at,
+            "requests": sum(e["count"] for e in endpoints),
+            "errors": sum(e["errors"] for e in endpoints),
+            "retries": sum(e["retries"] for e in endpoints),
+            "bytes_out": sum(e["bytes_out"] for e in endpoints),
+            "bytes_in": sum(e["bytes_in"] for e in endpoints),
+            "latency_ms": total.to_dict(),
+            "endpoints": endpoints,
+        }
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._endpoints.clear()
+            self.started_at = time.time()
+
+
+_metrics = TransportMetrics()
+
+
+def get_metrics() -> TransportMetrics:
+    """Return the process-wide metrics registry."""
+    return _metrics
+
+
+class InstrumentedElasticsearch(Elasticsearch):
+    """
+    Elasticsearch client that records every API call in ``get_metrics()``.
+
+    ``options()`` clones keep the subclass, so helpers such as
+    ``helpers.bulk`` are measured too.
+    """
+
+    def perform_request(  # type: ignore[override]
+        self,
+        method: str,
+        path: str,
+        *,
+        endpoint_id: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Any:
+        call = _CallRecord()
+        token = _current_call.set(call)
+        start = time.perf_counter()
+        error = True
+        try:
+            response = super().perform_request(
+                method, path, endpoint_id=endpoint_id, **kwargs
+            )
+            error = False
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            _current_call.reset(token)
+            _metrics.record(
+                endpoint_id or method.lower(),
+                elapsed,
+                error=error,
+                attempts=call.attempts,
+                bytes_out=call.bytes_out,
+                bytes_in=call.bytes_in,
+                node_seconds=call.node_seconds if call.attempts else None,
+            )
+
+
+class InstrumentedUrllib3HttpNode(Urllib3HttpNode):
+    """HTTP node that adds attempt, byte and wait-time counts to the current call.
+
+    Request bytes are counted before ``http_compress`` gzips the body.
+    """
+
+    def perform_request(  # type: ignore[override]
+        self,
+        method: str,
+        target: str,
+        body: Optional[bytes] = None,
+        headers: Any = None,
+        request_timeout: Any = DEFAULT,
+    ) -> Any:
+        call = _current_call.get()
+        if call is None:
+            return super().perform_request(
+                method,
+                target,
+                body=body,
+                headers=headers,
+                request_timeout=request_timeout,
+            )
+
+        call.attempts += 1
+        call.bytes_out += len(body) if body else 0
+        start = time.perf_counter()
+        try:
+            response = super().perform_request(
+                method,
+                target,
+                body=body,
+                headers=headers,
+                request_timeout=request_timeout,
+            )
+        finally:
+            call.node_seconds += time.perf_counter() - start
+        call.bytes_in += len(response.body)
+        return response
+
+
+class InstrumentedAsyncElasticsearch(AsyncElasticsearch):
+    """``InstrumentedElasticsearch`` for the async client.
+
+    The current call lives in a context variable, so concurrent calls on one
+    event loop are counted separately.
+    """
+
+    async def perform_request(  # type: ignore[override]
+        self,
+        method: str,
+        path: str,
+        *,
+        endpoint_id: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Any:
+        call = _CallRecord()
+        token = _current_call.set(call)
+        start = time.perf_counter()
+        error = True
+        try:
+            response = await super().perform_request(
+                method, path, endpoint_id=endpoint_id, **kwargs
+            )
+            error = False
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            _current_call.reset(token)
+            _metrics.record(
+                endpoint_id or method.lower(),
+                elapsed,
+                error=error,
+                attempts=call.attempts,
+                bytes_out=call.bytes_out,
+                bytes_in=call.bytes_in,
+                node_seconds=call.node_seconds if call.attempts else None,
+            )
+
+
+class InstrumentedAiohttpHttpNode(AiohttpHttpNode):
+    """``InstrumentedUrllib3HttpNode`` for the async client."""
+
+    async def perform_request(  # type: ignore[override]
+        self,
+        method: str,
+        target: str,
+        body: Optional[bytes] = None,
+        headers: Any = None,
+        request_timeout: Any = DEFAULT,
+    ) -> Any:
+        call = _current_call.get()
+        if call is None:
+            return await super().perform_request(
+                method,
+                target,
+                body=body,
+                headers=headers,
+                request_timeout=request_timeout,
+            )
+
+        call.attempts += 1
+        call.bytes_out += len(body) if body else 0
+        start = time.perf_counter()
+        try:
+            response = await super().perform_request(
+                method,
+                target,
+                body=body,
+                headers=headers,
+                request_timeout=request_timeout,
+            )
+        finally:
+            call.node_seconds += time.perf_counter() - start
+        call.bytes_in += len(response.body)
+        return response
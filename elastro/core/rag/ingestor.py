@@ -6,11 +6,12 @@ Updated with Semantic Chunking and BM25 Support.
 """
 
 import os
-import json
-from typing import List, Dict, Any, Generator, Optional
+from typing import Any, Dict, Generator, Optional
+
 from elastro.core.client import ElasticsearchClient
-from elastro.core.rag.ast_parser import ASTParser
+from elastro.core.document import DocumentManager
 from elastro.core.logger import get_logger
+from elastro.core.rag.ast_parser import ASTParser
 
 logger = get_logger(__name__)
 
@@ -23,7 +24,8 @@ class GraphRAGManager:
         self.index_name = index_name
         self.ast_parser = ASTParser()
 
-        # We explicitly target the agent's core polyglot languages + Markdown for KI Bridging
+        # We explicitly target the agent's core polyglot languages + Markdown
+        # for KI Bridging
         self.supported_extensions = {
             ".py",
             ".go",
@@ -83,12 +85,15 @@ class GraphRAGManager:
                 ],
             )
             logger.info(
-                "Successfully deployed ELSER inference pipeline framework (Enterprise Mode)."
+                "Successfully deployed ELSER inference pipeline framework "
+                "(Enterprise Mode)."
             )
             pipeline_deployed = True
         except Exception as e:
             logger.warning(
-                f"Could not scaffold ELSER pipeline (requires ML nodes or Platinum/Enterprise license). Falling back to Open Source BM25 Mode. Error: {e}"
+                "Could not scaffold ELSER pipeline (requires ML nodes or "
+                "Platinum/Enterprise license). Falling back to Open Source BM25 "
+                f"Mode. Error: {e}"
             )
 
         # Simple existence check without causing hard errors if it doesn't
@@ -179,7 +184,8 @@ class GraphRAGManager:
 
     def ingest_repository(self, repo_path: str) -> int:
         """
-        Orchestrates Elasticsearch bulk insertion directly leveraging the client helpers.
+        Orchestrates Elasticsearch bulk insertion directly leveraging the client
+        helpers.
         """
         from elasticsearch.helpers import bulk
 
@@ -199,7 +205,8 @@ class GraphRAGManager:
     def update_file(self, file_path: str, repo_path: Optional[str] = None) -> int:
         """
         Surgically updates a specific file's AST chunks in Elasticsearch.
-        Uses bulk processing for deletions to comply with performance constraints.
+        Stale chunks are removed with a server-side delete-by-query, then the
+        file is re-parsed and bulk indexed.
         """
         from elasticsearch.helpers import bulk
 
@@ -220,29 +227,16 @@ class GraphRAGManager:
 
         self.scaffold_index()
 
-        # 1. Yield bulk delete ops for stale chunks matching file_path
-        def generate_deletes() -> Generator[Dict[str, Any], None, None]:
-            query = {
-                "query": {"term": {"file_path": rel_path}},
-                "_source": False,
-                "size": 1000,
-            }
-            try:
-                res = self.client.client.search(index=self.index_name, body=query)
-                for hit in res.get("hits", {}).get("hits", []):
-                    yield {
-                        "_op_type": "delete",
-                        "_index": self.index_name,
-                        "_id": hit["_id"],
-                    }
-            except Exception as e:
-                logger.warning(f"Could not fetch existing chunks for deletion: {e}")
-
-        # Execute deletes
+        # 1. Delete stale chunks for this file server-side in one task
         try:
-            bulk(self.client.client, generate_deletes(), refresh=True, stats_only=True)
+            DocumentManager(self.client).delete_by_query(
+                self.index_name,
+                {"term": {"file_path": rel_path}},
+                slices=1,
+                refresh=True,
+            )
         except Exception as e:
-            logger.warning(f"Failed to bulk delete stale AST chunks: {e}")
+            logger.warning(f"Failed to delete stale AST chunks: {e}")
 
         # 2. Re-ingest
         def scan_single_file() -> Generator[Dict[str, Any], None, None]:
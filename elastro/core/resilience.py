@@ -0,0 +1,499 @@
+"""
+Client-side resilience module.
+
+This module keeps an overloaded cluster from being made worse by its own
+clients. Two mechanisms wrap the transport of every client, sync and async:
+
+* A token-bucket **retry budget** per client: every retry spends a token and
+  tokens refill at a fixed rate, so when many requests fail at once only a
+  bounded number of them are retried and the rest fail straight away. Each
+  client gets its own budget so that one client's retry settings and retry
+  storm cannot starve another.
+* A per-host **circuit breaker**, shared by every client in the process:
+  consecutive 429/5xx responses or connection failures open the circuit for
+  that host, requests to it then fail fast without touching the network, and
+  after a cool-down a single half-open probe decides whether to close it
+  again or back off for longer.
+
+Retries also get exponential backoff with full jitter instead of the
+transport's immediate retries.
+"""
+
+import asyncio
+import inspect
+import random
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from elastic_transport import ConnectionError as TransportConnectionError
+from elastic_transport import ConnectionTimeout, TransportError
+from elastic_transport.client_utils import DEFAULT, resolve_default
+
+from elastro.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(TransportError):
+    """
+    Raised instead of sending a request to a host whose circuit is open.
+
+    This is deliberately not a connection error: the transport would mark the
+    node dead, sniff and retry on a connection error, while an open circuit
+    means the request must fail fast.
+    """
+
+
+class RetryBudget:
+    """
+    Thread-safe token bucket that limits the retries of one client.
+
+    Args:
+        capacity: Maximum number of retries that can be spent in a burst
+        refill_rate: Tokens added per second
+    """
+
+    def __init__(self, capacity: float = 20, refill_rate: float = 2.0) -> None:
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.granted = 0
+        self.denied = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_rate)
+
+    def try_acquire(self, cost: float = 1.0) -> bool:
+        """Spend ``cost`` tokens for one retry; return False if the budget is spent."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= cost:
+                self._tokens -= cost
+                self.granted += 1
+                return True
+            self.denied += 1
+            return False
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tokens": round(self.tokens, 2),
+            "capacity": self.capacity,
+            "refill_rate": self.refill_rate,
+            "granted": self.granted,
+            "denied": self.denied,
+        }
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one host.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit
+        reset_timeout: Seconds the circuit stays open before a half-open probe
+        max_reset_timeout: Upper bound for the open period, which doubles each
+            time a half-open probe fails and resets once a probe succeeds
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 1.0,
+        max_reset_timeout: float = 30.0,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened = 0
+        self._open_for = reset_timeout
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return whether a request may be sent to the host now."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self._open_for:
+                    return False
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+            # Half-open: let exactly one probe through at a time
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def release_probe(self) -> None:
+        """Let another half-open probe through without recording an outcome."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._probe_in_flight = False
+            if self.state != CLOSED:
+                logger.info("Circuit closed after a successful probe")
+            self.state = CLOSED
+            self._open_for = self.reset_timeout
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+                self._open_for = min(self._open_for * 2, self.max_reset_timeout)
+                self._open()
+            elif self.state == CLOSED and self.failures >= self.failure_threshold:
+                self._open_for = self.reset_timeout
+                self._open()
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.opened += 1
+        self._opened_at = time.monotonic()
+        logger.warning(
+            f"Circuit opened after {self.failures} consecutive failures; "
+            f"retrying in {self._open_for:.1f}s"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "times_opened": self.opened,
+                "open_for": self._open_for,
+            }
+
+
+class Resilience:
+    """Per-host circuit breakers and the retry budgets of live clients."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._budgets: "weakref.WeakSet[RetryBudget]" = weakref.WeakSet()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def retry_budget(self, settings: Dict[str, Any]) -> RetryBudget:
+        """Create a retry budget for one client from ``settings``.
+
+        The budget is tracked for ``snapshot`` until its client is garbage
+        collected.
+        """
+        budget = RetryBudget(
+            capacity=settings.get("retry_budget", 20),
+            refill_rate=settings.get("retry_refill_rate", 2.0),
+        )
+        with self._lock:
+            self._budgets.add(budget)
+        return budget
+
+    def breaker(self, host: str, settings: Dict[str, Any]) -> CircuitBreaker:
+        """Return the circuit breaker for ``host``, creating it on first use."""
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(
+                    failure_threshold=settings.get("failure_threshold", 5),
+                    reset_timeout=settings.get("reset_timeout", 1.0),
+                    max_reset_timeout=settings.get("max_reset_timeout", 30.0),
+                )
+            return breaker
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            budgets = [budget.stats() for budget in self._budgets]
+            breakers = dict(self._breakers)
+        return {
+            "retry_budget": _combine_budget_stats(budgets),
+            "circuit_breakers": {
+                host: breaker.stats() for host, breaker in breakers.items()
+            },
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._budgets = weakref.WeakSet()
+            self._breakers.clear()
+
+
+def _combine_budget_stats(budgets: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Sum the stats of several clients' retry budgets into one summary."""
+    if not budgets:
+        return None
+    combined: Dict[str, Any] = {
+        key: sum(budget[key] for budget in budgets)
+        for key in ("tokens", "capacity", "refill_rate", "granted", "denied")
+    }
+    combined["tokens"] = round(combined["tokens"], 2)
+    combined["clients"] = len(budgets)
+    return combined
+
+
+_resilience = Resilience()
+
+
+def get_resilience() -> Resilience:
+    """Return the process-wide resilience state."""
+    return _resilience
+
+
+def _is_overload_status(status: int) -> bool:
+    return status == 429 or status >= 500
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Exponential backoff with full jitter for the given retry attempt (1-based)."""
+    return random.uniform(0, min(cap, base * (2 ** (attempt - 1))))
+
+
+def _is_async(base: type) -> bool:
+    return inspect.iscoroutinefunction(getattr(base, "perform_request", None))
+
+
+def _record_exception(breaker: CircuitBreaker, exc: BaseException) -> None:
+    if isinstance(exc, (TransportConnectionError, ConnectionTimeout)):
+        breaker.record_failure()
+    else:
+        # Not the cluster's fault (or a cancelled request); free a half-open
+        # probe slot
+        breaker.release_probe()
+
+
+def _record_response(breaker: CircuitBreaker, response: Any) -> None:
+    if _is_overload_status(response.meta.status):
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
+def circuit_breaking_node_class(base: type, settings: Dict[str, Any]) -> type:
+    """
+    Build a node class that consults the host's circuit breaker per request.
+
+    The breaker is shared by every node for the same ``base_url`` in the
+    process, so all clients, sync and async, back off from an overloaded
+    host together. ``base`` may be a sync or an async node class.
+    """
+
+    if _is_async(base):
+
+        class AsyncCircuitBreakingNode(base):  # type: ignore[misc, valid-type]
+            async def perform_request(self, *args: Any, **kwargs: Any) -> Any:
+                breaker = _resilience.breaker(self.base_url, settings)
+                if not breaker.allow():
+                    raise CircuitOpenError(f"Circuit open for {self.base_url}")
+                try:
+                    response = await super().perform_request(*args, **kwargs)
+                except BaseException as e:
+                    _record_exception(breaker, e)
+                    raise
+                _record_response(breaker, response)
+                return response
+
+        return AsyncCircuitBreakingNode
+
+    class CircuitBreakingNode(base):  # type: ignore[misc, valid-type]
+        def perform_request(self, *args: Any, **kwargs: Any) -> Any:
+            breaker = _resilience.breaker(self.base_url, settings)
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {self.base_url}")
+            try:
+                response = super().perform_request(*args, **kwargs)
+            except BaseException as e:
+                _record_exception(breaker, e)
+                raise
+            _record_response(breaker, response)
+            return response
+
+    return CircuitBreakingNode
+
+
+class _RetryBudgetMixin:
+    """Retry decisions shared by the sync and async retry budget transports."""
+
+    _settings: Dict[str, Any]
+    retry_budget: RetryBudget
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.retry_budget = _resilience.retry_budget(self._settings)
+
+    def _should_retry(
+        self,
+        outcome: Any,
+        attempt: int,
+        max_retries: int,
+        retry_on_status: Any,
+        retry_on_timeout: bool,
+    ) -> bool:
+        """Whether to retry after ``outcome``, an exception or a response."""
+        if isinstance(outcome, ConnectionTimeout):
+            if not retry_on_timeout:
+                return False
+        elif not isinstance(outcome, TransportConnectionError):
+            if outcome.meta.status not in retry_on_status:
+                return False
+        if attempt >= max_retries:
+            return False
+        if not self.retry_budget.try_acquire():
+            logger.warning("Retry budget exhausted; not retrying")
+            return False
+        return True
+
+    def _backoff(
+        self, method: str, target: str, attempt: int, max_retries: int
+    ) -> float:
+        delay = backoff_delay(
+            attempt,
+            float(self._settings.get("backoff_base", 0.1)),
+            float(self._settings.get("backoff_max", 5.0)),
+        )
+        logger.warning(
+            f"Retrying {method} {target} in {delay:.2f}s "
+            f"(attempt {attempt} of {max_retries})"
+        )
+        return delay
+
+
+def retry_budget_transport(base: type, settings: Dict[str, Any]) -> type:
+    """
+    Build a transport class that retries against a per-client retry budget.
+
+    Every transport instance, and so every client, gets its own budget. Each
+    attempt is one ``perform_request`` call on ``base`` with retries
+    disabled; this loop decides whether to retry, spending a budget token and
+    sleeping for a jittered backoff first. Requests rejected by an open
+    circuit are never retried. ``base`` may be ``Transport`` or
+    ``AsyncTransport``.
+    """
+
+    if _is_async(base):
+
+        class AsyncRetryBudgetTransport(_RetryBudgetMixin, base):  # type: ignore[misc, valid-type]
+            _settings = settings
+
+            async def perform_request(
+                self,
+                method: str,
+                target: str,
+                *,
+                max_retries: Any = DEFAULT,
+                retry_on_status: Any = DEFAULT,
+                retry_on_timeout: Any = DEFAULT,
+                **kwargs: Any,
+            ) -> Any:
+                max_retries = resolve_default(max_retries, self.max_retries)
+                retry_on_status = resolve_default(retry_on_status, self.retry_on_status)
+                retry_on_timeout = resolve_default(
+                    retry_on_timeout, self.retry_on_timeout
+                )
+
+                errors: Tuple[Exception, ...] = ()
+                attempt = 0
+                while True:
+                    try:
+                        response = await super().perform_request(
+                            method,
+                            target,
+                            max_retries=0,
+                            retry_on_status=retry_on_status,
+                            retry_on_timeout=retry_on_timeout,
+                            **kwargs,
+                        )
+                    except (ConnectionTimeout, TransportConnectionError) as e:
+                        if not self._should_retry(
+                            e, attempt, max_retries, retry_on_status, retry_on_timeout
+                        ):
+                            e.errors = errors
+                            raise
+                        errors += (e,)
+                    else:
+                        if not self._should_retry(
+                            response,
+                            attempt,
+                            max_retries,
+                            retry_on_status,
+                            retry_on_timeout,
+                        ):
+                            return response
+
+                    attempt += 1
+                    await asyncio.sleep(
+                        self._backoff(method, target, attempt, max_retries)
+                    )
+
+        return AsyncRetryBudgetTransport
+
+    class RetryBudgetTransport(_RetryBudgetMixin, base):  # type: ignore[misc, valid-type]
+        _settings = settings
+
+        def perform_request(
+            self,
+            method: str,
+            target: str,
+            *,
+            max_retries: Any = DEFAULT,
+            retry_on_status: Any = DEFAULT,
+            retry_on_timeout: Any = DEFAULT,
+            **kwargs: Any,
+        ) -> Any:
+            max_retries = resolve_default(max_retries, self.max_retries)
+            retry_on_status = resolve_default(retry_on_status, self.retry_on_status)
+            retry_on_timeout = resolve_default(retry_on_timeout, self.retry_on_timeout)
+
+            errors: Tuple[Exception, ...] = ()
+            attempt = 0
+            while True:
+                try:
+                    response = super().perform_request(
+                        method,
+                        target,
+                        max_retries=0,
+                        retry_on_status=retry_on_status,
+                        retry_on_timeout=retry_on_timeout,
+                        **kwargs,
+                    )
+                except (ConnectionTimeout, TransportConnectionError) as e:
+                    if not self._should_retry(
+                        e, attempt, max_retries, retry_on_status, retry_on_timeout
+                    ):
+                        e.errors = errors
+                        raise
+                    errors += (e,)
+                else:
+                    if not self._should_retry(
+                        response,
+                        attempt,
+                        max_retries,
+                        retry_on_status,
+                        retry_on_timeout,
+                    ):
+                        return response
+
+                attempt += 1
+                time.sleep(self._backoff(method, target, attempt, max_retries))
+
+    return RetryBudgetTransport
@@ -0,0 +1,283 @@
+"""
+Search result cache module.
+
+This module provides an opt-in, in-process cache for search responses. Entries
+are keyed on the index expression plus the canonicalized request body, bounded
+by entry count and serialized size with LRU and TTL eviction, and invalidated
+per index when elastro writes to it or when the index's refresh/sequence-number
+fingerprint changes on the cluster.
+"""
+
+import fnmatch
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from elastro.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_VALIDATE_INTERVAL = 1.0
+
+# Per-shard counters that move whenever new data becomes searchable
+FINGERPRINT_FILTER_PATH = [
+    "indices.*.shards.*.refresh.total",
+    "indices.*.shards.*.seq_no.max_seq_no",
+]
+
+
+@dataclass
+class _CacheEntry:
+    index: str
+    payload: bytes
+    fingerprint: Optional[str]
+    expires_at: float
+
+
+class SearchCache:
+    """
+    Bounded LRU/TTL cache for search responses.
+
+    Responses are stored serialized, so every hit returns a fresh object that
+    callers may mutate freely, and the byte bound reflects real payload sizes.
+    All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        validate_interval: Optional[float] = DEFAULT_VALIDATE_INTERVAL,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached responses in bytes
+            ttl_seconds: Lifetime of an entry
+            validate_interval: How often (in seconds) an index fingerprint is
+                re-read from the cluster; None disables fingerprint validation
+                so entries are only dropped on TTL or elastro writes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.validate_interval = validate_interval
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._fingerprints: Dict[str, Tuple[float, str]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any]) -> Optional["SearchCache"]:
+        """Build a cache from ``elasticsearch.search_cache`` settings.
+
+        Returns:
+            A cache when ``enabled`` is set, otherwise None
+        """
+        if not settings or not settings.get("enabled"):
+            return None
+        return cls(
+            max_entries=int(settings.get("max_entries", DEFAULT_MAX_ENTRIES)),
+            max_bytes=int(settings.get("max_bytes", DEFAULT_MAX_BYTES)),
+            ttl_seconds=float(settings.get("ttl_seconds", DEFAULT_TTL_SECONDS)),
+            validate_interval=settings.get(
+                "validate_interval", DEFAULT_VALIDATE_INTERVAL
+            ),
+        )
+
+    @staticmethod
+    def make_key(index: str, body: Dict[str, Any]) -> str:
+        """Build a cache key from an index expression and a request body.
+
+        Key order in the body does not matter; the canonical JSON is hashed.
+        """
+        canonical = json.dumps(
+            [index, body], sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def fingerprint(self, index: str, probe: Callable[[], Any]) -> Optional[str]:
+        """
+        Return the current fingerprint of an index expression.
+
+        The probe is only called when the last reading is older than
+        ``validate_interval``; its result is hashed.
+
+        Args:
+            index: Index expression the fingerprint belongs to
+            probe: Callable returning the raw fingerprint data from the cluster
+
+        Returns:
+            The fingerprint, or None when validation is disabled
+        """
+        if self.validate_interval is None:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            cached = self._fingerprints.get(index)
+        if cached is not None and now - cached[0] < self.validate_interval:
+            return cached[1]
+
+        raw = json.dumps(probe(), sort_keys=True, default=str)
+        value = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        with self._lock:
+            self._fingerprints[index] = (now, value)
+        return value
+
+    def get(self, key: str, fingerprint: Optional[str] = None) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from ``make_key``
+            fingerprint: Current fingerprint of the entry's index
+
+        Returns:
+            A fresh copy of the cached response, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= time.monotonic() or (
+                fingerprint is not None and entry.fingerprint != fingerprint
+            ):
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            payload = entry.payload
+
+        return json.loads(payload)
+
+    def put(
+        self,
+        key: str,
+        index: str,
+        response: Any,
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        """
+        Store a response, evicting least recently used entries as needed.
+
+        Responses larger than ``max_bytes`` are not cached.
+        """
+        try:
+            payload = json.dumps(response, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not caching search response for '{index}': {str(e)}")
+            return
+        if len(payload) > self.max_bytes:
+            return
+
+        entry = _CacheEntry(
+            index=index,
+            payload=payload,
+            fingerprint=fingerprint,
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += len(payload)
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, index: Optional[str] = None) -> int:
+        """
+        Drop cached responses for an index, or everything when index is None.
+
+        An entry is dropped when any comma-separated part of its index
+        expression matches the given index, either exactly or as a wildcard
+        pattern. Searches through aliases are covered by fingerprint
+        validation instead.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if index is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._fingerprints.clear()
+                self._bytes = 0
+            else:
+                targets = [part.strip() for part in index.split(",") if part.strip()]
+                stale = [
+                    key
+                    for key, entry in self._entries.items()
+                    if _matches(entry.index, targets)
+                ]
+                for key in stale:
+                    self._remove(key)
+                for expression in list(self._fingerprints):
+                    if _matches(expression, targets):
+                        del self._fingerprints[expression]
+                removed = len(stale)
+            self.invalidations += removed
+        if removed:
+            logger.debug(f"Invalidated {removed} cached searches for '{index}'")
+        return removed
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self.invalidate(None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters and current usage."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.payload)
+
+
+def _matches(expression: str, targets: List[str]) -> bool:
+    """Check whether an index expression covers any of the target indices."""
+    for part in expression.split(","):
+        part = part.strip()
+        if part.startswith("-"):
+            continue
+        if part in ("_all", "*"):
+            return True
+        for target in targets:
+            if part == target or fnmatch.fnmatchcase(target, part):
+                return True
+            # A write to a pattern (e.g. clearing "logs-*") covers its members
+            if fnmatch.fnmatchcase(part, target):
+                return True
+    return False
@@ -0,0 +1,332 @@
+"""
+By-query task runner module.
+
+This module runs ``_delete_by_query`` and ``_update_by_query`` as server-side
+tasks: requests are sliced so shards work in parallel, optionally throttled
+with ``requests_per_second``, submitted with ``wait_for_completion=false`` and
+then tracked through the tasks API.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union, cast
+
+from elastro.core.base import BaseManager
+from elastro.core.errors import OperationError, ValidationError
+from elastro.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+BY_QUERY_ACTIONS = ("delete_by_query", "update_by_query")
+
+# Transport action names reported by the tasks API for each by-query API
+_TASK_ACTIONS = {
+    "indices:data/write/delete/byquery": "delete_by_query",
+    "indices:data/write/update/byquery": "update_by_query",
+}
+
+# Polling starts fast so small tasks return quickly, then backs off.
+_INITIAL_POLL_INTERVAL = 0.1
+
+
+@dataclass
+class TaskProgress:
+    """Progress snapshot of a by-query task."""
+
+    task_id: str
+    action: str
+    completed: bool = False
+    total: int = 0
+    created: int = 0
+    updated: int = 0
+    deleted: int = 0
+    batches: int = 0
+    version_conflicts: int = 0
+    noops: int = 0
+    requests_per_second: float = -1.0
+    throttled_millis: int = 0
+    running_time_seconds: float = 0.0
+    failures: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def processed(self) -> int:
+        return (
+            self.created
+            + self.updated
+            + self.deleted
+            + self.version_conflicts
+            + self.noops
+        )
+
+    @property
+    def percent(self) -> float:
+        if self.total == 0:
+            return 100.0 if self.completed else 0.0
+        return min(100.0, (self.processed / self.total) * 100)
+
+    @classmethod
+    def from_task(
+        cls, task_id: str, action: str, payload: Dict[str, Any]
+    ) -> "TaskProgress":
+        """Build a snapshot from a ``GET _tasks/<id>`` response."""
+        task = payload.get("task", {})
+        # The final response carries the authoritative counters and failures;
+        # while running only task.status is populated.
+        response = payload.get("response") or {}
+        status = response or task.get("status", {})
+        return cls(
+            task_id=task_id,
+            action=action,
+            completed=bool(payload.get("completed", False)),
+            total=int(status.get("total", 0)),
+            created=int(status.get("created", 0)),
+            updated=int(status.get("updated", 0)),
+            deleted=int(status.get("deleted", 0)),
+            batches=int(status.get("batches", 0)),
+            version_conflicts=int(status.get("version_conflicts", 0)),
+            noops=int(status.get("noops", 0)),
+            requests_per_second=float(status.get("requests_per_second", -1.0)),
+            throttled_millis=int(status.get("throttled_millis", 0)),
+            running_time_seconds=task.get("running_time_in_nanos", 0) / 1e9,
+            failures=list(response.get("failures", [])),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "task_id": self.task_id,
+            "action": self.action,
+            "completed": self.completed,
+            "total": self.total,
+            "created": self.created,
+            "updated": self.updated,
+            "deleted": self.deleted,
+            "batches": self.batches,
+            "version_conflicts": self.version_conflicts,
+            "noops": self.noops,
+            "requests_per_second": self.requests_per_second,
+            "throttled_millis": self.throttled_millis,
+            "running_time_seconds": round(self.running_time_seconds, 2),
+            "percent": round(self.percent, 1),
+            "failure_count": len(self.failures),
+        }
+
+
+class TaskRunner(BaseManager):
+    """
+    Runner for server-side delete-by-query and update-by-query tasks.
+
+    Tasks are submitted asynchronously and can be polled, waited on with a
+    progress callback, rethrottled while running, or cancelled.
+    """
+
+    def submit(
+        self,
+        action: str,
+        index: str,
+        query: Dict[str, Any],
+        script: Optional[Dict[str, Any]] = None,
+        slices: Union[int, str] = "auto",
+        requests_per_second: Optional[float] = None,
+        conflicts: str = "proceed",
+        refresh: bool = False,
+        max_docs: Optional[int] = None,
+    ) -> str:
+        """
+        Submit a by-query request as a background task.
+
+        Args:
+            action: ``delete_by_query`` or ``update_by_query``
+            index: Index name or pattern
+            query: Query DSL selecting the documents
+            script: Update script (``update_by_query`` only)
+            slices: Number of parallel slices, or ``"auto"`` (one per shard)
+            requests_per_second: Throttle in sub-requests per second (None or
+                -1 for unthrottled)
+            conflicts: ``proceed`` to count version conflicts, ``abort`` to stop
+            refresh: Whether to refresh affected shards when done
+            max_docs: Maximum number of documents to process
+
+        Returns:
+            The task ID (``<node_id>:<task_number>``)
+
+        Raises:
+            ValidationError: If input validation fails
+            OperationError: If the task could not be submitted
+        """
+        if action not in BY_QUERY_ACTIONS:
+            raise ValidationError(f"Unsupported by-query action: {action}")
+        if not index:
+            raise ValidationError("Index name cannot be empty")
+        if not query:
+            raise ValidationError("Query cannot be empty")
+        if script is not None and action != "update_by_query":
+            raise ValidationError("A script is only valid for update_by_query")
+
+        # Accept both a bare query and a full body with a single "query" key
+        if "query" in query and len(query) == 1:
+            query = query["query"]
+
+        params: Dict[str, Any] = {
+            "index": index,
+            "query": query,
+            "slices": slices,
+            "conflicts": conflicts,
+            "refresh": refresh,
+            "wait_for_completion": False,
+        }
+        if script is not None:
+            params["script"] = script
+        if requests_per_second is not None:
+            params["requests_per_second"] = requests_per_second
+        if max_docs is not None:
+            params["max_docs"] = max_docs
+
+        try:
+            self._ensure_connected()
+            api = getattr(cast(Any, self._client.get_client()), action)
+            response = self._handle_response(api(**params))
+        except Exception as e:
+            logger.error(f"Failed to submit {action} on '{index}': {str(e)}")
+            raise OperationError(f"Failed to submit {action}: {str(e)}")
+
+        task_id = response.get("task")
+        if not task_id:
+            raise OperationError(f"{action} did not return a task ID")
+
+        logger.info(f"Submitted {action} on '{index}' as task {task_id}")
+        return str(task_id)
+
+    def get_progress(self, task_id: str, action: str = "") -> TaskProgress:
+        """
+        Fetch the current progress of a task.
+
+        Raises:
+            OperationError: If the task cannot be read or finished with an error
+        """
+        try:
+            self._ensure_connected()
+            payload = self._handle_response(
+                self._client.get_client().tasks.get(task_id=task_id)
+            )
+        except Exception as e:
+            raise OperationError(f"Failed to get task {task_id}: {str(e)}")
+
+        if payload.get("error"):
+            reason = payload["error"].get("reason", payload["error"])
+            raise OperationError(f"Task {task_id} failed: {reason}")
+
+        if not action:
+            task_action = str(payload.get("task", {}).get("action", ""))
+            action = _TASK_ACTIONS.get(task_action, "")
+        return TaskProgress.from_task(task_id, action, payload)
+
+    def wait(
+        self,
+        task_id: str,
+        action: str = "",
+        poll_interval: float = 2.0,
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[TaskProgress], None]] = None,
+    ) -> TaskProgress:
+        """
+        Poll a task until it completes.
+
+        Args:
+            task_id: Task to wait on
+            action: By-query action name (detected from the task when empty)
+            poll_interval: Maximum seconds between polls
+            timeout: Give up after this many seconds (the task keeps running)
+            on_progress: Called with every progress snapshot
+
+        Returns:
+            The final progress snapshot
+
+        Raises:
+            OperationError: If the task fails or the timeout is reached
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        interval = min(_INITIAL_POLL_INTERVAL, poll_interval)
+
+        while True:
+            progress = self.get_progress(task_id, action)
+            if on_progress is not None:
+                on_progress(progress)
+            if progress.completed:
+                return progress
+
+            if deadline is not None and time.monotonic() + interval > deadline:
+                raise OperationError(
+                    f"Timed out waiting for task {task_id} "
+                    f"({progress.processed}/{progress.total} processed)"
+                )
+            time.sleep(interval)
+            interval = min(interval * 2, poll_interval)
+
+    def rethrottle(
+        self, task_id: str, requests_per_second: float, action: str = ""
+    ) -> Dict[str, Any]:
+        """
+        Change the throttle of a running by-query task.
+
+        Speeding up takes effect immediately; slowing down applies after the
+        current batch completes.
+
+        Args:
+            task_id: Task to rethrottle
+            requests_per_second: New throttle (-1 for unthrottled)
+            action: By-query action name (detected from the task when empty)
+
+        Returns:
+            Rethrottle response
+        """
+        if not action:
+            action = self.get_progress(task_id).action
+        if action not in BY_QUERY_ACTIONS:
+            raise ValidationError(f"Task {task_id} is not a by-query task")
+
+        try:
+            self._ensure_connected()
+            api = getattr(cast(Any, self._client.get_client()), f"{action}_rethrottle")
+            response = api(task_id=task_id, requests_per_second=requests_per_second)
+            logger.info(f"Rethrottled task {task_id} to {requests_per_second} rps")
+            return self._handle_response(response)
+        except Exception as e:
+            raise OperationError(f"Failed to rethrottle task {task_id}: {str(e)}")
+
+    def cancel(self, task_id: str) -> Dict[str, Any]:
+        """Cancel a running task."""
+        try:
+            self._ensure_connected()
+            return self._handle_response(
+                self._client.get_client().tasks.cancel(task_id=task_id)
+            )
+        except Exception as e:
+            raise OperationError(f"Failed to cancel task {task_id}: {str(e)}")
+
+    def run(
+        self,
+        action: str,
+        index: str,
+        query: Dict[str, Any],
+        wait_for_completion: bool = True,
+        poll_interval: float = 2.0,
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[TaskProgress], None]] = None,
+        **submit_kwargs: Any,
+    ) -> TaskProgress:
+        """
+        Submit a by-query task and optionally wait for it.
+
+        When ``wait_for_completion`` is False the returned snapshot only
+        carries the task ID; use ``wait``/``get_progress`` to follow it.
+        """
+        task_id = self.submit(action, index, query, **submit_kwargs)
+        if not wait_for_completion:
+            return TaskProgress(task_id=task_id, action=action)
+        return self.wait(
+            task_id,
+            action,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            on_progress=on_progress,
+        )
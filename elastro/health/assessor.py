@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from elastro.core.client import ElasticsearchClient
 from elastro.core.logger import get_logger
-from elastro.health.collectors.base import CollectContext, Collector, CollectorRegistry
+from elastro.health.audit import HealthAuditLogger
+from elastro.health.collectors.base import (
+    DEFAULT_COLLECTOR_CONCURRENCY,
+    CollectContext,
+    Collector,
+    CollectorRegistry,
+    CollectorResult,
+)
 from elastro.health.collectors.cluster import (
     ClusterHealthCollector,
     PendingTasksCollector,
@@ -17,13 +24,14 @@ from elastro.health.collectors.health_report import (
     HealthReportCollector,
     non_passing_findings,
 )
-from elastro.health.collectors.nodes import NodesCollector
 from elastro.health.collectors.ilm import IlmCollector
 from elastro.health.collectors.mappings import MappingsCollector
+from elastro.health.collectors.nodes import NodesCollector
 from elastro.health.collectors.security import SecurityCollector
 from elastro.health.collectors.shards import ShardsCollector
 from elastro.health.collectors.snapshots import SnapshotsCollector
-from elastro.health.rules.engine import RuleContext, RuleEngine
+from elastro.health.config import DEFAULT_HISTORY_INDEX
+from elastro.health.history import index_assessment, query_assessment_history
 from elastro.health.models import (
     AssessmentReport,
     Finding,
@@ -31,13 +39,17 @@ from elastro.health.models import (
     Severity,
     score_to_status,
 )
-from elastro.health.audit import HealthAuditLogger
-from elastro.health.config import DEFAULT_HISTORY_INDEX
-from elastro.health.history import index_assessment, query_assessment_history
+from elastro.health.rules.engine import RuleContext, RuleEngine
 from elastro.health.scoring import compute_fallback_score, compute_weighted_score
 
 logger = get_logger(__name__)
 
+# Called as progress(event, payload) while an assessment runs. Events, in
+# order: "started" (es_version, collectors), one "collector" per finished
+# collector (result, findings), one "findings" per rule that emitted something
+# (source, findings), and "report" (report) once the assessment is complete.
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
 _DEFAULT_COLLECTORS: List[Collector] = [
     HealthReportCollector(),
     ClusterHealthCollector(),
@@ -76,9 +88,17 @@ class HealthAssessor:
         profile: str = "default",
         host: Optional[str] = None,
         audit_logger: Optional[HealthAuditLogger] = None,
+        progress: Optional[ProgressCallback] = None,
+        concurrency: int = DEFAULT_COLLECTOR_CONCURRENCY,
     ) -> AssessmentReport:
-        """Run registered collectors and build an assessment report."""
+        """Run registered collectors and build an assessment report.
+
+        Pass ``progress`` to receive collector results and rule findings as
+        they complete; see ``ProgressCallback`` for the events. Collectors
+        run on up to ``concurrency`` threads (1 runs them in sequence).
+        """
         start = time.monotonic()
+        emit = _progress_emitter(progress)
         ctx = CollectContext(client=self._client, timeout=timeout)
         ctx.options["verbose_report"] = verbose_report
         if feature:
@@ -98,7 +118,22 @@ class HealthAssessor:
         ctx.es_version = es_version
 
         logger.info("Starting health assessment (es_version=%s)", es_version)
-        results = _run_collectors(self._registry, ctx, names=collectors)
+        targets = collectors if collectors is not None else self._registry.list()
+        for name in targets:
+            ctx.cache.expect_node_metrics(
+                getattr(self._registry.get(name), "node_metrics", ())
+            )
+        emit("started", {"es_version": es_version, "collectors": targets})
+        results = _run_collectors(
+            self._registry,
+            ctx,
+            names=targets,
+            concurrency=concurrency,
+            on_result=lambda result: emit(
+                "collector",
+                {"result": result, "findings": _result_findings(result)},
+            ),
+        )
 
         cluster_name = "unknown"
         overall_score = 0
@@ -250,12 +285,22 @@ class HealthAssessor:
             assessment_history=assessment_history,
             es_version=es_version,
         )
-        rule_findings = RuleEngine().evaluate(rule_ctx)
+        rule_findings = RuleEngine().evaluate(
+            rule_ctx,
+            on_findings=lambda rule_name, emitted: emit(
+                "findings", {"source": rule_name, "findings": emitted}
+            ),
+        )
         if rule_findings:
             findings.extend(rule_findings)
             deduction = sum(item.score_impact for item in rule_findings)
             overall_score = max(0, overall_score - deduction)
 
+        logger.debug(
+            "Collector requests: %s sent, %s served from the request cache",
+            ctx.cache.misses,
+            ctx.cache.hits,
+        )
         duration_ms = int((time.monotonic() - start) * 1000)
         report = AssessmentReport(
             cluster_name=cluster_name,
@@ -295,9 +340,34 @@ class HealthAssessor:
                 host=resolved_host,
             )
 
+        emit("report", {"report": report})
         return report
 
 
+def _progress_emitter(progress: Optional[ProgressCallback]) -> ProgressCallback:
+    """Wrap a progress callback so its failures never abort the assessment."""
+
+    def emit(event: str, payload: Dict[str, Any]) -> None:
+        if progress is None:
+            return
+        try:
+            progress(event, payload)
+        except Exception as exc:
+            logger.warning("Health progress callback failed on %s: %s", event, exc)
+
+    return emit
+
+
+def _result_findings(result: CollectorResult) -> List[Finding]:
+    """Non-passing findings a collector result already carries."""
+    if result.status != "ok":
+        return []
+    findings = result.data.get("findings") or []
+    if result.name == "health_report":
+        return non_passing_findings(findings)
+    return [item for item in findings if isinstance(item, Finding)]
+
+
 def _load_assessment_history(
     client: ElasticsearchClient,
     *,
@@ -352,48 +422,20 @@ def _run_collectors(
     ctx: CollectContext,
     *,
     names: Optional[List[str]] = None,
+    on_result: Optional[Callable[[CollectorResult], None]] = None,
+    concurrency: int = DEFAULT_COLLECTOR_CONCURRENCY,
 ) -> List:
-    """Run collectors sequentially, sharing health report context with later collectors."""
-    from elastro.health.collectors.base import CollectorResult
-
-    targets = names if names is not None else registry.list()
-    results: List[CollectorResult] = []
-
-    for name in targets:
-        collector = registry.get(name)
-        if collector is None:
-            results.append(
-                CollectorResult(
-                    name=name,
-                    status="skipped",
-                    error=f"Unknown collector: {name}",
-                )
-            )
-            continue
-
-        start = time.monotonic()
-        try:
-            result = collector.collect(ctx)
-        except Exception as exc:
-            logger.warning(
-                "Collector %s failed: %s",
-                name,
-                exc,
-                exc_info=True,
-            )
-            result = CollectorResult(
-                name=name,
-                status="error",
-                error=str(exc),
-                duration_ms=int((time.monotonic() - start) * 1000),
-            )
-        else:
-            if result.duration_ms == 0:
-                result.duration_ms = int((time.monotonic() - start) * 1000)
+    """Run collectors, sharing health report context with collectors that need it."""
 
+    def completed(result: CollectorResult) -> None:
         if result.name == "health_report" and result.status == "ok":
             ctx.options["health_report"] = result.data.get("report")
-
-        results.append(result)
-
-    return results
+        if on_result is not None:
+            on_result(result)
+
+    return registry.run(
+        ctx,
+        names,
+        concurrency=concurrency,
+        on_result=completed,
+    )
@@ -0,0 +1,83 @@
+"""Split index names into index expressions for multi-index requests."""
+
+from __future__ import annotations
+
+import os
+from bisect import bisect_left
+from itertools import groupby
+from typing import Iterable, Iterator, List, Tuple
+
+# Longest index expression sent in one request path
+MAX_INDEX_EXPRESSION_CHARS = 3500
+
+_WILDCARD_UNSAFE_PREFIXES = ("-", "_", "+")
+
+
+def index_chunks(
+    names: List[str],
+    all_names: Iterable[str],
+    *,
+    chunk_size: int,
+    max_chars: int = MAX_INDEX_EXPRESSION_CHARS,
+) -> List[Tuple[str, List[str]]]:
+    """Split index names into ``(index expression, names)`` request chunks.
+
+    Names are grouped into prefix blocks: a block whose names are every index
+    in ``all_names`` under a shared prefix is requested as ``prefix*``, so a
+    family of indices costs one short pattern instead of one entry per name.
+    Blocks are packed in name order into chunks of at most ``chunk_size``
+    names, each with an expression under ``max_chars``.
+    """
+    known = sorted(set(all_names) | set(names))
+    chunks: List[Tuple[str, List[str]]] = []
+    parts: List[str] = []
+    current: List[str] = []
+    length = 0
+
+    def flush() -> None:
+        if current:
+            chunks.append((",".join(parts), list(current)))
+            parts.clear()
+            current.clear()
+
+    for part, block in _prefix_blocks(sorted(set(names)), known, chunk_size):
+        if current and (
+            len(current) + len(block) > chunk_size or length + len(part) + 1 > max_chars
+        ):
+            flush()
+            length = 0
+        parts.append(part)
+        current.extend(block)
+        length += len(part) + 1
+    flush()
+    return chunks
+
+
+def _prefix_blocks(
+    names: List[str],
+    known: List[str],
+    chunk_size: int,
+) -> Iterator[Tuple[str, List[str]]]:
+    """Yield ``(expression part, names)`` blocks covering sorted, unique names."""
+    if len(names) == 1:
+        yield names[0], names
+        return
+    prefix = os.path.commonprefix(names)
+    if (
+        prefix
+        and not prefix.startswith(_WILDCARD_UNSAFE_PREFIXES)
+        and len(names) <= chunk_size
+        and _count_prefixed(known, prefix) == len(names)
+    ):
+        yield f"{prefix}*", names
+        return
+    # Split on the character after the shared prefix; a name equal to the
+    # prefix itself sorts first and is its own block
+    for _, group in groupby(
+        names, key=lambda name: name[len(prefix) : len(prefix) + 1]
+    ):
+        yield from _prefix_blocks(list(group), known, chunk_size)
+
+
+def _count_prefixed(known: List[str], prefix: str) -> int:
+    return bisect_left(known, prefix + chr(0x10FFFF)) - bisect_left(known, prefix)
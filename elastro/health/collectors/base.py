@@ -2,17 +2,39 @@
 
 from __future__ import annotations
 
+import re
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    runtime_checkable,
+)
 
 from pydantic import BaseModel, Field
 
 from elastro.core.client import ElasticsearchClient
 from elastro.core.logger import get_logger
+from elastro.health.collectors.progress import tracking_progress
+from elastro.health.collectors.request_cache import RequestCache
 
 logger = get_logger(__name__)
 
+DEFAULT_COLLECTOR_CONCURRENCY = 6
+# Slack on top of ctx.timeout before a collector that has neither finished
+# nor reported progress (see progress.report_progress) is abandoned
+COLLECTOR_DEADLINE_GRACE_SECONDS = 5.0
+# How often the registry rechecks deadlines while collectors wait for a worker
+_DEADLINE_POLL_SECONDS = 0.5
+
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
 
 class CollectorResult(BaseModel):
     name: str
@@ -28,17 +50,42 @@ class CollectContext:
     timeout: str = "30s"
     es_version: Optional[str] = None
     options: Dict[str, Any] = field(default_factory=dict)
+    # Shared by every collector of one assessment; see RequestCache
+    cache: RequestCache = field(default_factory=RequestCache)
 
 
 @runtime_checkable
 class Collector(Protocol):
-    """Protocol for health assessment data collectors."""
+    """Protocol for health assessment data collectors.
+
+    A collector may also set ``depends_on`` to the names of collectors that
+    must finish before it starts when the registry runs concurrently. One that
+    makes several requests in a row calls ``report_progress`` after each, so
+    the concurrent registry judges it against its deadline per request.
+    """
 
     name: str
 
     def collect(self, ctx: CollectContext) -> CollectorResult: ...
 
 
+def timeout_seconds(timeout: str, default: float = 30.0) -> float:
+    """Convert an Elasticsearch time value such as ``30s`` or ``500ms`` to seconds."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*(ms|s|m|h)?\s*", str(timeout))
+    if not match:
+        return default
+    return float(match.group(1)) * _DURATION_UNITS[match.group(2) or "s"]
+
+
+def collector_deadline(ctx: CollectContext) -> float:
+    """Seconds a collector may go without finishing or reporting progress."""
+    return timeout_seconds(ctx.timeout) + COLLECTOR_DEADLINE_GRACE_SECONDS
+
+
+def _dependencies(collector: Optional[Collector]) -> Sequence[str]:
+    return tuple(getattr(collector, "depends_on", ()) or ())
+
+
 class CollectorRegistry:
     """Registry of named health collectors."""
 
@@ -63,43 +110,161 @@ class CollectorRegistry:
         self,
         ctx: CollectContext,
         names: Optional[List[str]] = None,
+        *,
+        concurrency: int = 1,
+        on_result: Optional[Callable[[CollectorResult], None]] = None,
     ) -> List[CollectorResult]:
-        """Run collectors sequentially; failures are captured per collector."""
+        """Run collectors; failures are captured per collector.
+
+        With ``concurrency`` above 1, independent collectors run on a thread
+        pool, each starting once the collectors it ``depends_on`` have
+        finished and abandoned once it overruns ``collector_deadline(ctx)``.
+        Results are returned in ``names`` order either way; ``on_result`` is
+        called (on the calling thread) as each one completes, before any
+        dependent collector starts.
+        """
         targets = names if names is not None else self.list()
-        results: List[CollectorResult] = []
-
-        for name in targets:
-            collector = self._collectors.get(name)
-            if collector is None:
-                results.append(
-                    CollectorResult(
-                        name=name,
-                        status="skipped",
-                        error=f"Unknown collector: {name}",
-                    )
-                )
-                continue
-
-            start = time.monotonic()
-            try:
-                result = collector.collect(ctx)
-            except Exception as exc:
-                logger.warning("Collector %s failed: %s", name, exc)
-                result = CollectorResult(
-                    name=name,
-                    status="error",
-                    error=str(exc),
-                    duration_ms=int((time.monotonic() - start) * 1000),
-                )
-            else:
-                if result.duration_ms == 0:
-                    result.duration_ms = int((time.monotonic() - start) * 1000)
-                logger.debug(
-                    "Collector %s finished: status=%s duration_ms=%s",
-                    name,
-                    result.status,
-                    result.duration_ms,
+        if concurrency <= 1 or len(targets) <= 1:
+            results: List[CollectorResult] = []
+            for name in targets:
+                result = self._collect(name, ctx)
+                if on_result is not None:
+                    on_result(result)
+                results.append(result)
+            return results
+        return self._run_concurrent(ctx, targets, concurrency, on_result)
+
+    def _collect(self, name: str, ctx: CollectContext) -> CollectorResult:
+        collector = self._collectors.get(name)
+        if collector is None:
+            return CollectorResult(
+                name=name,
+                status="skipped",
+                error=f"Unknown collector: {name}",
+            )
+
+        start = time.monotonic()
+        try:
+            result = collector.collect(ctx)
+        except Exception as exc:
+            logger.warning("Collector %s failed: %s", name, exc, exc_info=True)
+            return CollectorResult(
+                name=name,
+                status="error",
+                error=str(exc),
+                duration_ms=int((time.monotonic() - start) * 1000),
+            )
+        if result.duration_ms == 0:
+            result.duration_ms = int((time.monotonic() - start) * 1000)
+        logger.debug(
+            "Collector %s finished: status=%s duration_ms=%s",
+            name,
+            result.status,
+            result.duration_ms,
+        )
+        return result
+
+    def _run_concurrent(
+        self,
+        ctx: CollectContext,
+        targets: List[str],
+        concurrency: int,
+        on_result: Optional[Callable[[CollectorResult], None]],
+    ) -> List[CollectorResult]:
+        deadline = collector_deadline(ctx)
+        wanted = set(targets)
+        pending = list(targets)
+        finished: Dict[str, CollectorResult] = {}
+        running: Dict[Future, str] = {}
+        # Set by the worker when it starts a collector and on every progress
+        # report, so time spent queued for a worker does not count
+        started_at: Dict[str, float] = {}
+        last_progress: Dict[str, float] = {}
+
+        def finish(name: str, result: CollectorResult) -> None:
+            finished[name] = result
+            if on_result is not None:
+                on_result(result)
+
+        def work(name: str) -> CollectorResult:
+            def progressed() -> None:
+                last_progress[name] = time.monotonic()
+
+            started_at[name] = time.monotonic()
+            progressed()
+            with tracking_progress(progressed):
+                return self._collect(name, ctx)
+
+        pool = ThreadPoolExecutor(
+            max_workers=min(concurrency, len(targets)),
+            thread_name_prefix="elastro-collector",
+        )
+        try:
+            while pending or running:
+                for name in list(pending):
+                    deps = [
+                        d
+                        for d in _dependencies(self._collectors.get(name))
+                        if d in wanted and d != name
+                    ]
+                    if all(d in finished for d in deps):
+                        pending.remove(name)
+                        running[pool.submit(work, name)] = name
+
+                if not running:
+                    # Whatever is left waits on itself through a cycle
+                    for name in pending:
+                        finish(
+                            name,
+                            CollectorResult(
+                                name=name,
+                                status="skipped",
+                                error="Collector dependency cycle",
+                            ),
+                        )
+                    break
+
+                now = time.monotonic()
+                active = [
+                    last_progress[n] for n in running.values() if n in last_progress
+                ]
+                timeout = min(active) + deadline - now if active else deadline
+                if len(active) < len(running):
+                    # A queued collector may start at any moment
+                    timeout = min(timeout, _DEADLINE_POLL_SECONDS)
+                done, _ = wait(
+                    list(running),
+                    timeout=max(0.0, timeout),
+                    return_when=FIRST_COMPLETED,
                 )
-            results.append(result)
+                for future in done:
+                    finish(running.pop(future), future.result())
+
+                now = time.monotonic()
+                for future, name in list(running.items()):
+                    if (
+                        name not in last_progress
+                        or now - last_progress[name] < deadline
+                    ):
+                        continue
+                    # A running thread cannot be stopped; drop its result
+                    future.cancel()
+                    del running[future]
+                    logger.warning(
+                        "Collector %s made no progress for %.0fs; abandoning it",
+                        name,
+                        deadline,
+                    )
+                    finish(
+                        name,
+                        CollectorResult(
+                            name=name,
+                            status="error",
+                            error=f"Collector exceeded its {deadline:.0f}s deadline",
+                            duration_ms=int((now - started_at[name]) * 1000),
+                        ),
+                    )
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
-        return results
+        return [finished[name] for name in targets]
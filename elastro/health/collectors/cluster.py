@@ -5,6 +5,7 @@ from typing import Any, Dict
 from elastro.core.errors import OperationError
 from elastro.core.logger import get_logger
 from elastro.health.collectors.base import CollectContext, CollectorResult
+from elastro.health.collectors.progress import report_progress
 from elastro.health.manager import HealthManager
 
 logger = get_logger(__name__)
@@ -19,6 +20,7 @@ class ClusterHealthCollector:
         manager = HealthManager(ctx.client)
         try:
             data: Dict[str, Any] = manager.cluster_health(timeout=ctx.timeout)
+            report_progress()
             try:
                 state = manager.cluster_state(metric="blocks")
                 blocks = state.get("blocks", {}) if isinstance(state, dict) else {}
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import Any, Dict, List, Optional
 
 from elastro.core.errors import OperationError
+from elastro.core.index import IndexManager
 from elastro.core.logger import get_logger
 from elastro.health.collectors.base import CollectContext, CollectorResult
 from elastro.health.collectors.nodes import NodesCollector
-from elastro.health.manager import HealthManager
-from elastro.core.index import IndexManager
 from elastro.health.disk_blocks import discover_read_only_blocked_indices
+from elastro.health.manager import HealthManager
 from elastro.health.models import (
     Finding,
     FindingStatus,
@@ -32,21 +33,22 @@ class DiskCollector:
     """Derive per-node disk usage and emit findings above watermarks."""
 
     name = "disk"
+    node_metrics = ("fs",)
 
     def collect(self, ctx: CollectContext) -> CollectorResult:
         manager = HealthManager(ctx.client)
         logger.debug("Collecting disk usage and watermark settings")
 
         try:
-            settings = manager.cluster_settings(include_defaults=True)
+            settings = ctx.cache.fetch(
+                "cluster.get_settings",
+                manager.cluster_settings,
+                include_defaults=True,
+            )
             watermarks = parse_disk_watermarks(settings)
+            # Shares ctx.cache, so this reuses the nodes collector's requests
             nodes_result = NodesCollector().collect(
-                CollectContext(
-                    client=ctx.client,
-                    timeout=ctx.timeout,
-                    es_version=ctx.es_version,
-                    options={"metrics": "fs"},
-                )
+                replace(ctx, options={"metrics": "fs"})
             )
             if nodes_result.status != "ok":
                 return CollectorResult(
@@ -172,9 +174,11 @@ def disk_watermark_findings(
                 Severity.CRITICAL,
                 "flood-stage",
             )
+            threshold = flood_threshold
             score_impact = 15
         elif used_pct >= high_threshold:
             status, severity, stage = FindingStatus.WARN, Severity.HIGH, "high"
+            threshold = high_threshold
             score_impact = 8
         else:
             continue
@@ -189,7 +193,7 @@ def disk_watermark_findings(
                 score_impact=score_impact,
                 summary=(
                     f"Node '{node_name}' disk usage is {used_pct}% "
-                    f"(threshold {flood_threshold if stage == 'flood-stage' else high_threshold}%)."
+                    f"(threshold {threshold}%)."
                 ),
                 affected_resources=[node_name],
                 source="collector",
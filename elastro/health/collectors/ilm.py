@@ -1,8 +1,13 @@
-"""ILM lifecycle collector — index listing and stuck lifecycle detection."""
+"""ILM lifecycle collector — index listing and stuck lifecycle detection.
+
+Lifecycle state is read with one ``_ilm/explain`` request for all managed
+indices (``explain_lifecycles``) and classified in a single pass
+(``stuck_lifecycles``), rather than explaining a sample index by index.
+"""
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Optional
 
 from elastro.core.errors import OperationError
 from elastro.core.ilm import IlmManager
@@ -19,11 +24,23 @@ from elastro.health.models import (
 
 logger = get_logger(__name__)
 
-_MAX_EXPLAIN = 25
+_EXPLAIN_FILTER_PATH = ",".join(
+    f"indices.*.{key}"
+    for key in (
+        "index",
+        "managed",
+        "policy",
+        "phase",
+        "action",
+        "step",
+        "failed_step",
+        "step_info",
+    )
+)
 
 
 class IlmCollector:
-    """List indices and detect ILM lifecycle errors on unhealthy indices."""
+    """List indices and detect ILM lifecycle errors on every managed index."""
 
     name = "ilm"
 
@@ -33,15 +50,16 @@ class IlmCollector:
         logger.debug("Collecting ILM lifecycle status")
 
         try:
-            indices = index_manager.list()
-            findings = self._ilm_findings(
-                indices,
-                ilm_manager=ilm_manager,
-                health_report=ctx.options.get("health_report"),
-            )
+            indices = ctx.cache.fetch("cat.indices", index_manager.list, pattern="*")
+            explains = explain_lifecycles(ilm_manager)
+            findings = [
+                _stuck_finding(index_name, issue, explains[index_name])
+                for index_name, issue in sorted(stuck_lifecycles(explains).items())
+            ]
             logger.info(
-                "ILM collector complete: indices=%s findings=%s",
+                "ILM collector complete: indices=%s managed=%s findings=%s",
                 len(indices),
+                len(explains),
                 len(findings),
             )
             return CollectorResult(
@@ -50,6 +68,7 @@ class IlmCollector:
                 data={
                     "indices": indices,
                     "index_count": len(indices),
+                    "managed_count": len(explains),
                     "findings": findings,
                 },
             )
@@ -57,92 +76,54 @@ class IlmCollector:
             logger.error("ILM collector failed: %s", exc, exc_info=True)
             return CollectorResult(name=self.name, status="error", error=str(exc))
 
-    def _ilm_findings(
-        self,
-        indices: List[Dict[str, Any]],
-        *,
-        ilm_manager: IlmManager,
-        health_report: Optional[Dict[str, Any]],
-    ) -> List[Finding]:
-        targets = _select_explain_targets(indices, health_report)
-        findings: List[Finding] = []
-
-        for index_name in sorted(targets)[:_MAX_EXPLAIN]:
-            try:
-                explain = ilm_manager.explain_lifecycle(index_name)
-            except OperationError as exc:
-                logger.debug(
-                    "Skipping ILM explain for %s: %s",
-                    index_name,
-                    exc,
-                )
-                continue
-
-            issue = _lifecycle_issue(explain)
-            if issue is None:
-                continue
-
-            findings.append(
-                Finding(
-                    id=f"ilm.stuck.{index_name}",
-                    category="ilm",
-                    title=f"ILM lifecycle issue: {index_name}",
-                    status=FindingStatus.WARN,
-                    severity=Severity.MEDIUM,
-                    score_impact=5,
-                    summary=issue,
-                    affected_resources=[index_name],
-                    source="collector",
-                    indicator="ilm",
-                    remediation=RemediationAction(
-                        id="ilm_retry",
-                        label="Retry ILM step",
-                        command=(
-                            "elastro health fix --action ilm_retry "
-                            f"--index {index_name}"
-                        ),
-                        safety=RemediationSafety.CONFIRM,
-                    ),
-                    metadata={"explain": explain},
-                )
-            )
-
-        return findings
 
-
-def _select_explain_targets(
-    indices: List[Dict[str, Any]],
-    health_report: Optional[Dict[str, Any]],
-) -> Set[str]:
-    """Choose indices worth explaining — unhealthy first, then ILM indicator hints."""
-    targets: Set[str] = set()
-
-    for entry in indices:
-        if not isinstance(entry, dict):
+def explain_lifecycles(
+    ilm_manager: IlmManager,
+    *,
+    index_pattern: Optional[str] = None,
+    only_errors: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """Explain managed indices matching ``index_pattern`` in one request, by name."""
+    return ilm_manager.explain_lifecycles(
+        index_pattern or "*",
+        only_managed=True,
+        only_errors=only_errors,
+        filter_path=_EXPLAIN_FILTER_PATH,
+    )
+
+
+def stuck_lifecycles(explains: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+    """Map each user index with a failed or stuck lifecycle to its issue."""
+    issues: Dict[str, str] = {}
+    for index_name, explain in explains.items():
+        if not index_name or index_name.startswith("."):
             continue
-        name = str(entry.get("index", "")).strip()
-        if not name or name.startswith("."):
-            continue
-        health = str(entry.get("health", "green")).lower()
-        if health in {"yellow", "red"}:
-            targets.add(name)
-
-    if health_report:
-        indicator = (health_report.get("indicators") or {}).get("ilm") or {}
-        details = indicator.get("details") or {}
-        stagnating = details.get("stagnating_indices", 0)
-        try:
-            if int(stagnating) > 0:
-                for entry in indices:
-                    if not isinstance(entry, dict):
-                        continue
-                    name = str(entry.get("index", "")).strip()
-                    if name and not name.startswith("."):
-                        targets.add(name)
-        except (TypeError, ValueError):
-            pass
-
-    return targets
+        issue = _lifecycle_issue(explain)
+        if issue is not None:
+            issues[index_name] = issue
+    return issues
+
+
+def _stuck_finding(index_name: str, issue: str, explain: Dict[str, Any]) -> Finding:
+    return Finding(
+        id=f"ilm.stuck.{index_name}",
+        category="ilm",
+        title=f"ILM lifecycle issue: {index_name}",
+        status=FindingStatus.WARN,
+        severity=Severity.MEDIUM,
+        score_impact=5,
+        summary=issue,
+        affected_resources=[index_name],
+        source="collector",
+        indicator="ilm",
+        remediation=RemediationAction(
+            id="ilm_retry",
+            label="Retry ILM step",
+            command=f"elastro health fix --action ilm_retry --index {index_name}",
+            safety=RemediationSafety.CONFIRM,
+        ),
+        metadata={"explain": explain},
+    )
 
 
 def _lifecycle_issue(explain: Dict[str, Any]) -> Optional[str]:
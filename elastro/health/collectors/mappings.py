@@ -1,4 +1,9 @@
-"""Index mapping field-count collector for mapping explosion detection."""
+"""Index mapping field-count collector for mapping explosion detection.
+
+Mappings are fetched with ``indices.get_mapping`` for a chunk of indices at a
+time (see ``index_chunks``) and reduced to field counts before the next
+chunk is requested, so every user index can be scanned on large clusters.
+"""
 
 from __future__ import annotations
 
@@ -7,9 +12,11 @@ from typing import Any, Dict, List
 from elastro.core.errors import OperationError
 from elastro.core.index import IndexManager
 from elastro.core.logger import get_logger
+from elastro.health.chunking import index_chunks
 from elastro.health.collectors.base import CollectContext, CollectorResult
+from elastro.health.collectors.progress import report_progress
 from elastro.health.mappings import (
-    DEFAULT_MAX_INDICES,
+    MAPPING_CHUNK_SIZE,
     is_system_index,
     summarize_index_mapping,
 )
@@ -18,22 +25,42 @@ logger = get_logger(__name__)
 
 
 class MappingsCollector:
-    """Sample user indices and count mapped fields."""
+    """Count mapped fields of user indices, a chunk of indices per request."""
 
     name = "mappings"
 
     def collect(self, ctx: CollectContext) -> CollectorResult:
         index_manager = IndexManager(ctx.client)
-        max_indices = int(ctx.options.get("max_indices", DEFAULT_MAX_INDICES))
+        raw_max = ctx.options.get("max_indices")
+        max_indices = int(raw_max) if raw_max is not None else None
         index_pattern = ctx.options.get("index")
         logger.debug("Collecting mapping field counts max_indices=%s", max_indices)
 
         try:
-            indices = index_manager.list(pattern=index_pattern or "*")
-            summaries = self._summaries(index_manager, indices, max_indices=max_indices)
+            indices = ctx.cache.fetch(
+                "cat.indices", index_manager.list, pattern=index_pattern or "*"
+            )
+            all_names = [
+                str(entry.get("index", "")).strip()
+                for entry in indices
+                if isinstance(entry, dict)
+            ]
+            names = [n for n in all_names if n and not is_system_index(n)]
+            if max_indices is not None:
+                names = names[:max_indices]
+
+            summaries: List[Dict[str, Any]] = []
+            requests = 0
+            for expression, chunk in index_chunks(
+                names, all_names, chunk_size=MAPPING_CHUNK_SIZE
+            ):
+                summaries.extend(self._chunk_summaries(ctx, expression, chunk))
+                report_progress()
+                requests += 1
             logger.info(
-                "Mappings collector complete: scanned=%s indices",
+                "Mappings collector complete: scanned=%s indices in %s requests",
                 len(summaries),
+                requests,
             )
             return CollectorResult(
                 name=self.name,
@@ -47,34 +74,57 @@ class MappingsCollector:
             logger.error("Mappings collector failed: %s", exc, exc_info=True)
             return CollectorResult(name=self.name, status="error", error=str(exc))
 
-    def _summaries(
+    def _chunk_summaries(
         self,
-        index_manager: IndexManager,
-        indices: List[Dict[str, Any]],
-        *,
-        max_indices: int,
+        ctx: CollectContext,
+        expression: str,
+        names: List[str],
     ) -> List[Dict[str, Any]]:
+        """Summarize one chunk; its mappings are dropped before the next is fetched."""
+        es = ctx.client.client
+        try:
+            mappings = _body(
+                es.indices.get_mapping(
+                    index=expression,
+                    filter_path="*.mappings.properties",
+                    expand_wildcards="open,hidden",
+                    ignore_unavailable=True,
+                )
+            )
+        except Exception as exc:
+            logger.debug("Skipping mapping scan for %s: %s", expression, exc)
+            return []
+        try:
+            settings = _body(
+                es.indices.get_settings(
+                    index=expression,
+                    name="index.mapping.total_fields.limit",
+                    flat_settings=True,
+                    expand_wildcards="open,hidden",
+                    ignore_unavailable=True,
+                )
+            )
+        except Exception as exc:
+            logger.debug("Using default field limit for %s: %s", expression, exc)
+            settings = {}
+
         summaries: List[Dict[str, Any]] = []
-        for entry in indices:
-            if not isinstance(entry, dict):
-                continue
-            name = str(entry.get("index", "")).strip()
-            if not name or is_system_index(name):
-                continue
-            try:
-                raw = index_manager.get(name)
-            except OperationError as exc:
-                logger.debug("Skipping mapping scan for %s: %s", name, exc)
+        for name in names:
+            body = mappings.get(name)
+            if not isinstance(body, dict):
                 continue
+            summaries.append(
+                summarize_index_mapping(
+                    name,
+                    {
+                        "mappings": body.get("mappings") or {},
+                        "settings": (settings.get(name) or {}).get("settings") or {},
+                    },
+                )
+            )
+        return summaries
 
-            if isinstance(raw, dict) and name in raw:
-                body = raw[name]
-            elif isinstance(raw, dict):
-                body = next(iter(raw.values()), {})
-            else:
-                continue
 
-            summaries.append(summarize_index_mapping(name, body))
-            if len(summaries) >= max_indices:
-                break
-        return summaries
+def _body(response: Any) -> Dict[str, Any]:
+    body = getattr(response, "body", response)
+    return dict(body) if isinstance(body, dict) else {}
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
 from elastro.core.errors import OperationError
 from elastro.core.logger import get_logger
@@ -18,6 +18,7 @@ class NodesCollector:
     """Collect per-node JVM, filesystem, OS, and circuit-breaker stats."""
 
     name = "nodes"
+    node_metrics = DEFAULT_METRICS
 
     def collect(self, ctx: CollectContext) -> CollectorResult:
         manager = HealthManager(ctx.client)
@@ -30,11 +31,12 @@ class NodesCollector:
             node_id,
         )
         try:
-            stats = manager.node_stats(
+            stats = ctx.cache.node_stats(
+                manager.node_stats,
                 node_id=node_id,
                 metrics=list(metrics),
             )
-            info = manager.node_info(node_id=node_id)
+            info = ctx.cache.fetch("nodes.info", manager.node_info, node_id=node_id)
             nodes = _normalize_nodes(stats, info)
             return CollectorResult(
                 name=self.name,
@@ -0,0 +1,33 @@
+"""Progress reporting from running collectors to the concurrent registry.
+
+The registry abandons a collector that goes a whole deadline (about one
+request timeout) without finishing or reporting progress. Collectors that
+make several requests in a row call ``report_progress`` after each one, so a
+scan of many index chunks is judged per request rather than as a whole.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+_local = threading.local()
+
+
+def report_progress() -> None:
+    """Tell the registry that the collector on this thread is still advancing."""
+    callback: Optional[Callable[[], None]] = getattr(_local, "callback", None)
+    if callback is not None:
+        callback()
+
+
+@contextmanager
+def tracking_progress(callback: Callable[[], None]) -> Iterator[None]:
+    """Route ``report_progress`` calls made on this thread to ``callback``."""
+    previous = getattr(_local, "callback", None)
+    _local.callback = callback
+    try:
+        yield
+    finally:
+        _local.callback = previous
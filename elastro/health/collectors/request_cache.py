@@ -0,0 +1,148 @@
+"""Per-assessment memoization of Elasticsearch reads shared by collectors.
+
+Several collectors need the same data (index listings, node stats, cluster
+settings). ``RequestCache`` lives on ``CollectContext`` for one assessment and
+makes each distinct call once: the first caller runs the request and any
+concurrent or later caller with the same API and parameters waits on, then
+reuses, its result. Node stats requests are additionally merged by metric, so
+a collector asking for ``fs`` is served by a call that also fetched ``jvm``.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from elastro.core.logger import get_logger
+from elastro.health.collectors.progress import report_progress
+
+logger = get_logger(__name__)
+
+CacheKey = Tuple[str, Tuple[Tuple[str, Hashable], ...]]
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def request_key(api: str, params: Dict[str, Any]) -> CacheKey:
+    """Cache key for ``api`` called with ``params`` (argument order does not matter)."""
+    return api, tuple(sorted((name, _freeze(value)) for name, value in params.items()))
+
+
+class RequestCache:
+    """Thread-safe, single-flight memo of read-only requests for one assessment.
+
+    Failed requests are not cached: callers already waiting see the error,
+    later callers try again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: Dict[CacheKey, Future] = {}
+        # (node_id, metrics or None for all, future) per node stats call
+        self._node_stats: List[Tuple[Optional[str], Optional[frozenset], Future]] = []
+        self._expected_node_metrics: List[str] = []
+        self.hits = 0
+        self.misses = 0
+
+    def fetch(self, api: str, loader: Callable[..., Any], **params: Any) -> Any:
+        """Return ``loader(**params)``, calling it at most once per api and params."""
+        key = request_key(api, params)
+        with self._lock:
+            cached = self._futures.get(key)
+            if cached is None:
+                future: Future = Future()
+                self._futures[key] = future
+                self.misses += 1
+            else:
+                self.hits += 1
+        if cached is not None:
+            logger.debug("Request cache hit api=%s params=%s", api, params)
+            return cached.result()
+        return self._complete(future, loader, params, key=key)
+
+    def expect_node_metrics(self, metrics: Iterable[str]) -> None:
+        """Declare node stats metrics later requests should fetch together."""
+        with self._lock:
+            for metric in metrics:
+                if metric not in self._expected_node_metrics:
+                    self._expected_node_metrics.append(metric)
+
+    def node_stats(
+        self,
+        loader: Callable[..., Dict[str, Any]],
+        *,
+        node_id: Optional[str] = None,
+        metrics: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Node stats covering ``metrics``, reusing any call that already covers them.
+
+        A new call fetches the requested metrics plus those declared through
+        ``expect_node_metrics``, so the response may hold more metrics than asked for.
+        """
+        wanted = frozenset(metrics) if metrics else None
+        with self._lock:
+            for cached_node, cached_metrics, future in self._node_stats:
+                if cached_node != node_id:
+                    continue
+                if cached_metrics is None or (
+                    wanted is not None and wanted <= cached_metrics
+                ):
+                    self.hits += 1
+                    break
+            else:
+                future = None
+                fetch_metrics = None
+                if metrics:
+                    fetch_metrics = list(metrics) + [
+                        m for m in self._expected_node_metrics if m not in metrics
+                    ]
+                future_new: Future = Future()
+                self._node_stats.append(
+                    (
+                        node_id,
+                        frozenset(fetch_metrics) if fetch_metrics else None,
+                        future_new,
+                    )
+                )
+                self.misses += 1
+        if future is not None:
+            logger.debug("Request cache hit api=nodes.stats metrics=%s", metrics)
+            return future.result()
+        return self._complete(
+            future_new,
+            loader,
+            {"node_id": node_id, "metrics": fetch_metrics},
+            node_stats=True,
+        )
+
+    def _complete(
+        self,
+        future: Future,
+        loader: Callable[..., Any],
+        params: Dict[str, Any],
+        *,
+        key: Optional[CacheKey] = None,
+        node_stats: bool = False,
+    ) -> Any:
+        try:
+            result = loader(**params)
+        except BaseException as exc:
+            with self._lock:
+                if key is not None:
+                    self._futures.pop(key, None)
+                if node_stats:
+                    self._node_stats = [
+                        entry for entry in self._node_stats if entry[2] is not future
+                    ]
+            future.set_exception(exc)
+            raise
+        future.set_result(result)
+        report_progress()
+        return result
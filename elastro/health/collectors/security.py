@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Sequence
 
 from elastro.core.logger import get_logger
 from elastro.health.collectors.base import CollectContext, CollectorResult
+from elastro.health.collectors.progress import report_progress
 from elastro.health.models import (
     Finding,
     FindingStatus,
@@ -137,6 +138,7 @@ def _native_realm_findings(ctx: CollectContext) -> List[Finding]:
             )
         )
 
+    report_progress()
     try:
         roles = es.security.get_role()
     except Exception as exc:
@@ -1,4 +1,10 @@
-"""Shard listing and size analysis collector."""
+"""Shard listing and size analysis collector.
+
+cat.shards rows are loaded straight into a columnar ``ShardTable``. On large
+clusters the listing is requested in chunks of indices, so only one chunk of
+JSON rows is alive at a time and memory stays flat as shard counts grow. Raw
+rows are only kept in the result when ``include_shard_rows`` is set.
+"""
 
 from __future__ import annotations
 
@@ -7,17 +13,22 @@ from typing import Any, Dict, List, Optional
 from elastro.core.errors import OperationError
 from elastro.core.index import IndexManager
 from elastro.core.logger import get_logger
+from elastro.health.chunking import index_chunks
 from elastro.health.collectors.base import CollectContext, CollectorResult
+from elastro.health.collectors.progress import report_progress
 from elastro.health.shards import (
     DEFAULT_OVERSHARD_THRESHOLD_MB,
     DEFAULT_UNDERSHARD_THRESHOLD_GB,
     ShardAnalysis,
-    analyze_shards,
+    ShardTable,
+    analyze_shard_table,
 )
 
 logger = get_logger(__name__)
 
 _CAT_HEADERS = "index,shard,prirep,state,store,node"
+# Indices per cat.shards request once a listing spans more than this many
+SHARD_LIST_CHUNK_SIZE = 500
 
 
 class ShardsCollector:
@@ -41,9 +52,9 @@ class ShardsCollector:
             undershard_gb,
         )
         try:
-            rows = _fetch_cat_shards(ctx, index_pattern=index_pattern)
-            analysis = analyze_shards(
-                rows,
+            table = load_shard_table(ctx, index_pattern=index_pattern)
+            analysis = analyze_shard_table(
+                table,
                 overshard_threshold_mb=overshard_mb,
                 undershard_threshold_gb=undershard_gb,
             )
@@ -52,20 +63,75 @@ class ShardsCollector:
                 analysis.total_shards,
                 analysis.unassigned_count,
             )
-            return CollectorResult(
-                name=self.name,
-                status="ok",
-                data={
-                    "shards": rows,
-                    "analysis": _analysis_to_dict(analysis),
-                    "index": index_pattern,
-                },
-            )
+            data: Dict[str, Any] = {
+                "analysis": _analysis_to_dict(analysis),
+                "index": index_pattern,
+            }
+            if ctx.options.get("include_shard_rows"):
+                data["shards"] = list(table.rows())
+            return CollectorResult(name=self.name, status="ok", data=data)
         except OperationError as exc:
             logger.error("Shards collector failed: %s", exc, exc_info=True)
             return CollectorResult(name=self.name, status="error", error=str(exc))
 
 
+def load_shard_table(
+    ctx: CollectContext,
+    *,
+    index_pattern: Optional[str] = None,
+) -> ShardTable:
+    """List shards into a ``ShardTable``, one index chunk at a time."""
+    table = ShardTable()
+    for expression in _shard_list_expressions(ctx, index_pattern):
+        table.extend(_fetch_cat_shards(ctx, index_pattern=expression))
+        report_progress()
+    logger.debug(
+        "Loaded %s shard(s) of %s index(es) across %s node(s)",
+        len(table),
+        len(table.index_names),
+        len(table.node_names),
+    )
+    return table
+
+
+def _shard_list_expressions(
+    ctx: CollectContext,
+    index_pattern: Optional[str],
+) -> List[Optional[str]]:
+    """Index expressions to list shards for; one request unless the listing is large."""
+    index_manager = IndexManager(ctx.client)
+    try:
+        all_indices = ctx.cache.fetch("cat.indices", index_manager.list, pattern="*")
+        indices = (
+            ctx.cache.fetch("cat.indices", index_manager.list, pattern=index_pattern)
+            if index_pattern and index_pattern != "*"
+            else all_indices
+        )
+    except OperationError as exc:
+        logger.warning("Listing shards in one request; index listing failed: %s", exc)
+        return [index_pattern]
+
+    names = _index_names(indices)
+    if len(names) <= SHARD_LIST_CHUNK_SIZE:
+        return [index_pattern]
+    return [
+        expression
+        for expression, _ in index_chunks(
+            names, _index_names(all_indices), chunk_size=SHARD_LIST_CHUNK_SIZE
+        )
+    ]
+
+
+def _index_names(indices: Any) -> List[str]:
+    if not isinstance(indices, list):
+        return []
+    return [
+        str(row["index"])
+        for row in indices
+        if isinstance(row, dict) and row.get("index")
+    ]
+
+
 def _fetch_cat_shards(
     ctx: CollectContext,
     *,
@@ -128,7 +194,7 @@ def _analysis_to_dict(analysis: ShardAnalysis) -> Dict[str, Any]:
                 "store_bytes": item.store_bytes,
                 "node": item.node,
             }
-            for item in analysis.oversharded[:50]
+            for item in analysis.oversharded
         ],
         "undersharded": [
             {
@@ -138,6 +204,10 @@ def _analysis_to_dict(analysis: ShardAnalysis) -> Dict[str, Any]:
                 "store_bytes": item.store_bytes,
                 "node": item.node,
             }
-            for item in analysis.undersharded[:50]
+            for item in analysis.undersharded
         ],
+        "oversharded_by_index": analysis.oversharded_by_index,
+        "nodes": analysis.nodes,
+        "node_shard_skew": analysis.node_shard_skew,
+        "node_bytes_skew": analysis.node_bytes_skew,
     }
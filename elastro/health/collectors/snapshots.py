@@ -8,6 +8,7 @@ from elastro.core.errors import OperationError
 from elastro.core.logger import get_logger
 from elastro.core.snapshot import SnapshotManager
 from elastro.health.collectors.base import CollectContext, CollectorResult
+from elastro.health.collectors.progress import report_progress
 from elastro.health.models import Finding, FindingStatus, Severity
 
 logger = get_logger(__name__)
@@ -50,7 +51,9 @@ class SnapshotsCollector:
                         Finding(
                             id=f"snapshots.verify.{repo_name}",
                             category="snapshots",
-                            title=f"Snapshot repository verification failed: {repo_name}",
+                            title=(
+                                f"Snapshot repository verification failed: {repo_name}"
+                            ),
                             status=FindingStatus.WARN,
                             severity=Severity.HIGH,
                             score_impact=5,
@@ -60,6 +63,7 @@ class SnapshotsCollector:
                             metadata={"repository": repo_name},
                         )
                     )
+                report_progress()
 
             logger.info(
                 "Snapshots collector complete: repositories=%s findings=%s",
@@ -116,21 +116,30 @@ def build_oversharding_guide(
     measured = int(analysis.get("measured_shards", 0))
     total = int(analysis.get("total_shards", 0))
     avg_bytes = float(analysis.get("avg_bytes", 0))
-    oversharded_rows = analysis.get("oversharded") or []
-    top_indices = _aggregate_oversharded_by_index(oversharded_rows)
+    by_index = analysis.get("oversharded_by_index")
+    if by_index:
+        # Rolled up over every oversharded shard, not just the listed ones
+        top_indices = [
+            {**item, "smallest_human": format_bytes(int(item["smallest_bytes"]))}
+            for item in by_index
+        ]
+    else:
+        top_indices = _aggregate_oversharded_by_index(analysis.get("oversharded") or [])
 
     pct = 0.0
     if measured > 0:
         pct = round((oversharded_count / measured) * 100, 1)
 
     why = (
-        f"Elastro flagged {oversharded_count} assigned shard(s) under {threshold_human} "
+        f"Elastro flagged {oversharded_count} assigned shard(s) "
+        f"under {threshold_human} "
         f"({pct}% of {measured} measured shards). Elasticsearch production guidance "
         f"targets primary shard sizes between {_ELASTIC_TARGET_MIN_GB}GB and "
         f"{_ELASTIC_TARGET_MAX_GB}GB (and below {_ELASTIC_DOCS_PER_SHARD:,} documents "
         f"per shard). Shards at sub-megabyte sizes are far below that band — typical "
         f"causes are aggressive ILM rollover on low-volume streams, too many primaries "
-        f"in index templates, or empty/near-empty backing indices that were never deleted."
+        "in index templates, or empty/near-empty backing indices that were never "
+        "deleted."
     )
 
     implications = [
@@ -151,7 +160,8 @@ def build_oversharding_guide(
             "cluster-state updates during allocation and mapping changes."
         ),
         (
-            f"Default `cluster.max_shards_per_node` is {_DEFAULT_MAX_SHARDS_PER_NODE:,} "
+            "Default `cluster.max_shards_per_node` is "
+            f"{_DEFAULT_MAX_SHARDS_PER_NODE:,} "
             "for non-frozen shards — dense small-shard layouts hit this ceiling during "
             "rollover or reindex before disk is full."
         ),
@@ -162,11 +172,13 @@ def build_oversharding_guide(
             "title": "Inventory the worst offenders",
             "body": (
                 "List oversharded shards and group by index to decide whether the "
-                "problem is a template, a single bloated index pattern, or ILM rollover."
+                "problem is a template, a single bloated index pattern, or ILM "
+                "rollover."
             ),
             "commands": [
                 "elastro health shards --analyze -o table",
-                "elastro -o json health shards --analyze | jq '.analysis.oversharded[:20]'",
+                "elastro -o json health shards --analyze "
+                "| jq '.analysis.oversharded[:20]'",
             ],
         },
         {
@@ -176,8 +188,8 @@ def build_oversharding_guide(
                 "low-traffic streams — that creates many small backing indices. Prefer "
                 "`max_primary_shard_size` (Elastic recommends 10gb–50gb bounds via ILM "
                 "rollover) and delete empty backing indices. Update the matching index "
-                "template's `index.number_of_shards` for *new* backing indices; existing "
-                "small indices must be reindexed or shrunk."
+                "template's `index.number_of_shards` for *new* backing indices; "
+                "existing small indices must be reindexed or shrunk."
             ),
             "commands": [
                 "elastro health ilm --stuck-only -o table",
@@ -193,7 +205,8 @@ def build_oversharding_guide(
                 "shrink is an option for managed indices."
             ),
             "commands": [
-                "curl -X PUT \"$ES_HOST/my-index/_settings\" -H 'Content-Type: application/json' "
+                'curl -X PUT "$ES_HOST/my-index/_settings" '
+                "-H 'Content-Type: application/json' "
                 "-d '{\"index.blocks.write\": true}'",
                 'curl -X POST "$ES_HOST/my-index/_shrink/my-index-shrunk" '
                 "-H 'Content-Type: application/json' "
@@ -208,16 +221,18 @@ def build_oversharding_guide(
                 "Delete source indices after validation and repoint aliases."
             ),
             "commands": [
-                "curl -X POST \"$ES_HOST/_reindex\" -H 'Content-Type: application/json' "
-                '-d \'{"source": {"index": "logs-2099.10.*"}, "dest": {"index": "logs-2099.10"}}\'',
+                'curl -X POST "$ES_HOST/_reindex" '
+                "-H 'Content-Type: application/json' "
+                '-d \'{"source": {"index": "logs-2099.10.*"}, '
+                '"dest": {"index": "logs-2099.10"}}\'',
             ],
         },
         {
             "title": "Prevent recurrence in templates",
             "body": (
                 "Lower `index.number_of_shards` in component/index templates for new "
-                "indices and validate with a canary index before rolling template changes "
-                "to production writers."
+                "indices and validate with a canary index before rolling template "
+                "changes to production writers."
             ),
             "commands": [
                 'curl -X GET "$ES_HOST/_index_template/my-template"',
@@ -226,10 +241,14 @@ def build_oversharding_guide(
     ]
 
     cautions = [
-        "Shard count is fixed at index creation — you cannot lower `index.number_of_shards` in place.",
-        "Shrink, reindex, and template changes need spare disk for a second copy of data during migration.",
-        "The current write index on a data stream cannot be shrunk; roll the stream first.",
-        "Force-merge only reduces segments inside a shard; it does not fix too many primaries.",
+        "Shard count is fixed at index creation — you cannot lower "
+        "`index.number_of_shards` in place.",
+        "Shrink, reindex, and template changes need spare disk for a second copy "
+        "of data during migration.",
+        "The current write index on a data stream cannot be shrunk; "
+        "roll the stream first.",
+        "Force-merge only reduces segments inside a shard; "
+        "it does not fix too many primaries.",
     ]
 
     sections: Dict[str, Any] = {
@@ -243,7 +262,9 @@ def build_oversharding_guide(
         "oversharded_count": oversharded_count,
         "measured_shards": measured,
         "elastic_guidance": {
-            "target_shard_size_gb": f"{_ELASTIC_TARGET_MIN_GB}-{_ELASTIC_TARGET_MAX_GB}",
+            "target_shard_size_gb": (
+                f"{_ELASTIC_TARGET_MIN_GB}-{_ELASTIC_TARGET_MAX_GB}"
+            ),
             "max_docs_per_shard": _ELASTIC_DOCS_PER_SHARD,
         },
         "references": [
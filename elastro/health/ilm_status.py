@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -10,11 +10,11 @@ from elastro.core.client import ElasticsearchClient
 from elastro.core.ilm import IlmManager
 from elastro.core.index import IndexManager
 from elastro.core.logger import get_logger
-from elastro.health.collectors.ilm import _lifecycle_issue, _select_explain_targets
+from elastro.health.collectors.ilm import explain_lifecycles, stuck_lifecycles
 
 logger = get_logger(__name__)
 
-_MAX_EXPLAIN = 100
+_MAX_ROWS = 100
 
 
 class StuckIlmIndex(BaseModel):
@@ -32,54 +32,24 @@ def list_ilm_indices(
     *,
     index_pattern: Optional[str] = None,
     stuck_only: bool = True,
-    health_report: Optional[Dict[str, Any]] = None,
-    limit: int = _MAX_EXPLAIN,
+    limit: Optional[int] = _MAX_ROWS,
 ) -> List[StuckIlmIndex]:
-    """Return ILM lifecycle rows, optionally limited to stuck indices only."""
-    if stuck_only:
-        return list_stuck_ilm_indices(
-            client,
-            index_pattern=index_pattern,
-            health_report=health_report,
-            limit=limit,
-        )
-
-    index_manager = IndexManager(client)
-    ilm_manager = IlmManager(client)
-    indices = index_manager.list(index_pattern or "*")
-    targets = _select_explain_targets(indices, health_report)
-
-    if index_pattern:
-        import fnmatch
-
-        targets = {name for name in targets if fnmatch.fnmatchcase(name, index_pattern)}
-
-    health_by_index = {
-        str(entry.get("index", "")): str(entry.get("health", "unknown")).lower()
-        for entry in indices
-        if isinstance(entry, dict)
-    }
+    """Return ILM lifecycle rows for managed indices, optionally only stuck ones.
 
-    rows: List[StuckIlmIndex] = []
-    for index_name in sorted(targets)[:limit]:
-        try:
-            explain = ilm_manager.explain_lifecycle(index_name)
-        except Exception as exc:
-            logger.debug("Skipping ILM explain for %s: %s", index_name, exc)
-            continue
-
-        issue = _lifecycle_issue(explain)
-        rows.append(
-            StuckIlmIndex(
-                index_name=index_name,
-                health=health_by_index.get(index_name, "unknown"),
-                issue=issue or "ok",
-                step=str(explain.get("step", "")),
-                explain=explain,
-            )
-        )
-
-    logger.info("ILM scan complete: targets=%s rows=%s", len(targets), len(rows))
+    ``limit`` caps the rows listed when ``stuck_only`` is False; stuck indices
+    are always all returned.
+    """
+    if stuck_only:
+        return list_stuck_ilm_indices(client, index_pattern=index_pattern)
+
+    explains, health_by_index = _explain(client, index_pattern)
+    issues = stuck_lifecycles(explains)
+    names = sorted(name for name in explains if not name.startswith("."))
+    rows = [
+        _row(name, issues.get(name, "ok"), explains[name], health_by_index)
+        for name in names[:limit]
+    ]
+    logger.info("ILM scan complete: managed=%s rows=%s", len(explains), len(rows))
     return rows
 
 
@@ -87,49 +57,46 @@ def list_stuck_ilm_indices(
     client: ElasticsearchClient,
     *,
     index_pattern: Optional[str] = None,
-    health_report: Optional[Dict[str, Any]] = None,
-    limit: int = _MAX_EXPLAIN,
+    limit: Optional[int] = None,
 ) -> List[StuckIlmIndex]:
-    """Return indices whose ILM lifecycle is in ERROR or otherwise stuck."""
-    index_manager = IndexManager(client)
-    ilm_manager = IlmManager(client)
-    indices = index_manager.list(index_pattern or "*")
-    targets = _select_explain_targets(indices, health_report)
-
-    if index_pattern:
-        import fnmatch
+    """Return managed indices whose ILM lifecycle is in ERROR or otherwise stuck."""
+    explains, health_by_index = _explain(client, index_pattern)
+    issues = stuck_lifecycles(explains)
+    stuck = [
+        _row(name, issues[name], explains[name], health_by_index)
+        for name in sorted(issues)[:limit]
+    ]
+    logger.info(
+        "ILM stuck scan complete: managed=%s stuck=%s", len(explains), len(stuck)
+    )
+    return stuck
 
-        targets = {name for name in targets if fnmatch.fnmatchcase(name, index_pattern)}
 
+def _explain(
+    client: ElasticsearchClient,
+    index_pattern: Optional[str],
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """Explain managed indices in one request, with their cat health alongside."""
+    explains = explain_lifecycles(IlmManager(client), index_pattern=index_pattern)
+    indices = IndexManager(client).list(index_pattern or "*")
     health_by_index = {
         str(entry.get("index", "")): str(entry.get("health", "unknown")).lower()
         for entry in indices
         if isinstance(entry, dict)
     }
-
-    stuck: List[StuckIlmIndex] = []
-    for index_name in sorted(targets)[:limit]:
-        try:
-            explain = ilm_manager.explain_lifecycle(index_name)
-        except Exception as exc:
-            logger.debug("Skipping ILM explain for %s: %s", index_name, exc)
-            continue
-
-        issue = _lifecycle_issue(explain)
-        if issue is None:
-            continue
-
-        stuck.append(
-            StuckIlmIndex(
-                index_name=index_name,
-                health=health_by_index.get(index_name, "unknown"),
-                issue=issue,
-                step=str(explain.get("step", "")),
-                explain=explain,
-            )
-        )
-
-    logger.info(
-        "ILM stuck scan complete: targets=%s stuck=%s", len(targets), len(stuck)
+    return explains, health_by_index
+
+
+def _row(
+    index_name: str,
+    issue: str,
+    explain: Dict[str, Any],
+    health_by_index: Dict[str, str],
+) -> StuckIlmIndex:
+    return StuckIlmIndex(
+        index_name=index_name,
+        health=health_by_index.get(index_name, "unknown"),
+        issue=issue,
+        step=str(explain.get("step", "")),
+        explain=explain,
     )
-    return stuck
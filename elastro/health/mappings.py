@@ -11,6 +11,8 @@ logger = get_logger(__name__)
 DEFAULT_FIELD_LIMIT = 1000
 DEFAULT_FIELD_WARN_RATIO = 0.8
 DEFAULT_MAX_INDICES = 50
+# Indices per get_mapping request
+MAPPING_CHUNK_SIZE = 200
 
 
 def is_system_index(index_name: str) -> bool:
@@ -20,29 +22,45 @@ def is_system_index(index_name: str) -> bool:
 
 
 def count_mapping_fields(properties: Optional[Dict[str, Any]]) -> int:
-    """Recursively count mapped fields including nested and multi-fields."""
-    if not isinstance(properties, dict):
-        return 0
+    """Count mapped fields including nested and multi-fields.
 
+    Walks the mapping with an explicit stack, so deeply nested objects cannot
+    hit the recursion limit.
+    """
     total = 0
-    for spec in properties.values():
-        if not isinstance(spec, dict):
-            total += 1
+    stack = [properties]
+    while stack:
+        current = stack.pop()
+        if not isinstance(current, dict):
             continue
-        total += 1
-        if "properties" in spec:
-            total += count_mapping_fields(spec.get("properties"))
-        if "fields" in spec:
-            total += count_mapping_fields(spec.get("fields"))
+        for spec in current.values():
+            total += 1
+            if not isinstance(spec, dict):
+                continue
+            if "properties" in spec:
+                stack.append(spec.get("properties"))
+            if "fields" in spec:
+                stack.append(spec.get("fields"))
     return total
 
 
 def extract_field_limit(settings: Dict[str, Any]) -> int:
-    """Read index.mapping.total_fields.limit from index settings."""
-    index_settings = settings.get("index") if isinstance(settings, dict) else {}
-    if not isinstance(index_settings, dict):
+    """Read index.mapping.total_fields.limit from index settings.
+
+    Accepts flat settings (``flat_settings=true``) as well as the nested form.
+    """
+    if not isinstance(settings, dict):
         return DEFAULT_FIELD_LIMIT
-    raw = index_settings.get("mapping.total_fields.limit", DEFAULT_FIELD_LIMIT)
+    raw = settings.get("index.mapping.total_fields.limit")
+    if raw is None:
+        index_settings = settings.get("index")
+        if not isinstance(index_settings, dict):
+            return DEFAULT_FIELD_LIMIT
+        raw = index_settings.get("mapping.total_fields.limit")
+        if raw is None:
+            raw = ((index_settings.get("mapping") or {}).get("total_fields") or {}).get(
+                "limit", DEFAULT_FIELD_LIMIT
+            )
     try:
         return int(raw)
     except (TypeError, ValueError):
@@ -0,0 +1,462 @@
+"""Classify unassigned shards from cluster state without allocation explain.
+
+``_cluster/allocation/explain`` answers one shard per request and runs the
+full set of allocation deciders, which takes minutes on a large red cluster.
+Most unassigned shards fail for a handful of obvious reasons that can be read
+straight from the routing table, index settings, cluster settings and node
+attributes, all fetched once:
+
+* allocation disabled through ``cluster.routing.allocation.enable``,
+* allocation retries exhausted (``ALLOCATION_FAILED``),
+* more copies than eligible data nodes (replicas sharing a node),
+* index or cluster routing filters that match no data node,
+* a tier preference (``_tier_preference``) no data node can satisfy,
+* awareness attributes that no data node carries, or forced awareness
+  values that are missing,
+* delayed allocation waiting for a departed node.
+
+``classify_index`` returns None for anything else; those shards are left to
+allocation explain.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from elastro.core.logger import get_logger
+from elastro.health.chunking import index_chunks
+
+logger = get_logger(__name__)
+
+# Indices per cluster state request
+STATE_CHUNK_SIZE = 500
+DEFAULT_MAX_RETRIES = 5
+
+_STATE_FILTER_PATH = [
+    "routing_table.indices.*.shards",
+    "metadata.indices.*.settings.index.number_of_replicas",
+    "metadata.indices.*.settings.index.routing.allocation",
+    "metadata.indices.*.settings.index.allocation.max_retries",
+]
+_NODE_FILTER_PATH = [
+    "nodes.*.name",
+    "nodes.*.host",
+    "nodes.*.ip",
+    "nodes.*.roles",
+    "nodes.*.attributes",
+]
+_BUILTIN_ATTRIBUTES = ("_name", "_host", "_ip", "_id")
+# Matched against node roles rather than node attributes
+_TIER_ATTRIBUTE = "_tier"
+_TIER_PREFERENCE = "index.routing.allocation.include._tier_preference"
+_DATA_TIERS = ("data_content", "data_hot", "data_warm", "data_cold", "data_frozen")
+
+
+@dataclass
+class LocalDiagnosis:
+    """Outcome of classifying an index's unassigned shards locally."""
+
+    reason: str
+    allocate_explanation: str
+    routing_filter_fault: bool = False
+    unassigned: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class AllocationState:
+    """Routing, settings and node attributes needed to classify unassigned shards."""
+
+    shards: Dict[str, List[Dict[str, Any]]]
+    index_settings: Dict[str, Dict[str, Any]]
+    cluster_settings: Dict[str, Any]
+    nodes: Dict[str, Dict[str, Any]]
+
+    @property
+    def data_nodes(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            node_id: node
+            for node_id, node in self.nodes.items()
+            if any(
+                role == "data" or str(role).startswith("data_")
+                for role in node.get("roles") or ["data"]
+            )
+        }
+
+    def unassigned_shards(self, index_name: str) -> List[Dict[str, Any]]:
+        return [
+            shard
+            for shard in self.shards.get(index_name, [])
+            if shard.get("state") == "UNASSIGNED"
+        ]
+
+
+def fetch_allocation_state(
+    es: Any,
+    index_names: List[str],
+    all_names: List[str],
+) -> AllocationState:
+    """Read routing tables, index settings, cluster settings and nodes once."""
+    states = [
+        _body(es.cluster.state(**_state_params(expression)))
+        for expression in _state_expressions(index_names, all_names)
+    ]
+    settings = _body(es.cluster.get_settings(flat_settings=True))
+    nodes = _body(es.nodes.info(filter_path=_NODE_FILTER_PATH))
+    return _build_state(states, settings, nodes)
+
+
+async def fetch_allocation_state_async(
+    es: Any,
+    index_names: List[str],
+    all_names: List[str],
+) -> AllocationState:
+    """``fetch_allocation_state`` for an ``AsyncElasticsearch`` client."""
+    states = [
+        _body(await es.cluster.state(**_state_params(expression)))
+        for expression in _state_expressions(index_names, all_names)
+    ]
+    settings = _body(await es.cluster.get_settings(flat_settings=True))
+    nodes = _body(await es.nodes.info(filter_path=_NODE_FILTER_PATH))
+    return _build_state(states, settings, nodes)
+
+
+def _state_expressions(index_names: List[str], all_names: List[str]) -> List[str]:
+    return [
+        expression
+        for expression, _ in index_chunks(
+            index_names, all_names, chunk_size=STATE_CHUNK_SIZE
+        )
+    ]
+
+
+def _state_params(expression: str) -> Dict[str, Any]:
+    return {
+        "metric": "routing_table,metadata",
+        "index": expression,
+        "expand_wildcards": "all",
+        "filter_path": _STATE_FILTER_PATH,
+    }
+
+
+def _build_state(
+    states: List[Dict[str, Any]],
+    settings: Dict[str, Any],
+    nodes: Dict[str, Any],
+) -> AllocationState:
+    shards: Dict[str, List[Dict[str, Any]]] = {}
+    index_settings: Dict[str, Dict[str, Any]] = {}
+    for state in states:
+        for name, routing in (
+            (state.get("routing_table") or {}).get("indices") or {}
+        ).items():
+            shards[name] = [
+                copy
+                for copies in (routing.get("shards") or {}).values()
+                for copy in copies
+            ]
+        for name, meta in ((state.get("metadata") or {}).get("indices") or {}).items():
+            index_settings[name] = _flatten((meta.get("settings") or {}))
+
+    cluster_settings: Dict[str, Any] = {}
+    cluster_settings.update(settings.get("persistent") or {})
+    cluster_settings.update(settings.get("transient") or {})
+
+    return AllocationState(
+        shards=shards,
+        index_settings=index_settings,
+        cluster_settings=cluster_settings,
+        nodes=dict(nodes.get("nodes") or {}),
+    )
+
+
+def classify_index(state: AllocationState, index_name: str) -> Optional[LocalDiagnosis]:
+    """Explain why an index's shards are unassigned, or None when unclear."""
+    # Missing from the routing table (deleted, or skipped by the state read);
+    # only allocation explain can tell what is going on
+    if index_name not in state.shards:
+        return None
+    unassigned = state.unassigned_shards(index_name)
+    if not unassigned:
+        return LocalDiagnosis(
+            reason="ASSIGNED",
+            allocate_explanation=(
+                "All shards are assigned; copies may still be initializing "
+                "or relocating."
+            ),
+        )
+
+    shard = sorted(unassigned, key=lambda copy: not copy.get("primary"))[0]
+    info = shard.get("unassigned_info") or {}
+    reason = str(info.get("reason") or "UNKNOWN_REASON")
+    replicas_only = not any(copy.get("primary") for copy in unassigned)
+    settings = state.index_settings.get(index_name, {})
+    summary = [_shard_summary(copy) for copy in unassigned]
+
+    def result(
+        explanation: str, *, routing_filter_fault: bool = False
+    ) -> LocalDiagnosis:
+        return LocalDiagnosis(
+            reason=reason,
+            allocate_explanation=explanation,
+            routing_filter_fault=routing_filter_fault,
+            unassigned=summary,
+        )
+
+    enable = str(
+        state.cluster_settings.get("cluster.routing.allocation.enable", "all")
+    ).lower()
+    if enable == "none" or (enable == "primaries" and replicas_only):
+        return result(
+            f"Allocation blocked: cluster.routing.allocation.enable is '{enable}'."
+        )
+
+    max_retries = _int(
+        settings.get("index.allocation.max_retries"), DEFAULT_MAX_RETRIES
+    )
+    failed_attempts = _int(info.get("failed_attempts"), 0)
+    if reason == "ALLOCATION_FAILED" and failed_attempts >= max_retries:
+        details = info.get("details") or "no details"
+        return result(
+            f"Allocation failed {failed_attempts} times, reaching "
+            f"index.allocation.max_retries ({max_retries}): {details}"
+        )
+
+    data_nodes = state.data_nodes
+    tiers = _csv(settings.get(_TIER_PREFERENCE))
+    tier_nodes = _preferred_tier_nodes(data_nodes, tiers) if tiers else data_nodes
+    if data_nodes and not tier_nodes:
+        return result(
+            "Allocation blocked: no data node is in the preferred tier(s) "
+            f"{', '.join(tiers)} (index.routing.allocation.include._tier_preference)."
+        )
+    eligible = {
+        node_id: node
+        for node_id, node in tier_nodes.items()
+        if _passes_filters(
+            node_id, node, _filters(settings, "index.routing.allocation.")
+        )
+        and _passes_filters(
+            node_id,
+            node,
+            _filters(state.cluster_settings, "cluster.routing.allocation."),
+        )
+    }
+    if data_nodes and not eligible:
+        index_filtered = bool(_filters(settings, "index.routing.allocation."))
+        scope = "index" if index_filtered else "cluster"
+        return result(
+            f"Allocation blocked: {scope}.routing.allocation filters match no "
+            "data node.",
+            routing_filter_fault=index_filtered,
+        )
+
+    awareness = _csv(
+        state.cluster_settings.get("cluster.routing.allocation.awareness.attributes")
+    )
+    for attribute in awareness:
+        aware_nodes = [
+            node
+            for node in eligible.values()
+            if (node.get("attributes") or {}).get(attribute)
+        ]
+        if eligible and not aware_nodes:
+            return result(
+                f"Allocation blocked: no eligible data node has awareness attribute "
+                f"'{attribute}'."
+            )
+        forced = _csv(
+            state.cluster_settings.get(
+                f"cluster.routing.allocation.awareness.force.{attribute}.values"
+            )
+        )
+        present = {
+            (node.get("attributes") or {}).get(attribute) for node in aware_nodes
+        }
+        missing = [value for value in forced if value not in present]
+        if replicas_only and missing:
+            return result(
+                f"Replica allocation blocked by forced awareness on '{attribute}': "
+                f"no node with value(s) {', '.join(missing)}."
+            )
+
+    copies = _int(settings.get("index.number_of_replicas"), 0) + 1
+    if replicas_only and eligible and copies > len(eligible):
+        return result(
+            f"Index needs {copies} copies of each shard but only {len(eligible)} "
+            "eligible data node(s) exist; a replica cannot be allocated to the same "
+            "node as another copy of the shard."
+        )
+
+    if reason == "NODE_LEFT" and info.get("delayed"):
+        return result(
+            "Allocation delayed: waiting for the departed node to rejoin "
+            "(index.unassigned.node_left.delayed_timeout)."
+        )
+
+    return None
+
+
+def group_key(state: AllocationState, index_name: str) -> tuple:
+    """Key under which ambiguous indices are expected to share an explanation."""
+    shard = first_unassigned(state, index_name)
+    if shard is None:
+        # Nothing to compare against; explain each such index on its own
+        return ("NO_UNASSIGNED_SHARD", index_name)
+    info = shard.get("unassigned_info") or {}
+    routing = _filters(
+        state.index_settings.get(index_name, {}), "index.routing.allocation."
+    )
+    return (
+        str(info.get("reason") or "UNKNOWN_REASON"),
+        bool(shard.get("primary")),
+        str(info.get("details") or ""),
+        tuple(sorted(routing.items())),
+        str(state.index_settings.get(index_name, {}).get(_TIER_PREFERENCE) or ""),
+    )
+
+
+def first_unassigned(
+    state: AllocationState, index_name: str
+) -> Optional[Dict[str, Any]]:
+    """The copy to explain for an index: primaries before replicas.
+
+    None when the routing table holds no unassigned copy of the index.
+    """
+    unassigned = state.unassigned_shards(index_name)
+    if not unassigned:
+        return None
+    return sorted(unassigned, key=lambda copy: not copy.get("primary"))[0]
+
+
+def _filters(settings: Dict[str, Any], prefix: str) -> Dict[str, str]:
+    """``{"require._name": "node-1", ...}`` from require/include/exclude settings."""
+    filters: Dict[str, str] = {}
+    for key, value in settings.items():
+        if not key.startswith(prefix):
+            continue
+        rest = key[len(prefix) :]
+        kind, _, attribute = rest.partition(".")
+        if (
+            kind not in {"require", "include", "exclude"}
+            or not attribute
+            or value in (None, "")
+        ):
+            continue
+        # Reserved attributes such as _tier_preference are not node
+        # attributes; tier preference is handled by _preferred_tier_nodes
+        if attribute.startswith("_") and attribute not in (
+            *_BUILTIN_ATTRIBUTES,
+            _TIER_ATTRIBUTE,
+        ):
+            continue
+        filters[rest] = str(value)
+    return filters
+
+
+def _node_tiers(node: Dict[str, Any]) -> List[str]:
+    roles = [str(role) for role in node.get("roles") or ["data"]]
+    # The generic data role belongs to every tier
+    if "data" in roles:
+        return list(_DATA_TIERS)
+    return [role for role in roles if role in _DATA_TIERS]
+
+
+def _preferred_tier_nodes(
+    data_nodes: Dict[str, Dict[str, Any]], tiers: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Data nodes of the first preferred tier that has any, as allocation does."""
+    for tier in tiers:
+        nodes = {
+            node_id: node
+            for node_id, node in data_nodes.items()
+            if tier in _node_tiers(node)
+        }
+        if nodes:
+            return nodes
+    return {}
+
+
+def _passes_filters(
+    node_id: str, node: Dict[str, Any], filters: Dict[str, str]
+) -> bool:
+    """Apply allocation filters the way the filter allocation decider does."""
+    include_matches: List[bool] = []
+    for key, raw in filters.items():
+        kind, attribute = key.split(".", 1)
+        matched = _node_matches(node_id, node, attribute, _csv(raw))
+        if kind == "require" and not matched:
+            return False
+        if kind == "exclude" and matched:
+            return False
+        if kind == "include":
+            include_matches.append(matched)
+    return not include_matches or any(include_matches)
+
+
+def _node_matches(
+    node_id: str,
+    node: Dict[str, Any],
+    attribute: str,
+    patterns: List[str],
+) -> bool:
+    if attribute == _TIER_ATTRIBUTE:
+        return any(
+            fnmatch.fnmatchcase(tier, pattern)
+            for tier in _node_tiers(node)
+            for pattern in patterns
+        )
+    if attribute in _BUILTIN_ATTRIBUTES:
+        value = {
+            "_name": node.get("name"),
+            "_host": node.get("host"),
+            "_ip": node.get("ip"),
+            "_id": node_id,
+        }[attribute]
+    else:
+        value = (node.get("attributes") or {}).get(attribute)
+    if value is None:
+        return False
+    return any(fnmatch.fnmatchcase(str(value), pattern) for pattern in patterns)
+
+
+def _shard_summary(copy: Dict[str, Any]) -> Dict[str, Any]:
+    info = copy.get("unassigned_info") or {}
+    return {
+        "shard": copy.get("shard"),
+        "primary": bool(copy.get("primary")),
+        "reason": info.get("reason"),
+        "failed_attempts": info.get("failed_attempts"),
+    }
+
+
+def _flatten(value: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    flat: Dict[str, Any] = {}
+    for key, item in value.items():
+        name = f"{prefix}{key}"
+        if isinstance(item, dict):
+            flat.update(_flatten(item, f"{name}."))
+        else:
+            flat[name] = item
+    return flat
+
+
+def _csv(raw: Any) -> List[str]:
+    if raw is None:
+        return []
+    if isinstance(raw, (list, tuple)):
+        return [str(part).strip() for part in raw if str(part).strip()]
+    return [part.strip() for part in str(raw).split(",") if part.strip()]
+
+
+def _int(raw: Any, default: int) -> int:
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return default
+
+
+def _body(response: Any) -> Dict[str, Any]:
+    body = getattr(response, "body", response)
+    return dict(body) if isinstance(body, dict) else {}
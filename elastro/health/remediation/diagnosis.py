@@ -6,6 +6,13 @@ from typing import Any, Dict, List, Optional
 
 from elastro.core.index import IndexManager
 from elastro.core.logger import get_logger
+from elastro.health.remediation.allocation_state import (
+    LocalDiagnosis,
+    classify_index,
+    fetch_allocation_state,
+    first_unassigned,
+    group_key,
+)
 from elastro.health.remediation.models import IndexDiagnosis
 
 logger = get_logger(__name__)
@@ -47,7 +54,8 @@ def suggest_action_id(
     ):
         return (
             "reduce_replicas",
-            "The replica count is likely higher than the number of available physical nodes.",
+            "The replica count is likely higher than the number of available "
+            "physical nodes.",
         )
 
     if reason == "ALLOCATION_FAILED":
@@ -72,9 +80,21 @@ def diagnose_index(
     health: str,
     status: str = "unknown",
     cat_entry: Optional[Dict[str, Any]] = None,
+    shard: Optional[Dict[str, Any]] = None,
 ) -> IndexDiagnosis:
-    """Explain allocation for an index and suggest a remediation action."""
-    explain_result = index_manager.allocation_explain(index_name)
+    """Explain allocation for an index and suggest a remediation action.
+
+    Pass a routing-table ``shard`` copy to explain that copy specifically.
+    """
+    if shard is not None:
+        response = index_manager._client.get_client().cluster.allocation_explain(
+            index=index_name,
+            shard=int(shard.get("shard", 0)),
+            primary=bool(shard.get("primary")),
+        )
+        explain_result = dict(getattr(response, "body", response))
+    else:
+        explain_result = index_manager.allocation_explain(index_name)
     allocate_explanation = explain_result.get(
         "allocate_explanation", "No explanation available"
     )
@@ -114,7 +134,10 @@ def diagnose_index(
 
 def list_unhealthy_indices(index_manager: IndexManager) -> List[Dict[str, Any]]:
     """Return cat indices entries that are yellow or red."""
-    indices = index_manager.list()
+    return _unhealthy(index_manager.list())
+
+
+def _unhealthy(indices: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     unhealthy = [
         idx for idx in indices if idx.get("health", "green") in {"yellow", "red"}
     ]
@@ -122,45 +145,158 @@ def list_unhealthy_indices(index_manager: IndexManager) -> List[Dict[str, Any]]:
     return unhealthy
 
 
-def diagnose_unhealthy_indices(index_manager: IndexManager) -> List[IndexDiagnosis]:
-    """Scan and diagnose every yellow/red index in the cluster."""
-    diagnoses: List[IndexDiagnosis] = []
-    for idx in list_unhealthy_indices(index_manager):
-        name = str(idx.get("index", "")).strip()
-        if not name:
-            continue
-        health = str(idx.get("health", "unknown"))
-        status = str(idx.get("status", "unknown"))
+def diagnose_unhealthy_indices(
+    index_manager: IndexManager,
+    *,
+    bulk: bool = True,
+) -> List[IndexDiagnosis]:
+    """Scan and diagnose every yellow/red index in the cluster.
+
+    In ``bulk`` mode most indices are classified from one cluster state read
+    (see ``allocation_state``) and allocation explain runs only for one index
+    per group of unclear cases. If the state cannot be read, every index is
+    explained individually.
+    """
+    indices = index_manager.list()
+    unhealthy = [
+        idx for idx in _unhealthy(indices) if str(idx.get("index", "")).strip()
+    ]
+    diagnoses: Optional[List[IndexDiagnosis]] = None
+    if bulk and unhealthy:
+        # The full listing lets chunking collapse names into prefix* patterns
+        all_names = [
+            name
+            for name in (str(idx.get("index", "")).strip() for idx in indices)
+            if name
+        ]
         try:
-            diagnoses.append(
-                diagnose_index(
-                    index_manager,
-                    index_name=name,
-                    health=health,
-                    status=status,
-                    cat_entry=idx,
-                )
-            )
+            diagnoses = _diagnose_from_state(index_manager, unhealthy, all_names)
         except Exception as exc:
             logger.warning(
-                "Failed to diagnose index %s: %s",
-                name,
+                "Bulk diagnosis unavailable, explaining each index: %s",
                 exc,
                 exc_info=True,
             )
-            diagnoses.append(
-                IndexDiagnosis(
-                    index_name=name,
-                    health=health,
-                    status=status,
-                    allocate_explanation=f"Failed to explain allocation: {exc}",
-                    reason="ERROR",
-                    metadata={"error": str(exc)},
-                )
-            )
+    if diagnoses is None:
+        diagnoses = [_explain_or_error(index_manager, idx) for idx in unhealthy]
     logger.info(
         "Diagnosis complete: %s index(es), %s actionable",
         len(diagnoses),
         sum(1 for d in diagnoses if d.suggested_action_id),
     )
     return diagnoses
+
+
+def _diagnose_from_state(
+    index_manager: IndexManager,
+    unhealthy: List[Dict[str, Any]],
+    all_names: List[str],
+) -> List[IndexDiagnosis]:
+    names = [str(idx["index"]).strip() for idx in unhealthy]
+    state = fetch_allocation_state(
+        index_manager._client.get_client(), names, all_names=all_names
+    )
+
+    diagnoses: Dict[str, IndexDiagnosis] = {}
+    ambiguous: Dict[tuple, List[Dict[str, Any]]] = {}
+    for idx, name in zip(unhealthy, names):
+        local = classify_index(state, name)
+        if local is None:
+            ambiguous.setdefault(group_key(state, name), []).append(idx)
+            continue
+        diagnoses[name] = _local_diagnosis(idx, name, local)
+
+    # One allocation explain per group of alike unclear indices
+    for group in ambiguous.values():
+        representative = group[0]
+        explained = _explain_or_error(
+            index_manager,
+            representative,
+            shard=first_unassigned(state, str(representative["index"]).strip()),
+        )
+        for idx in group:
+            name = str(idx["index"]).strip()
+            if idx is representative:
+                diagnoses[name] = explained
+                continue
+            metadata = {"cat": idx, "explained_by": explained.index_name}
+            diagnoses[name] = explained.model_copy(
+                update={
+                    "index_name": name,
+                    "health": str(idx.get("health", "unknown")),
+                    "status": str(idx.get("status", "unknown")),
+                    "metadata": metadata,
+                }
+            )
+
+    logger.info(
+        "Bulk diagnosis: %s index(es) classified from cluster state, "
+        "%s allocation explain(s) for the rest",
+        len(names) - sum(len(group) for group in ambiguous.values()),
+        len(ambiguous),
+    )
+    return [diagnoses[name] for name in names]
+
+
+def _local_diagnosis(
+    idx: Dict[str, Any],
+    name: str,
+    local: LocalDiagnosis,
+) -> IndexDiagnosis:
+    health = str(idx.get("health", "unknown"))
+    action_id, suggestion = suggest_action_id(
+        health=health,
+        reason=local.reason,
+        allocate_explanation=local.allocate_explanation,
+        routing_filter_fault=local.routing_filter_fault,
+    )
+    return IndexDiagnosis(
+        index_name=name,
+        health=health,
+        status=str(idx.get("status", "unknown")),
+        allocate_explanation=local.allocate_explanation,
+        reason=local.reason,
+        routing_filter_fault=local.routing_filter_fault,
+        suggested_action_id=action_id,
+        suggestion_text=suggestion,
+        metadata={
+            "cat": idx,
+            "diagnosed_from": "cluster_state",
+            "unassigned": local.unassigned,
+        },
+    )
+
+
+def _explain_or_error(
+    index_manager: IndexManager,
+    idx: Dict[str, Any],
+    *,
+    shard: Optional[Dict[str, Any]] = None,
+) -> IndexDiagnosis:
+    name = str(idx.get("index", "")).strip()
+    health = str(idx.get("health", "unknown"))
+    status = str(idx.get("status", "unknown"))
+    try:
+        return diagnose_index(
+            index_manager,
+            index_name=name,
+            health=health,
+            status=status,
+            cat_entry=idx,
+            shard=shard,
+        )
+    except Exception as exc:
+        logger.warning(
+            "Failed to diagnose index %s: %s",
+            name,
+            exc,
+            exc_info=True,
+        )
+        return IndexDiagnosis(
+            index_name=name,
+            health=health,
+            status=status,
+            allocate_explanation=f"Failed to explain allocation: {exc}",
+            reason="ERROR",
+            metadata={"error": str(exc)},
+        )
@@ -11,6 +11,7 @@ from elastro.health.models import Finding
 logger = get_logger(__name__)
 
 RuleFn = Callable[["RuleContext"], List[Finding]]
+FindingsCallback = Callable[[str, List[Finding]], None]
 
 
 @dataclass
@@ -63,8 +64,16 @@ class RuleEngine:
             mapping_explosion_findings,
         ]
 
-    def evaluate(self, ctx: RuleContext) -> List[Finding]:
-        """Run all rules and return merged findings."""
+    def evaluate(
+        self,
+        ctx: RuleContext,
+        on_findings: Optional[FindingsCallback] = None,
+    ) -> List[Finding]:
+        """Run all rules and return merged findings.
+
+        ``on_findings`` is called with the rule name and its findings as each
+        rule that emits something finishes.
+        """
         findings: List[Finding] = []
         for rule in self._rules:
             rule_name = getattr(rule, "__name__", repr(rule))
@@ -85,4 +94,6 @@ class RuleEngine:
                     len(emitted),
                 )
                 findings.extend(emitted)
+                if on_findings is not None:
+                    on_findings(rule_name, emitted)
         return findings
@@ -1,16 +1,38 @@
-"""Shard size analysis helpers for health diagnostics."""
+"""Shard size analysis helpers for health diagnostics.
+
+Shards are held in a columnar ``ShardTable`` (typed arrays plus interned
+index and node names) rather than one object per row, and analysed column
+by column. With NumPy installed (``pip install elastro-client[analysis]``)
+the analysis is vectorized over zero-copy views of those arrays; without it
+the same results come from a single pass over the columns.
+"""
 
 from __future__ import annotations
 
+import heapq
+import importlib
+from array import array
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from elastro.core.logger import get_logger
 
+try:
+    np: Any = importlib.import_module("numpy")
+except ImportError:  # optional: pure-Python column pass instead
+    np = None
+
 logger = get_logger(__name__)
 
 DEFAULT_OVERSHARD_THRESHOLD_MB = 1.0
 DEFAULT_UNDERSHARD_THRESHOLD_GB = 50.0
+# Offender shards, indices and nodes kept in an analysis
+DEFAULT_TOP_K = 50
+
+SHARD_STATES = ("STARTED", "RELOCATING", "INITIALIZING", "UNASSIGNED", "OTHER")
+_STATE_CODES = {state: code for code, state in enumerate(SHARD_STATES)}
+_UNASSIGNED = _STATE_CODES["UNASSIGNED"]
+_NO_NODE = -1
 
 _SIZE_MULTIPLIERS = {
     "b": 1,
@@ -47,6 +69,11 @@ class ShardAnalysis:
     undersharded: List[ShardSizeRecord] = field(default_factory=list)
     overshard_threshold_bytes: int = 0
     undershard_threshold_bytes: int = 0
+    # Indices with the most oversharded shards, and per-node placement
+    oversharded_by_index: List[Dict[str, Any]] = field(default_factory=list)
+    nodes: List[Dict[str, Any]] = field(default_factory=list)
+    node_shard_skew: float = 0.0
+    node_bytes_skew: float = 0.0
 
 
 def parse_store_size(value: Any) -> Optional[int]:
@@ -109,53 +136,351 @@ def normalize_shard_rows(rows: List[Dict[str, Any]]) -> List[ShardSizeRecord]:
     return records
 
 
-def analyze_shards(
-    rows: List[Dict[str, Any]],
+class ShardTable:
+    """Columnar store of cat.shards rows.
+
+    Each column is a typed ``array``; index and node names are interned once
+    and referenced by integer code, so a row costs about 20 bytes instead of
+    a dict or dataclass per shard.
+    """
+
+    __slots__ = (
+        "index_names",
+        "node_names",
+        "_index_codes",
+        "_node_codes",
+        "index_ids",
+        "node_ids",
+        "shards",
+        "primary",
+        "states",
+        "store_bytes",
+    )
+
+    def __init__(self) -> None:
+        self.index_names: List[str] = []
+        self.node_names: List[str] = []
+        self._index_codes: Dict[str, int] = {}
+        self._node_codes: Dict[str, int] = {}
+        self.index_ids = array("i")
+        self.node_ids = array("i")
+        self.shards = array("i")
+        self.primary = array("b")
+        self.states = array("b")
+        self.store_bytes = array("q")
+
+    def __len__(self) -> int:
+        return len(self.index_ids)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any]) -> "ShardTable":
+        """Build a table from cat.shards JSON rows, skipping malformed ones."""
+        table = cls()
+        table.extend(rows)
+        return table
+
+    def extend(self, rows: Iterable[Any]) -> None:
+        """Append cat.shards JSON rows, skipping malformed ones."""
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            self.append(
+                index=row.get("index"),
+                shard=row.get("shard"),
+                prirep=row.get("prirep"),
+                state=row.get("state"),
+                store=row.get("store"),
+                node=row.get("node"),
+            )
+
+    def append(
+        self,
+        *,
+        index: Any,
+        shard: Any,
+        prirep: Any,
+        state: Any,
+        store: Any,
+        node: Any,
+    ) -> None:
+        """Add one shard copy; rows without an index name are ignored."""
+        index_name = str(index or "").strip()
+        if not index_name:
+            return
+        code = self._index_codes.get(index_name)
+        if code is None:
+            code = self._index_codes[index_name] = len(self.index_names)
+            self.index_names.append(index_name)
+        node_name = str(node or "").strip()
+        if node_name in ("", "-", "null"):
+            node_code = _NO_NODE
+        else:
+            node_code = self._node_codes.get(node_name, _NO_NODE)
+            if node_code == _NO_NODE:
+                node_code = self._node_codes[node_name] = len(self.node_names)
+                self.node_names.append(node_name)
+        try:
+            shard_num = int(shard)
+        except (TypeError, ValueError):
+            shard_num = -1
+
+        self.index_ids.append(code)
+        self.node_ids.append(node_code)
+        self.shards.append(shard_num)
+        self.primary.append(1 if str(prirep or "").lower() == "p" else 0)
+        self.states.append(
+            _STATE_CODES.get(str(state or "").upper(), _STATE_CODES["OTHER"])
+        )
+        self.store_bytes.append(parse_store_size(store) or 0)
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Yield the table as cat.shards-style rows, one dict at a time."""
+        for position in range(len(self)):
+            record = self.record(position)
+            yield {
+                "index": record.index,
+                "shard": record.shard,
+                "prirep": record.prirep,
+                "state": record.state,
+                "store": record.store_bytes,
+                "node": record.node,
+            }
+
+    def record(self, position: int) -> ShardSizeRecord:
+        """Materialize one row as a ``ShardSizeRecord``."""
+        node_code = self.node_ids[position]
+        shard_num = self.shards[position]
+        return ShardSizeRecord(
+            index=self.index_names[self.index_ids[position]],
+            shard=str(shard_num) if shard_num >= 0 else "",
+            prirep="p" if self.primary[position] else "r",
+            state=SHARD_STATES[self.states[position]],
+            store_bytes=self.store_bytes[position],
+            node=self.node_names[node_code] if node_code != _NO_NODE else "",
+        )
+
+
+def analyze_shard_table(
+    table: ShardTable,
     *,
     overshard_threshold_mb: float = DEFAULT_OVERSHARD_THRESHOLD_MB,
     undershard_threshold_gb: float = DEFAULT_UNDERSHARD_THRESHOLD_GB,
+    top_k: int = DEFAULT_TOP_K,
 ) -> ShardAnalysis:
-    """Analyze shard sizes for oversharding and undersharding patterns."""
+    """Analyze shard sizes and placement of a ``ShardTable``.
+
+    Counts cover every shard; ``oversharded`` lists the ``top_k`` smallest
+    oversharded shards and ``undersharded`` the ``top_k`` largest
+    undersharded ones.
+    """
     overshard_bytes = int(overshard_threshold_mb * _SIZE_MULTIPLIERS["mb"])
     undershard_bytes = int(undershard_threshold_gb * _SIZE_MULTIPLIERS["gb"])
+    columns = _numpy_columns if np is not None else _python_columns
+    stats = columns(table, overshard_bytes, undershard_bytes, top_k)
+
+    node_counts, node_bytes = stats["node_counts"], stats["node_bytes"]
+    held = [code for code, count in enumerate(node_counts) if count]
+    nodes: List[Dict[str, Any]] = [
+        {
+            "node": table.node_names[code],
+            "shard_count": int(node_counts[code]),
+            "store_bytes": int(node_bytes[code]),
+        }
+        for code in held
+    ]
+    nodes.sort(key=lambda item: (-item["store_bytes"], item["node"]))
 
-    records = normalize_shard_rows(rows)
-    measured: List[ShardSizeRecord] = []
-    oversharded: List[ShardSizeRecord] = []
-    undersharded: List[ShardSizeRecord] = []
-    unassigned = 0
+    analysis = ShardAnalysis(
+        total_shards=len(table),
+        measured_shards=stats["measured"],
+        avg_bytes=stats["avg_bytes"],
+        oversharded_count=stats["oversharded"],
+        undersharded_count=stats["undersharded"],
+        unassigned_count=stats["unassigned"],
+        oversharded=[table.record(i) for i in stats["smallest"]],
+        undersharded=[table.record(i) for i in stats["largest"]],
+        overshard_threshold_bytes=overshard_bytes,
+        undershard_threshold_bytes=undershard_bytes,
+        oversharded_by_index=[
+            {
+                "index": table.index_names[code],
+                "oversharded_shard_count": int(count),
+                "smallest_bytes": int(smallest),
+            }
+            for code, count, smallest in stats["by_index"]
+        ],
+        nodes=nodes[:top_k],
+        node_shard_skew=_skew([node_counts[code] for code in held]),
+        node_bytes_skew=_skew([node_bytes[code] for code in held]),
+    )
+    logger.debug(
+        "Shard analysis: total=%s measured=%s oversharded=%s undersharded=%s "
+        "nodes=%s numpy=%s",
+        analysis.total_shards,
+        analysis.measured_shards,
+        analysis.oversharded_count,
+        analysis.undersharded_count,
+        len(nodes),
+        np is not None,
+    )
+    return analysis
 
-    for record in records:
-        if record.state == "UNASSIGNED":
+
+def _skew(values: List[float]) -> float:
+    """Largest value relative to the mean (1.0 means perfectly even)."""
+    if not values:
+        return 0.0
+    mean = sum(values) / len(values)
+    return round(max(values) / mean, 3) if mean else 0.0
+
+
+def _python_columns(
+    table: ShardTable,
+    overshard_bytes: int,
+    undershard_bytes: int,
+    top_k: int,
+) -> Dict[str, Any]:
+    sizes, states, node_ids, index_ids = (
+        table.store_bytes,
+        table.states,
+        table.node_ids,
+        table.index_ids,
+    )
+    node_counts = [0] * len(table.node_names)
+    node_bytes = [0] * len(table.node_names)
+    by_index: Dict[int, List[int]] = {}
+    over: List[int] = []
+    under: List[int] = []
+    measured = total_bytes = unassigned = 0
+
+    for i in range(len(table)):
+        if states[i] == _UNASSIGNED:
             unassigned += 1
             continue
-        if record.store_bytes <= 0:
+        size = sizes[i]
+        node = node_ids[i]
+        if node != _NO_NODE:
+            node_counts[node] += 1
+            node_bytes[node] += size
+        if size <= 0:
             continue
-        measured.append(record)
-        if record.store_bytes < overshard_bytes:
-            oversharded.append(record)
-        elif record.store_bytes > undershard_bytes:
-            undersharded.append(record)
-
-    avg_bytes = (
-        sum(item.store_bytes for item in measured) / len(measured) if measured else 0.0
+        measured += 1
+        total_bytes += size
+        if size < overshard_bytes:
+            over.append(i)
+            entry = by_index.get(index_ids[i])
+            if entry is None:
+                by_index[index_ids[i]] = [1, size]
+            else:
+                entry[0] += 1
+                entry[1] = min(entry[1], size)
+        elif size > undershard_bytes:
+            under.append(i)
+
+    top_indices = heapq.nsmallest(
+        top_k,
+        by_index.items(),
+        key=lambda item: (-item[1][0], table.index_names[item[0]]),
     )
-    logger.debug(
-        "Shard analysis: total=%s measured=%s oversharded=%s undersharded=%s",
-        len(records),
-        len(measured),
-        len(oversharded),
-        len(undersharded),
+    return {
+        "measured": measured,
+        "avg_bytes": total_bytes / measured if measured else 0.0,
+        "unassigned": unassigned,
+        "oversharded": len(over),
+        "undersharded": len(under),
+        "smallest": heapq.nsmallest(top_k, over, key=lambda i: (sizes[i], i)),
+        "largest": heapq.nsmallest(top_k, under, key=lambda i: (-sizes[i], i)),
+        "by_index": [(code, count, low) for code, (count, low) in top_indices],
+        "node_counts": node_counts,
+        "node_bytes": node_bytes,
+    }
+
+
+def _numpy_columns(
+    table: ShardTable,
+    overshard_bytes: int,
+    undershard_bytes: int,
+    top_k: int,
+) -> Dict[str, Any]:
+    # Zero-copy views over the table's arrays
+    sizes = np.frombuffer(table.store_bytes, dtype=table.store_bytes.typecode)
+    states = np.frombuffer(table.states, dtype=table.states.typecode)
+    node_ids = np.frombuffer(table.node_ids, dtype=table.node_ids.typecode)
+    index_ids = np.frombuffer(table.index_ids, dtype=table.index_ids.typecode)
+
+    assigned = states != _UNASSIGNED
+    measured = assigned & (sizes > 0)
+    over = measured & (sizes < overshard_bytes)
+    under = measured & (sizes > undershard_bytes)
+    measured_count = int(np.count_nonzero(measured))
+
+    placed = assigned & (node_ids != _NO_NODE)
+    node_total = len(table.node_names)
+    node_counts = np.bincount(node_ids[placed], minlength=node_total)
+    node_bytes = np.bincount(
+        node_ids[placed], weights=sizes[placed], minlength=node_total
     )
-    return ShardAnalysis(
-        total_shards=len(records),
-        measured_shards=len(measured),
-        avg_bytes=avg_bytes,
-        oversharded_count=len(oversharded),
-        undersharded_count=len(undersharded),
-        unassigned_count=unassigned,
-        oversharded=oversharded,
-        undersharded=undersharded,
-        overshard_threshold_bytes=overshard_bytes,
-        undershard_threshold_bytes=undershard_bytes,
+
+    over_positions = np.flatnonzero(over)
+    over_index = index_ids[over_positions]
+    index_counts = np.bincount(over_index, minlength=len(table.index_names))
+    index_smallest = np.full(len(table.index_names), np.iinfo(np.int64).max)
+    np.minimum.at(index_smallest, over_index, sizes[over_positions])
+    flagged = np.flatnonzero(index_counts)
+    top_codes = _top_k(flagged, -index_counts[flagged], top_k, table.index_names)
+
+    return {
+        "measured": measured_count,
+        "avg_bytes": float(sizes[measured].mean()) if measured_count else 0.0,
+        "unassigned": int(np.count_nonzero(~assigned)),
+        "oversharded": int(over_positions.size),
+        "undersharded": int(np.count_nonzero(under)),
+        "smallest": _top_k(over_positions, sizes[over_positions], top_k),
+        "largest": _top_k(np.flatnonzero(under), -sizes[under], top_k),
+        "by_index": [
+            (code, index_counts[code], index_smallest[code]) for code in top_codes
+        ],
+        "node_counts": node_counts.tolist(),
+        "node_bytes": node_bytes.astype(np.int64).tolist(),
+    }
+
+
+def _top_k(
+    positions: Any,
+    keys: Any,
+    k: int,
+    names: Optional[List[str]] = None,
+) -> List[int]:
+    """Positions with the ``k`` smallest keys, ordered; ties by name or position."""
+    if positions.size > k:
+        # argpartition finds the k smallest without sorting the rest; keep
+        # every element tied with the k-th so tie-breaking stays stable
+        cutoff = keys[np.argpartition(keys, k - 1)[k - 1]] if k > 0 else None
+        if cutoff is None:
+            return []
+        keep = keys <= cutoff
+        positions, keys = positions[keep], keys[keep]
+    ordered: List[Tuple[Any, Any, int]] = sorted(
+        zip(
+            keys.tolist(),
+            [names[p] for p in positions.tolist()] if names else positions.tolist(),
+            positions.tolist(),
+        )
+    )
+    return [position for _, _, position in ordered[:k]]
+
+
+def analyze_shards(
+    rows: List[Dict[str, Any]],
+    *,
+    overshard_threshold_mb: float = DEFAULT_OVERSHARD_THRESHOLD_MB,
+    undershard_threshold_gb: float = DEFAULT_UNDERSHARD_THRESHOLD_GB,
+    top_k: int = DEFAULT_TOP_K,
+) -> ShardAnalysis:
+    """Analyze cat.shards rows for oversharding and undersharding patterns."""
+    return analyze_shard_table(
+        ShardTable.from_rows(rows),
+        overshard_threshold_mb=overshard_threshold_mb,
+        undershard_threshold_gb=undershard_threshold_gb,
+        top_k=top_k,
     )
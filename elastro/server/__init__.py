@@ -17,12 +17,14 @@ import secrets
 import signal
 import urllib.error
 import urllib.request
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import uvicorn
 from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 
@@ -31,7 +33,14 @@ from elastro.core.logger import get_logger
 
 logger = get_logger(__name__)
 
-GUI_CAPABILITIES: List[str] = ["clusters", "indices", "health", "cli", "config"]
+GUI_CAPABILITIES: List[str] = [
+    "clusters",
+    "indices",
+    "health",
+    "cli",
+    "config",
+    "stats",
+]
 
 
 def _wait_for_server_ready(port: int, *, timeout: float = 8.0) -> bool:
@@ -102,12 +111,35 @@ def _should_reuse_gui_server(state: Dict[str, Any]) -> bool:
     return True
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Pre-warm the health cache on startup; release shared state on shutdown."""
+    from elastro.server.cli_executor import get_cli_executor
+    from elastro.server.health_cache import get_refresher
+    from elastro.server.routes.health import prewarm_health_cache
+    from elastro.server.services import close_async_clients, get_client_pool
+
+    read_config = getattr(app.state, "read_config", None)
+    if read_config is not None:
+        try:
+            prewarm_health_cache(read_config)
+        except Exception as exc:
+            logger.warning("Health cache pre-warm skipped: %s", exc)
+
+    yield
+    get_cli_executor().shutdown()
+    get_refresher().shutdown()
+    get_client_pool().close()
+    await close_async_clients()
+
+
 class ElastroGUI:
     def __init__(self) -> None:
         self.config_dir = Path.home() / ".elastic"
         self.config_file = self.config_dir / "gui_config.json"
         self.token = secrets.token_urlsafe(32)
-        self.app = FastAPI(title="Elastro Local GUI API")
+        self.app = FastAPI(title="Elastro Local GUI API", lifespan=_lifespan)
+        self.app.state.read_config = self._read_config
 
         # Setup static dir — points to the embedded Vue build
         self.static_dir = Path(__file__).parent.parent / "gui"
@@ -169,6 +201,12 @@ class ElastroGUI:
         return token
 
     def _setup_routes(self) -> None:
+        # Conditional GETs for the polling dashboards. Middleware added later
+        # wraps what came before, so CORS sits outside the ETag middleware
+        # (its 304s carry the CORS headers) and GZip compresses on the way out.
+        from elastro.server.http_cache import GZIP_MINIMUM_SIZE, ETagMiddleware
+
+        self.app.add_middleware(ETagMiddleware)
         # Enable CORS — locked to localhost only (OWASP hardened)
         self.app.add_middleware(
             CORSMiddleware,
@@ -176,15 +214,20 @@ class ElastroGUI:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=["ETag"],
+        )
+        self.app.add_middleware(
+            GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=6
         )
 
         # Mount modular routers — each route module binds to our shared
         # config accessor and token verifier via a factory function.
-        from elastro.server.routes.config import config_routes
-        from elastro.server.routes.clusters import cluster_routes
-        from elastro.server.routes.indices import index_routes
         from elastro.server.routes.cli import cli_routes
+        from elastro.server.routes.clusters import cluster_routes
+        from elastro.server.routes.config import config_routes
         from elastro.server.routes.health import health_routes
+        from elastro.server.routes.indices import index_routes
+        from elastro.server.routes.stats import stats_routes
 
         self.app.include_router(
             config_routes(self._read_config, self._write_config, self.verify_token)
@@ -193,6 +236,7 @@ class ElastroGUI:
         self.app.include_router(index_routes(self._read_config, self.verify_token))
         self.app.include_router(cli_routes(self._read_config, self.verify_token))
         self.app.include_router(health_routes(self._read_config, self.verify_token))
+        self.app.include_router(stats_routes(self.verify_token))
 
         @self.app.get("/api/meta")
         def api_meta() -> Dict[str, Any]:
@@ -212,7 +256,8 @@ class ElastroGUI:
 
             @self.app.get("/{full_path:path}")
             def serve_gui(full_path: str) -> HTMLResponse:
-                # Never serve SPA HTML for API paths — avoids silent axios parse failures
+                # Never serve SPA HTML for API paths — avoids silent axios
+                # parse failures
                 if full_path.startswith("api/"):
                     raise HTTPException(status_code=404, detail="API route not found")
                 index_path = self.static_dir / "index.html"
@@ -226,6 +271,11 @@ class ElastroGUI:
 
 
 def run_server(port: int = 8080, token: str = "") -> None:
+    # The GUI terminal runs CLI commands in this process: drop the banner and
+    # render tables at the width the terminal pane expects
+    os.environ.setdefault("ELASTRO_GUI_MODE", "1")
+    os.environ.setdefault("COLUMNS", "400")
+
     gui = ElastroGUI()
     if token:
         gui.token = token  # Override for the process
@@ -269,8 +319,8 @@ def launch_gui_process() -> str:
             port = s.getsockname()[1]
 
     # We use a detached subprocess instead of multiprocessing to survive CLI exit
-    import sys
     import subprocess
+    import sys
 
     cmd = [
         sys.executable,
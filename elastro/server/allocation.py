@@ -0,0 +1,248 @@
+"""
+Batched allocation diagnosis for the GUI unhealthy-indices view.
+
+Explaining every yellow or red index separately costs two requests per
+index, which is too slow on clusters with hundreds of them. Instead, this
+reuses the remediation diagnosis in
+``elastro.health.remediation.allocation_state``:
+
+* one cluster state read (chunked by index) classifies most unassigned
+  shards locally,
+* the remaining indices are grouped by ``group_key`` and only one
+  representative per group is explained,
+* explains run concurrently under a semaphore, and
+* the resulting rows are cached per cluster for a few seconds so polling
+  dashboards do not repeat the work.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from elastro.core.logger import get_logger
+from elastro.health.remediation.allocation_state import (
+    AllocationState,
+    LocalDiagnosis,
+    classify_index,
+    fetch_allocation_state_async,
+    first_unassigned,
+    group_key,
+)
+
+logger = get_logger(__name__)
+
+EXPLAIN_CONCURRENCY = 8
+DIAGNOSIS_CACHE_TTL = 15.0
+
+GroupKey = tuple
+
+
+def summarize_explain(idx: Dict[str, Any], explain: Dict[str, Any]) -> Dict[str, Any]:
+    """Condense an allocation explanation into the GUI's unhealthy-index row."""
+    unassigned = explain.get("unassigned_info", {})
+
+    routing_filter_fault = False
+    explanation_parts = []
+    for node_decision in explain.get("node_allocation_decisions", []):
+        for decider in node_decision.get("deciders", []):
+            if decider.get("decision") == "NO":
+                msg = decider.get("explanation", "").strip()
+                if msg and msg not in explanation_parts:
+                    explanation_parts.append(msg)
+
+            if decider.get(
+                "decider"
+            ) == "filter" and "index.routing.allocation" in decider.get(
+                "explanation", ""
+            ):
+                routing_filter_fault = True
+
+    alloc_explanation = explain.get("allocate_explanation", "")
+    if (
+        "Elasticsearch isn't allowed to allocate this shard" in alloc_explanation
+        and explanation_parts
+    ):
+        alloc_explanation = "Allocation blocked: " + " | ".join(explanation_parts)
+    elif not alloc_explanation:
+        alloc_explanation = "No explanation"
+
+    return {
+        "index": str(idx.get("index", "")),
+        "health": idx.get("health"),
+        "status": idx.get("status"),
+        "allocate_explanation": alloc_explanation,
+        "reason": unassigned.get("reason", "UNKNOWN"),
+        "routing_filter_fault": routing_filter_fault,
+    }
+
+
+def _error_row(idx: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "index": str(idx.get("index", "")),
+        "health": idx.get("health"),
+        "status": idx.get("status"),
+        "allocate_explanation": "Failed to fetch explanation",
+        "reason": "ERROR",
+        "routing_filter_fault": False,
+    }
+
+
+def _local_row(idx: Dict[str, Any], local: LocalDiagnosis) -> Dict[str, Any]:
+    return {
+        "index": str(idx.get("index", "")),
+        "health": idx.get("health"),
+        "status": idx.get("status"),
+        "allocate_explanation": local.allocate_explanation,
+        "reason": local.reason,
+        "routing_filter_fault": local.routing_filter_fault,
+    }
+
+
+@dataclass
+class _CachedDiagnosis:
+    rows: List[Dict[str, Any]]
+    expires_at: float
+
+
+class AllocationDiagnoser:
+    """
+    Diagnoses unhealthy indices with one explain per group of alike shards.
+
+    Args:
+        concurrency: Maximum allocation-explain requests in flight per call
+        ttl: Seconds a cluster's diagnosis is served from cache
+    """
+
+    def __init__(
+        self,
+        concurrency: int = EXPLAIN_CONCURRENCY,
+        ttl: float = DIAGNOSIS_CACHE_TTL,
+    ) -> None:
+        self.concurrency = concurrency
+        self.ttl = ttl
+        self._cache: Dict[str, _CachedDiagnosis] = {}
+
+    async def diagnose(
+        self,
+        cache_key: str,
+        es: Any,
+        *,
+        refresh: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Return one row per yellow or red index of the cluster behind ``es``."""
+        cached = self._cache.get(cache_key)
+        if cached is not None and not refresh and time.monotonic() < cached.expires_at:
+            return cached.rows
+
+        indices = await es.cat.indices(index="*", format="json")
+        names = [
+            str(idx["index"])
+            for idx in indices
+            if isinstance(idx, dict) and idx.get("index")
+        ]
+        unhealthy = [
+            idx
+            for idx in indices
+            if isinstance(idx, dict)
+            and idx.get("health", "green") in ["yellow", "red"]
+            and idx.get("index")
+        ]
+        rows = await self._diagnose(es, unhealthy, names) if unhealthy else []
+        self._cache[cache_key] = _CachedDiagnosis(
+            rows=rows, expires_at=time.monotonic() + self.ttl
+        )
+        return rows
+
+    async def _diagnose(
+        self,
+        es: Any,
+        unhealthy: List[Dict[str, Any]],
+        all_names: List[str],
+    ) -> List[Dict[str, Any]]:
+        names = [str(idx["index"]) for idx in unhealthy]
+        state = await fetch_allocation_state_async(es, names, all_names)
+
+        local_rows: Dict[str, Dict[str, Any]] = {}
+        keys: Dict[str, GroupKey] = {}
+        groups: Dict[GroupKey, List[str]] = {}
+        for idx, name in zip(unhealthy, names):
+            local = classify_index(state, name)
+            if local is not None:
+                local_rows[name] = _local_row(idx, local)
+                continue
+            keys[name] = group_key(state, name)
+            groups.setdefault(keys[name], []).append(name)
+
+        explains = await self._explain_groups(es, groups, state)
+
+        rows = []
+        for idx in unhealthy:
+            name = str(idx["index"])
+            if name in local_rows:
+                rows.append(local_rows[name])
+                continue
+            representative, explain = explains[keys[name]]
+            if isinstance(explain, BaseException):
+                rows.append(_error_row(idx))
+                continue
+            row = summarize_explain(idx, explain)
+            if representative != name:
+                row["explained_by"] = representative
+            rows.append(row)
+
+        logger.info(
+            "Diagnosed %s unhealthy indices with %s allocation explains",
+            len(rows),
+            len(groups),
+        )
+        return rows
+
+    async def _explain_groups(
+        self,
+        es: Any,
+        groups: Dict[GroupKey, List[str]],
+        state: AllocationState,
+    ) -> Dict[GroupKey, Tuple[str, Any]]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def explain(name: str) -> Dict[str, Any]:
+            # Indices missing from the routing table fall back to shard 0
+            shard = first_unassigned(state, name) or {"primary": True}
+            async with semaphore:
+                response = await es.cluster.allocation_explain(
+                    index=name,
+                    shard=int(shard.get("shard", 0)),
+                    primary=bool(shard.get("primary")),
+                )
+            return dict(getattr(response, "body", response))
+
+        keys = list(groups)
+        results = await asyncio.gather(
+            *(explain(groups[key][0]) for key in keys),
+            return_exceptions=True,
+        )
+        for key, result in zip(keys, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Failed to explain allocation for index=%s: %s",
+                    groups[key][0],
+                    result,
+                    exc_info=result,
+                )
+        return {key: (groups[key][0], result) for key, result in zip(keys, results)}
+
+    def invalidate(self, cache_key: Optional[str] = None) -> None:
+        """Drop cached diagnoses for one cluster, or for all of them."""
+        if cache_key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(cache_key, None)
+
+
+_diagnoser = AllocationDiagnoser()
+
+
+def get_allocation_diagnoser() -> AllocationDiagnoser:
+    """Return the process-wide allocation diagnoser."""
+    return _diagnoser
@@ -0,0 +1,284 @@
+"""
+In-process execution of elastro CLI commands for the GUI terminal.
+
+Running ``elastro`` as a subprocess pays the interpreter start-up, the Click
+and client import cost and a fresh cluster connection on every command. The
+executor here instead invokes the Click command tree inside the server
+process, on a small worker pool, against the pooled client for the cluster.
+
+Output is captured per worker thread: while any command runs, ``sys.stdout``,
+``sys.stderr`` and ``sys.stdin`` are replaced by proxies that route the
+running thread's I/O to its own buffers and everything else to the original
+streams, so concurrent commands (and the server itself) never interleave.
+"""
+
+import ctypes
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import click
+
+from elastro.core.client import ElasticsearchClient
+from elastro.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+CLI_TIMEOUT_SECONDS = 30
+CLI_WORKERS = 4
+
+# Commands that start servers, manage processes or replace the client they
+# are given; these always run in a subprocess
+SUBPROCESS_ONLY_COMMANDS = frozenset({"gui", "daemon", "stats"})
+
+
+class CommandTimeout(Exception):
+    """Raised when an in-process command does not finish within its timeout."""
+
+
+class CommandCancelled(BaseException):
+    """
+    Raised inside a worker thread to abort a command that timed out.
+
+    A ``BaseException`` so that commands' own ``except Exception`` handlers
+    do not swallow it.
+    """
+
+
+@dataclass
+class CLIResult:
+    exit_code: int
+    output: str
+
+
+class _ThreadLocalStream:
+    """Stream proxy that sends the capturing thread's I/O to its own buffer."""
+
+    def __init__(self, fallback: Any, local: threading.local, attr: str) -> None:
+        self._fallback = fallback
+        self._local = local
+        self._attr = attr
+
+    def _target(self) -> Any:
+        return getattr(self._local, self._attr, None) or self._fallback
+
+    def write(self, data: str) -> int:
+        return self._target().write(data)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def read(self, *args: Any) -> str:
+        return self._target().read(*args)
+
+    def readline(self, *args: Any) -> str:
+        return self._target().readline(*args)
+
+    def isatty(self) -> bool:
+        # Captured output is rendered by the GUI terminal, so keep colours
+        if getattr(self._local, self._attr, None) is not None:
+            return True
+        return self._fallback.isatty()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+
+class _StreamCapture:
+    """Installs the stream proxies while at least one command is running."""
+
+    _STREAMS = ("stdout", "stderr", "stdin")
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._active = 0
+        self._proxies: Dict[str, _ThreadLocalStream] = {}
+        self._saved: Dict[str, Any] = {}
+
+    def start(
+        self, stdout: io.StringIO, stderr: io.StringIO, stdin: io.StringIO
+    ) -> None:
+        self._local.stdout, self._local.stderr, self._local.stdin = (
+            stdout,
+            stderr,
+            stdin,
+        )
+        with self._lock:
+            for name in self._STREAMS:
+                current = getattr(sys, name)
+                # Someone else may have swapped the stream since we installed
+                # our proxy; wrap whatever is there now
+                if current is not self._proxies.get(name):
+                    proxy = _ThreadLocalStream(current, self._local, name)
+                    self._proxies[name] = proxy
+                    self._saved[name] = current
+                    setattr(sys, name, proxy)
+            self._active += 1
+
+    def stop(self) -> None:
+        with self._lock:
+            # Count down first: a CommandCancelled landing mid-way must not
+            # leave the proxies installed for good
+            self._active -= 1
+            try:
+                self._local.stdout = self._local.stderr = self._local.stdin = None
+            finally:
+                if self._active == 0:
+                    for name, proxy in self._proxies.items():
+                        if getattr(sys, name) is proxy:
+                            setattr(sys, name, self._saved[name])
+                    self._proxies.clear()
+                    self._saved.clear()
+
+
+_capture = _StreamCapture()
+
+
+def _default_command() -> click.Command:
+    from elastro.cli.cli import cli
+
+    return cli
+
+
+def _exit_code(command: click.Command, args: List[str], client: Any) -> int:
+    try:
+        rv = command.main(
+            args=args,
+            prog_name="elastro",
+            obj=client,
+            standalone_mode=False,
+        )
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        sys.stderr.write("Aborted!\n")
+        return 1
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        sys.stderr.write(f"{e.code}\n")
+        return 1
+    except Exception as e:
+        logger.warning("In-process CLI command %s failed: %s", args, e, exc_info=True)
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+    # standalone_mode=False returns the exit code from ctx.exit()
+    return rv if isinstance(rv, int) else 0
+
+
+class InProcessCLI:
+    """
+    Runs CLI commands on a worker pool with captured output and timeouts.
+
+    Args:
+        command: Click command to invoke (default: the ``elastro`` CLI)
+        max_workers: Commands that may run at the same time
+        timeout: Default seconds a command may run before it is cancelled
+    """
+
+    def __init__(
+        self,
+        command: Optional[click.Command] = None,
+        max_workers: int = CLI_WORKERS,
+        timeout: float = CLI_TIMEOUT_SECONDS,
+    ) -> None:
+        self._command = command
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="elastro-cli",
+                )
+            return self._executor
+
+    def run(
+        self,
+        args: List[str],
+        client: ElasticsearchClient,
+        *,
+        stdin: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> CLIResult:
+        """
+        Run ``elastro <args>`` against ``client`` and return its output.
+
+        Raises:
+            CommandTimeout: If the command runs longer than ``timeout``
+        """
+        timeout = self.timeout if timeout is None else timeout
+        job: Dict[str, Any] = {"thread": None, "done": False, "lock": threading.Lock()}
+        future = self._pool().submit(self._invoke, job, args, client, stdin)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeout:
+            self._cancel(future, job)
+            raise CommandTimeout(
+                f"Command execution timed out after {timeout:g} seconds"
+            ) from None
+
+    def _invoke(
+        self,
+        job: Dict[str, Any],
+        args: List[str],
+        client: ElasticsearchClient,
+        stdin: Optional[str],
+    ) -> CLIResult:
+        job["thread"] = threading.get_ident()
+        stdout, stderr = io.StringIO(), io.StringIO()
+        _capture.start(stdout, stderr, io.StringIO(stdin or ""))
+        try:
+            command = self._command or _default_command()
+            exit_code = _exit_code(command, args, client)
+        finally:
+            # Once done is set, _cancel no longer raises into this thread
+            try:
+                with job["lock"]:
+                    job["done"] = True
+            finally:
+                _capture.stop()
+
+        output = stdout.getvalue()
+        if stderr.getvalue():
+            output += "\n" + stderr.getvalue()
+        return CLIResult(exit_code=exit_code, output=output)
+
+    @staticmethod
+    def _cancel(future: Any, job: Dict[str, Any]) -> None:
+        """Drop a queued command, or raise CommandCancelled in a running one."""
+        if future.cancel():
+            return
+        with job["lock"]:
+            if job["done"] or job["thread"] is None:
+                return
+            # Delivered at the thread's next bytecode; a blocking call (such
+            # as a request) is interrupted once it returns or times out
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                ctypes.c_ulong(job["thread"]), ctypes.py_object(CommandCancelled)
+            )
+        logger.warning("Cancelled in-process CLI command after timeout")
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_executor = InProcessCLI()
+
+
+def get_cli_executor() -> InProcessCLI:
+    """Return the process-wide in-process CLI executor."""
+    return _executor
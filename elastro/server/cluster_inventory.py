@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from elastro.core.logger import get_logger
 from elastro.health.shards import format_bytes
@@ -10,29 +11,36 @@ from elastro.health.shards import format_bytes
 logger = get_logger(__name__)
 
 
-def _safe_count(
-    callable_obj: Callable[[], int], *, label: str, default: int = 0
-) -> int:
-    try:
-        return callable_obj()
-    except Exception as exc:
-        logger.debug("Cluster inventory %s unavailable: %s", label, exc)
-        return default
+def _rows(response: Any) -> List[Any]:
+    """Return the row list of a cat API response (or an empty list)."""
+    if isinstance(response, list):
+        return response
+    body = getattr(response, "body", response)
+    return body if isinstance(body, list) else []
+
+
+def _body(response: Any) -> Dict[str, Any]:
+    """Return the dict body of an API response (or an empty dict)."""
+    if isinstance(response, dict):
+        return response
+    body = getattr(response, "body", None)
+    return body if isinstance(body, dict) else {}
+
+
+def _kibana_index_names(indices_response: Any) -> List[str]:
+    return [
+        str(row.get("index", "")).strip()
+        for row in _rows(indices_response)
+        if isinstance(row, dict) and str(row.get("index", "")).strip()
+    ]
 
 
 def _count_kibana_objects(es: Any, object_type: str) -> Optional[int]:
     """Count Kibana saved objects when .kibana* indices exist."""
     try:
-        indices_response = es.cat.indices(index=".kibana*", format="json", h="index")
-        if not isinstance(indices_response, list):
-            body = getattr(indices_response, "body", indices_response)
-            indices_response = body if isinstance(body, list) else []
-
-        index_names = [
-            str(row.get("index", "")).strip()
-            for row in indices_response
-            if isinstance(row, dict) and str(row.get("index", "")).strip()
-        ]
+        index_names = _kibana_index_names(
+            es.cat.indices(index=".kibana*", format="json", h="index")
+        )
         if not index_names:
             return None
 
@@ -40,12 +48,30 @@ def _count_kibana_objects(es: Any, object_type: str) -> Optional[int]:
             index=",".join(index_names),
             query={"term": {"type": object_type}},
         )
-        count = (
-            response.get("count")
-            if isinstance(response, dict)
-            else getattr(response, "body", {}).get("count")
+        return int(_body(response).get("count") or 0)
+    except Exception as exc:
+        logger.debug(
+            "Kibana %s count unavailable: %s",
+            object_type,
+            exc,
+        )
+        return None
+
+
+async def _count_kibana_objects_async(es: Any, object_type: str) -> Optional[int]:
+    """Async variant of ``_count_kibana_objects``."""
+    try:
+        index_names = _kibana_index_names(
+            await es.cat.indices(index=".kibana*", format="json", h="index")
+        )
+        if not index_names:
+            return None
+
+        response = await es.count(
+            index=",".join(index_names),
+            query={"term": {"type": object_type}},
         )
-        return int(count or 0)
+        return int(_body(response).get("count") or 0)
     except Exception as exc:
         logger.debug(
             "Kibana %s count unavailable: %s",
@@ -55,10 +81,116 @@ def _count_kibana_objects(es: Any, object_type: str) -> Optional[int]:
         return None
 
 
+def _optional_call(call: Callable[[], Any], label: str) -> Any:
+    try:
+        return call()
+    except Exception as exc:
+        logger.debug("Cluster inventory %s unavailable: %s", label, exc)
+        return None
+
+
+async def _optional_await(awaitable: Awaitable[Any], label: str) -> Any:
+    try:
+        return await awaitable
+    except Exception as exc:
+        logger.debug("Cluster inventory %s unavailable: %s", label, exc)
+        return None
+
+
 def fetch_cluster_inventory(es: Any) -> Dict[str, Any]:
     """Collect high-level cluster inventory metrics from Elasticsearch."""
-    health = es.cluster.health()
-    nodes_info = es.nodes.info()
+    return _build_inventory(
+        health=es.cluster.health(),
+        nodes_info=es.nodes.info(),
+        idx_res=es.cat.indices(format="json"),
+        shard_rows=es.cat.shards(format="json", h="index,shard,state"),
+        cluster_stats=es.cluster.stats(),
+        data_streams=_optional_call(
+            lambda: es.indices.get_data_stream(name="*"), "data_streams"
+        ),
+        ilm_policies=_optional_call(es.ilm.get_lifecycle, "ilm_policies"),
+        composable=_optional_call(
+            lambda: es.indices.get_index_template(name="*"), "composable templates"
+        ),
+        legacy=_optional_call(
+            lambda: es.indices.get_template(name="*"), "legacy templates"
+        ),
+        repo_res=_optional_call(es.snapshot.get_repository, "snapshot repositories"),
+        dashboard_count=_count_kibana_objects(es, "dashboard"),
+        visualization_count=_count_kibana_objects(es, "visualization"),
+    )
+
+
+async def fetch_cluster_inventory_async(es: Any) -> Dict[str, Any]:
+    """
+    Collect the cluster inventory with an ``AsyncElasticsearch`` client.
+
+    All inventory requests are independent, so they are issued concurrently
+    and the page waits for the slowest one rather than the sum of them.
+    """
+    (
+        health,
+        nodes_info,
+        idx_res,
+        shard_rows,
+        cluster_stats,
+        data_streams,
+        ilm_policies,
+        composable,
+        legacy,
+        repo_res,
+        dashboard_count,
+        visualization_count,
+    ) = await asyncio.gather(
+        es.cluster.health(),
+        es.nodes.info(),
+        es.cat.indices(format="json"),
+        es.cat.shards(format="json", h="index,shard,state"),
+        es.cluster.stats(),
+        _optional_await(es.indices.get_data_stream(name="*"), "data_streams"),
+        _optional_await(es.ilm.get_lifecycle(), "ilm_policies"),
+        _optional_await(
+            es.indices.get_index_template(name="*"), "composable templates"
+        ),
+        _optional_await(es.indices.get_template(name="*"), "legacy templates"),
+        _optional_await(es.snapshot.get_repository(), "snapshot repositories"),
+        _count_kibana_objects_async(es, "dashboard"),
+        _count_kibana_objects_async(es, "visualization"),
+    )
+    return _build_inventory(
+        health=health,
+        nodes_info=nodes_info,
+        idx_res=idx_res,
+        shard_rows=shard_rows,
+        cluster_stats=cluster_stats,
+        data_streams=data_streams,
+        ilm_policies=ilm_policies,
+        composable=composable,
+        legacy=legacy,
+        repo_res=repo_res,
+        dashboard_count=dashboard_count,
+        visualization_count=visualization_count,
+    )
+
+
+def _build_inventory(
+    *,
+    health: Any,
+    nodes_info: Any,
+    idx_res: Any,
+    shard_rows: Any,
+    cluster_stats: Any,
+    data_streams: Any,
+    ilm_policies: Any,
+    composable: Any,
+    legacy: Any,
+    repo_res: Any,
+    dashboard_count: Optional[int],
+    visualization_count: Optional[int],
+) -> Dict[str, Any]:
+    """Summarize raw inventory responses; optional ones may be None."""
+    health = _body(health)
+    nodes_info = _body(nodes_info)
     node_count = int(nodes_info.get("_nodes", {}).get("total", 0))
 
     node_roles: Dict[str, int] = {}
@@ -68,11 +200,7 @@ def fetch_cluster_inventory(es: Any) -> Dict[str, Any]:
         for role in node_data.get("roles", ["unknown"]):
             node_roles[str(role)] = node_roles.get(str(role), 0) + 1
 
-    idx_res = es.cat.indices(format="json")
-    if not isinstance(idx_res, list):
-        body = getattr(idx_res, "body", idx_res)
-        idx_res = body if isinstance(body, list) else []
-
+    idx_res = _rows(idx_res)
     red_indices = 0
     yellow_indices = 0
     green_indices = 0
@@ -89,75 +217,31 @@ def fetch_cluster_inventory(es: Any) -> Dict[str, Any]:
 
     total_indices = len(idx_res)
 
-    shard_rows = es.cat.shards(format="json", h="index,shard,state")
-    if not isinstance(shard_rows, list):
-        body = getattr(shard_rows, "body", shard_rows)
-        shard_rows = body if isinstance(body, list) else []
-
+    shard_rows = _rows(shard_rows)
     unassigned_shards = 0
     for row in shard_rows:
         if isinstance(row, dict) and str(row.get("state", "")).upper() == "UNASSIGNED":
             unassigned_shards += 1
 
-    cluster_stats = es.cluster.stats()
-    indices_stats = (
-        cluster_stats.get("indices", {}) if isinstance(cluster_stats, dict) else {}
-    )
+    indices_stats = _body(cluster_stats).get("indices", {})
     docs = indices_stats.get("docs", {}) if isinstance(indices_stats, dict) else {}
     store = indices_stats.get("store", {}) if isinstance(indices_stats, dict) else {}
     total_docs = int(docs.get("count", 0) or 0)
     total_store_bytes = int(store.get("size_in_bytes", 0) or 0)
 
-    data_stream_count = _safe_count(
-        lambda: len(
-            (
-                es.indices.get_data_stream(name="*").get("data_streams", [])
-                if isinstance(es.indices.get_data_stream(name="*"), dict)
-                else []
-            )
-        ),
-        label="data_streams",
-    )
-
-    ilm_count = _safe_count(
-        lambda: len(es.ilm.get_lifecycle()),
-        label="ilm_policies",
+    data_stream_count = len(_body(data_streams).get("data_streams", []))
+    ilm_count = len(_body(ilm_policies))
+    template_count = len(_body(composable).get("index_templates", [])) + len(
+        _body(legacy)
     )
 
-    template_count = 0
-    try:
-        composable = es.indices.get_index_template(name="*")
-        templates = (
-            composable.get("index_templates", [])
-            if isinstance(composable, dict)
-            else []
-        )
-        template_count += len(templates)
-    except Exception as exc:
-        logger.debug("Composable index templates unavailable: %s", exc)
-    try:
-        legacy = es.indices.get_template(name="*")
-        if isinstance(legacy, dict):
-            template_count += len(legacy)
-    except Exception as exc:
-        logger.debug("Legacy index templates unavailable: %s", exc)
-
-    repos: List[Dict[str, str]] = []
-    try:
-        repo_res = es.snapshot.get_repository()
-        if isinstance(repo_res, dict):
-            for repo_name, repo_data in repo_res.items():
-                repos.append(
-                    {
-                        "name": str(repo_name),
-                        "type": str((repo_data or {}).get("type", "unknown")),
-                    }
-                )
-    except Exception as exc:
-        logger.debug("Snapshot repositories unavailable: %s", exc)
-
-    dashboard_count = _count_kibana_objects(es, "dashboard")
-    visualization_count = _count_kibana_objects(es, "visualization")
+    repos: List[Dict[str, str]] = [
+        {
+            "name": str(repo_name),
+            "type": str((repo_data or {}).get("type", "unknown")),
+        }
+        for repo_name, repo_data in _body(repo_res).items()
+    ]
 
     return {
         "health": str(health.get("status", "unknown")),
@@ -1,11 +1,19 @@
-"""In-memory TTL cache for health assessment reports (GUI API)."""
+"""In-memory stale-while-revalidate cache for health assessment reports (GUI API).
+
+Reports are fresh for ``ttl_seconds`` and may then be served stale for up to
+``max_stale_seconds`` while a background refresh replaces them, so pages never
+wait on a full ``HealthAssessor.run`` once a cluster has been assessed. The
+cache and per-cluster history are both LRU-bounded to ``MAX_CLUSTERS``.
+"""
 
 from __future__ import annotations
 
+import threading
 import time
-from collections import deque
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Deque, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
 
 from elastro.core.logger import get_logger
 from elastro.health.models import AssessmentReport
@@ -13,28 +21,63 @@ from elastro.health.models import AssessmentReport
 logger = get_logger(__name__)
 
 DEFAULT_TTL_SECONDS = 60
+MAX_STALE_SECONDS = 3600
 MAX_HISTORY = 20
+MAX_CLUSTERS = 32
+REFRESH_WORKERS = 2
 
 
 @dataclass
 class _CacheEntry:
     report: AssessmentReport
     expires_at: float
+    stale_until: float
 
 
-_assessment_cache: Dict[str, _CacheEntry] = {}
-_history: Dict[str, Deque[Dict[str, Any]]] = {}
+_lock = threading.RLock()
+_assessment_cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+_history: "OrderedDict[str, Deque[Dict[str, Any]]]" = OrderedDict()
+_version = 0
 
 
-def get_cached_report(cluster_name: str) -> Optional[AssessmentReport]:
-    """Return a cached assessment if still valid."""
-    entry = _assessment_cache.get(cluster_name)
-    if entry is None:
-        return None
-    if time.monotonic() >= entry.expires_at:
-        _assessment_cache.pop(cluster_name, None)
+def _evict_lru(mapping: "OrderedDict[str, Any]") -> None:
+    while len(mapping) > MAX_CLUSTERS:
+        evicted, _ = mapping.popitem(last=False)
+        logger.debug("Evicted least recently used cluster=%s", evicted)
+
+
+def cache_version() -> int:
+    """Counter bumped whenever cached reports or history change (for ETags)."""
+    return _version
+
+
+def lookup_report(cluster_name: str) -> Optional[Tuple[AssessmentReport, bool]]:
+    """Return ``(report, is_fresh)`` for a servable entry, or None."""
+    with _lock:
+        entry = _assessment_cache.get(cluster_name)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if now >= entry.stale_until:
+            _assessment_cache.pop(cluster_name, None)
+            return None
+        _assessment_cache.move_to_end(cluster_name)
+        if cluster_name in _history:
+            _history.move_to_end(cluster_name)
+        return entry.report, now < entry.expires_at
+
+
+def get_cached_report(
+    cluster_name: str,
+    *,
+    allow_stale: bool = False,
+) -> Optional[AssessmentReport]:
+    """Return a cached assessment if still valid (or merely stale, if allowed)."""
+    hit = lookup_report(cluster_name)
+    if hit is None:
         return None
-    return entry.report
+    report, fresh = hit
+    return report if fresh or allow_stale else None
 
 
 def store_report(
@@ -42,35 +85,147 @@ def store_report(
     report: AssessmentReport,
     *,
     ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    max_stale_seconds: int = MAX_STALE_SECONDS,
 ) -> None:
     """Cache an assessment and append to per-cluster history."""
-    _assessment_cache[cluster_name] = _CacheEntry(
-        report=report,
-        expires_at=time.monotonic() + ttl_seconds,
-    )
+    global _version
+    now = time.monotonic()
     payload = report.model_dump(mode="json")
     payload.pop("raw_health_report", None)
-    history = _history.setdefault(cluster_name, deque(maxlen=MAX_HISTORY))
-    history.appendleft(payload)
+    with _lock:
+        _version += 1
+        _assessment_cache[cluster_name] = _CacheEntry(
+            report=report,
+            expires_at=now + ttl_seconds,
+            stale_until=now + ttl_seconds + max_stale_seconds,
+        )
+        _assessment_cache.move_to_end(cluster_name)
+        _evict_lru(_assessment_cache)
+
+        history = _history.get(cluster_name)
+        if history is None:
+            history = _history[cluster_name] = deque(maxlen=MAX_HISTORY)
+        history.appendleft(payload)
+        _history.move_to_end(cluster_name)
+        _evict_lru(_history)
+        history_len = len(history)
     logger.debug(
         "Cached assessment cluster=%s score=%s history_len=%s",
         cluster_name,
         report.overall_score,
-        len(history),
+        history_len,
     )
 
 
 def get_history(cluster_name: str, *, limit: int = 10) -> List[Dict[str, Any]]:
     """Return recent cached assessment snapshots for a cluster."""
-    items = list(_history.get(cluster_name, []))
+    with _lock:
+        items = list(_history.get(cluster_name, []))
     return items[:limit]
 
 
 def clear_cache(cluster_name: Optional[str] = None) -> None:
     """Clear cache entries (used in tests)."""
-    if cluster_name is None:
-        _assessment_cache.clear()
-        _history.clear()
-        return
-    _assessment_cache.pop(cluster_name, None)
-    _history.pop(cluster_name, None)
+    global _version
+    with _lock:
+        _version += 1
+        if cluster_name is None:
+            _assessment_cache.clear()
+            _history.clear()
+            return
+        _assessment_cache.pop(cluster_name, None)
+        _history.pop(cluster_name, None)
+
+
+class HealthRefresher:
+    """
+    Runs assessments on a small background pool, at most one per cluster.
+
+    ``refresh`` is single-flight: while an assessment for a cluster is running,
+    further calls return the same future instead of starting another one.
+    """
+
+    def __init__(self, max_workers: int = REFRESH_WORKERS) -> None:
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def refresh(
+        self,
+        cluster_name: str,
+        run: Callable[[], AssessmentReport],
+    ) -> Future:
+        """Start (or join) the background assessment for ``cluster_name``."""
+        with self._lock:
+            future = self._inflight.get(cluster_name)
+            if future is not None:
+                return future
+            future = self._pool().submit(self._run, cluster_name, run)
+            self._inflight[cluster_name] = future
+            return future
+
+    def submit(self, run: Callable[[], Any]) -> Future:
+        """Run a one-off assessment on the pool, outside the single-flight set."""
+        with self._lock:
+            return self._pool().submit(run)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        # Callers hold self._lock
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="elastro-health-refresh",
+            )
+        return self._executor
+
+    def _run(
+        self,
+        cluster_name: str,
+        run: Callable[[], AssessmentReport],
+    ) -> AssessmentReport:
+        try:
+            return run()
+        except Exception as exc:
+            logger.warning(
+                "Background health refresh failed for cluster=%s: %s",
+                cluster_name,
+                exc,
+            )
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(cluster_name, None)
+
+    def prewarm(
+        self,
+        clusters: Iterable[Tuple[str, Callable[[], AssessmentReport]]],
+    ) -> int:
+        """Schedule refreshes for clusters without a fresh report; return the count."""
+        scheduled = 0
+        for cluster_name, run in clusters:
+            if get_cached_report(cluster_name) is not None:
+                continue
+            self.refresh(cluster_name, run)
+            scheduled += 1
+        return scheduled
+
+    def in_flight(self) -> List[str]:
+        with self._lock:
+            return sorted(self._inflight)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the pool, dropping refreshes that have not started yet."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._inflight.clear()
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_refresher = HealthRefresher()
+
+
+def get_refresher() -> HealthRefresher:
+    """Return the process-wide health refresher."""
+    return _refresher
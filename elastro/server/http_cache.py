@@ -0,0 +1,126 @@
+"""Conditional GET support for GUI API responses (ETag / If-None-Match)."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response
+from starlette.datastructures import MutableHeaders
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import ASGIApp
+
+CACHE_CONTROL = "no-cache"
+# Routes whose every response is new opt out of tagging with this
+NO_STORE = "no-store"
+# Responses may be gzipped on the way out while the ETag names the identity
+# representation, so caches must key on the request's Accept-Encoding.
+VARY = "Accept-Encoding"
+# GZipMiddleware adds the Vary header itself to bodies at least this large
+GZIP_MINIMUM_SIZE = 1024
+
+
+def strong_etag(*parts: Any) -> str:
+    """Build a quoted strong ETag from the values that determine a response."""
+    digest = hashlib.sha1(
+        "\x1f".join(str(part) for part in parts).encode("utf-8")
+    ).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header value matches ``etag``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as If-None-Match requires
+    bare = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == bare
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": VARY},
+    )
+
+
+def _add_vary(headers: MutableHeaders) -> None:
+    vary = headers.get("vary")
+    if vary is None:
+        headers["Vary"] = VARY
+    elif VARY.lower() not in [value.strip().lower() for value in vary.split(",")]:
+        headers["Vary"] = f"{vary}, {VARY}"
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+) -> Optional[Response]:
+    """
+    Tag ``response`` with ``etag`` and return a 304 if the client has it already.
+
+    Routes call this before building their body so a matching poll skips the
+    serialization work entirely.
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return _not_modified(etag)
+    return None
+
+
+class ETagMiddleware(BaseHTTPMiddleware):
+    """
+    Give every successful JSON ``GET /api`` response an ETag and honour
+    ``If-None-Match``.
+
+    Responses that already carry an ETag keep it, ``no-store`` responses are
+    left alone, and the rest are tagged with a hash of their body, which saves
+    the transfer (not the work) on a match. Tagged responses vary on
+    ``Accept-Encoding``; bodies large enough for GZip are left for it to mark
+    so the header is not doubled.
+    """
+
+    def __init__(self, app: ASGIApp, gzip_minimum_size: int = GZIP_MINIMUM_SIZE):
+        super().__init__(app)
+        self.gzip_minimum_size = gzip_minimum_size
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        response = await call_next(request)
+        if (
+            request.method != "GET"
+            or not request.url.path.startswith("/api/")
+            or response.status_code != 200
+            or not response.headers.get("content-type", "").startswith(
+                "application/json"
+            )
+            or response.headers.get("cache-control") == NO_STORE
+        ):
+            return response
+
+        etag = response.headers.get("etag")
+        if etag is None:
+            body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore[attr-defined]
+            etag = f'"{hashlib.sha1(body).hexdigest()[:32]}"'
+            headers = dict(response.headers)
+            headers["etag"] = etag
+            headers.setdefault("cache-control", CACHE_CONTROL)
+            response = Response(
+                content=body,
+                status_code=response.status_code,
+                headers=headers,
+            )
+        if int(response.headers.get("content-length", 0)) < self.gzip_minimum_size:
+            _add_vary(response.headers)
+
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return _not_modified(etag)
+        return response
@@ -2,11 +2,12 @@
 Routes __init__ — re-exports all API routers for clean mounting.
 """
 
-from elastro.server.routes.config import router as config_router
-from elastro.server.routes.clusters import router as clusters_router
-from elastro.server.routes.indices import router as indices_router
 from elastro.server.routes.cli import router as cli_router
+from elastro.server.routes.clusters import router as clusters_router
+from elastro.server.routes.config import router as config_router
 from elastro.server.routes.health import router as health_router
+from elastro.server.routes.indices import router as indices_router
+from elastro.server.routes.stats import router as stats_router
 
 __all__ = [
     "config_router",
@@ -14,4 +15,5 @@ __all__ = [
     "indices_router",
     "cli_router",
     "health_router",
+    "stats_router",
 ]
@@ -5,14 +5,88 @@ CLI proxy routes — /api/cluster/{cluster_name}/cli endpoint.
 import os
 import shlex
 import subprocess
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional
+
 from fastapi import APIRouter, Depends, HTTPException
 
+from elastro.core.logger import get_logger
+from elastro.server.cli_executor import (
+    CLI_TIMEOUT_SECONDS,
+    SUBPROCESS_ONLY_COMMANDS,
+    CommandTimeout,
+    get_cli_executor,
+)
 from elastro.server.schemas import ClusterCLIRequestSchema
+from elastro.server.services import build_es_client
+
+logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api", tags=["cli"])
 
 
+def _in_process_enabled(config: Dict[str, Any], args: List[str]) -> bool:
+    cli_conf = config.get("cli", {}) if isinstance(config, dict) else {}
+    if isinstance(cli_conf, dict) and cli_conf.get("in_process") is False:
+        return False
+    return not (args and args[0] in SUBPROCESS_ONLY_COMMANDS)
+
+
+def _run_in_process(
+    target_c: Dict[str, Any], args: List[str], stdin: Optional[str]
+) -> Dict[str, Any]:
+    result = get_cli_executor().run(
+        args,
+        build_es_client(target_c),
+        stdin=stdin,
+        timeout=CLI_TIMEOUT_SECONDS,
+    )
+    return {"exit_code": result.exit_code, "output": result.output}
+
+
+def _run_subprocess(
+    target_c: Dict[str, Any], args: List[str], stdin: Optional[str]
+) -> Dict[str, Any]:
+    # Ensure scheme is present for subprocess execution
+    host = target_c["host"]
+    if not host.startswith("http://") and not host.startswith("https://"):
+        host = "http://" + host
+
+    # Construct strict elastro command base
+    cmd = ["elastro", "--host", host]
+    cmd.extend(args)
+
+    # Clone env and inject cluster credentials securely
+    run_env = os.environ.copy()
+    run_env["FORCE_COLOR"] = "1"
+    run_env["COLUMNS"] = "400"
+    run_env["ELASTRO_LOG_LEVEL"] = "WARNING"
+    run_env["ELASTRO_GUI_MODE"] = "1"
+
+    auth_conf = target_c.get("auth", {})
+    if "api_key" in auth_conf and auth_conf["api_key"]:
+        run_env["ELASTIC_API_KEY"] = auth_conf["api_key"]
+    elif "username" in auth_conf:
+        run_env["ELASTIC_USERNAME"] = auth_conf["username"]
+        run_env["ELASTIC_PASSWORD"] = auth_conf.get("password", "")
+
+    result = subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        input=stdin,
+        timeout=CLI_TIMEOUT_SECONDS,
+        env=run_env,
+    )
+
+    output = ""
+    if result.stdout:
+        output += result.stdout
+    if result.stderr:
+        output += "\n" + result.stderr
+
+    return {"exit_code": result.returncode, "output": output}
+
+
 def cli_routes(read_config: Any, verify_token: Any) -> APIRouter:
     """Bind CLI proxy routes to shared config accessor and auth functions."""
 
@@ -54,50 +128,24 @@ def cli_routes(read_config: Any, verify_token: Any) -> APIRouter:
                 status_code=400, detail=f"Invalid shell command formatting: {e}"
             )
 
-        # Ensure scheme is present for subprocess execution
-        host = target_c["host"]
-        if not host.startswith("http://") and not host.startswith("https://"):
-            host = "http://" + host
-
-        # Construct strict elastro command base
-        cmd = ["elastro", "--host", host]
-        cmd.extend(args)
-
-        # Clone env and inject cluster credentials securely
-        run_env = os.environ.copy()
-        run_env["FORCE_COLOR"] = "1"
-        run_env["COLUMNS"] = "400"
-        run_env["ELASTRO_LOG_LEVEL"] = "WARNING"
-        run_env["ELASTRO_GUI_MODE"] = "1"
-
-        auth_conf = target_c.get("auth", {})
-        if "api_key" in auth_conf and auth_conf["api_key"]:
-            run_env["ELASTIC_API_KEY"] = auth_conf["api_key"]
-        elif "username" in auth_conf:
-            run_env["ELASTIC_USERNAME"] = auth_conf["username"]
-            run_env["ELASTIC_PASSWORD"] = auth_conf.get("password", "")
-
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                input=req.stdin,
-                timeout=30,
-                env=run_env,
-            )
-
-            output = ""
-            if result.stdout:
-                output += result.stdout
-            if result.stderr:
-                output += "\n" + result.stderr
-
-            return {"exit_code": result.returncode, "output": output}
-        except subprocess.TimeoutExpired:
+            if _in_process_enabled(config, args):
+                try:
+                    return _run_in_process(target_c, args, req.stdin)
+                except CommandTimeout:
+                    raise
+                except Exception as e:
+                    logger.warning(
+                        "In-process CLI unavailable, falling back to subprocess: %s",
+                        e,
+                    )
+            return _run_subprocess(target_c, args, req.stdin)
+        except (subprocess.TimeoutExpired, CommandTimeout):
             raise HTTPException(
                 status_code=408,
-                detail="Command execution timed out after 30 seconds",
+                detail=(
+                    f"Command execution timed out after {CLI_TIMEOUT_SECONDS} seconds"
+                ),
             )
         except FileNotFoundError:
             raise HTTPException(
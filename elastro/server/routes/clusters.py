@@ -2,92 +2,126 @@
 Cluster routes — /api/clusters endpoints.
 """
 
-from typing import Dict, Any, List
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from elastro.core.logger import get_logger
-from elastro.server.cluster_inventory import fetch_cluster_inventory
-from elastro.server.services import build_es_client, parse_index_size
+from elastro.health.shards import format_bytes
+from elastro.server.cluster_inventory import fetch_cluster_inventory_async
+from elastro.server.services import get_async_es_client
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api", tags=["clusters"])
 
+# Per-cluster deadline (seconds) for the /api/clusters overview
+CLUSTER_OVERVIEW_TIMEOUT = 5.0
+MAX_CLUSTER_OVERVIEW_TIMEOUT = 60.0
+
+# Only the cat.indices columns the overview uses, with sizes in bytes
+_OVERVIEW_COLUMNS = "index,health,store.size,docs.count"
+
+
+async def _cluster_overview(c: Dict[str, Any]) -> Dict[str, Any]:
+    """Fetch health and index summary for one cluster."""
+    es = get_async_es_client(c)
+    health, idx_res = await asyncio.gather(
+        es.cluster.health(),
+        es.cat.indices(format="json", h=_OVERVIEW_COLUMNS, bytes="b"),
+    )
+
+    unstable: List[Dict[str, Any]] = []
+    largest_idx_name = "N/A"
+    largest_idx_size = -1
+
+    for idx in idx_res:
+        if not isinstance(idx, dict):
+            continue
+        if idx.get("health") in ["yellow", "red"]:
+            unstable.append(
+                {
+                    "index": idx.get("index", "unknown"),
+                    "health": idx.get("health"),
+                    "docs": idx.get("docs.count", "0"),
+                }
+            )
+
+        try:
+            size_bytes = int(idx.get("store.size") or 0)
+        except (TypeError, ValueError):
+            size_bytes = 0
+
+        if size_bytes > largest_idx_size:
+            largest_idx_size = size_bytes
+            largest_idx_name = idx.get("index", "Unknown")
+
+    return {
+        "name": c["name"],
+        "host": c["host"],
+        "health": health["status"],
+        "state": "online",
+        "index_count": len(idx_res),
+        "largest_index": {
+            "name": largest_idx_name,
+            "size": format_bytes(max(largest_idx_size, 0)),
+        },
+        "unstable_indices": unstable,
+    }
+
+
+async def _cluster_overview_with_deadline(
+    c: Dict[str, Any], timeout: float
+) -> Dict[str, Any]:
+    """Run ``_cluster_overview`` under a deadline; failures become offline rows."""
+    try:
+        return await asyncio.wait_for(_cluster_overview(c), timeout)
+    except asyncio.TimeoutError:
+        logger.error(f"Cluster {c['name']} did not respond within {timeout}s")
+        state, error = "timeout", f"No response within {timeout:g}s"
+    except Exception as e:
+        logger.error(f"Failed to connect to {c['name']}: {str(e)}")
+        state, error = "offline", str(e)
+
+    return {
+        "name": c["name"],
+        "host": c["host"],
+        "health": "offline",
+        "state": state,
+        "error": error,
+        "index_count": 0,
+        "largest_index": {"name": "N/A", "size": "0B"},
+        "unstable_indices": [],
+    }
+
 
 def cluster_routes(read_config: Any, verify_token: Any) -> APIRouter:
     """Bind cluster routes to the shared config accessor and auth functions."""
 
     @router.get("/clusters")
-    def get_clusters_health(
+    async def get_clusters_health(
+        timeout: float = Query(
+            CLUSTER_OVERVIEW_TIMEOUT,
+            gt=0,
+            le=MAX_CLUSTER_OVERVIEW_TIMEOUT,
+            description="Per-cluster deadline in seconds",
+        ),
         token: str = Depends(verify_token),
     ) -> Dict[str, Any]:
         config = read_config()
-        results = []
-
-        for c in config.get("clusters", []):
-            try:
-                client = build_es_client(c)
-                es = client.client
-
-                health = es.cluster.health()
-                idx_res = es.cat.indices(format="json")
-
-                unstable: List[Dict[str, Any]] = []
-                largest_idx_name = "N/A"
-                largest_idx_size = -1
-                largest_idx_raw = "0b"
-
-                for idx in idx_res:
-                    if not isinstance(idx, dict):
-                        continue
-                    if idx.get("health") in ["yellow", "red"]:
-                        unstable.append(
-                            {
-                                "index": idx.get("index", "unknown"),
-                                "health": idx.get("health"),
-                                "docs": idx.get("docs.count", "0"),
-                            }
-                        )
-
-                    raw_size = idx.get("store.size", "0b")
-                    size_bytes, _ = parse_index_size(raw_size)
-
-                    if size_bytes > largest_idx_size:
-                        largest_idx_size = size_bytes
-                        largest_idx_name = idx.get("index", "Unknown")
-                        largest_idx_raw = idx.get("store.size", "0b")
-
-                results.append(
-                    {
-                        "name": c["name"],
-                        "host": c["host"],
-                        "health": health["status"],
-                        "index_count": len(idx_res),
-                        "largest_index": {
-                            "name": largest_idx_name,
-                            "size": largest_idx_raw,
-                        },
-                        "unstable_indices": unstable,
-                    }
-                )
-
-            except Exception as e:
-                logger.error(f"Failed to connect to {c['name']}: {str(e)}")
-                results.append(
-                    {
-                        "name": c["name"],
-                        "host": c["host"],
-                        "health": "offline",
-                        "index_count": 0,
-                        "largest_index": {"name": "N/A", "size": "0B"},
-                        "unstable_indices": [],
-                    }
-                )
-
-        return {"clusters": results}
+        # Every cluster gets its own deadline, so the response takes as long
+        # as the slowest healthy cluster or one timeout, whichever is less
+        results = await asyncio.gather(
+            *(
+                _cluster_overview_with_deadline(c, timeout)
+                for c in config.get("clusters", [])
+            )
+        )
+        return {"clusters": list(results)}
 
     @router.get("/cluster/{cluster_name}")
-    def get_cluster_details(
+    async def get_cluster_details(
         cluster_name: str, token: str = Depends(verify_token)
     ) -> Dict[str, Any]:
         config = read_config()
@@ -105,8 +139,9 @@ def cluster_routes(read_config: Any, verify_token: Any) -> APIRouter:
             )
 
         try:
-            client = build_es_client(target_c)
-            inventory = fetch_cluster_inventory(client.client)
+            inventory = await fetch_cluster_inventory_async(
+                get_async_es_client(target_c)
+            )
 
             return {
                 "name": target_c["name"],
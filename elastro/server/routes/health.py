@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import json
+from concurrent.futures import Future
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 from elastro.core.logger import get_logger
-from elastro.health.assessor import HealthAssessor
-from elastro.health.collectors.nodes import NodesCollector
+from elastro.health.assessor import HealthAssessor, ProgressCallback
 from elastro.health.collectors.base import CollectContext
+from elastro.health.collectors.nodes import NodesCollector
 from elastro.health.config import DEFAULT_HISTORY_INDEX
 from elastro.health.history import (
     filter_records_by_window,
@@ -17,16 +22,20 @@ from elastro.health.history import (
     query_assessment_history,
 )
 from elastro.health.models import AssessmentReport, FindingStatus
-from elastro.health.trends import compute_trends_from_records
 from elastro.health.remediation.catalog import RemediationCatalog
 from elastro.health.remediation.executor import RemediationExecutor
 from elastro.health.rules.jvm import jvm_heap_used_percent
+from elastro.health.trends import compute_trends_from_records
 from elastro.server.health_cache import (
     DEFAULT_TTL_SECONDS,
+    cache_version,
     get_cached_report,
     get_history,
+    get_refresher,
+    lookup_report,
     store_report,
 )
+from elastro.server.http_cache import NO_STORE, conditional_response, strong_etag
 from elastro.server.schemas import HealthFixRequestSchema
 from elastro.server.services import build_es_client
 
@@ -34,6 +43,9 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api", tags=["health"])
 
+# Seconds between SSE comment lines sent while no event is ready
+STREAM_PING_SECONDS = 15.0
+
 
 def _health_assessment_settings(read_config: Any) -> Dict[str, Any]:
     config = read_config()
@@ -44,6 +56,7 @@ def _health_assessment_settings(read_config: Any) -> Dict[str, Any]:
     return {
         "enable_history": bool(assessment.get("enable_history", False)),
         "history_index": str(assessment.get("history_index", DEFAULT_HISTORY_INDEX)),
+        "prewarm": bool(assessment.get("prewarm", True)),
     }
 
 
@@ -168,6 +181,7 @@ def _run_assessment(
     verbose: bool = True,
     features: Optional[List[str]] = None,
     timeout: str = "30s",
+    progress: Optional[ProgressCallback] = None,
 ) -> AssessmentReport:
     settings = _health_assessment_settings(read_config)
     client = build_es_client(target)
@@ -187,6 +201,7 @@ def _run_assessment(
         enable_history=settings["enable_history"],
         history_index=settings["history_index"],
         host=str(target.get("host", "unknown")),
+        progress=progress,
     )
     if report.cluster_name == "unknown":
         report = report.model_copy(update={"cluster_name": cluster_name})
@@ -194,6 +209,58 @@ def _run_assessment(
     return report
 
 
+def _refresh(
+    cluster_name: str,
+    target: Dict[str, Any],
+    read_config: Any,
+) -> Future:
+    """Start or join the single-flight default assessment for a cluster."""
+    return get_refresher().refresh(
+        cluster_name,
+        partial(_run_assessment, cluster_name, target, read_config),
+    )
+
+
+def prewarm_health_cache(read_config: Any) -> int:
+    """Assess every configured cluster in the background; return how many."""
+    if not _health_assessment_settings(read_config)["prewarm"]:
+        return 0
+    config = read_config()
+    clusters = [
+        (c["name"], partial(_run_assessment, c["name"], c, read_config))
+        for c in config.get("clusters", [])
+        if c.get("name")
+    ]
+    scheduled = get_refresher().prewarm(clusters)
+    logger.info("Pre-warming health cache for %s cluster(s)", scheduled)
+    return scheduled
+
+
+def _progress_event(event: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-ready SSE data for one assessment progress event."""
+    if event == "collector":
+        result = payload["result"]
+        return {
+            "name": result.name,
+            "status": result.status,
+            "error": result.error,
+            "duration_ms": result.duration_ms,
+            "findings": [f.model_dump(mode="json") for f in payload["findings"]],
+        }
+    if event == "findings":
+        return {
+            "source": payload["source"],
+            "findings": [f.model_dump(mode="json") for f in payload["findings"]],
+        }
+    if event == "report":
+        return _serialize_report(payload["report"])
+    return payload
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
 def _disk_used_percent(fs: Dict[str, Any]) -> Optional[float]:
     total = fs.get("total") or {}
     available = total.get("available_in_bytes")
@@ -231,6 +298,7 @@ def health_routes(read_config: Any, verify_token: Any) -> APIRouter:
     @router.get("/clusters/{cluster_name}/health/assess")
     def assess_cluster_health(
         cluster_name: str,
+        response: Response,
         verbose: bool = Query(True, description="Request verbose _health_report"),
         features: Optional[List[str]] = Query(None, description="Limit indicators"),
         token: str = Depends(verify_token),
@@ -238,13 +306,18 @@ def health_routes(read_config: Any, verify_token: Any) -> APIRouter:
         target = _find_cluster(read_config, cluster_name)
         try:
             logger.info("GUI health assess requested for cluster=%s", cluster_name)
-            report = _run_assessment(
-                cluster_name,
-                target,
-                read_config,
-                verbose=verbose,
-                features=features,
-            )
+            if verbose and not features:
+                report = _refresh(cluster_name, target, read_config).result()
+            else:
+                report = _run_assessment(
+                    cluster_name,
+                    target,
+                    read_config,
+                    verbose=verbose,
+                    features=features,
+                )
+            # Every assessment is a new report, so there is nothing to revalidate
+            response.headers["Cache-Control"] = NO_STORE
             return _serialize_report(report)
         except HTTPException:
             raise
@@ -260,28 +333,109 @@ def health_routes(read_config: Any, verify_token: Any) -> APIRouter:
                 detail=f"Health assessment failed: {exc}",
             ) from exc
 
-    @router.get("/clusters/{cluster_name}/health/score")
+    @router.get("/clusters/{cluster_name}/health/assess/stream")
+    async def stream_cluster_health(
+        cluster_name: str,
+        verbose: bool = Query(True, description="Request verbose _health_report"),
+        features: Optional[List[str]] = Query(None, description="Limit indicators"),
+        token: str = Depends(verify_token),
+    ) -> StreamingResponse:
+        """Stream collector results and rule findings as server-sent events."""
+        target = _find_cluster(read_config, cluster_name)
+        loop = asyncio.get_running_loop()
+        events: "asyncio.Queue[Optional[Tuple[str, Dict[str, Any]]]]" = asyncio.Queue()
+
+        def emit(item: Optional[Tuple[str, Dict[str, Any]]]) -> None:
+            try:
+                loop.call_soon_threadsafe(events.put_nowait, item)
+            except RuntimeError:
+                # The request's loop is gone; the report is still cached
+                pass
+
+        def progress(event: str, payload: Dict[str, Any]) -> None:
+            emit((event, _progress_event(event, payload)))
+
+        def assess() -> None:
+            try:
+                _run_assessment(
+                    cluster_name,
+                    target,
+                    read_config,
+                    verbose=verbose,
+                    features=features,
+                    progress=progress,
+                )
+            except Exception as exc:
+                logger.error(
+                    "Health assess stream failed for %s: %s",
+                    cluster_name,
+                    exc,
+                    exc_info=True,
+                )
+                emit(("error", {"detail": f"Health assessment failed: {exc}"}))
+            finally:
+                emit(None)
+
+        logger.info("GUI health assess stream requested for cluster=%s", cluster_name)
+        # Runs on the refresher's bounded pool and keeps going (caching its
+        # report) if the client disconnects before the end of the stream.
+        get_refresher().submit(assess)
+
+        async def stream() -> AsyncIterator[str]:
+            while True:
+                try:
+                    item = await asyncio.wait_for(events.get(), STREAM_PING_SECONDS)
+                except asyncio.TimeoutError:
+                    # Keep proxies from closing the connection while we wait
+                    # for a pool worker or a slow collector
+                    yield ": ping\n\n"
+                    continue
+                if item is None:
+                    return
+                yield _sse(*item)
+
+        return StreamingResponse(
+            stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @router.get("/clusters/{cluster_name}/health/score", response_model=None)
     def get_cluster_health_score(
         cluster_name: str,
+        request: Request,
+        response: Response,
         refresh: bool = Query(False, description="Bypass cache and re-assess"),
         token: str = Depends(verify_token),
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], Response]:
         target = _find_cluster(read_config, cluster_name)
-        cached = None if refresh else get_cached_report(cluster_name)
+        hit = None if refresh else lookup_report(cluster_name)
 
         try:
-            if cached is None:
-                report = _run_assessment(cluster_name, target, read_config)
+            if hit is None:
+                report = _refresh(cluster_name, target, read_config).result()
+                fresh = True
             else:
-                report = cached
-
+                # Serve what we have; a stale report is revalidated off-request
+                report, fresh = hit
+                if not fresh:
+                    _refresh(cluster_name, target, read_config)
+
+            not_modified = conditional_response(
+                request,
+                response,
+                strong_etag("score", report.session_id, hit is not None, fresh),
+            )
+            if not_modified is not None:
+                return not_modified
             return {
                 "cluster_name": cluster_name,
                 "overall_score": report.overall_score,
                 "overall_status": report.overall_status.value,
                 "assessed_at": report.assessed_at.isoformat(),
                 "elasticsearch_version": report.elasticsearch_version,
-                "cached": cached is not None and not refresh,
+                "cached": hit is not None,
+                "stale": not fresh,
                 "findings_count": len(_open_findings(report)),
             }
         except HTTPException:
@@ -298,32 +452,54 @@ def health_routes(read_config: Any, verify_token: Any) -> APIRouter:
                 detail=f"Failed to compute health score: {exc}",
             ) from exc
 
-    @router.get("/clusters/{cluster_name}/health/findings")
+    @router.get("/clusters/{cluster_name}/health/findings", response_model=None)
     def get_cluster_health_findings(
         cluster_name: str,
+        request: Request,
+        response: Response,
         token: str = Depends(verify_token),
-    ) -> Dict[str, Any]:
-        _find_cluster(read_config, cluster_name)
-        report = get_cached_report(cluster_name)
-        if report is None:
+    ) -> Union[Dict[str, Any], Response]:
+        target = _find_cluster(read_config, cluster_name)
+        hit = lookup_report(cluster_name)
+        if hit is None:
             raise HTTPException(
                 status_code=404,
                 detail="No cached assessment. Run GET /health/assess first.",
             )
+        report, fresh = hit
+        if not fresh:
+            _refresh(cluster_name, target, read_config)
+        not_modified = conditional_response(
+            request, response, strong_etag("findings", report.session_id, fresh)
+        )
+        if not_modified is not None:
+            return not_modified
         return {
             "cluster_name": cluster_name,
             "overall_score": report.overall_score,
+            "stale": not fresh,
             "findings": _open_findings(report),
         }
 
-    @router.get("/clusters/{cluster_name}/health/history")
+    @router.get("/clusters/{cluster_name}/health/history", response_model=None)
     def get_cluster_health_history(
         cluster_name: str,
+        request: Request,
+        response: Response,
         limit: int = Query(10, ge=1, le=50),
         token: str = Depends(verify_token),
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], Response]:
         target = _find_cluster(read_config, cluster_name)
         settings = _health_assessment_settings(read_config)
+        if not settings["enable_history"]:
+            # Cache-only history changes only when the cache does
+            not_modified = conditional_response(
+                request,
+                response,
+                strong_etag("history", cluster_name, cache_version(), limit),
+            )
+            if not_modified is not None:
+                return not_modified
         assessments = _load_cluster_history(
             cluster_name,
             target,
@@ -427,7 +603,7 @@ def health_routes(read_config: Any, verify_token: Any) -> APIRouter:
 
         index_name = req.index_name
         if not index_name and req.finding_id:
-            report = get_cached_report(cluster_name)
+            report = get_cached_report(cluster_name, allow_stale=True)
             if report:
                 finding = next(
                     (f for f in report.findings if f.id == req.finding_id),
@@ -459,7 +635,7 @@ def health_routes(read_config: Any, verify_token: Any) -> APIRouter:
             from elastro.health.audit import HealthAuditLogger
 
             client = build_es_client(target)
-            cached_report = get_cached_report(cluster_name)
+            cached_report = get_cached_report(cluster_name, allow_stale=True)
             session_id = cached_report.session_id if cached_report else None
             audit = HealthAuditLogger(client, host=str(target.get("host", "unknown")))
             executor = RemediationExecutor(
@@ -2,12 +2,18 @@
 Index routes — /api/clusters/{cluster_name}/indices endpoints.
 """
 
-from typing import Dict, Any
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from elastro.core.logger import get_logger
+from elastro.server.allocation import get_allocation_diagnoser
 from elastro.server.schemas import IndexFixRequestSchema
-from elastro.server.services import build_es_client
+from elastro.server.services import (
+    build_es_client,
+    cluster_key,
+    get_async_es_client,
+)
 
 logger = get_logger(__name__)
 
@@ -29,8 +35,10 @@ def index_routes(read_config: Any, verify_token: Any) -> APIRouter:
         return target_c
 
     @router.get("/clusters/{cluster_name}/indices/unhealthy")
-    def get_unhealthy_indices(
-        cluster_name: str, token: str = Depends(verify_token)
+    async def get_unhealthy_indices(
+        cluster_name: str,
+        refresh: bool = Query(False, description="Bypass the short diagnosis cache"),
+        token: str = Depends(verify_token),
     ) -> Dict[str, Any]:
         target_c = _find_cluster(cluster_name)
 
@@ -39,83 +47,10 @@ def index_routes(read_config: Any, verify_token: Any) -> APIRouter:
                 "GUI unhealthy indices requested for cluster=%s",
                 cluster_name,
             )
-            client = build_es_client(target_c)
-
-            from elastro.core.index import IndexManager
-
-            idx_mgr = IndexManager(client)
-
-            indices = idx_mgr.list()
-            unhealthy = [
-                idx
-                for idx in indices
-                if idx.get("health", "green") in ["yellow", "red"]
-            ]
-
-            results = []
-            for idx in unhealthy:
-                name = str(idx.get("index", ""))
-                if not name:
-                    continue
-                try:
-                    explain = idx_mgr.allocation_explain(name)
-                    unassigned = explain.get("unassigned_info", {})
-
-                    routing_filter_fault = False
-                    explanation_parts = []
-                    for node_decision in explain.get("node_allocation_decisions", []):
-                        for decider in node_decision.get("deciders", []):
-                            if decider.get("decision") == "NO":
-                                msg = decider.get("explanation", "").strip()
-                                if msg and msg not in explanation_parts:
-                                    explanation_parts.append(msg)
-
-                            if decider.get(
-                                "decider"
-                            ) == "filter" and "index.routing.allocation" in decider.get(
-                                "explanation", ""
-                            ):
-                                routing_filter_fault = True
-
-                    alloc_explanation = explain.get("allocate_explanation", "")
-                    if (
-                        "Elasticsearch isn't allowed to allocate this shard"
-                        in alloc_explanation
-                        and explanation_parts
-                    ):
-                        alloc_explanation = "Allocation blocked: " + " | ".join(
-                            explanation_parts
-                        )
-                    elif not alloc_explanation:
-                        alloc_explanation = "No explanation"
-
-                    results.append(
-                        {
-                            "index": name,
-                            "health": idx.get("health"),
-                            "status": idx.get("status"),
-                            "allocate_explanation": alloc_explanation,
-                            "reason": unassigned.get("reason", "UNKNOWN"),
-                            "routing_filter_fault": routing_filter_fault,
-                        }
-                    )
-                except Exception as e:
-                    logger.error(
-                        "Failed to explain allocation for index=%s: %s",
-                        name,
-                        e,
-                        exc_info=True,
-                    )
-                    results.append(
-                        {
-                            "index": name,
-                            "health": idx.get("health"),
-                            "status": idx.get("status"),
-                            "allocate_explanation": "Failed to fetch explanation",
-                            "reason": "ERROR",
-                            "routing_filter_fault": False,
-                        }
-                    )
+            es = get_async_es_client(target_c)
+            results = await get_allocation_diagnoser().diagnose(
+                cluster_key(target_c), es, refresh=refresh
+            )
             logger.info(
                 "Unhealthy indices complete cluster=%s count=%s",
                 cluster_name,
@@ -176,6 +111,8 @@ def index_routes(read_config: Any, verify_token: Any) -> APIRouter:
                 }
             if not result.success:
                 raise HTTPException(status_code=500, detail=result.message)
+            # The fix changes allocation; don't serve the old diagnosis
+            get_allocation_diagnoser().invalidate(cluster_key(target_c))
             return {
                 "status": "success",
                 "message": result.message,
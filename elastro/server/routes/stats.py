@@ -0,0 +1,32 @@
+"""
+Stats routes — /api/stats endpoints.
+"""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends
+
+from elastro.core.metrics import get_metrics
+from elastro.core.resilience import get_resilience
+from elastro.server.services import get_async_client_pool, get_client_pool
+
+router = APIRouter(prefix="/api", tags=["stats"])
+
+
+def stats_routes(verify_token: Any) -> APIRouter:
+    """Bind stats routes to the shared token verifier."""
+
+    @router.get("/stats")
+    def get_stats(
+        reset: bool = False, token: str = Depends(verify_token)
+    ) -> Dict[str, Any]:
+        """Per-API request metrics for every client built by this server."""
+        snapshot = get_metrics().snapshot()
+        snapshot["resilience"] = get_resilience().snapshot()
+        snapshot["client_pool"] = get_client_pool().stats()
+        snapshot["async_client_pool"] = get_async_client_pool().stats()
+        if reset:
+            get_metrics().reset()
+        return snapshot
+
+    return router
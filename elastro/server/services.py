@@ -5,30 +5,24 @@ Provides reusable cluster client construction and index size parsing
 to eliminate duplication across route modules.
 """
 
-from typing import Dict, Any, Tuple
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from elasticsearch import AsyncElasticsearch
+
 from elastro.core.client import ElasticsearchClient
 from elastro.core.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-def build_es_client(cluster_config: Dict[str, Any]) -> ElasticsearchClient:
-    """
-    Construct and connect an ElasticsearchClient from a GUI cluster config entry.
-
-    This is the single, canonical factory for constructing ES clients within
-    the GUI server. All route modules MUST use this instead of inlining
-    client construction logic.
-
-    Args:
-        cluster_config: A dict from gui_config.json with 'host' and 'auth' keys.
-
-    Returns:
-        A connected ElasticsearchClient instance.
-
-    Raises:
-        elastro.core.errors.ConnectionError: If the cluster is unreachable.
-    """
+def _client_from_config(cluster_config: Dict[str, Any]) -> ElasticsearchClient:
+    """Build an unconnected ElasticsearchClient from a GUI cluster config entry."""
     auth_conf = cluster_config.get("auth", {})
 
     auth_kwargs: Dict[str, Any] = {}
@@ -44,9 +38,312 @@ def build_es_client(cluster_config: Dict[str, Any]) -> ElasticsearchClient:
     if not host.startswith("http://") and not host.startswith("https://"):
         host = "http://" + host
 
-    client = ElasticsearchClient(hosts=[host], **auth_kwargs)
-    client.connect()
-    return client
+    return ElasticsearchClient(hosts=[host], **auth_kwargs)
+
+
+def cluster_key(cluster_config: Dict[str, Any]) -> str:
+    """
+    Return a stable key for a cluster config (host plus auth fingerprint).
+
+    Credentials are hashed so the key can be logged or used as a dict key
+    without leaking secrets.
+    """
+    auth = json.dumps(cluster_config.get("auth") or {}, sort_keys=True)
+    fingerprint = hashlib.sha256(auth.encode("utf-8")).hexdigest()[:16]
+    return f"{cluster_config.get('host', '')}#{fingerprint}"
+
+
+def _config_digest(cluster_config: Dict[str, Any]) -> str:
+    """Return a digest of the connection settings in a cluster config entry."""
+    # The display name is not a connection setting; clusters registered
+    # under two names share one pooled client
+    settings = {k: v for k, v in cluster_config.items() if k != "name"}
+    raw = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# Seconds between background pings of pooled clients
+POOL_HEALTH_INTERVAL = 30.0
+# Pooled clients unused for this long are closed
+POOL_IDLE_TTL = 600.0
+
+
+@dataclass
+class _PoolEntry:
+    client: ElasticsearchClient
+    digest: str
+    last_used: float = field(default_factory=time.monotonic)
+    healthy: bool = True
+
+
+class ClientPool:
+    """
+    Process-wide pool of connected clients, one per cluster config.
+
+    Entries are keyed by ``cluster_key`` (host plus auth fingerprint), so all
+    routes touching the same cluster share one client and its connection
+    pool. A background thread pings pooled clients to keep connections warm,
+    flags unhealthy ones for a rebuild on next use and closes entries that
+    have been idle for ``idle_ttl`` seconds. An entry whose config changed
+    (e.g. new TLS or timeout settings under the same credentials) is rebuilt.
+    """
+
+    def __init__(
+        self,
+        health_interval: float = POOL_HEALTH_INTERVAL,
+        idle_ttl: float = POOL_IDLE_TTL,
+    ) -> None:
+        self.health_interval = health_interval
+        self.idle_ttl = idle_ttl
+        self._entries: Dict[str, _PoolEntry] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def get(self, cluster_config: Dict[str, Any]) -> ElasticsearchClient:
+        """Return the pooled client for a cluster config, building it if needed."""
+        key = cluster_key(cluster_config)
+        digest = _config_digest(cluster_config)
+        stale: Optional[ElasticsearchClient] = None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry.digest != digest
+                or not entry.healthy
+                or not entry.client.is_connected()
+            ):
+                stale = entry.client
+                entry = None
+            if entry is None:
+                client = _client_from_config(cluster_config)
+                # Skip the ping; the route's first request verifies the connection
+                client.connect(lazy=True)
+                entry = self._entries[key] = _PoolEntry(client, digest)
+                logger.debug(f"Client pool: built client for {key}")
+            entry.last_used = time.monotonic()
+            self._ensure_thread()
+
+        if stale is not None:
+            logger.info(f"Client pool: rebuilt client for {key}")
+            self._close(stale)
+        return entry.client
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._maintain, name="elastro-client-pool", daemon=True
+            )
+            self._thread.start()
+
+    def _maintain(self) -> None:
+        while not self._stop.wait(self.health_interval):
+            self.check_health()
+            self.evict_idle()
+
+    def check_health(self) -> None:
+        """Ping every pooled client and flag the unreachable ones."""
+        with self._lock:
+            entries = list(self._entries.items())
+        for key, entry in entries:
+            try:
+                healthy = bool(entry.client.get_client().ping())
+            except Exception:
+                healthy = False
+            if entry.healthy and not healthy:
+                logger.warning(f"Client pool: {key} failed its health check")
+            entry.healthy = healthy
+
+    def evict_idle(self) -> int:
+        """Close entries unused for ``idle_ttl`` seconds; return how many."""
+        cutoff = time.monotonic() - self.idle_ttl
+        with self._lock:
+            idle = [k for k, e in self._entries.items() if e.last_used < cutoff]
+            evicted = [self._entries.pop(k).client for k in idle]
+        for client in evicted:
+            self._close(client)
+        if evicted:
+            logger.debug(f"Client pool: evicted {len(evicted)} idle clients")
+        return len(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                key: {
+                    "healthy": entry.healthy,
+                    "idle_seconds": round(now - entry.last_used, 1),
+                }
+                for key, entry in self._entries.items()
+            }
+
+    def close(self) -> None:
+        """Stop the maintenance thread and close every pooled client."""
+        self._stop.set()
+        with self._lock:
+            clients = [entry.client for entry in self._entries.values()]
+            self._entries.clear()
+        for client in clients:
+            self._close(client)
+
+    @staticmethod
+    def _close(client: ElasticsearchClient) -> None:
+        try:
+            client.disconnect()
+        except Exception as e:
+            logger.warning(f"Failed to close pooled client: {str(e)}")
+
+
+_client_pool = ClientPool()
+
+
+def get_client_pool() -> ClientPool:
+    """Return the process-wide client pool used by the GUI routes."""
+    return _client_pool
+
+
+def build_es_client(cluster_config: Dict[str, Any]) -> ElasticsearchClient:
+    """
+    Return a connected ElasticsearchClient for a GUI cluster config entry.
+
+    This is the single, canonical factory for constructing ES clients within
+    the GUI server. All route modules MUST use this instead of inlining
+    client construction logic. Clients come from the shared ``ClientPool``,
+    so callers must not disconnect them.
+
+    Args:
+        cluster_config: A dict from gui_config.json with 'host' and 'auth' keys.
+
+    Returns:
+        A lazily connected, pooled ElasticsearchClient instance. If the
+        cluster is unreachable or rejects the credentials, its first request
+        raises elastro.core.errors.ConnectionError / AuthenticationError.
+    """
+    return _client_pool.get(cluster_config)
+
+
+@dataclass
+class _AsyncPoolEntry:
+    client: ElasticsearchClient
+    digest: str
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class AsyncClientPool:
+    """
+    Process-wide pool of async clients, one per cluster config.
+
+    Entries are keyed and rebuilt like ``ClientPool`` entries: by
+    ``cluster_key``, with a rebuild when the config digest changes, and
+    closed once idle for ``idle_ttl`` seconds. Async clients can only be
+    closed on an event loop, so idle entries are evicted on lookup instead
+    of by a background thread, and their close is scheduled on the caller's
+    loop.
+    """
+
+    def __init__(self, idle_ttl: float = POOL_IDLE_TTL) -> None:
+        self.idle_ttl = idle_ttl
+        self._entries: Dict[str, _AsyncPoolEntry] = {}
+        self._lock = threading.Lock()
+        self._closing: Set["asyncio.Task[None]"] = set()
+
+    def get(self, cluster_config: Dict[str, Any]) -> AsyncElasticsearch:
+        """Return the pooled async client for a cluster config."""
+        key = cluster_key(cluster_config)
+        digest = _config_digest(cluster_config)
+
+        with self._lock:
+            stale = self._pop_idle(time.monotonic())
+            entry = self._entries.get(key)
+            if entry is not None and entry.digest != digest:
+                stale.append(self._entries.pop(key).client)
+                entry = None
+                logger.info(f"Async client pool: rebuilt client for {key}")
+            if entry is None:
+                entry = self._entries[key] = _AsyncPoolEntry(
+                    _client_from_config(cluster_config), digest
+                )
+                logger.debug(f"Async client pool: built client for {key}")
+            entry.last_used = time.monotonic()
+            async_client = entry.client.get_async_client()
+
+        for client in stale:
+            self._schedule_close(client)
+        return async_client
+
+    def evict_idle(self) -> int:
+        """Close entries unused for ``idle_ttl`` seconds; return how many."""
+        with self._lock:
+            evicted = self._pop_idle(time.monotonic())
+        for client in evicted:
+            self._schedule_close(client)
+        return len(evicted)
+
+    def _pop_idle(self, now: float) -> List[ElasticsearchClient]:
+        cutoff = now - self.idle_ttl
+        idle = [k for k, e in self._entries.items() if e.last_used < cutoff]
+        if idle:
+            logger.debug(f"Async client pool: evicted {len(idle)} idle clients")
+        return [self._entries.pop(k).client for k in idle]
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                key: {"idle_seconds": round(now - entry.last_used, 1)}
+                for key, entry in self._entries.items()
+            }
+
+    async def close(self) -> None:
+        """Close every pooled async client (called on GUI server shutdown)."""
+        with self._lock:
+            clients = [entry.client for entry in self._entries.values()]
+            self._entries.clear()
+        for client in clients:
+            await self._close(client)
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    def _schedule_close(self, client: ElasticsearchClient) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._close(client))
+            return
+        task = loop.create_task(self._close(client))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(client: ElasticsearchClient) -> None:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close async client: {str(e)}")
+
+
+_async_client_pool = AsyncClientPool()
+
+
+def get_async_client_pool() -> AsyncClientPool:
+    """Return the process-wide async client pool used by the GUI routes."""
+    return _async_client_pool
+
+
+def get_async_es_client(cluster_config: Dict[str, Any]) -> AsyncElasticsearch:
+    """
+    Return the shared, pooled AsyncElasticsearch client for a cluster.
+
+    Clients come from the shared ``AsyncClientPool``; callers must not close
+    them.
+    """
+    return _async_client_pool.get(cluster_config)
+
+
+async def close_async_clients() -> None:
+    """Close every shared async client (called on GUI server shutdown)."""
+    await _async_client_pool.close()
 
 
 def parse_index_size(raw_size: str) -> Tuple[int, str]:
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Elastro - Bulk Compression Benchmark
+
+Measures how much ``http_compress`` shrinks bulk request bodies and, when a
+cluster is given, the indexing throughput with and without compression.
+
+    # Payload sizes only (no cluster needed)
+    python examples/bulk_compression_benchmark.py --docs 20000
+
+    # Payload sizes plus throughput against a cluster
+    python examples/bulk_compression_benchmark.py --host http://localhost:9200 \\
+        --username elastic --password changeme --docs 50000 --chunk-size 1000
+
+Compression trades client CPU for bytes on the wire, so it helps most when
+the link (e.g. a WAN or metered connection) is the bottleneck.
+"""
+
+import argparse
+import gzip
+import json
+import random
+import string
+import time
+from typing import Any, Dict, List, Optional
+
+from elastro import ElasticsearchClient
+from elastro.core.document import DocumentManager
+
+
+def make_documents(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Generate log-like documents with realistic repetition."""
+    rng = random.Random(seed)
+    services = ["api", "auth", "billing", "search", "worker"]
+    levels = ["INFO", "INFO", "INFO", "WARN", "ERROR"]
+    return [
+        {
+            "@timestamp": f"2024-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}Z",
+            "service": rng.choice(services),
+            "level": rng.choice(levels),
+            "host": f"node-{rng.randint(1, 20):02d}",
+            "latency_ms": round(rng.expovariate(1 / 40), 2),
+            "message": "request completed for user "
+            + "".join(rng.choices(string.ascii_lowercase, k=8)),
+        }
+        for i in range(count)
+    ]
+
+
+def bulk_bodies(
+    index: str, documents: List[Dict[str, Any]], chunk_size: int
+) -> List[bytes]:
+    """Serialize documents into NDJSON bulk bodies, one per chunk."""
+    bodies = []
+    for start in range(0, len(documents), chunk_size):
+        lines = []
+        for doc in documents[start : start + chunk_size]:
+            lines.append(json.dumps({"index": {"_index": index}}))
+            lines.append(json.dumps(doc, separators=(",", ":")))
+        bodies.append(("\n".join(lines) + "\n").encode("utf-8"))
+    return bodies
+
+
+def measure_payload(bodies: List[bytes]) -> Dict[str, float]:
+    """Compress bodies the way elastic_transport does and report sizes."""
+    raw = sum(len(b) for b in bodies)
+    start = time.perf_counter()
+    compressed = sum(len(gzip.compress(b)) for b in bodies)
+    elapsed = time.perf_counter() - start
+    return {
+        "raw_bytes": raw,
+        "gzip_bytes": compressed,
+        "ratio": raw / compressed if compressed else 0.0,
+        "gzip_seconds": elapsed,
+    }
+
+
+def measure_throughput(
+    args: argparse.Namespace, documents: List[Dict[str, Any]], compress: bool
+) -> Dict[str, float]:
+    """Bulk index the documents into a fresh index and time it."""
+    auth: Optional[Dict[str, str]] = None
+    if args.username:
+        auth = {"username": args.username, "password": args.password or ""}
+    client = ElasticsearchClient(
+        hosts=[args.host],
+        auth=auth,
+        use_config=False,
+        transport={"http_compress": compress},
+    )
+    client.connect()
+    es = client.get_client()
+    index = f"{args.index}-{'gzip' if compress else 'plain'}"
+    es.options(ignore_status=404).indices.delete(index=index)
+    es.indices.create(index=index, settings={"number_of_replicas": 0})
+
+    try:
+        start = time.perf_counter()
+        summary = DocumentManager(client).bulk_index_sync(
+            index,
+            documents,
+            thread_count=args.threads,
+            chunk_size=args.chunk_size,
+        )
+        elapsed = time.perf_counter() - start
+    finally:
+        es.options(ignore_status=404).indices.delete(index=index)
+        client.disconnect()
+
+    return {
+        "seconds": elapsed,
+        "docs_per_second": len(documents) / elapsed if elapsed else 0.0,
+        "errors": summary.get("error_count", 0),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--host", help="Cluster URL; omit to measure payloads only")
+    parser.add_argument("--username")
+    parser.add_argument("--password")
+    parser.add_argument("--index", default="elastro-compress-bench")
+    args = parser.parse_args()
+
+    documents = make_documents(args.docs)
+    payload = measure_payload(bulk_bodies(args.index, documents, args.chunk_size))
+
+    print(f"Documents:         {args.docs} in chunks of {args.chunk_size}")
+    print(f"Bulk payload:      {payload['raw_bytes'] / 1e6:.2f} MB")
+    print(
+        f"Gzipped payload:   {payload['gzip_bytes'] / 1e6:.2f} MB "
+        f"({payload['ratio']:.1f}x smaller)"
+    )
+    print(f"Compression CPU:   {payload['gzip_seconds']:.2f} s")
+
+    if not args.host:
+        return
+
+    for compress in (False, True):
+        result = measure_throughput(args, documents, compress)
+        label = "http_compress=on " if compress else "http_compress=off"
+        print(
+            f"{label}: {result['seconds']:.2f} s, "
+            f"{result['docs_per_second']:.0f} docs/s, {result['errors']} errors"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 """Integration tests for GUI health API routes."""
 
+import time
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -13,6 +14,7 @@ from elastro.health.models import (
     Severity,
 )
 from elastro.server import ElastroGUI
+from elastro.server.allocation import get_allocation_diagnoser
 from elastro.server.health_cache import clear_cache, store_report
 
 
@@ -49,12 +51,14 @@ def _assess_side_effect(cluster_name, target, read_config, **kwargs):
 @pytest.fixture
 def api_client(tmp_path, monkeypatch):
     clear_cache()
+    get_allocation_diagnoser().invalidate()
     gui = ElastroGUI()
     gui.token = "test-token"
     gui.config_dir = tmp_path
     gui.config_file = tmp_path / "gui_config.json"
     gui.config_file.write_text(
-        '{"clusters": [{"name": "docker-cluster", "host": "http://localhost:9205", "auth": {}}]}'
+        '{"clusters": [{"name": "docker-cluster", '
+        '"host": "http://localhost:9205", "auth": {}}]}'
     )
     return TestClient(gui.app), gui
 
@@ -77,6 +81,59 @@ class TestHealthAPI:
         assert payload["cluster_name"] == "docker-cluster"
         assert "raw_health_report" not in payload
 
+    @patch("elastro.server.routes.health._run_assessment")
+    def test_assess_stream_endpoint(self, mock_run, api_client):
+        client, _ = api_client
+
+        def _streaming_side_effect(cluster_name, target, read_config, **kwargs):
+            progress = kwargs["progress"]
+            report = _mock_report(cluster_name)
+            progress(
+                "started", {"es_version": "8.15.2", "collectors": ["health_report"]}
+            )
+            progress("findings", {"source": "jvm_rule", "findings": report.findings})
+            progress("report", {"report": report})
+            return report
+
+        mock_run.side_effect = _streaming_side_effect
+
+        response = client.get(
+            "/api/clusters/docker-cluster/health/assess/stream",
+            headers={"Authorization": "Bearer test-token"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            line.split(": ", 1)[1]
+            for line in response.text.splitlines()
+            if line.startswith("event: ")
+        ]
+        assert events == ["started", "findings", "report"]
+        assert '"overall_score": 82' in response.text
+
+    @patch("elastro.server.routes.health.STREAM_PING_SECONDS", 0.01)
+    @patch("elastro.server.routes.health._run_assessment")
+    def test_assess_stream_pings_while_waiting(self, mock_run, api_client):
+        client, _ = api_client
+
+        def _slow_side_effect(cluster_name, target, read_config, **kwargs):
+            time.sleep(0.2)
+            report = _mock_report(cluster_name)
+            kwargs["progress"]("report", {"report": report})
+            return report
+
+        mock_run.side_effect = _slow_side_effect
+
+        response = client.get(
+            "/api/clusters/docker-cluster/health/assess/stream",
+            headers={"Authorization": "Bearer test-token"},
+        )
+
+        lines = response.text.splitlines()
+        assert ": ping" in lines
+        assert lines.index(": ping") < lines.index("event: report")
+
     @patch("elastro.server.routes.health._run_assessment")
     def test_score_uses_cache(self, mock_run, api_client):
         client, _ = api_client
@@ -115,6 +172,68 @@ class TestHealthAPI:
         assert len(payload["findings"]) == 1
         assert payload["findings"][0]["id"] == "indicator.shards_availability"
 
+    @patch("elastro.server.routes.health._run_assessment")
+    def test_findings_conditional_get(self, mock_run, api_client):
+        client, _ = api_client
+        mock_run.side_effect = _assess_side_effect
+        headers = {"Authorization": "Bearer test-token"}
+
+        client.get("/api/clusters/docker-cluster/health/score", headers=headers)
+        first = client.get(
+            "/api/clusters/docker-cluster/health/findings", headers=headers
+        )
+        etag = first.headers["etag"]
+        second = client.get(
+            "/api/clusters/docker-cluster/health/findings",
+            headers={**headers, "If-None-Match": etag},
+        )
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert second.content == b""
+
+    @patch("elastro.server.routes.health._run_assessment")
+    def test_assess_is_not_tagged(self, mock_run, api_client):
+        client, _ = api_client
+        mock_run.side_effect = _assess_side_effect
+        headers = {"Authorization": "Bearer test-token"}
+
+        response = client.get(
+            "/api/clusters/docker-cluster/health/assess",
+            headers={**headers, "If-None-Match": "*"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-store"
+        assert "etag" not in response.headers
+
+    @patch("elastro.server.routes.health._run_assessment")
+    def test_history_gzipped_and_revalidated(self, mock_run, api_client):
+        client, _ = api_client
+        mock_run.side_effect = _assess_side_effect
+        headers = {"Authorization": "Bearer test-token", "Accept-Encoding": "gzip"}
+
+        for _ in range(5):
+            client.get("/api/clusters/docker-cluster/health/assess", headers=headers)
+        first = client.get(
+            "/api/clusters/docker-cluster/health/history", headers=headers
+        )
+        cached = client.get(
+            "/api/clusters/docker-cluster/health/history",
+            headers={**headers, "If-None-Match": first.headers["etag"]},
+        )
+        client.get("/api/clusters/docker-cluster/health/assess", headers=headers)
+        changed = client.get(
+            "/api/clusters/docker-cluster/health/history",
+            headers={**headers, "If-None-Match": first.headers["etag"]},
+        )
+
+        assert first.headers["content-encoding"] == "gzip"
+        assert len(first.json()["assessments"]) == 5
+        assert cached.status_code == 304
+        assert changed.status_code == 200
+
     @patch("elastro.server.routes.health.compute_trends_from_records")
     @patch("elastro.server.routes.health._load_cluster_history")
     @patch("elastro.server.routes.health._run_assessment")
@@ -445,24 +564,56 @@ class TestUnhealthyIndicesAPI:
             "node_allocation_decisions": [{"deciders": deciders}],
         }
 
-    @patch("elastro.core.index.IndexManager")
-    @patch("elastro.server.routes.indices.build_es_client")
-    def test_unhealthy_indices_returns_yellow_and_red(
-        self, mock_build, mock_index_manager_cls, api_client
-    ):
+    def _async_es(self, indices, explains, reasons=None):
+        es = MagicMock()
+        es.cat.indices = AsyncMock(return_value=indices)
+        reasons = reasons or {}
+        routing = {}
+        for idx in indices:
+            copies = [{"shard": 0, "primary": True, "state": "STARTED"}]
+            if idx["health"] != "green":
+                reason = reasons.get(idx["index"], "REPLICA_ADDED")
+                copies.append(
+                    {
+                        "shard": 0,
+                        "primary": False,
+                        "state": "UNASSIGNED",
+                        "unassigned_info": {"reason": reason},
+                    }
+                )
+            routing[idx["index"]] = {"shards": {"0": copies}}
+        es.cluster.state = AsyncMock(
+            return_value={"routing_table": {"indices": routing}}
+        )
+        es.cluster.get_settings = AsyncMock(
+            return_value={"persistent": {}, "transient": {}}
+        )
+        es.nodes.info = AsyncMock(
+            return_value={
+                "nodes": {"n1": {"roles": ["data"]}, "n2": {"roles": ["data"]}}
+            }
+        )
+        es.cluster.allocation_explain = AsyncMock(side_effect=explains)
+        return es
+
+    @patch("elastro.server.routes.indices.get_async_es_client")
+    def test_unhealthy_indices_returns_yellow_and_red(self, mock_get_es, api_client):
         client, _ = api_client
-        mock_build.return_value = MagicMock()
-        mock_idx_mgr = MagicMock()
-        mock_idx_mgr.list.return_value = [
-            {"index": "logs-000001", "health": "yellow", "status": "open"},
-            {"index": "healthy-index", "health": "green", "status": "open"},
-            {"index": "broken-index", "health": "red", "status": "open"},
-        ]
-        mock_idx_mgr.allocation_explain.side_effect = [
-            self._allocation_explain(),
-            self._allocation_explain(reason="ALLOCATION_FAILED", routing_filter=True),
-        ]
-        mock_index_manager_cls.return_value = mock_idx_mgr
+        es = self._async_es(
+            [
+                {"index": "logs-000001", "health": "yellow", "status": "open"},
+                {"index": "healthy-index", "health": "green", "status": "open"},
+                {"index": "broken-index", "health": "red", "status": "open"},
+            ],
+            [
+                self._allocation_explain(),
+                self._allocation_explain(
+                    reason="ALLOCATION_FAILED", routing_filter=True
+                ),
+            ],
+            reasons={"broken-index": "ALLOCATION_FAILED"},
+        )
+        mock_get_es.return_value = es
 
         response = client.get(
             "/api/clusters/docker-cluster/indices/unhealthy",
@@ -477,19 +628,43 @@ class TestUnhealthyIndicesAPI:
         assert "Allocation blocked:" in indices[0]["allocate_explanation"]
         assert indices[1]["index"] == "broken-index"
         assert indices[1]["routing_filter_fault"] is True
+        assert es.cluster.allocation_explain.await_count == 2
 
-    @patch("elastro.core.index.IndexManager")
-    @patch("elastro.server.routes.indices.build_es_client")
-    def test_unhealthy_indices_empty_when_all_green(
-        self, mock_build, mock_index_manager_cls, api_client
+    @patch("elastro.server.routes.indices.get_async_es_client")
+    def test_unhealthy_indices_explains_one_per_group_and_caches(
+        self, mock_get_es, api_client
     ):
         client, _ = api_client
-        mock_build.return_value = MagicMock()
-        mock_idx_mgr = MagicMock()
-        mock_idx_mgr.list.return_value = [
-            {"index": "healthy-index", "health": "green", "status": "open"},
+        indices = [
+            {"index": f"logs-{n:06d}", "health": "yellow", "status": "open"}
+            for n in range(1, 4)
         ]
-        mock_index_manager_cls.return_value = mock_idx_mgr
+        es = self._async_es(indices, [self._allocation_explain()])
+        mock_get_es.return_value = es
+        headers = {"Authorization": "Bearer test-token"}
+
+        first = client.get(
+            "/api/clusters/docker-cluster/indices/unhealthy", headers=headers
+        )
+        second = client.get(
+            "/api/clusters/docker-cluster/indices/unhealthy", headers=headers
+        )
+
+        rows = first.json()["indices"]
+        assert [row["index"] for row in rows] == [idx["index"] for idx in indices]
+        assert all(row["reason"] == "REPLICA_ADDED" for row in rows)
+        assert rows[1]["explained_by"] == "logs-000001"
+        assert second.json() == first.json()
+        assert es.cluster.allocation_explain.await_count == 1
+        assert es.cat.indices.await_count == 1
+
+    @patch("elastro.server.routes.indices.get_async_es_client")
+    def test_unhealthy_indices_empty_when_all_green(self, mock_get_es, api_client):
+        client, _ = api_client
+        es = self._async_es(
+            [{"index": "healthy-index", "health": "green", "status": "open"}], []
+        )
+        mock_get_es.return_value = es
 
         response = client.get(
             "/api/clusters/docker-cluster/indices/unhealthy",
@@ -498,20 +673,17 @@ class TestUnhealthyIndicesAPI:
 
         assert response.status_code == 200
         assert response.json()["indices"] == []
+        es.cluster.allocation_explain.assert_not_awaited()
 
-    @patch("elastro.core.index.IndexManager")
-    @patch("elastro.server.routes.indices.build_es_client")
+    @patch("elastro.server.routes.indices.get_async_es_client")
     def test_unhealthy_indices_handles_allocation_explain_failure(
-        self, mock_build, mock_index_manager_cls, api_client
+        self, mock_get_es, api_client
     ):
         client, _ = api_client
-        mock_build.return_value = MagicMock()
-        mock_idx_mgr = MagicMock()
-        mock_idx_mgr.list.return_value = [
-            {"index": "logs-000001", "health": "yellow", "status": "open"},
-        ]
-        mock_idx_mgr.allocation_explain.side_effect = RuntimeError("explain failed")
-        mock_index_manager_cls.return_value = mock_idx_mgr
+        mock_get_es.return_value = self._async_es(
+            [{"index": "logs-000001", "health": "yellow", "status": "open"}],
+            RuntimeError("explain failed"),
+        )
 
         response = client.get(
             "/api/clusters/docker-cluster/indices/unhealthy",
@@ -147,7 +147,7 @@ class TestIndexFixCLI:
         assert "Diagnostics complete" in result.output
 
     @patch("elastro.cli.cli.ElasticsearchClient.connect")
-    @patch("elastro.health.remediation.diagnosis.diagnose_unhealthy_indices")
+    @patch("elastro.health.remediation.fix.diagnose_unhealthy_indices")
     @patch("elastro.health.remediation.diagnosis.list_unhealthy_indices")
     def test_fix_shows_no_automated_fix_without_suggestion(
         self,
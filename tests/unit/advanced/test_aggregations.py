@@ -1,6 +1,7 @@
 """Unit tests for AggregationBuilder."""
 
 import pytest
+
 from elastro.advanced.aggregations import AggregationBuilder
 
 
@@ -49,7 +50,7 @@ class TestAggregationBuilder:
             "my_date_histogram": {
                 "date_histogram": {
                     "field": "date_field",
-                    "interval": "day",
+                    "calendar_interval": "day",
                     "format": "yyyy-MM-dd",
                 }
             }
@@ -63,7 +64,7 @@ class TestAggregationBuilder:
 
         expected = {
             "my_date_histogram": {
-                "date_histogram": {"field": "date_field", "interval": "month"}
+                "date_histogram": {"field": "date_field", "calendar_interval": "month"}
             }
         }
         assert builder.to_dict() == expected
@@ -159,7 +160,7 @@ class TestAggregationBuilder:
         expected = {
             "categories": {"terms": {"field": "category", "size": 5}},
             "sales_over_time": {
-                "date_histogram": {"field": "sale_date", "interval": "month"}
+                "date_histogram": {"field": "sale_date", "calendar_interval": "month"}
             },
         }
         assert builder.to_dict() == expected
@@ -0,0 +1,250 @@
+"""Unit tests for composite aggregations and the composite paginator."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from elastro.advanced.aggregations import (
+    AggregationBuilder,
+    CompositeAggregationBuilder,
+)
+from elastro.advanced.composite import CompositePaginator
+
+
+@pytest.fixture
+def mock_es_client():
+    """Return a mock Elasticsearch client."""
+    return MagicMock()
+
+
+@pytest.fixture
+def paginator(mock_es_client):
+    """Return a CompositePaginator instance with a mocked ES client."""
+    return CompositePaginator(mock_es_client)
+
+
+def _page(buckets, after_key=None):
+    result = {"buckets": buckets}
+    if after_key is not None:
+        result["after_key"] = after_key
+    return {"aggregations": {"composite": result}}
+
+
+class TestCompositeAggregationBuilder:
+    """Tests for the CompositeAggregationBuilder class."""
+
+    def test_sources_and_sub_aggregations(self):
+        """Test building a composite aggregation with mixed sources."""
+        composite = (
+            CompositeAggregationBuilder()
+            .terms("category", "category.keyword", missing_bucket=True)
+            .date_histogram("day", "timestamp", "day", order="desc")
+            .histogram("price", "price", 10)
+            .size(50)
+            .sub_aggregations(AggregationBuilder().avg("avg_price", "price"))
+        )
+
+        assert composite.to_aggregation() == {
+            "composite": {
+                "sources": [
+                    {
+                        "category": {
+                            "terms": {
+                                "field": "category.keyword",
+                                "missing_bucket": True,
+                            }
+                        }
+                    },
+                    {
+                        "day": {
+                            "date_histogram": {
+                                "field": "timestamp",
+                                "calendar_interval": "day",
+                                "order": "desc",
+                            }
+                        }
+                    },
+                    {"price": {"histogram": {"field": "price", "interval": 10}}},
+                ],
+                "size": 50,
+            },
+            "aggs": {"avg_price": {"avg": {"field": "price"}}},
+        }
+
+    def test_requires_a_source(self):
+        """Test that a composite aggregation without sources is rejected."""
+        with pytest.raises(ValueError):
+            CompositeAggregationBuilder().to_dict()
+
+    def test_aggregation_builder_composite(self):
+        """Test adding a composite aggregation to an AggregationBuilder."""
+        builder = AggregationBuilder().composite(
+            "by_host",
+            [{"host": {"terms": {"field": "host"}}}],
+            size=100,
+            after={"host": "web-1"},
+        )
+
+        assert builder.to_dict() == {
+            "by_host": {
+                "composite": {
+                    "sources": [{"host": {"terms": {"field": "host"}}}],
+                    "size": 100,
+                    "after": {"host": "web-1"},
+                }
+            }
+        }
+
+    def test_aggregation_builder_composite_keeps_builder(self):
+        """Test that adding a composite builder leaves the builder unchanged."""
+        composite = CompositeAggregationBuilder().terms("host", "host").size(50)
+
+        builder = AggregationBuilder().composite("default", composite)
+        builder.composite("paged", composite, size=10, after={"host": "web-1"})
+
+        assert builder.to_dict()["default"]["composite"]["size"] == 50
+        assert builder.to_dict()["paged"]["composite"] == {
+            "sources": [{"host": {"terms": {"field": "host"}}}],
+            "size": 10,
+            "after": {"host": "web-1"},
+        }
+        assert composite.to_dict() == {
+            "sources": [{"host": {"terms": {"field": "host"}}}],
+            "size": 50,
+        }
+
+    def test_fixed_interval_date_histogram(self):
+        """Test that multiples of a unit are sent as fixed_interval."""
+        builder = AggregationBuilder().date_histogram("weekly", "ts", interval="7d")
+
+        assert builder.to_dict() == {
+            "weekly": {"date_histogram": {"field": "ts", "fixed_interval": "7d"}}
+        }
+
+    def test_calendar_multiples_are_rejected(self):
+        """Test that multiples of calendar-only units raise a clear error."""
+        builder = AggregationBuilder()
+        assert builder.date_histogram("q", "ts", interval="1q").to_dict()["q"] == {
+            "date_histogram": {"field": "ts", "calendar_interval": "1q"}
+        }
+        for interval in ("2M", "2w", "3q", "2y"):
+            with pytest.raises(ValueError, match="single unit"):
+                builder.date_histogram("bad", "ts", interval=interval)
+
+    def test_partitioned_terms(self):
+        """Test the include partition of a partitioned terms aggregation."""
+        builder = AggregationBuilder().partitioned_terms(
+            "users", "user_id", partition=2, num_partitions=8, size=500
+        )
+
+        assert builder.to_dict() == {
+            "users": {
+                "terms": {
+                    "field": "user_id",
+                    "size": 500,
+                    "include": {"partition": 2, "num_partitions": 8},
+                }
+            }
+        }
+        with pytest.raises(ValueError):
+            AggregationBuilder().partitioned_terms("users", "user_id", 8, 8)
+
+
+class TestCompositePaginator:
+    """Tests for the CompositePaginator class."""
+
+    def test_iter_buckets_follows_after_key(self, paginator, mock_es_client):
+        """Test that pages are requested with the previous after_key."""
+        mock_es_client.search.side_effect = [
+            _page([{"key": {"host": "a"}}, {"key": {"host": "b"}}], {"host": "b"}),
+            _page([{"key": {"host": "c"}}], {"host": "c"}),
+            _page([{"key": {"host": "d"}}]),
+        ]
+        composite = CompositeAggregationBuilder().terms("host", "host").size(2)
+
+        buckets = list(
+            paginator.iter_buckets("logs", composite, query={"match_all": {}})
+        )
+
+        # A short page with an after_key does not end pagination
+        assert [b["key"]["host"] for b in buckets] == ["a", "b", "c", "d"]
+        assert mock_es_client.search.call_count == 3
+        first, second, third = [
+            c[1]["body"] for c in mock_es_client.search.call_args_list
+        ]
+        assert first["size"] == 0
+        assert first["query"] == {"match_all": {}}
+        assert "after" not in first["aggs"]["composite"]["composite"]
+        assert second["aggs"]["composite"]["composite"]["after"] == {"host": "b"}
+        assert third["aggs"]["composite"]["composite"]["after"] == {"host": "c"}
+
+    def test_iter_buckets_is_lazy(self, paginator, mock_es_client):
+        """Test that later pages are only fetched when consumed."""
+        mock_es_client.search.return_value = _page(
+            [{"key": {"host": "a"}}], {"host": "a"}
+        )
+        composite = CompositeAggregationBuilder().terms("host", "host").size(1)
+
+        buckets = paginator.iter_buckets("logs", composite)
+        assert mock_es_client.search.call_count == 0
+        next(buckets)
+        assert mock_es_client.search.call_count == 1
+
+    def test_iter_buckets_stops_on_empty_page(self, paginator, mock_es_client):
+        """Test that an empty page ends pagination."""
+        mock_es_client.search.side_effect = [
+            _page([{"key": {"host": "a"}}], {"host": "a"}),
+            _page([]),
+        ]
+        composite = CompositeAggregationBuilder().terms("host", "host").size(1)
+
+        assert len(list(paginator.iter_buckets("logs", composite))) == 1
+        assert mock_es_client.search.call_count == 2
+
+    def test_partitioned_terms(self, paginator, mock_es_client):
+        """Test that every partition is fetched and yielded in order."""
+
+        def search(index, body):
+            partition = body["aggs"]["users"]["terms"]["include"]["partition"]
+            return {
+                "aggregations": {
+                    "users": {"buckets": [{"key": f"user-{partition}", "doc_count": 1}]}
+                }
+            }
+
+        mock_es_client.search.side_effect = search
+
+        buckets = list(
+            paginator.partitioned_terms(
+                "events",
+                "user_id",
+                num_partitions=4,
+                size=100,
+                sub_aggregations=AggregationBuilder().max("last_seen", "ts"),
+                name="users",
+            )
+        )
+
+        assert [b["key"] for b in buckets] == [f"user-{i}" for i in range(4)]
+        assert mock_es_client.search.call_count == 4
+        body = mock_es_client.search.call_args[1]["body"]
+        assert body["aggs"]["users"]["aggs"] == {"last_seen": {"max": {"field": "ts"}}}
+
+    def test_partitions_in_flight_are_bounded(self, paginator):
+        """Test that only max_workers partitions run ahead of the consumer."""
+        fetched = []
+        lock = threading.Lock()
+
+        def fetch(partition):
+            with lock:
+                fetched.append(partition)
+            return [{"key": partition}]
+
+        buckets = paginator._iter_partitions(fetch, num_partitions=10, max_workers=2)
+        assert next(buckets) == {"key": 0}
+        time.sleep(0.05)
+
+        assert len(fetched) <= 3
+        assert [b["key"] for b in buckets] == list(range(1, 10))
@@ -0,0 +1,70 @@
+"""Unit tests for the delete-by-query / update-by-query commands."""
+
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from elastro.cli.commands.document import delete_by_query, update_by_query
+
+
+class TestByQueryCommands:
+    def test_delete_without_query_is_rejected(self):
+        client = MagicMock()
+        with patch("elastro.core.task_runner.TaskRunner") as mock_runner_cls:
+            result = CliRunner().invoke(
+                delete_by_query,
+                ["logs", "--file", "-"],
+                input='{"size": 10}',
+                obj=client,
+            )
+
+        assert result.exit_code == 2
+        assert "'query' key" in result.output
+        mock_runner_cls.return_value.submit.assert_not_called()
+
+    def test_update_with_script_only_is_rejected(self):
+        client = MagicMock()
+        with patch("elastro.core.task_runner.TaskRunner") as mock_runner_cls:
+            result = CliRunner().invoke(
+                update_by_query,
+                ["logs", "--file", "-"],
+                input='{"script": {"source": "ctx._source.x = 1"}}',
+                obj=client,
+            )
+
+        assert result.exit_code == 2
+        mock_runner_cls.return_value.submit.assert_not_called()
+
+    def test_malformed_body_is_rejected(self):
+        client = MagicMock()
+        with patch("elastro.core.task_runner.TaskRunner") as mock_runner_cls:
+            result = CliRunner().invoke(
+                update_by_query,
+                ["logs", "--file", "-"],
+                input='{"query": ',
+                obj=client,
+            )
+
+        assert result.exit_code == 2
+        assert "not valid JSON" in result.output
+        mock_runner_cls.return_value.submit.assert_not_called()
+
+    def test_query_is_submitted(self):
+        client = MagicMock()
+        with patch("elastro.core.task_runner.TaskRunner") as mock_runner_cls:
+            mock_runner_cls.return_value.submit.return_value = "node1:7"
+            result = CliRunner().invoke(
+                delete_by_query,
+                ["logs", "--file", "-", "--no-wait"],
+                input='{"query": {"term": {"level": "debug"}}}',
+                obj=client,
+            )
+
+        assert result.exit_code == 0
+        mock_runner_cls.return_value.submit.assert_called_once_with(
+            "delete_by_query",
+            "logs",
+            {"term": {"level": "debug"}},
+            slices="auto",
+            requests_per_second=None,
+        )
@@ -0,0 +1,20 @@
+"""Unit tests for the doc get command."""
+
+from unittest.mock import MagicMock
+
+from click.testing import CliRunner
+
+from elastro.cli.commands.document import get_document
+
+
+class TestGetDocumentCommand:
+    def test_malformed_ids_file_is_a_usage_error(self):
+        result = CliRunner().invoke(
+            get_document,
+            ["logs", "--ids-file", "-"],
+            input='["a", "b"',
+            obj=MagicMock(),
+        )
+
+        assert result.exit_code == 2
+        assert "not valid JSON" in result.output
@@ -2,15 +2,14 @@
 Unit tests for the loader module.
 """
 
-import os
-import yaml
 import json
+import os
+from unittest.mock import mock_open, patch
+
 import pytest
-from pathlib import Path
-from unittest.mock import patch, mock_open, MagicMock
+import yaml
 
 from elastro.config import loader
-from elastro.config.defaults import DEFAULT_CONFIG
 from elastro.core.errors import ConfigurationError
 
 
@@ -155,6 +154,25 @@ class TestLoadFromEnv:
             result = loader._load_from_env(config)
             assert result["section"]["subsection"]["key"] == "value"
 
+    def test_env_transport_options(self):
+        """Test that compound transport option names are not split."""
+        config = {"elasticsearch": {}}
+
+        with patch.dict(
+            os.environ,
+            {
+                "ELASTIC_ELASTICSEARCH_HTTP_COMPRESS": "true",
+                "ELASTIC_ELASTICSEARCH_SNIFF_ON_NODE_FAILURE": "true",
+                "ELASTIC_ELASTICSEARCH_MIN_DELAY_BETWEEN_SNIFFING": "30",
+                "ELASTIC_ELASTICSEARCH_NODE_SELECTOR": "random",
+            },
+        ):
+            result = loader._load_from_env(config)
+            assert result["elasticsearch"]["http_compress"] is True
+            assert result["elasticsearch"]["sniff_on_node_failure"] is True
+            assert result["elasticsearch"]["min_delay_between_sniffing"] == 30
+            assert result["elasticsearch"]["node_selector"] == "random"
+
 
 class TestMergeConfigs:
     """Tests for _merge_configs function."""
@@ -358,7 +376,8 @@ class TestLoadConfig:
                 ):
                     config = loader.load_config()
                     assert config == sample_config
-                    # It should try to load from the first standard location (CWD/elastic.yaml)
+                    # It should try to load from the first standard location
+                    # (CWD/elastic.yaml)
                     mock_load.assert_called_once()
 
     def test_global_config_storage(self, reset_config, sample_config):
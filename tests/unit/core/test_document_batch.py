@@ -0,0 +1,127 @@
+"""
+Unit tests for DocumentManager batched lookups (mget / msearch).
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from elastro.core.client import ElasticsearchClient
+from elastro.core.document import DocumentManager
+from elastro.core.errors import ValidationError
+
+
+@pytest.fixture
+def mock_es_client():
+    """Mock ElasticsearchClient whose get_client() returns a raw ES mock."""
+    client = MagicMock(spec=ElasticsearchClient)
+    client.get_client.return_value = MagicMock()
+    return client
+
+
+def _mget_side_effect(**kwargs):
+    return {
+        "docs": [
+            {"_index": kwargs["index"], "_id": doc_id, "found": doc_id != "missing"}
+            for doc_id in kwargs["ids"]
+        ]
+    }
+
+
+class TestDocumentManagerMget:
+    """Tests for DocumentManager.mget / get_many."""
+
+    def test_mget_preserves_order_across_chunks(self, mock_es_client):
+        es = mock_es_client.get_client()
+        es.mget.side_effect = _mget_side_effect
+        ids = [str(i) for i in range(10)] + ["missing"]
+
+        manager = DocumentManager(mock_es_client)
+        docs = manager.mget("test-index", ids, chunk_size=3, max_workers=4)
+
+        assert [doc["_id"] for doc in docs] == ids
+        assert docs[-1]["found"] is False
+        assert es.mget.call_count == 4
+
+    def test_mget_chunk_failure_returns_per_item_errors(self, mock_es_client):
+        es = mock_es_client.get_client()
+
+        def _side_effect(**kwargs):
+            if "2" in kwargs["ids"]:
+                raise Exception("node down")
+            return _mget_side_effect(**kwargs)
+
+        es.mget.side_effect = _side_effect
+
+        manager = DocumentManager(mock_es_client)
+        docs = manager.get_many("test-index", ["0", "1", "2", "3"], chunk_size=2)
+
+        assert [doc["_id"] for doc in docs] == ["0", "1", "2", "3"]
+        assert docs[0]["found"] is True
+        assert "node down" in docs[2]["error"]["reason"]
+        assert "error" in docs[3]
+
+    def test_mget_source_filter(self, mock_es_client):
+        es = mock_es_client.get_client()
+        es.mget.side_effect = _mget_side_effect
+
+        DocumentManager(mock_es_client).mget("idx", ["a"], source=["title"])
+
+        es.mget.assert_called_once_with(index="idx", ids=["a"], _source=["title"])
+
+    @pytest.mark.parametrize(
+        "index,ids,chunk_size,message",
+        [
+            ("", ["a"], 10, "Index name cannot be empty"),
+            ("idx", [], 10, "IDs must be a non-empty list"),
+            ("idx", ["a"], 0, "chunk_size must be a positive integer"),
+        ],
+    )
+    def test_mget_validation(self, mock_es_client, index, ids, chunk_size, message):
+        with pytest.raises(ValidationError, match=message):
+            DocumentManager(mock_es_client).mget(index, ids, chunk_size=chunk_size)
+
+
+class TestDocumentManagerMsearch:
+    """Tests for DocumentManager.msearch / search_many."""
+
+    def test_msearch_builds_bodies_and_preserves_order(self, mock_es_client):
+        es = mock_es_client.get_client()
+
+        def _side_effect(searches):
+            bodies = searches[1::2]
+            return {
+                "responses": [
+                    {"hits": {"hits": [], "total": {"value": i}}, "query": b["query"]}
+                    for i, b in enumerate(bodies)
+                ]
+            }
+
+        es.msearch.side_effect = _side_effect
+        queries = [{"term": {"user": str(i)}} for i in range(5)]
+
+        manager = DocumentManager(mock_es_client)
+        responses = manager.search_many(
+            "logs-*", queries, options={"size": 1}, chunk_size=2
+        )
+
+        assert [r["query"] for r in responses] == queries
+        assert es.msearch.call_count == 3
+        first_call = es.msearch.call_args_list[0].kwargs["searches"]
+        assert first_call[0] == {"index": "logs-*"}
+        assert first_call[1] == {"query": {"term": {"user": "0"}}, "size": 1}
+
+    def test_msearch_chunk_failure_returns_per_item_errors(self, mock_es_client):
+        es = mock_es_client.get_client()
+        es.msearch.side_effect = Exception("timeout")
+
+        responses = DocumentManager(mock_es_client).msearch(
+            "idx", [{"match_all": {}}, {"match_all": {}}]
+        )
+
+        assert len(responses) == 2
+        assert all("timeout" in r["error"]["reason"] for r in responses)
+
+    def test_msearch_validation(self, mock_es_client):
+        with pytest.raises(ValidationError, match="Queries must be a non-empty list"):
+            DocumentManager(mock_es_client).msearch("idx", [])
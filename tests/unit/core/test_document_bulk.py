@@ -6,12 +6,14 @@ DocumentManager.bulk_index_sync() / bulk_delete_sync() methods.
 """
 
 import warnings
+from unittest.mock import MagicMock, PropertyMock, patch
+
 import pytest
-from unittest.mock import MagicMock, PropertyMock
+
+from elastro.core.client import ElasticsearchClient
+from elastro.core.document import BulkErrorCollector, DocumentManager
 from elastro.core.document_bulk import BulkDocumentManager
-from elastro.core.document import DocumentManager
 from elastro.core.errors import DocumentError, ValidationError
-from elastro.core.client import ElasticsearchClient
 
 
 @pytest.fixture
@@ -195,3 +197,82 @@ class TestBulkDocumentManagerDeprecation:
             response = manager.bulk_delete("test-index", ["doc1"])
 
         assert response == expected_response
+
+
+def _fake_parallel_bulk(client, actions, **kwargs):
+    """Stand-in for helpers.parallel_bulk that fails every third action."""
+    for i, action in enumerate(actions):
+        op = action.get("_op_type", "index")
+        if i % 3 == 2:
+            yield False, {op: {"_id": action.get("_id"), "status": 400}}
+        else:
+            yield True, {op: {"_id": action.get("_id"), "status": 200}}
+
+
+class TestDocumentManagerParallelBulk:
+    """Tests for the thread-pooled sync bulk path."""
+
+    @patch("elastro.core.document.helpers.parallel_bulk")
+    def test_bulk_index_sync_threaded_summary(self, mock_parallel, mock_es_client):
+        mock_parallel.side_effect = _fake_parallel_bulk
+        documents = [{"_id": str(i), "field": i} for i in range(6)]
+
+        manager = DocumentManager(mock_es_client)
+        result = manager.bulk_index_sync(
+            "test-index", documents, refresh=True, thread_count=8, queue_size=2
+        )
+
+        assert result["success_count"] == 4
+        assert result["error_count"] == 2
+        assert result["errors_truncated"] is False
+        kwargs = mock_parallel.call_args.kwargs
+        assert kwargs["thread_count"] == 8
+        assert kwargs["queue_size"] == 2
+        assert kwargs["raise_on_error"] is False
+        # Refresh happens once at the end, not per chunk
+        mock_es_client.get_client().indices.refresh.assert_called_once_with(
+            index="test-index"
+        )
+        mock_es_client.get_client().bulk.assert_not_called()
+        # Caller documents are not mutated
+        assert documents[0] == {"_id": "0", "field": 0}
+
+    @patch("elastro.core.document.helpers.parallel_bulk")
+    def test_bulk_delete_sync_threaded(self, mock_parallel, mock_es_client):
+        mock_parallel.side_effect = _fake_parallel_bulk
+
+        result = DocumentManager(mock_es_client).bulk_delete_sync(
+            "test-index", ["a", "b"], thread_count=2
+        )
+
+        assert result["success_count"] == 2
+        mock_es_client.get_client().indices.refresh.assert_not_called()
+
+    @patch("elastro.core.document.helpers.parallel_bulk")
+    def test_parallel_bulk_streams_items(self, mock_parallel, mock_es_client):
+        mock_parallel.side_effect = _fake_parallel_bulk
+        seen = []
+
+        DocumentManager(mock_es_client).parallel_bulk_sync(
+            ({"_index": "i", "_id": str(i)} for i in range(3)),
+            on_item=lambda ok, item: seen.append(ok),
+        )
+
+        assert seen == [True, True, False]
+
+    def test_error_collector_is_bounded(self):
+        collector = BulkErrorCollector(max_errors=2)
+        for i in range(5):
+            collector.add(False, {"index": {"_id": str(i)}})
+        collector.add(True, {})
+
+        summary = collector.to_dict()
+        assert summary["error_count"] == 5
+        assert summary["success_count"] == 1
+        assert len(summary["errors"]) == 2
+        assert summary["errors_truncated"] is True
+
+    def test_stream_bulk_validation(self, mock_es_client):
+        manager = DocumentManager(mock_es_client)
+        with pytest.raises(ValidationError, match="must be positive integers"):
+            list(manager.stream_bulk_sync([], thread_count=0))
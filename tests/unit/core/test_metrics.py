@@ -0,0 +1,204 @@
+"""Unit tests for the transport metrics module."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from elastro.core.client import ElasticsearchClient
+from elastro.core.metrics import (
+    InstrumentedAiohttpHttpNode,
+    InstrumentedAsyncElasticsearch,
+    InstrumentedElasticsearch,
+    LatencyHistogram,
+    TransportMetrics,
+    get_metrics,
+)
+
+
+class _FakeElasticsearch(BaseHTTPRequestHandler):
+    """Minimal HTTP handler that answers like an Elasticsearch node."""
+
+    def _reply(self, status, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("X-Elastic-Product", "Elasticsearch")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("X-Elastic-Product", "Elasticsearch")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        self._reply(200, {"version": {"number": "8.19.0"}, "tagline": "test"})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.startswith("/missing"):
+            self._reply(404, {"error": {"type": "index_not_found_exception"}})
+        else:
+            self._reply(200, {"hits": {"total": {"value": 0}, "hits": []}})
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def es_host():
+    """Serve fake Elasticsearch responses on a local port."""
+    server = HTTPServer(("127.0.0.1", 0), _FakeElasticsearch)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    get_metrics().reset()
+    yield
+    get_metrics().reset()
+
+
+class TestLatencyHistogram:
+    """Tests for the LatencyHistogram class."""
+
+    def test_percentiles_within_precision(self):
+        """Test that percentiles stay within the bucket precision."""
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000.0)
+
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(500, rel=0.02)
+        assert histogram.percentile(99) == pytest.approx(990, rel=0.02)
+        assert histogram.percentile(100) == 1000.0
+        assert histogram.to_dict()["min"] == 1.0
+
+    def test_small_values_are_exact(self):
+        """Test that sub-128us samples are counted exactly."""
+        histogram = LatencyHistogram()
+        histogram.record(0.000050)
+
+        assert histogram.percentile(50) == 0.05
+
+    def test_merge(self):
+        """Test that merged histograms combine counts and extremes."""
+        a, b = LatencyHistogram(), LatencyHistogram()
+        a.record(0.001)
+        b.record(0.100)
+        a.merge(b)
+
+        assert a.count == 2
+        assert a.to_dict()["max"] == 100.0
+        assert a.to_dict()["min"] == 1.0
+
+
+class TestTransportMetrics:
+    """Tests for the TransportMetrics registry."""
+
+    def test_record_and_snapshot(self):
+        """Test per-endpoint aggregation, retries and totals."""
+        metrics = TransportMetrics()
+        metrics.record("search", 0.010, bytes_out=100, bytes_in=400, node_seconds=0.008)
+        metrics.record("search", 0.020, error=True, attempts=3, node_seconds=0.015)
+        metrics.record("info", 0.001)
+
+        snapshot = metrics.snapshot()
+        search = snapshot["endpoints"][0]
+
+        assert search["endpoint"] == "search"
+        assert search["count"] == 2
+        assert search["errors"] == 1
+        assert search["retries"] == 2
+        assert search["bytes_out"] == 100
+        assert search["client_overhead_ms"] == pytest.approx(3.5, abs=0.1)
+        assert snapshot["requests"] == 3
+
+        metrics.reset()
+        assert metrics.snapshot()["requests"] == 0
+
+
+class TestInstrumentedClient:
+    """Tests for recording through a real transport."""
+
+    def test_records_endpoints_and_bytes(self, es_host):
+        """Test that API calls are recorded under their endpoint names."""
+        client = ElasticsearchClient(hosts=[es_host], use_config=False, metrics=True)
+        client.connect()
+        es = client.get_client()
+        assert isinstance(es, InstrumentedElasticsearch)
+
+        es.search(index="logs", query={"match_all": {}})
+        with pytest.raises(Exception):
+            es.search(index="missing", query={"match_all": {}})
+
+        endpoints = {e["endpoint"]: e for e in get_metrics().snapshot()["endpoints"]}
+        assert endpoints["ping"]["count"] == 1
+        assert endpoints["search"]["count"] == 2
+        assert endpoints["search"]["errors"] == 1
+        assert endpoints["search"]["bytes_out"] > 0
+        assert endpoints["search"]["bytes_in"] > 0
+        assert endpoints["search"]["node_latency_ms"]["max"] > 0
+        client.disconnect()
+
+    def test_disabled_by_default_without_config(self, es_host):
+        """Test that explicit clients are not instrumented unless asked."""
+        client = ElasticsearchClient(hosts=[es_host], use_config=False)
+        client.connect()
+
+        assert not isinstance(client.get_client(), InstrumentedElasticsearch)
+        assert get_metrics().snapshot()["requests"] == 0
+        client.disconnect()
+
+    def test_async_client_records_endpoints_and_bytes(self, es_host):
+        """Test that the async client classes record into the same registry."""
+
+        async def run():
+            es = InstrumentedAsyncElasticsearch(
+                hosts=[es_host], node_class=InstrumentedAiohttpHttpNode
+            )
+            try:
+                await asyncio.gather(
+                    es.search(index="logs", query={"match_all": {}}),
+                    es.search(index="logs", query={"match_all": {}}),
+                )
+            finally:
+                await es.close()
+
+        asyncio.run(run())
+
+        endpoints = {e["endpoint"]: e for e in get_metrics().snapshot()["endpoints"]}
+        assert endpoints["search"]["count"] == 2
+        assert endpoints["search"]["retries"] == 0
+        assert endpoints["search"]["bytes_in"] > 0
+        assert endpoints["search"]["node_latency_ms"]["max"] > 0
+
+    def test_shared_async_client_is_instrumented(self, es_host):
+        """Test that metrics=True also instruments the shared async client."""
+        client = ElasticsearchClient(
+            hosts=[es_host],
+            use_config=False,
+            metrics=True,
+            async_pool={"keepalive_timeout": 5},
+        )
+
+        async def run():
+            async with client:
+                es = client.get_async_client()
+                assert isinstance(es, InstrumentedAsyncElasticsearch)
+                await es.search(index="logs", query={"match_all": {}})
+
+        asyncio.run(run())
+
+        endpoints = {e["endpoint"]: e for e in get_metrics().snapshot()["endpoints"]}
+        assert endpoints["search"]["count"] == 1
+        assert endpoints["search"]["node_latency_ms"]["max"] > 0
@@ -0,0 +1,262 @@
+"""Unit tests for the retry budget and circuit breaker."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import patch
+
+import pytest
+from elastic_transport import AiohttpHttpNode, AsyncTransport
+from elastic_transport import ConnectionError as TransportConnectionError
+from elasticsearch import AsyncElasticsearch
+
+from elastro.core.client import ElasticsearchClient
+from elastro.core.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+    circuit_breaking_node_class,
+    get_resilience,
+    retry_budget_transport,
+)
+
+
+class _OverloadedElasticsearch(BaseHTTPRequestHandler):
+    """HTTP handler that rejects searches with a configurable status."""
+
+    status = 503
+    requests = 0
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("X-Elastic-Product", "Elasticsearch")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        type(self).requests += 1
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        payload = json.dumps({"error": {"type": "overloaded"}}).encode("utf-8")
+        self.send_response(type(self).status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("X-Elastic-Product", "Elasticsearch")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def overloaded_host():
+    """Serve 503 responses on a local port."""
+    _OverloadedElasticsearch.requests = 0
+    _OverloadedElasticsearch.status = 503
+    server = HTTPServer(("127.0.0.1", 0), _OverloadedElasticsearch)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def clean_resilience():
+    get_resilience().reset()
+    yield
+    get_resilience().reset()
+
+
+def _client(host, **settings):
+    resilience = {"enabled": True, "backoff_base": 0, **settings}
+    client = ElasticsearchClient(
+        hosts=[host], max_retries=3, use_config=False, resilience=resilience
+    )
+    client.connect()
+    return client.get_client()
+
+
+class TestRetryBudget:
+    """Tests for the RetryBudget token bucket."""
+
+    def test_budget_is_spent_and_refilled(self):
+        """Test that tokens run out and come back at the refill rate."""
+        with patch("elastro.core.resilience.time.monotonic", return_value=0.0):
+            budget = RetryBudget(capacity=2, refill_rate=1.0)
+            assert budget.try_acquire()
+            assert budget.try_acquire()
+            assert not budget.try_acquire()
+        with patch("elastro.core.resilience.time.monotonic", return_value=1.5):
+            assert budget.try_acquire()
+            assert not budget.try_acquire()
+        assert budget.stats()["denied"] == 2
+
+
+class TestCircuitBreaker:
+    """Tests for the CircuitBreaker state machine."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that only consecutive failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+    def test_half_open_allows_one_probe(self):
+        """Test that a single probe is let through after the reset timeout."""
+        with patch("elastro.core.resilience.time.monotonic", return_value=0.0):
+            breaker = CircuitBreaker(failure_threshold=1, reset_timeout=1.0)
+            breaker.record_failure()
+        with patch("elastro.core.resilience.time.monotonic", return_value=1.5):
+            assert breaker.allow()
+            assert breaker.state == "half_open"
+            assert not breaker.allow()
+            breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_failed_probe_backs_off_longer(self):
+        """Test that a failed probe doubles the open period up to the cap."""
+        with patch("elastro.core.resilience.time.monotonic", return_value=0.0):
+            breaker = CircuitBreaker(
+                failure_threshold=1, reset_timeout=1.0, max_reset_timeout=1.5
+            )
+            breaker.record_failure()
+        with patch("elastro.core.resilience.time.monotonic", return_value=1.0):
+            assert breaker.allow()
+            breaker.record_failure()
+        assert breaker.stats()["open_for"] == 1.5
+        with patch("elastro.core.resilience.time.monotonic", return_value=2.0):
+            assert not breaker.allow()
+
+
+class TestResilientTransport:
+    """Tests for the retry budget and breaker on a real transport."""
+
+    def test_retries_limited_by_budget(self, overloaded_host):
+        """Test that retries stop when the shared budget is spent."""
+        es = _client(overloaded_host, retry_budget=1, failure_threshold=100)
+
+        with pytest.raises(Exception):
+            es.search(index="logs")
+
+        # One attempt plus the single retry the budget allows
+        assert _OverloadedElasticsearch.requests == 2
+        assert get_resilience().snapshot()["retry_budget"]["denied"] == 1
+
+    def test_clients_have_separate_budgets(self, overloaded_host):
+        """Test that one client's retries do not spend another's budget."""
+        first = _client(overloaded_host, retry_budget=1, failure_threshold=100)
+        second = _client(overloaded_host, retry_budget=1, failure_threshold=100)
+
+        for es in (first, second):
+            with pytest.raises(Exception):
+                es.search(index="logs")
+
+        # Each client sent one attempt plus its own single retry
+        assert _OverloadedElasticsearch.requests == 4
+        budget = get_resilience().snapshot()["retry_budget"]
+        assert budget["clients"] == 2
+        assert budget["granted"] == 2
+
+    def test_open_circuit_fails_fast(self, overloaded_host):
+        """Test that an open circuit rejects requests without sending them."""
+        es = _client(overloaded_host, failure_threshold=2, reset_timeout=60)
+
+        with pytest.raises(Exception):
+            es.search(index="logs")
+        sent = _OverloadedElasticsearch.requests
+
+        with patch.object(es.transport.node_pool, "mark_dead") as mark_dead:
+            with pytest.raises(CircuitOpenError):
+                es.search(index="logs")
+
+        assert sent == 2
+        assert _OverloadedElasticsearch.requests == sent
+        # An open circuit is not a connection failure of the node
+        assert not isinstance(CircuitOpenError("open"), TransportConnectionError)
+        mark_dead.assert_not_called()
+        breakers = get_resilience().snapshot()["circuit_breakers"]
+        assert breakers[overloaded_host]["state"] == "open"
+
+    def test_client_errors_do_not_trip_breaker(self, overloaded_host):
+        """Test that 4xx responses other than 429 count as healthy."""
+        _OverloadedElasticsearch.status = 404
+        es = _client(overloaded_host, failure_threshold=1)
+
+        for _ in range(3):
+            with pytest.raises(Exception):
+                es.search(index="missing")
+
+        assert _OverloadedElasticsearch.requests == 3
+        breakers = get_resilience().snapshot()["circuit_breakers"]
+        assert breakers[overloaded_host]["state"] == "closed"
+
+
+class TestAsyncResilientTransport:
+    """Tests for the retry budget and breaker on the async transport."""
+
+    def test_open_circuit_fails_fast(self, overloaded_host):
+        """Test that async clients retry on budget and honour an open circuit."""
+        settings = {"backoff_base": 0, "failure_threshold": 2, "reset_timeout": 60}
+
+        async def run():
+            es = AsyncElasticsearch(
+                hosts=[overloaded_host],
+                max_retries=3,
+                transport_class=retry_budget_transport(AsyncTransport, settings),
+                node_class=circuit_breaking_node_class(AiohttpHttpNode, settings),
+            )
+            try:
+                with pytest.raises(Exception):
+                    await es.search(index="logs")
+                sent = _OverloadedElasticsearch.requests
+                with pytest.raises(CircuitOpenError):
+                    await es.search(index="logs")
+                return sent
+            finally:
+                await es.close()
+
+        sent = asyncio.run(run())
+
+        assert sent == 2
+        assert _OverloadedElasticsearch.requests == sent
+        snapshot = get_resilience().snapshot()
+        # The second retry is spent before the open circuit rejects it
+        assert snapshot["retry_budget"]["granted"] == 2
+        assert snapshot["circuit_breakers"][overloaded_host]["state"] == "open"
+
+    def test_shared_async_client_backs_off_on_open_circuit(self, overloaded_host):
+        """Test that the client's shared async client uses the breaker and budget."""
+        client = ElasticsearchClient(
+            hosts=[overloaded_host],
+            max_retries=3,
+            use_config=False,
+            resilience={
+                "enabled": True,
+                "backoff_base": 0,
+                "failure_threshold": 2,
+                "reset_timeout": 60,
+            },
+        )
+
+        async def run():
+            async with client:
+                es = client.get_async_client()
+                with pytest.raises(Exception):
+                    await es.search(index="logs")
+                with pytest.raises(CircuitOpenError):
+                    await es.search(index="logs")
+
+        asyncio.run(run())
+
+        assert _OverloadedElasticsearch.requests == 2
+        snapshot = get_resilience().snapshot()
+        assert snapshot["retry_budget"]["clients"] == 1
+        assert snapshot["circuit_breakers"][overloaded_host]["state"] == "open"
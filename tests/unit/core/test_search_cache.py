@@ -0,0 +1,178 @@
+"""Unit tests for the search result cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from elastro.core.client import ElasticsearchClient
+from elastro.core.document import DocumentManager
+from elastro.core.search_cache import SearchCache
+
+
+@pytest.fixture
+def cache():
+    """Return a cache without fingerprint validation."""
+    return SearchCache(max_entries=3, validate_interval=None)
+
+
+@pytest.fixture
+def cached_manager():
+    """Return a DocumentManager whose client has a search cache enabled."""
+    client = MagicMock(spec=ElasticsearchClient)
+    client.search_cache = SearchCache(validate_interval=None)
+    es = MagicMock()
+    es.search.return_value = {"hits": {"total": {"value": 1}, "hits": [{"_id": "1"}]}}
+    client.get_client.return_value = es
+    return DocumentManager(client), client, es
+
+
+class TestSearchCache:
+    """Tests for the SearchCache class."""
+
+    def test_key_is_canonical(self):
+        """Test that key order in the body does not change the cache key."""
+        a = SearchCache.make_key("logs", {"query": {"match_all": {}}, "size": 5})
+        b = SearchCache.make_key("logs", {"size": 5, "query": {"match_all": {}}})
+
+        assert a == b
+        assert a != SearchCache.make_key("metrics", {"size": 5})
+
+    def test_hit_returns_a_copy(self, cache):
+        """Test that mutating a returned response does not touch the cache."""
+        cache.put("k", "logs", {"hits": {"hits": [1]}})
+
+        first = cache.get("k")
+        first["hits"]["hits"].append(2)
+
+        assert cache.get("k") == {"hits": {"hits": [1]}}
+        assert cache.stats()["hits"] == 2
+
+    def test_lru_eviction_by_count(self, cache):
+        """Test that the least recently used entry is evicted first."""
+        for key in ("a", "b", "c"):
+            cache.put(key, "logs", {"key": key})
+        cache.get("a")
+        cache.put("d", "logs", {"key": "d"})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"key": "a"}
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        """Test that the byte bound evicts entries and skips oversized ones."""
+        cache = SearchCache(max_bytes=40, validate_interval=None)
+        cache.put("a", "logs", {"v": "x" * 20})
+        cache.put("b", "logs", {"v": "y" * 20})
+        cache.put("huge", "logs", {"v": "z" * 100})
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.get("huge") is None
+        assert cache.stats()["bytes"] <= 40
+
+    def test_ttl_expiry(self, cache):
+        """Test that expired entries are not served."""
+        with patch("elastro.core.search_cache.time.monotonic", return_value=100.0):
+            cache.put("k", "logs", {"v": 1})
+        with patch("elastro.core.search_cache.time.monotonic", return_value=161.0):
+            assert cache.get("k") is None
+
+    def test_fingerprint_mismatch_is_a_miss(self, cache):
+        """Test that entries stored under an older fingerprint are dropped."""
+        cache.put("k", "logs", {"v": 1}, fingerprint="gen-1")
+
+        assert cache.get("k", "gen-1") == {"v": 1}
+        assert cache.get("k", "gen-2") is None
+
+    def test_fingerprint_probe_is_rate_limited(self):
+        """Test that the cluster is probed at most once per validate_interval."""
+        cache = SearchCache(validate_interval=10)
+        probe = MagicMock(return_value={"refresh": 1})
+
+        with patch("elastro.core.search_cache.time.monotonic", return_value=0.0):
+            first = cache.fingerprint("logs", probe)
+            assert cache.fingerprint("logs", probe) == first
+        probe.return_value = {"refresh": 2}
+        with patch("elastro.core.search_cache.time.monotonic", return_value=11.0):
+            assert cache.fingerprint("logs", probe) != first
+        assert probe.call_count == 2
+
+    def test_invalidate_matches_patterns(self, cache):
+        """Test per-index invalidation across exact names and wildcards."""
+        cache.put("exact", "logs-1", {})
+        cache.put("pattern", "logs-*", {})
+        cache.put("other", "metrics", {})
+
+        assert cache.invalidate("logs-1") == 2
+        assert cache.get("other") == {}
+
+    def test_from_config(self):
+        """Test that the cache is only built when enabled."""
+        assert SearchCache.from_config({"enabled": False}) is None
+        cache = SearchCache.from_config({"enabled": True, "max_entries": 5})
+        assert cache.max_entries == 5
+
+
+class TestDocumentManagerSearchCache:
+    """Tests for the search cache integration in DocumentManager."""
+
+    def test_repeated_search_hits_cache(self, cached_manager):
+        """Test that identical searches only reach the cluster once."""
+        manager, _, es = cached_manager
+
+        first = manager.search("logs", {"match_all": {}}, {"size": 5})
+        second = manager.search("logs", {"match_all": {}}, {"size": 5})
+
+        assert first == second
+        es.search.assert_called_once()
+
+    def test_use_cache_false_bypasses(self, cached_manager):
+        """Test that use_cache=False always queries the cluster."""
+        manager, _, es = cached_manager
+
+        manager.search("logs", {"match_all": {}})
+        manager.search("logs", {"match_all": {}}, use_cache=False)
+
+        assert es.search.call_count == 2
+
+    def test_writes_invalidate(self, cached_manager):
+        """Test that writes through elastro invalidate the index."""
+        manager, client, es = cached_manager
+        es.index.return_value = {"result": "created"}
+
+        manager.search("logs", {"match_all": {}})
+        manager.index("logs", None, {"message": "new"})
+        manager.search("logs", {"match_all": {}})
+
+        assert es.search.call_count == 2
+        assert client.search_cache.stats()["invalidations"] == 1
+
+    def test_fingerprint_change_invalidates(self, cached_manager):
+        """Test that a changed refresh/seq_no fingerprint forces a new search."""
+        manager, client, es = cached_manager
+        client.search_cache.validate_interval = 0
+        es.indices.stats.side_effect = [
+            {"indices": {"logs": {"shards": {"0": [{"seq_no": {"max_seq_no": 1}}]}}}},
+            {"indices": {"logs": {"shards": {"0": [{"seq_no": {"max_seq_no": 1}}]}}}},
+            {"indices": {"logs": {"shards": {"0": [{"seq_no": {"max_seq_no": 2}}]}}}},
+        ]
+
+        manager.search("logs", {"match_all": {}})
+        manager.search("logs", {"match_all": {}})
+        manager.search("logs", {"match_all": {}})
+
+        assert es.search.call_count == 2
+        assert es.indices.stats.call_args[1]["level"] == "shards"
+
+    def test_fingerprint_failure_searches_uncached(self, cached_manager):
+        """Test that a failing fingerprint probe does not fail the search."""
+        manager, client, es = cached_manager
+        client.search_cache.validate_interval = 0
+        es.indices.stats.side_effect = Exception("security_exception")
+
+        first = manager.search("logs", {"match_all": {}})
+        manager.search("logs", {"match_all": {}})
+
+        assert first["hits"]["hits"] == [{"_id": "1"}]
+        assert es.search.call_count == 2
+        assert client.search_cache.stats()["entries"] == 0
@@ -0,0 +1,148 @@
+"""
+Unit tests for the by-query TaskRunner.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from elastro.core.client import ElasticsearchClient
+from elastro.core.document import DocumentManager
+from elastro.core.errors import OperationError, ValidationError
+from elastro.core.task_runner import TaskProgress, TaskRunner
+
+
+@pytest.fixture
+def mock_es_client():
+    """Mock ElasticsearchClient whose get_client() returns a raw ES mock."""
+    client = MagicMock(spec=ElasticsearchClient)
+    client.get_client.return_value = MagicMock()
+    return client
+
+
+def _running(done, total):
+    return {
+        "completed": False,
+        "task": {
+            "action": "indices:data/write/delete/byquery",
+            "running_time_in_nanos": 2_000_000_000,
+            "status": {"total": total, "deleted": done, "batches": 1},
+        },
+    }
+
+
+def _finished(total, failures=None):
+    return {
+        "completed": True,
+        "task": {"action": "indices:data/write/delete/byquery"},
+        "response": {"total": total, "deleted": total, "failures": failures or []},
+    }
+
+
+class TestTaskRunner:
+    """Tests for TaskRunner submission, polling and rethrottling."""
+
+    def test_submit_delete_by_query_uses_background_task(self, mock_es_client):
+        es = mock_es_client.get_client()
+        es.delete_by_query.return_value = {"task": "node1:42"}
+
+        task_id = TaskRunner(mock_es_client).submit(
+            "delete_by_query",
+            "logs",
+            {"query": {"term": {"level": "debug"}}},
+            requests_per_second=500,
+        )
+
+        assert task_id == "node1:42"
+        es.delete_by_query.assert_called_once_with(
+            index="logs",
+            query={"term": {"level": "debug"}},
+            slices="auto",
+            conflicts="proceed",
+            refresh=False,
+            wait_for_completion=False,
+            requests_per_second=500,
+        )
+
+    def test_submit_validation(self, mock_es_client):
+        runner = TaskRunner(mock_es_client)
+        with pytest.raises(ValidationError, match="Unsupported by-query action"):
+            runner.submit("reindex", "logs", {"match_all": {}})
+        with pytest.raises(ValidationError, match="only valid for update_by_query"):
+            runner.submit(
+                "delete_by_query", "logs", {"match_all": {}}, script={"source": ""}
+            )
+
+    @patch("elastro.core.task_runner.time.sleep")
+    def test_wait_reports_progress_until_complete(self, mock_sleep, mock_es_client):
+        es = mock_es_client.get_client()
+        es.tasks.get.side_effect = [
+            _running(10, 100),
+            _running(60, 100),
+            _finished(100),
+        ]
+        seen = []
+
+        final = TaskRunner(mock_es_client).wait(
+            "node1:42", on_progress=lambda p: seen.append(p.percent)
+        )
+
+        assert seen == [10.0, 60.0, 100.0]
+        assert final.completed is True
+        assert final.deleted == 100
+        assert final.action == "delete_by_query"
+        assert mock_sleep.call_count == 2
+
+    def test_get_progress_task_error(self, mock_es_client):
+        es = mock_es_client.get_client()
+        es.tasks.get.return_value = {
+            "completed": True,
+            "error": {"type": "search_phase_execution_exception", "reason": "boom"},
+        }
+
+        with pytest.raises(OperationError, match="boom"):
+            TaskRunner(mock_es_client).get_progress("node1:42")
+
+    def test_rethrottle_detects_action(self, mock_es_client):
+        es = mock_es_client.get_client()
+        es.tasks.get.return_value = _running(1, 10)
+        es.delete_by_query_rethrottle.return_value = {"nodes": {}}
+
+        TaskRunner(mock_es_client).rethrottle("node1:42", -1)
+
+        es.delete_by_query_rethrottle.assert_called_once_with(
+            task_id="node1:42", requests_per_second=-1
+        )
+
+
+class TestDocumentManagerByQuery:
+    """Tests for DocumentManager.delete_by_query / update_by_query."""
+
+    def test_delete_by_query_no_wait(self, mock_es_client):
+        es = mock_es_client.get_client()
+        es.delete_by_query.return_value = {"task": "node1:7"}
+
+        progress = DocumentManager(mock_es_client).delete_by_query(
+            "logs", {"match_all": {}}, wait_for_completion=False
+        )
+
+        assert progress == TaskProgress(task_id="node1:7", action="delete_by_query")
+        es.tasks.get.assert_not_called()
+
+    def test_update_by_query_waits_for_result(self, mock_es_client):
+        es = mock_es_client.get_client()
+        es.update_by_query.return_value = {"task": "node1:8"}
+        es.tasks.get.return_value = {
+            "completed": True,
+            "task": {},
+            "response": {"total": 3, "updated": 3, "failures": []},
+        }
+        script = {"source": "ctx._source.archived = true"}
+
+        progress = DocumentManager(mock_es_client).update_by_query(
+            "logs", {"match_all": {}}, script=script, slices=4
+        )
+
+        assert progress.updated == 3
+        assert es.update_by_query.call_args.kwargs["script"] == script
+        assert es.update_by_query.call_args.kwargs["slices"] == 4
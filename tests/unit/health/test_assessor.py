@@ -168,7 +168,6 @@ class TestHealthAssessor(unittest.TestCase):
             name = "nodes"
 
             def collect(self, ctx: CollectContext) -> CollectorResult:
-                from elastro.health.models import Finding, Severity
 
                 return CollectorResult(
                     name=self.name,
@@ -203,6 +202,48 @@ class TestHealthAssessor(unittest.TestCase):
         rule_ids = {finding.id for finding in report.findings}
         self.assertIn("jvm.heap_pressure.es-node-1", rule_ids)
 
+    def test_run_reports_progress(self):
+        class _NodesStub:
+            name = "nodes"
+
+            def collect(self, ctx: CollectContext) -> CollectorResult:
+                return CollectorResult(
+                    name=self.name,
+                    status="ok",
+                    data={
+                        "nodes": {
+                            "n1": {
+                                "name": "es-node-1",
+                                "roles": ["data"],
+                                "jvm": {"mem": {"heap_used_percent": 88}},
+                            }
+                        }
+                    },
+                )
+
+        events = []
+
+        def progress(event, payload):
+            events.append((event, payload))
+            if event == "started":
+                raise RuntimeError("callback errors must not abort the run")
+
+        registry = CollectorRegistry()
+        registry.register(_NodesStub())
+        report = HealthAssessor(self.mock_client, registry=registry).run(
+            collectors=["nodes"], progress=progress
+        )
+
+        names = [event for event, _ in events]
+        self.assertEqual(names[0], "started")
+        self.assertEqual(names[1], "collector")
+        self.assertEqual(events[1][1]["result"].name, "nodes")
+        self.assertIn("findings", names)
+        rule_batch = next(p for e, p in events if e == "findings")
+        self.assertEqual(rule_batch["source"], "jvm_rule")
+        self.assertEqual(names[-1], "report")
+        self.assertIs(events[-1][1]["report"], report)
+
 
 if __name__ == "__main__":
     unittest.main()
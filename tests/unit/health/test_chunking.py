@@ -0,0 +1,42 @@
+"""Unit tests for index expression chunking."""
+
+import unittest
+
+from elastro.health.chunking import index_chunks
+
+
+class TestIndexChunks(unittest.TestCase):
+    def test_chunks_use_wildcards_only_when_exact(self):
+        names = ["logs-1", "logs-2", "metrics-1"]
+        all_names = names + ["logs-archive"]
+
+        chunks = index_chunks(names, all_names, chunk_size=2)
+        self.assertEqual(
+            chunks,
+            [("logs-1,logs-2", ["logs-1", "logs-2"]), ("metrics-1", ["metrics-1"])],
+        )
+        self.assertEqual(
+            index_chunks(["logs-1", "logs-2"], ["logs-1", "logs-2"], chunk_size=10),
+            [("logs-*", ["logs-1", "logs-2"])],
+        )
+        long_names = [f"index-{i:04d}" for i in range(50)]
+        bounded = index_chunks(
+            long_names, ["index-other"], chunk_size=50, max_chars=100
+        )
+        self.assertTrue(all(len(expression) <= 100 for expression, _ in bounded))
+        self.assertEqual(sum(len(chunk) for _, chunk in bounded), 50)
+
+    def test_prefix_families_pack_into_few_chunks(self):
+        names = [f"logs-{day:03d}-{part}" for day in range(300) for part in "ab"]
+        all_names = names + ["logs-archive", "metrics-1"]
+
+        chunks = index_chunks(names, all_names, chunk_size=500)
+
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(sum(len(chunk) for _, chunk in chunks), len(names))
+        self.assertEqual(chunks[0][0], "logs-0*,logs-1*")
+        self.assertEqual(chunks[1][0], "logs-2*")
+
+
+if __name__ == "__main__":
+    unittest.main()
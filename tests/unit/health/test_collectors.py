@@ -1,18 +1,22 @@
 """Unit tests for health collector registry."""
 
+import threading
+import time
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from elastro.core.client import ElasticsearchClient
 from elastro.health.collectors.base import (
     CollectContext,
     CollectorRegistry,
     CollectorResult,
+    timeout_seconds,
 )
 from elastro.health.collectors.cluster import (
     ClusterHealthCollector,
     PendingTasksCollector,
 )
+from elastro.health.collectors.progress import report_progress
 
 
 class _FailingCollector:
@@ -22,6 +26,23 @@ class _FailingCollector:
         raise RuntimeError("boom")
 
 
+class _SleepingCollector:
+    def __init__(self, name, seconds=0.0, depends_on=(), log=None, steps=1):
+        self.name = name
+        self.seconds = seconds
+        self.depends_on = depends_on
+        self.log = log if log is not None else []
+        self.steps = steps
+
+    def collect(self, ctx: CollectContext) -> CollectorResult:
+        self.log.append(("start", self.name))
+        for _ in range(self.steps):
+            time.sleep(self.seconds)
+            report_progress()
+        self.log.append(("end", self.name))
+        return CollectorResult(name=self.name, data={"thread": threading.get_ident()})
+
+
 class TestCollectorRegistry(unittest.TestCase):
     def setUp(self):
         self.registry = CollectorRegistry()
@@ -52,6 +73,88 @@ class TestCollectorRegistry(unittest.TestCase):
         self.assertEqual(results[0].status, "error")
         self.assertEqual(results[0].error, "boom")
 
+    def test_concurrent_run_keeps_order_and_overlaps(self):
+        for name in ("a", "b", "c"):
+            self.registry.register(_SleepingCollector(name, seconds=0.2))
+        seen = []
+
+        start = time.monotonic()
+        results = self.registry.run(
+            self.ctx, concurrency=3, on_result=lambda r: seen.append(r.name)
+        )
+
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual([r.name for r in results], ["a", "b", "c"])
+        self.assertEqual(sorted(seen), ["a", "b", "c"])
+        self.assertEqual(len({r.data["thread"] for r in results}), 3)
+
+    def test_concurrent_run_waits_for_dependencies(self):
+        log = []
+        self.registry.register(
+            _SleepingCollector("late", depends_on=("first",), log=log)
+        )
+        self.registry.register(_SleepingCollector("first", seconds=0.1, log=log))
+        self.registry.register(
+            _SleepingCollector("loop", depends_on=("loop2",), log=log)
+        )
+        self.registry.register(
+            _SleepingCollector("loop2", depends_on=("loop",), log=log)
+        )
+
+        results = self.registry.run(self.ctx, concurrency=4)
+
+        self.assertLess(log.index(("end", "first")), log.index(("start", "late")))
+        self.assertEqual(
+            [r.status for r in results], ["ok", "ok", "skipped", "skipped"]
+        )
+        self.assertIn("cycle", results[2].error or "")
+
+    def test_concurrent_run_abandons_overrunning_collector(self):
+        self.registry.register(_SleepingCollector("slow", seconds=1.0))
+        self.registry.register(_SleepingCollector("fast"))
+        ctx = CollectContext(client=self.mock_client, timeout="100ms")
+
+        with patch(
+            "elastro.health.collectors.base.COLLECTOR_DEADLINE_GRACE_SECONDS", 0.1
+        ):
+            start = time.monotonic()
+            results = self.registry.run(ctx, concurrency=2)
+
+        self.assertLess(time.monotonic() - start, 0.8)
+        self.assertEqual(results[0].status, "error")
+        self.assertIn("deadline", results[0].error or "")
+        self.assertEqual(results[1].status, "ok")
+
+    def test_queued_collectors_do_not_spend_their_deadline(self):
+        for name in ("a", "b", "c"):
+            self.registry.register(_SleepingCollector(name, seconds=0.15))
+        ctx = CollectContext(client=self.mock_client, timeout="100ms")
+
+        with patch(
+            "elastro.health.collectors.base.COLLECTOR_DEADLINE_GRACE_SECONDS", 0.1
+        ):
+            results = self.registry.run(ctx, concurrency=2)
+
+        self.assertEqual([r.status for r in results], ["ok", "ok", "ok"])
+
+    def test_progress_reports_extend_the_deadline(self):
+        self.registry.register(_SleepingCollector("chunked", seconds=0.12, steps=4))
+        self.registry.register(_SleepingCollector("quick"))
+        ctx = CollectContext(client=self.mock_client, timeout="100ms")
+
+        with patch(
+            "elastro.health.collectors.base.COLLECTOR_DEADLINE_GRACE_SECONDS", 0.1
+        ):
+            results = self.registry.run(ctx, concurrency=2)
+
+        self.assertEqual([r.status for r in results], ["ok", "ok"])
+
+    def test_timeout_seconds(self):
+        self.assertEqual(timeout_seconds("30s"), 30.0)
+        self.assertEqual(timeout_seconds("500ms"), 0.5)
+        self.assertEqual(timeout_seconds("2m"), 120.0)
+        self.assertEqual(timeout_seconds("bogus"), 30.0)
+
 
 class TestClusterHealthCollector(unittest.TestCase):
     def test_collect_success(self):
@@ -8,7 +8,8 @@ from elastro.health.collectors.base import CollectContext
 from elastro.health.collectors.ilm import (
     IlmCollector,
     _lifecycle_issue,
-    _select_explain_targets,
+    explain_lifecycles,
+    stuck_lifecycles,
 )
 
 
@@ -19,38 +20,63 @@ class TestIlmCollector(unittest.TestCase):
         self.mock_client.client = self.mock_es
         self.ctx = CollectContext(client=self.mock_client)
 
-    def test_select_explain_targets_prefers_unhealthy_indices(self):
-        indices = [
-            {"index": "logs-000001", "health": "yellow"},
-            {"index": "healthy", "health": "green"},
-        ]
-        targets = _select_explain_targets(indices, health_report=None)
-        self.assertEqual(targets, {"logs-000001"})
-
     def test_lifecycle_issue_detects_error_step(self):
         issue = _lifecycle_issue({"step": "ERROR", "step_info": "snapshot failed"})
         self.assertIn("snapshot failed", issue or "")
 
+    def test_stuck_lifecycles_classifies_user_indices(self):
+        issues = stuck_lifecycles(
+            {
+                "logs-000001": {"managed": True, "step": "ERROR"},
+                "logs-000002": {
+                    "managed": True,
+                    "phase": "hot",
+                    "step": "check-rollover-ready",
+                },
+                ".ds-internal": {"managed": True, "step": "ERROR"},
+            }
+        )
+        self.assertEqual(list(issues), ["logs-000001"])
+
+    def test_explain_lifecycles_uses_one_pattern_request(self):
+        ilm_manager = MagicMock()
+        ilm_manager.explain_lifecycles.return_value = {"a-1": {"step": "ERROR"}}
+
+        explains = explain_lifecycles(ilm_manager, only_errors=True)
+
+        self.assertEqual(list(explains), ["a-1"])
+        call = ilm_manager.explain_lifecycles.call_args
+        self.assertEqual(call.args, ("*",))
+        self.assertTrue(call.kwargs["only_managed"])
+        self.assertTrue(call.kwargs["only_errors"])
+
     @patch("elastro.health.collectors.ilm.IlmManager")
     @patch("elastro.health.collectors.ilm.IndexManager")
-    def test_collect_returns_indices_and_findings(
+    def test_collect_explains_all_managed_indices_at_once(
         self, mock_index_manager_cls, mock_ilm_manager_cls
     ):
         mock_index_manager_cls.return_value.list.return_value = [
-            {"index": "logs-000001", "health": "yellow", "rep": "1"}
+            {"index": "logs-000001", "health": "green", "rep": "1"},
+            {"index": "logs-000002", "health": "green", "rep": "1"},
         ]
-        mock_ilm_manager_cls.return_value.explain_lifecycle.return_value = {
-            "managed": True,
-            "step": "ERROR",
-            "step_info": "rollover blocked",
+        mock_ilm_manager_cls.return_value.explain_lifecycles.return_value = {
+            "logs-000001": {
+                "managed": True,
+                "step": "ERROR",
+                "step_info": "rollover blocked",
+            },
+            "logs-000002": {"managed": True, "phase": "hot", "step": "complete"},
         }
 
         result = IlmCollector().collect(self.ctx)
 
         self.assertEqual(result.status, "ok")
-        self.assertEqual(result.data["index_count"], 1)
+        self.assertEqual(result.data["index_count"], 2)
+        self.assertEqual(result.data["managed_count"], 2)
         self.assertEqual(len(result.data["findings"]), 1)
         self.assertEqual(result.data["findings"][0].category, "ilm")
+        mock_ilm_manager_cls.return_value.explain_lifecycles.assert_called_once()
+        mock_ilm_manager_cls.return_value.explain_lifecycle.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@
 from unittest.mock import MagicMock, patch
 
 from elastro.core.client import ElasticsearchClient
-from elastro.health.ilm_status import list_stuck_ilm_indices
+from elastro.health.ilm_status import list_ilm_indices, list_stuck_ilm_indices
 
 
 class TestListStuckIlmIndices:
@@ -14,10 +14,12 @@ class TestListStuckIlmIndices:
         mock_index_manager_cls.return_value.list.return_value = [
             {"index": "logs-000001", "health": "yellow"},
         ]
-        mock_ilm_manager_cls.return_value.explain_lifecycle.return_value = {
-            "managed": True,
-            "step": "ERROR",
-            "step_info": "snapshot failed",
+        mock_ilm_manager_cls.return_value.explain_lifecycles.return_value = {
+            "logs-000001": {
+                "managed": True,
+                "step": "ERROR",
+                "step_info": "snapshot failed",
+            },
         }
 
         stuck = list_stuck_ilm_indices(client)
@@ -25,3 +27,26 @@ class TestListStuckIlmIndices:
         assert len(stuck) == 1
         assert stuck[0].index_name == "logs-000001"
         assert "snapshot failed" in stuck[0].issue
+        assert stuck[0].health == "yellow"
+
+    @patch("elastro.health.ilm_status.IlmManager")
+    @patch("elastro.health.ilm_status.IndexManager")
+    def test_lists_all_managed_indices(
+        self, mock_index_manager_cls, mock_ilm_manager_cls
+    ):
+        client = MagicMock(spec=ElasticsearchClient)
+        mock_index_manager_cls.return_value.list.return_value = []
+        mock_ilm_manager_cls.return_value.explain_lifecycles.return_value = {
+            "logs-000002": {"managed": True, "phase": "hot", "step": "complete"},
+            "logs-000001": {"managed": True, "step": "ERROR"},
+        }
+
+        rows = list_ilm_indices(client, index_pattern="logs-*", stuck_only=False)
+
+        assert [row.index_name for row in rows] == ["logs-000001", "logs-000002"]
+        assert rows[1].issue == "ok"
+        mock_ilm_manager_cls.return_value.explain_lifecycles.assert_called_once()
+        assert (
+            mock_ilm_manager_cls.return_value.explain_lifecycles.call_args.args[0]
+            == "logs-*"
+        )
@@ -32,6 +32,24 @@ class TestMappingHelpers(unittest.TestCase):
         limit = extract_field_limit({"index": {"mapping.total_fields.limit": "750"}})
         self.assertEqual(limit, 750)
 
+    def test_count_mapping_fields_handles_deep_nesting(self):
+        properties = {"leaf": {"type": "keyword"}}
+        for depth in range(5000):
+            properties = {f"level{depth}": {"type": "object", "properties": properties}}
+        self.assertEqual(count_mapping_fields(properties), 5001)
+
+    def test_extract_field_limit_reads_flat_and_nested_settings(self):
+        self.assertEqual(
+            extract_field_limit({"index.mapping.total_fields.limit": "2000"}), 2000
+        )
+        self.assertEqual(
+            extract_field_limit(
+                {"index": {"mapping": {"total_fields": {"limit": "1500"}}}}
+            ),
+            1500,
+        )
+        self.assertEqual(extract_field_limit({}), 1000)
+
     def test_summarize_index_mapping_computes_ratio(self):
         summary = summarize_index_mapping(
             "logs-000001",
@@ -0,0 +1,78 @@
+"""Unit tests for mappings collector."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from elastro.core.client import ElasticsearchClient
+from elastro.health.collectors.base import CollectContext
+from elastro.health.collectors.mappings import MappingsCollector
+
+
+def _properties(count):
+    return {f"f{i}": {"type": "keyword"} for i in range(count)}
+
+
+class TestMappingsCollector(unittest.TestCase):
+    def setUp(self):
+        self.mock_es = MagicMock()
+        self.mock_client = MagicMock(spec=ElasticsearchClient)
+        self.mock_client.client = self.mock_es
+        self.ctx = CollectContext(client=self.mock_client)
+
+    @patch("elastro.health.collectors.mappings.IndexManager")
+    def test_scans_all_indices_with_bulk_requests(self, mock_index_manager_cls):
+        names = [f"logs-{i:06d}" for i in range(300)]
+        mock_index_manager_cls.return_value.list.return_value = [
+            {"index": name} for name in names + [".security-7"]
+        ]
+
+        def get_mapping(index, **kwargs):
+            wanted = []
+            for part in index.split(","):
+                if part.endswith("*"):
+                    wanted += [n for n in names if n.startswith(part[:-1])]
+                else:
+                    wanted.append(part)
+            return {n: {"mappings": {"properties": _properties(3)}} for n in wanted}
+
+        self.mock_es.indices.get_mapping.side_effect = get_mapping
+        self.mock_es.indices.get_settings.return_value = {
+            "logs-000007": {
+                "settings": {"index.mapping.total_fields.limit": "4"},
+            }
+        }
+
+        result = MappingsCollector().collect(self.ctx)
+
+        self.assertEqual(result.status, "ok")
+        self.assertEqual(result.data["scanned_count"], 300)
+        self.assertEqual(self.mock_es.indices.get_mapping.call_count, 2)
+        by_name = {entry["index"]: entry for entry in result.data["indices"]}
+        self.assertEqual(by_name["logs-000007"]["field_limit"], 4)
+        self.assertEqual(by_name["logs-000007"]["field_ratio"], 0.75)
+        self.assertEqual(by_name["logs-000008"]["field_limit"], 1000)
+        mock_index_manager_cls.return_value.get.assert_not_called()
+
+    @patch("elastro.health.collectors.mappings.IndexManager")
+    def test_honours_max_indices(self, mock_index_manager_cls):
+        mock_index_manager_cls.return_value.list.return_value = [
+            {"index": "a-1"},
+            {"index": "b-1"},
+        ]
+        self.mock_es.indices.get_mapping.return_value = {
+            "a-1": {"mappings": {"properties": _properties(1)}}
+        }
+        self.mock_es.indices.get_settings.return_value = {}
+        self.ctx.options["max_indices"] = 1
+
+        result = MappingsCollector().collect(self.ctx)
+
+        self.assertEqual(result.data["scanned_count"], 1)
+        self.mock_es.indices.get_mapping.assert_called_once()
+        self.assertEqual(
+            self.mock_es.indices.get_mapping.call_args.kwargs["index"], "a-1"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
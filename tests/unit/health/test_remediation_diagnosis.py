@@ -1,11 +1,45 @@
 """Unit tests for remediation diagnosis helpers."""
 
+from unittest.mock import MagicMock
+
+from elastro.health.remediation.allocation_state import (
+    AllocationState,
+    classify_index,
+    fetch_allocation_state,
+)
 from elastro.health.remediation.diagnosis import (
     detect_routing_filter_fault,
+    diagnose_unhealthy_indices,
     suggest_action_id,
 )
 
 
+def _copy(shard, primary, state="UNASSIGNED", **info):
+    copy = {"shard": shard, "primary": primary, "state": state}
+    if state == "UNASSIGNED":
+        copy["unassigned_info"] = {"reason": "INDEX_CREATED", **info}
+    return copy
+
+
+def _state(shards, index_settings=None, cluster_settings=None, nodes=None):
+    return AllocationState(
+        shards=shards,
+        index_settings=index_settings or {},
+        cluster_settings=cluster_settings or {},
+        nodes=nodes
+        if nodes is not None
+        else {
+            "n1": {"name": "node-1", "roles": ["data"], "attributes": {"zone": "a"}},
+            "n2": {
+                "name": "node-2",
+                "roles": ["data_hot"],
+                "attributes": {"zone": "b"},
+            },
+            "m1": {"name": "master-1", "roles": ["master"]},
+        },
+    )
+
+
 class TestSuggestActionId:
     def test_yellow_replica_same_node(self):
         action_id, suggestion = suggest_action_id(
@@ -54,7 +88,9 @@ class TestDetectRoutingFilterFault:
                     "deciders": [
                         {
                             "decider": "filter",
-                            "explanation": "index.routing.allocation.exclude._name blocks",
+                            "explanation": (
+                                "index.routing.allocation.exclude._name blocks"
+                            ),
                         }
                     ]
                 }
@@ -69,3 +105,240 @@ class TestDetectRoutingFilterFault:
             ]
         }
         assert detect_routing_filter_fault(explain) is False
+
+
+class TestClassifyIndex:
+    def test_replicas_above_data_node_count(self):
+        state = _state(
+            {"logs": [_copy(0, True, "STARTED"), _copy(0, False), _copy(0, False)]},
+            index_settings={"logs": {"index.number_of_replicas": "2"}},
+        )
+        diagnosis = classify_index(state, "logs")
+        assert "3 copies" in diagnosis.allocate_explanation
+        action_id, _ = suggest_action_id(
+            health="yellow",
+            reason=diagnosis.reason,
+            allocate_explanation=diagnosis.allocate_explanation,
+            routing_filter_fault=diagnosis.routing_filter_fault,
+        )
+        assert action_id == "reduce_replicas"
+
+    def test_routing_filters_matching_no_node(self):
+        state = _state(
+            {"logs": [_copy(0, True)]},
+            index_settings={
+                "logs": {"index.routing.allocation.require._name": "node-9*"}
+            },
+        )
+        diagnosis = classify_index(state, "logs")
+        assert diagnosis.routing_filter_fault is True
+
+    def test_exhausted_retries_and_awareness(self):
+        failed = _state(
+            {"logs": [_copy(0, True, reason="ALLOCATION_FAILED", failed_attempts=5)]}
+        )
+        assert classify_index(failed, "logs").reason == "ALLOCATION_FAILED"
+
+        unaware = _state(
+            {"logs": [_copy(0, True)]},
+            cluster_settings={
+                "cluster.routing.allocation.awareness.attributes": "rack"
+            },
+        )
+        assert "rack" in classify_index(unaware, "logs").allocate_explanation
+
+    def test_unclear_shards_are_left_for_explain(self):
+        state = _state({"logs": [_copy(0, True, reason="NODE_LEFT")]})
+        assert classify_index(state, "logs") is None
+
+    def test_default_tier_preference_is_not_a_routing_filter(self):
+        # Index settings as an 8.x cluster returns them for a new index
+        es = MagicMock()
+        es.cluster.state.return_value = {
+            "routing_table": {
+                "indices": {
+                    "logs": {
+                        "shards": {
+                            "0": [
+                                _copy(0, True, "STARTED"),
+                                _copy(0, False, reason="NODE_LEFT"),
+                            ]
+                        }
+                    }
+                }
+            },
+            "metadata": {
+                "indices": {
+                    "logs": {
+                        "settings": {
+                            "index": {
+                                "number_of_replicas": "1",
+                                "routing": {
+                                    "allocation": {
+                                        "include": {"_tier_preference": "data_content"}
+                                    }
+                                },
+                            }
+                        }
+                    }
+                }
+            },
+        }
+        es.cluster.get_settings.return_value = {"persistent": {}, "transient": {}}
+        es.nodes.info.return_value = {
+            "nodes": {
+                "n1": {"name": "node-1", "roles": ["data_content", "data_hot"]},
+                "n2": {"name": "node-2", "roles": ["data"]},
+                "n3": {"name": "node-3", "roles": ["data_warm"]},
+            }
+        }
+        state = fetch_allocation_state(es, ["logs"], ["logs"])
+
+        assert classify_index(state, "logs") is None
+
+    def test_tier_preference_falls_back_to_later_tiers(self):
+        nodes = {
+            "n1": {"name": "node-1", "roles": ["data_hot"]},
+            "n2": {"name": "node-2", "roles": ["data_hot"]},
+        }
+        preference = "index.routing.allocation.include._tier_preference"
+        fallback = _state(
+            {"logs": [_copy(0, True, reason="NODE_LEFT")]},
+            index_settings={"logs": {preference: "data_warm,data_hot"}},
+            nodes=nodes,
+        )
+        assert classify_index(fallback, "logs") is None
+
+        missing = _state(
+            {"logs": [_copy(0, True)]},
+            index_settings={"logs": {preference: "data_cold"}},
+            nodes=nodes,
+        )
+        diagnosis = classify_index(missing, "logs")
+        assert "data_cold" in diagnosis.allocate_explanation
+        assert diagnosis.routing_filter_fault is False
+
+    def test_tier_filter_matches_node_roles(self):
+        state = _state(
+            {"logs": [_copy(0, True)]},
+            index_settings={
+                "logs": {"index.routing.allocation.require._tier": "data_warm"}
+            },
+            nodes={"n1": {"name": "node-1", "roles": ["data_hot"]}},
+        )
+        assert classify_index(state, "logs").routing_filter_fault is True
+
+
+class TestDiagnoseUnhealthyIndices:
+    def _index_manager(self, es, names):
+        index_manager = MagicMock()
+        index_manager._client.get_client.return_value = es
+        index_manager.list.return_value = [
+            {"index": name, "health": "red", "status": "open"} for name in names
+        ]
+        return index_manager
+
+    def test_bulk_explains_one_index_per_unclear_group(self):
+        names = ["logs-1", "logs-2", "logs-3"]
+        es = MagicMock()
+        es.cluster.state.return_value = {
+            "routing_table": {
+                "indices": {
+                    "logs-1": {"shards": {"0": [_copy(0, True, reason="NODE_LEFT")]}},
+                    "logs-2": {"shards": {"0": [_copy(0, True, reason="NODE_LEFT")]}},
+                    "logs-3": {
+                        "shards": {
+                            "0": [
+                                _copy(
+                                    0,
+                                    True,
+                                    reason="ALLOCATION_FAILED",
+                                    failed_attempts=5,
+                                )
+                            ]
+                        }
+                    },
+                }
+            }
+        }
+        es.cluster.get_settings.return_value = {"persistent": {}, "transient": {}}
+        es.nodes.info.return_value = {"nodes": {"n1": {"roles": ["data"]}}}
+        es.cluster.allocation_explain.return_value = {
+            "allocate_explanation": "no valid shard copy",
+            "unassigned_info": {"reason": "NODE_LEFT"},
+        }
+        index_manager = self._index_manager(es, names)
+
+        diagnoses = diagnose_unhealthy_indices(index_manager)
+
+        assert [d.index_name for d in diagnoses] == names
+        es.cluster.allocation_explain.assert_called_once_with(
+            index="logs-1", shard=0, primary=True
+        )
+        assert diagnoses[1].allocate_explanation == "no valid shard copy"
+        assert diagnoses[1].metadata["explained_by"] == "logs-1"
+        assert diagnoses[2].suggested_action_id == "reroute_failed"
+        index_manager.allocation_explain.assert_not_called()
+
+    def test_index_missing_from_state_is_explained(self):
+        es = MagicMock()
+        es.cluster.state.return_value = {
+            "routing_table": {
+                "indices": {
+                    "logs-1": {"shards": {"0": [_copy(0, True, "STARTED")]}},
+                }
+            }
+        }
+        es.cluster.get_settings.return_value = {"persistent": {}, "transient": {}}
+        es.nodes.info.return_value = {"nodes": {"n1": {"roles": ["data"]}}}
+        index_manager = self._index_manager(es, ["logs-1", "logs-2", "logs-3"])
+        index_manager.allocation_explain.return_value = {
+            "allocate_explanation": "index not found",
+            "unassigned_info": {"reason": "UNKNOWN"},
+        }
+
+        diagnoses = diagnose_unhealthy_indices(index_manager)
+
+        assert diagnoses[0].reason == "ASSIGNED"
+        assert [d.allocate_explanation for d in diagnoses[1:]] == [
+            "index not found",
+            "index not found",
+        ]
+        # Missing indices are not grouped; each is explained on its own
+        assert [c.args for c in index_manager.allocation_explain.call_args_list] == [
+            ("logs-2",),
+            ("logs-3",),
+        ]
+        assert es.cluster.state.call_args.kwargs["expand_wildcards"] == "all"
+
+    def test_state_read_uses_full_listing(self):
+        es = MagicMock()
+        es.cluster.state.return_value = {}
+        es.cluster.get_settings.return_value = {"persistent": {}, "transient": {}}
+        es.nodes.info.return_value = {"nodes": {}}
+        index_manager = self._index_manager(es, [])
+        index_manager.list.return_value = [
+            {"index": "logs-1", "health": "red", "status": "open"},
+            {"index": "logs-2", "health": "green", "status": "open"},
+            {"index": "metrics-1", "health": "green", "status": "open"},
+        ]
+        index_manager.allocation_explain.return_value = {}
+
+        diagnose_unhealthy_indices(index_manager)
+
+        # Without the healthy names logs* would look like an exact match
+        assert es.cluster.state.call_args.kwargs["index"] == "logs-1"
+
+    def test_falls_back_to_per_index_explain(self):
+        es = MagicMock()
+        es.cluster.state.side_effect = RuntimeError("forbidden")
+        index_manager = self._index_manager(es, ["logs-1"])
+        index_manager.allocation_explain.return_value = {
+            "allocate_explanation": "blocked",
+            "unassigned_info": {"reason": "INDEX_CREATED"},
+        }
+
+        diagnoses = diagnose_unhealthy_indices(index_manager)
+
+        assert diagnoses[0].allocate_explanation == "blocked"
+        index_manager.allocation_explain.assert_called_once_with("logs-1")
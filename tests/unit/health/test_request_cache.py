@@ -0,0 +1,77 @@
+"""Unit tests for the per-assessment collector request cache."""
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from elastro.core.errors import OperationError
+from elastro.health.collectors.request_cache import RequestCache
+
+
+class TestRequestCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = RequestCache()
+
+    def test_fetch_dedupes_by_api_and_params(self):
+        loader = Mock(side_effect=lambda **params: [params])
+
+        first = self.cache.fetch("cat.indices", loader, pattern="*")
+        second = self.cache.fetch("cat.indices", loader, pattern="*")
+        other = self.cache.fetch("cat.indices", loader, pattern="logs-*")
+
+        self.assertIs(first, second)
+        self.assertEqual(other, [{"pattern": "logs-*"}])
+        self.assertEqual(loader.call_count, 2)
+        self.assertEqual((self.cache.misses, self.cache.hits), (2, 1))
+
+    def test_concurrent_callers_share_one_request(self):
+        calls = []
+
+        def slow_loader(**params):
+            calls.append(params)
+            time.sleep(0.1)
+            return {"persistent": {}}
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    self.cache.fetch(
+                        "cluster.get_settings", slow_loader, include_defaults=True
+                    )
+                )
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 4)
+
+    def test_failures_are_not_cached(self):
+        loader = Mock(side_effect=[OperationError("down"), ["ok"]])
+
+        with self.assertRaises(OperationError):
+            self.cache.fetch("cat.indices", loader, pattern="*")
+
+        self.assertEqual(self.cache.fetch("cat.indices", loader, pattern="*"), ["ok"])
+
+    def test_node_stats_merges_expected_metrics(self):
+        loader = Mock(return_value={"nodes": {}})
+        self.cache.expect_node_metrics(["jvm", "fs", "os"])
+
+        self.cache.node_stats(loader, metrics=["fs"])
+        self.cache.node_stats(loader, metrics=["jvm", "os"])
+        self.cache.node_stats(loader, node_id="n1", metrics=["fs"])
+
+        self.assertEqual(loader.call_count, 2)
+        loader.assert_any_call(node_id=None, metrics=["fs", "jvm", "os"])
+        loader.assert_any_call(node_id="n1", metrics=["fs", "jvm", "os"])
+
+
+if __name__ == "__main__":
+    unittest.main()
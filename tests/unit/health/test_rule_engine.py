@@ -25,6 +25,32 @@ class TestRuleEngine(unittest.TestCase):
         self.assertEqual(len(findings), 1)
         self.assertEqual(findings[0].id, "test.warn")
 
+    def test_reports_each_rule_batch(self):
+        def always_warn(ctx: RuleContext):
+            return [
+                Finding(
+                    id="test.warn",
+                    category="test",
+                    title="Test warning",
+                    status=FindingStatus.WARN,
+                    severity=Severity.LOW,
+                    summary="Synthetic rule finding",
+                    source="rule",
+                )
+            ]
+
+        def silent(ctx: RuleContext):
+            return []
+
+        batches = []
+        RuleEngine(rules=[silent, always_warn]).evaluate(
+            RuleContext(),
+            on_findings=lambda name, findings: batches.append((name, findings)),
+        )
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0][0], "always_warn")
+        self.assertEqual(batches[0][1][0].id, "test.warn")
+
     def test_continues_when_rule_raises(self):
         def broken_rule(_ctx: RuleContext):
             raise RuntimeError("rule failed")
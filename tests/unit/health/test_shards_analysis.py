@@ -3,8 +3,16 @@
 import json
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-from elastro.health.shards import analyze_shards, format_bytes, parse_store_size
+from elastro.health import shards
+from elastro.health.shards import (
+    ShardTable,
+    analyze_shard_table,
+    analyze_shards,
+    format_bytes,
+    parse_store_size,
+)
 
 FIXTURES = Path(__file__).resolve().parents[2] / "fixtures" / "health"
 
@@ -41,5 +49,140 @@ class TestShardAnalysis(unittest.TestCase):
         self.assertIn("Avg size:", summary)
 
 
+class TestShardTable(unittest.TestCase):
+    def setUp(self):
+        self.rows = json.loads((FIXTURES / "cat_shards_mixed.json").read_text())
+
+    def test_interns_index_and_node_names(self):
+        table = ShardTable.from_rows(self.rows + ["junk", {"index": ""}])
+
+        self.assertEqual(len(table), 6)
+        self.assertEqual(
+            table.index_names,
+            ["logs-000001", "metrics-2024", "tiny-index", "stale-index"],
+        )
+        self.assertEqual(table.node_names, ["node-1", "node-2"])
+        self.assertEqual(table.node_ids[5], -1)
+
+    def test_record_round_trips_a_row(self):
+        table = ShardTable.from_rows(self.rows)
+
+        record = table.record(1)
+        self.assertEqual(
+            (record.index, record.shard, record.prirep, record.state, record.node),
+            ("logs-000001", "0", "r", "STARTED", "node-2"),
+        )
+        self.assertEqual(record.store_bytes, 512 * 1024)
+        self.assertEqual(table.record(5).node, "")
+
+
+class _ShardTableAnalysisCases:
+    """Assertions shared by the NumPy and pure-Python analysis paths."""
+
+    def analyze(self, rows, **kwargs):
+        raise NotImplementedError
+
+    def rows(self):
+        rows = [
+            {
+                "index": f"small-{i % 3}",
+                "shard": str(i),
+                "prirep": "p",
+                "state": "STARTED",
+                "store": str(1000 + i),
+                "node": f"node-{i % 2}",
+            }
+            for i in range(9)
+        ]
+        rows.append(
+            {
+                "index": "huge",
+                "shard": "0",
+                "prirep": "p",
+                "state": "STARTED",
+                "store": str(80 * 1024**3),
+                "node": "node-0",
+            }
+        )
+        rows.append(
+            {
+                "index": "huge",
+                "shard": "1",
+                "prirep": "r",
+                "state": "UNASSIGNED",
+                "store": None,
+                "node": None,
+            }
+        )
+        return rows
+
+    def test_counts_cover_every_shard_but_lists_keep_top_k(self):
+        analysis = self.analyze(self.rows(), top_k=4)
+
+        self.assertEqual(analysis.total_shards, 11)
+        self.assertEqual(analysis.measured_shards, 10)
+        self.assertEqual(analysis.unassigned_count, 1)
+        self.assertEqual(analysis.oversharded_count, 9)
+        self.assertEqual(analysis.undersharded_count, 1)
+        self.assertEqual(
+            [item.store_bytes for item in analysis.oversharded],
+            [1000, 1001, 1002, 1003],
+        )
+        self.assertEqual(analysis.undersharded[0].index, "huge")
+
+    def test_rolls_up_oversharded_shards_by_index(self):
+        analysis = self.analyze(self.rows(), top_k=2)
+
+        self.assertEqual(
+            analysis.oversharded_by_index,
+            [
+                {
+                    "index": "small-0",
+                    "oversharded_shard_count": 3,
+                    "smallest_bytes": 1000,
+                },
+                {
+                    "index": "small-1",
+                    "oversharded_shard_count": 3,
+                    "smallest_bytes": 1001,
+                },
+            ],
+        )
+
+    def test_reports_per_node_placement_and_skew(self):
+        analysis = self.analyze(self.rows())
+
+        self.assertEqual(
+            [(n["node"], n["shard_count"]) for n in analysis.nodes],
+            [("node-0", 6), ("node-1", 4)],
+        )
+        self.assertEqual(
+            analysis.nodes[0]["store_bytes"],
+            80 * 1024**3 + 1000 + 1002 + 1004 + 1006 + 1008,
+        )
+        self.assertEqual(analysis.node_shard_skew, 1.2)
+        self.assertGreater(analysis.node_bytes_skew, 1.9)
+
+    def test_empty_table(self):
+        analysis = self.analyze([])
+
+        self.assertEqual(analysis.total_shards, 0)
+        self.assertEqual(analysis.avg_bytes, 0.0)
+        self.assertEqual(analysis.nodes, [])
+        self.assertEqual(analysis.node_shard_skew, 0.0)
+
+
+class TestShardTableAnalysisPython(_ShardTableAnalysisCases, unittest.TestCase):
+    def analyze(self, rows, **kwargs):
+        with patch.object(shards, "np", None):
+            return analyze_shard_table(ShardTable.from_rows(rows), **kwargs)
+
+
+@unittest.skipUnless(shards.np is not None, "numpy not installed")
+class TestShardTableAnalysisNumpy(_ShardTableAnalysisCases, unittest.TestCase):
+    def analyze(self, rows, **kwargs):
+        return analyze_shard_table(ShardTable.from_rows(rows), **kwargs)
+
+
 if __name__ == "__main__":
     unittest.main()
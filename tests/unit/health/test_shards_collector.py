@@ -6,8 +6,13 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from elastro.core.client import ElasticsearchClient
+from elastro.core.errors import ElasticIndexError
 from elastro.health.collectors.base import CollectContext
-from elastro.health.collectors.shards import ShardsCollector
+from elastro.health.collectors.shards import (
+    SHARD_LIST_CHUNK_SIZE,
+    ShardsCollector,
+    load_shard_table,
+)
 
 FIXTURES = Path(__file__).resolve().parents[2] / "fixtures" / "health"
 
@@ -19,6 +24,12 @@ class TestShardsCollector(unittest.TestCase):
         self.mock_es.cat.shards.return_value = self.rows
         self.mock_client = MagicMock(spec=ElasticsearchClient)
         self.mock_client.client = self.mock_es
+        patcher = patch("elastro.health.collectors.shards.IndexManager")
+        self.index_manager = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.index_manager.list.return_value = [
+            {"index": name} for name in {row["index"] for row in self.rows}
+        ]
         self.ctx = CollectContext(client=self.mock_client)
 
     def test_collect_returns_analysis(self):
@@ -27,12 +38,83 @@ class TestShardsCollector(unittest.TestCase):
         analysis = result.data["analysis"]
         self.assertEqual(analysis["total_shards"], 6)
         self.assertEqual(analysis["oversharded_count"], 4)
+        self.assertEqual(analysis["nodes"][0]["node"], "node-1")
 
-    @patch("elastro.health.collectors.shards.IndexManager")
-    def test_explain_allocation_for_index(self, mock_index_manager_cls):
+    def test_raw_rows_kept_only_on_request(self):
+        result = ShardsCollector().collect(self.ctx)
+        self.assertNotIn("shards", result.data)
+
+        self.ctx.options["include_shard_rows"] = True
+        result = ShardsCollector().collect(self.ctx)
+        self.assertEqual(len(result.data["shards"]), 6)
+        self.assertEqual(
+            result.data["shards"][0],
+            {
+                "index": "logs-000001",
+                "shard": "0",
+                "prirep": "p",
+                "state": "STARTED",
+                "store": 512 * 1024,
+                "node": "node-1",
+            },
+        )
+
+    def test_small_listing_uses_one_request(self):
+        load_shard_table(self.ctx, index_pattern="logs-*")
+
+        self.mock_es.cat.shards.assert_called_once_with(
+            format="json",
+            h="index,shard,prirep,state,store,node",
+            bytes="b",
+            index="logs-*",
+        )
+
+    def test_large_listing_is_fetched_in_index_chunks(self):
+        names = [f"logs-{i:05d}" for i in range(SHARD_LIST_CHUNK_SIZE * 2 + 1)]
+        self.index_manager.list.return_value = [{"index": name} for name in names] + [
+            {"index": "metrics-1"}
+        ]
+
+        def cat_shards(**params):
+            chunk = []
+            for part in params["index"].split(","):
+                if part.endswith("*"):
+                    chunk += [name for name in names if name.startswith(part[:-1])]
+                else:
+                    chunk.append(part)
+            return [
+                {
+                    "index": name,
+                    "shard": "0",
+                    "prirep": "p",
+                    "state": "STARTED",
+                    "store": "100",
+                    "node": "node-1",
+                }
+                for name in chunk
+            ]
+
+        self.mock_es.cat.shards.side_effect = cat_shards
+
+        table = load_shard_table(self.ctx)
+
+        self.assertEqual(self.mock_es.cat.shards.call_count, 3)
+        self.assertEqual(len(table), len(names) + 1)
+        self.assertEqual(sorted(table.index_names), names + ["metrics-1"])
+        self.assertEqual(table.node_names, ["node-1"])
+
+    def test_index_listing_failure_falls_back_to_one_request(self):
+        self.index_manager.list.side_effect = ElasticIndexError("forbidden")
+
+        table = load_shard_table(self.ctx)
+
+        self.assertEqual(len(table), 6)
+        self.mock_es.cat.shards.assert_called_once()
+
+    def test_explain_allocation_for_index(self):
         from elastro.health.collectors.shards import explain_allocation
 
-        mock_index_manager_cls.return_value.allocation_explain.return_value = {
+        self.index_manager.allocation_explain.return_value = {
             "allocate_explanation": "blocked",
         }
         payload = explain_allocation(self.ctx, index_name="logs-000001")
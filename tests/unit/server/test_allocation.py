@@ -0,0 +1,80 @@
+"""Unit tests for the GUI allocation diagnoser."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from elastro.server.allocation import AllocationDiagnoser
+
+
+def _copy(shard, primary, state="UNASSIGNED", **info):
+    copy = {"shard": shard, "primary": primary, "state": state}
+    if state == "UNASSIGNED":
+        copy["unassigned_info"] = {"reason": "INDEX_CREATED", **info}
+    return copy
+
+
+def _mock_es(routing):
+    es = MagicMock()
+    es.cat.indices = AsyncMock(
+        return_value=[
+            {"index": name, "health": "red", "status": "open"} for name in routing
+        ]
+        + [{"index": "other-1", "health": "green", "status": "open"}]
+    )
+    es.cluster.state = AsyncMock(
+        return_value={
+            "routing_table": {
+                "indices": {
+                    name: {"shards": {"0": copies}} for name, copies in routing.items()
+                }
+            }
+        }
+    )
+    es.cluster.get_settings = AsyncMock(
+        return_value={"persistent": {}, "transient": {}}
+    )
+    es.nodes.info = AsyncMock(return_value={"nodes": {"n1": {"roles": ["data"]}}})
+    es.cluster.allocation_explain = AsyncMock(
+        return_value={
+            "allocate_explanation": "no valid shard copy",
+            "unassigned_info": {"reason": "NODE_LEFT"},
+        }
+    )
+    return es
+
+
+class TestAllocationDiagnoser:
+    def test_classifies_locally_and_explains_one_per_group(self):
+        es = _mock_es(
+            {
+                "logs-1": [_copy(0, True, reason="NODE_LEFT")],
+                "logs-2": [_copy(0, True, reason="NODE_LEFT")],
+                "logs-3": [
+                    _copy(0, True, reason="ALLOCATION_FAILED", failed_attempts=5)
+                ],
+            }
+        )
+
+        rows = asyncio.run(AllocationDiagnoser().diagnose("c1", es))
+
+        assert [row["index"] for row in rows] == ["logs-1", "logs-2", "logs-3"]
+        es.cluster.allocation_explain.assert_awaited_once_with(
+            index="logs-1", shard=0, primary=True
+        )
+        assert rows[1]["explained_by"] == "logs-1"
+        assert rows[2]["reason"] == "ALLOCATION_FAILED"
+        assert "max_retries" in rows[2]["allocate_explanation"]
+
+    def test_index_missing_from_state_is_explained(self):
+        es = _mock_es({"logs-1": [_copy(0, True, "STARTED")]})
+        es.cat.indices.return_value.append(
+            {"index": "logs-2", "health": "red", "status": "open"}
+        )
+
+        rows = asyncio.run(AllocationDiagnoser().diagnose("c1", es))
+
+        assert rows[0]["reason"] == "ASSIGNED"
+        assert rows[1]["allocate_explanation"] == "no valid shard copy"
+        es.cluster.allocation_explain.assert_awaited_once_with(
+            index="logs-2", shard=0, primary=True
+        )
@@ -0,0 +1,175 @@
+"""Unit tests for the in-process GUI CLI executor."""
+
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import click
+import pytest
+
+from elastro.core.client import ElasticsearchClient
+from elastro.server.cli_executor import CommandTimeout, InProcessCLI
+
+
+@click.group()
+@click.pass_context
+def _tool(ctx):
+    """Small command tree standing in for the elastro CLI."""
+
+
+@_tool.command()
+@click.argument("text")
+@click.pass_obj
+def echo(client, text):
+    click.echo(f"{client.name}:{text}")
+    click.echo("warned", err=True)
+
+
+@_tool.command()
+def ask():
+    name = click.prompt("Name")
+    click.echo(f"hello {name}")
+
+
+@_tool.command()
+def spin():
+    while True:
+        time.sleep(0.01)
+
+
+@_tool.command()
+def fail():
+    raise click.ClickException("broken")
+
+
+@pytest.fixture
+def executor():
+    executor = InProcessCLI(command=_tool, max_workers=2, timeout=5)
+    yield executor
+    executor.shutdown()
+
+
+def _client(name="prod"):
+    client = MagicMock(spec=ElasticsearchClient)
+    client.name = name
+    return client
+
+
+class TestInProcessCLI:
+    """Tests for the InProcessCLI class."""
+
+    def test_captures_output_per_command(self, executor):
+        """Test that concurrent commands get their own stdout and stderr."""
+        stdout = sys.stdout
+        results = {}
+
+        def run(name):
+            results[name] = executor.run(["echo", name], _client(name))
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in ("a", "b", "c")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for name, result in results.items():
+            assert result.exit_code == 0
+            assert result.output == f"{name}:{name}\n\nwarned\n"
+        assert sys.stdout is stdout
+
+    def test_stdin_and_errors(self, executor):
+        """Test that prompts read the request stdin and errors set exit codes."""
+        answered = executor.run(["ask"], _client(), stdin="elastro\n")
+        failed = executor.run(["fail"], _client())
+        unknown = executor.run(["nope"], _client())
+
+        assert "hello elastro" in answered.output
+        assert failed.exit_code == 1
+        assert "broken" in failed.output
+        assert unknown.exit_code == 2
+
+    def test_timeout_cancels_command(self, executor):
+        """Test that a command past its timeout is cancelled and the pool reused."""
+        with pytest.raises(CommandTimeout):
+            executor.run(["spin"], _client(), timeout=0.2)
+
+        assert executor.run(["echo", "after"], _client()).exit_code == 0
+
+    def test_command_is_done_before_capture_stops(self, executor):
+        """Test that a finished command cannot be cancelled while restoring."""
+        from elastro.server.cli_executor import _capture
+
+        jobs = []
+        seen = []
+        real_invoke, real_stop = executor._invoke, _capture.stop
+
+        def invoke(job, *args):
+            jobs.append(job)
+            return real_invoke(job, *args)
+
+        def stop():
+            seen.append(jobs[0]["done"])
+            real_stop()
+
+        with patch.object(executor, "_invoke", side_effect=invoke):
+            with patch.object(_capture, "stop", side_effect=stop):
+                executor.run(["echo", "x"], _client())
+
+        assert seen == [True]
+
+    def test_runs_elastro_cli_with_given_client(self):
+        """Test that the real CLI keeps the pooled client it is handed."""
+        client = _client()
+        client.client = MagicMock()
+        client.client.cluster.health.return_value = {
+            "cluster_name": "prod",
+            "status": "green",
+        }
+        executor = InProcessCLI(max_workers=1)
+        try:
+            result = executor.run(["utils", "health"], client)
+        finally:
+            executor.shutdown()
+
+        assert result.exit_code == 0, result.output
+        assert "green" in result.output
+        client.connect.assert_not_called()
+
+    def test_connection_options_are_rejected_without_loading_config(self, tmp_path):
+        """Test that -c/--host cannot replace the server's config or client."""
+        other_config = tmp_path / "other.yaml"
+        other_config.write_text("default: {}\n")
+        executor = InProcessCLI(max_workers=1)
+        try:
+            with patch("elastro.cli.cli.load_config") as mock_load_config:
+                result = executor.run(
+                    ["-c", str(other_config), "--host", "http://other:9200"]
+                    + ["utils", "health"],
+                    _client(),
+                )
+        finally:
+            executor.shutdown()
+
+        assert result.exit_code == 2
+        assert "--config, --host cannot be used here" in result.output
+        mock_load_config.assert_not_called()
+
+    def test_output_option_applies_without_touching_config(self):
+        """Test that -o reaches format_output through the command context."""
+        executor = InProcessCLI(max_workers=1)
+        try:
+            with (
+                patch("elastro.cli.cli.load_config") as mock_load_config,
+                patch("elastro.cli.commands.document.DocumentManager") as mock_docs,
+            ):
+                mock_docs.return_value.get.return_value = {"_id": "1", "found": True}
+                result = executor.run(
+                    ["-o", "yaml", "doc", "get", "logs", "1"], _client()
+                )
+        finally:
+            executor.shutdown()
+
+        assert result.exit_code == 0, result.output
+        assert "found: true" in result.output
+        mock_load_config.assert_not_called()
@@ -0,0 +1,137 @@
+"""Unit tests for the GUI server client pool."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from elastro.server.services import AsyncClientPool, ClientPool
+
+CLUSTER = {"name": "prod", "host": "localhost:9200", "auth": {"username": "u"}}
+
+
+@pytest.fixture
+def pool():
+    """Return a pool whose clients are mocks and whose thread never runs."""
+    with (
+        patch("elastro.server.services._client_from_config") as factory,
+        patch.object(ClientPool, "_ensure_thread"),
+    ):
+        factory.side_effect = lambda config: MagicMock(name=config["host"])
+        yield ClientPool(idle_ttl=60), factory
+
+
+class TestClientPool:
+    """Tests for the ClientPool class."""
+
+    def test_reuses_client_per_cluster(self, pool):
+        """Test that repeated lookups share one lazily connected client."""
+        pool, factory = pool
+
+        first = pool.get(CLUSTER)
+        second = pool.get(dict(CLUSTER, name="prod-alias"))
+
+        assert first is second
+        factory.assert_called_once()
+        first.connect.assert_called_once_with(lazy=True)
+
+    def test_separate_clients_per_auth(self, pool):
+        """Test that different credentials get different clients."""
+        pool, _ = pool
+
+        a = pool.get(CLUSTER)
+        b = pool.get(dict(CLUSTER, auth={"username": "other"}))
+
+        assert a is not b
+
+    def test_rebuilds_on_config_change(self, pool):
+        """Test that a changed setting under the same key rebuilds the client."""
+        pool, _ = pool
+        old = pool.get(CLUSTER)
+
+        new = pool.get(dict(CLUSTER, verify_certs=False))
+
+        assert new is not old
+        old.disconnect.assert_called_once()
+
+    def test_rebuilds_unhealthy_client(self, pool):
+        """Test that a client failing its health check is replaced on next use."""
+        pool, _ = pool
+        old = pool.get(CLUSTER)
+        old.get_client.return_value.ping.return_value = False
+
+        pool.check_health()
+
+        assert pool.get(CLUSTER) is not old
+
+    def test_evicts_idle_clients(self, pool):
+        """Test that clients idle past the TTL are closed."""
+        pool, _ = pool
+        with patch("elastro.server.services.time.monotonic", return_value=0.0):
+            client = pool.get(CLUSTER)
+        with patch("elastro.server.services.time.monotonic", return_value=61.0):
+            assert pool.evict_idle() == 1
+
+        client.disconnect.assert_called_once()
+        assert pool.stats() == {}
+
+
+@pytest.fixture
+def async_pool():
+    """Return an async pool whose clients are mocks, with the list of builds."""
+    built = []
+
+    def build(config):
+        client = MagicMock(name=config["host"], aclose=AsyncMock())
+        built.append(client)
+        return client
+
+    with patch("elastro.server.services._client_from_config", side_effect=build):
+        yield AsyncClientPool(idle_ttl=60), built
+
+
+class TestAsyncClientPool:
+    """Tests for the AsyncClientPool class."""
+
+    def test_reuses_client_per_cluster(self, async_pool):
+        """Test that repeated lookups share one async client."""
+        pool, built = async_pool
+
+        first = pool.get(CLUSTER)
+        second = pool.get(dict(CLUSTER, name="prod-alias"))
+
+        assert first is second
+        assert len(built) == 1
+
+    def test_rebuilds_on_config_change(self, async_pool):
+        """Test that a changed setting rebuilds and closes the old client."""
+        pool, built = async_pool
+
+        async def lookups():
+            pool.get(CLUSTER)
+            pool.get(dict(CLUSTER, verify_certs=False))
+            await asyncio.sleep(0)
+
+        asyncio.run(lookups())
+
+        old, new = built
+        old.aclose.assert_awaited_once()
+        new.aclose.assert_not_awaited()
+
+    def test_evicts_idle_clients(self, async_pool):
+        """Test that clients idle past the TTL are closed on the next lookup."""
+        pool, built = async_pool
+
+        async def lookups():
+            with patch("elastro.server.services.time.monotonic", return_value=0.0):
+                pool.get(CLUSTER)
+            with patch("elastro.server.services.time.monotonic", return_value=61.0):
+                pool.get(dict(CLUSTER, host="other:9200"))
+            await pool.close()
+
+        asyncio.run(lookups())
+
+        idle, other = built
+        idle.aclose.assert_awaited_once()
+        other.aclose.assert_awaited_once()
+        assert pool.stats() == {}
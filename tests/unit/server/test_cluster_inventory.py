@@ -1,8 +1,12 @@
 """Unit tests for GUI cluster inventory metrics."""
 
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
-from elastro.server.cluster_inventory import fetch_cluster_inventory
+from elastro.server.cluster_inventory import (
+    fetch_cluster_inventory,
+    fetch_cluster_inventory_async,
+)
 
 
 def _mock_es():
@@ -76,3 +80,40 @@ class TestClusterInventory:
         assert inventory["storage"]["total_bytes"] == 5 * 1024**3
         assert inventory["kibana"]["dashboards"] == 12
         assert inventory["backups"]["repository_count"] == 1
+
+    def test_fetch_cluster_inventory_async_matches_sync(self):
+        sync_es = _mock_es()
+        async_es = MagicMock()
+        for path in (
+            "cluster.health",
+            "cluster.stats",
+            "nodes.info",
+            "cat.indices",
+            "cat.shards",
+            "count",
+            "indices.get_data_stream",
+            "indices.get_index_template",
+            "indices.get_template",
+            "ilm.get_lifecycle",
+            "snapshot.get_repository",
+        ):
+            parent_name, _, attr = path.rpartition(".")
+            sync_parent = sync_es
+            async_parent = async_es
+            for part in filter(None, parent_name.split(".")):
+                sync_parent = getattr(sync_parent, part)
+                async_parent = getattr(async_parent, part)
+            setattr(
+                async_parent, attr, AsyncMock(side_effect=getattr(sync_parent, attr))
+            )
+        async_es.snapshot.get_repository.side_effect = RuntimeError("no repos")
+
+        inventory = asyncio.run(fetch_cluster_inventory_async(async_es))
+
+        expected = fetch_cluster_inventory(_mock_es())
+        expected["backups"] = {
+            "configured": False,
+            "repository_count": 0,
+            "repositories": [],
+        }
+        assert inventory == expected
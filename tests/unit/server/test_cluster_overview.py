@@ -0,0 +1,98 @@
+"""Unit tests for the /api/clusters overview fan-out."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from elastro.server.routes import clusters as cluster_module
+
+CLUSTERS = [
+    {"name": "fast", "host": "fast:9200"},
+    {"name": "hung", "host": "hung:9200"},
+    {"name": "down", "host": "down:9200"},
+]
+
+
+def _overview_endpoint():
+    router = cluster_module.cluster_routes(
+        lambda: {"clusters": CLUSTERS}, lambda: "token"
+    )
+    # The module-level router accumulates routes; the newest one is ours
+    return [r.endpoint for r in router.routes if r.path == "/api/clusters"][-1]
+
+
+def _es_for(cluster):
+    es = MagicMock()
+    if cluster["name"] == "fast":
+        es.cluster.health = AsyncMock(return_value={"status": "yellow"})
+        es.cat.indices = AsyncMock(
+            return_value=[
+                {"index": "small", "health": "green", "store.size": "10"},
+                {
+                    "index": "big",
+                    "health": "yellow",
+                    "store.size": "2048",
+                    "docs.count": "5",
+                },
+            ]
+        )
+    elif cluster["name"] == "hung":
+
+        async def _never(**kwargs):
+            await asyncio.sleep(60)
+
+        es.cluster.health = _never
+        es.cat.indices = _never
+    else:
+        es.cluster.health = AsyncMock(side_effect=ConnectionError("refused"))
+        es.cat.indices = AsyncMock(return_value=[])
+    return es
+
+
+class TestClusterOverview:
+    def test_fan_out_with_deadline(self):
+        endpoint = _overview_endpoint()
+
+        with patch.object(cluster_module, "get_async_es_client", side_effect=_es_for):
+            start = time.monotonic()
+            result = asyncio.run(endpoint(timeout=0.2, token="t"))
+            elapsed = time.monotonic() - start
+
+        rows = {row["name"]: row for row in result["clusters"]}
+        assert elapsed < 1.0
+        assert [row["name"] for row in result["clusters"]] == ["fast", "hung", "down"]
+        assert rows["fast"]["state"] == "online"
+        assert rows["fast"]["largest_index"] == {"name": "big", "size": "2.0 KB"}
+        assert rows["fast"]["unstable_indices"][0]["docs"] == "5"
+        assert rows["hung"]["health"] == "offline"
+        assert rows["hung"]["state"] == "timeout"
+        assert rows["down"]["state"] == "offline"
+        assert "refused" in rows["down"]["error"]
+
+    def test_requests_only_needed_columns(self):
+        endpoint = _overview_endpoint()
+        es = _es_for(CLUSTERS[0])
+
+        with patch.object(cluster_module, "get_async_es_client", return_value=es):
+            asyncio.run(endpoint(timeout=1.0, token="t"))
+
+        kwargs = es.cat.indices.call_args.kwargs
+        assert kwargs["h"] == "index,health,store.size,docs.count"
+        assert kwargs["bytes"] == "b"
+
+    def test_timeout_is_bounded(self):
+        router = cluster_module.cluster_routes(
+            lambda: {"clusters": []}, lambda: "token"
+        )
+        app = FastAPI()
+        # Mount only our route; earlier registrations may have stricter auth
+        app.router.routes.append(
+            [r for r in router.routes if r.path == "/api/clusters"][-1]
+        )
+        client = TestClient(app)
+
+        assert client.get("/api/clusters", params={"timeout": 0}).status_code == 422
+        assert client.get("/api/clusters", params={"timeout": 3600}).status_code == 422
@@ -0,0 +1,116 @@
+"""Unit tests for the GUI health report cache and background refresher."""
+
+import threading
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from elastro.health.models import AssessmentReport, FindingStatus
+from elastro.server import health_cache
+from elastro.server.health_cache import (
+    HealthRefresher,
+    clear_cache,
+    get_cached_report,
+    get_history,
+    lookup_report,
+    store_report,
+)
+
+
+def _report(cluster_name="prod", score=90):
+    return AssessmentReport(
+        session_id=f"session-{cluster_name}-{score}",
+        cluster_name=cluster_name,
+        assessed_at=datetime(2026, 6, 15, tzinfo=timezone.utc),
+        overall_score=score,
+        overall_status=FindingStatus.PASS,
+    )
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+class TestHealthCache:
+    """Tests for the stale-while-revalidate report cache."""
+
+    def test_serves_stale_until_hard_expiry(self):
+        """Test that expired reports are served stale, then dropped."""
+        with patch("elastro.server.health_cache.time.monotonic", return_value=0.0):
+            store_report("prod", _report(), ttl_seconds=10, max_stale_seconds=100)
+
+        with patch("elastro.server.health_cache.time.monotonic", return_value=5.0):
+            assert lookup_report("prod")[1] is True
+        with patch("elastro.server.health_cache.time.monotonic", return_value=50.0):
+            report, fresh = lookup_report("prod")
+            assert fresh is False
+            assert get_cached_report("prod") is None
+            assert get_cached_report("prod", allow_stale=True) is report
+        with patch("elastro.server.health_cache.time.monotonic", return_value=111.0):
+            assert lookup_report("prod") is None
+
+    def test_lru_bounds_clusters(self):
+        """Test that the least recently used cluster is evicted first."""
+        with patch.object(health_cache, "MAX_CLUSTERS", 2):
+            store_report("a", _report("a"))
+            store_report("b", _report("b"))
+            lookup_report("a")
+            store_report("c", _report("c"))
+
+        assert lookup_report("b") is None
+        assert lookup_report("a") is not None
+        assert get_history("b") == []
+        assert len(get_history("c")) == 1
+
+
+class TestHealthRefresher:
+    """Tests for the HealthRefresher class."""
+
+    def test_single_flight_per_cluster(self):
+        """Test that concurrent refreshes for one cluster share one run."""
+        refresher = HealthRefresher()
+        release = threading.Event()
+        calls = []
+
+        def run():
+            calls.append(1)
+            release.wait(5)
+            report = _report()
+            store_report("prod", report)
+            return report
+
+        first = refresher.refresh("prod", run)
+        second = refresher.refresh("prod", run)
+        assert first is second
+        assert refresher.in_flight() == ["prod"]
+
+        release.set()
+        assert first.result(5).overall_score == 90
+        assert len(calls) == 1
+        refresher.shutdown(wait=True)
+        assert refresher.in_flight() == []
+
+    def test_prewarm_skips_fresh_clusters(self):
+        """Test that pre-warming only assesses clusters without a fresh report."""
+        refresher = HealthRefresher()
+        store_report("fresh", _report("fresh"))
+        ran = []
+
+        def runner(name):
+            def run():
+                ran.append(name)
+                return _report(name)
+
+            return run
+
+        scheduled = refresher.prewarm(
+            [("fresh", runner("fresh")), ("cold", runner("cold"))]
+        )
+        refresher.shutdown(wait=True)
+
+        assert scheduled == 1
+        assert ran == ["cold"]
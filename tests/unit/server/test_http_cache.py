@@ -0,0 +1,89 @@
+"""Unit tests for GUI API conditional GET support."""
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.testclient import TestClient
+
+from elastro.server.http_cache import (
+    GZIP_MINIMUM_SIZE,
+    ETagMiddleware,
+    etag_matches,
+    strong_etag,
+)
+
+
+def _app():
+    app = FastAPI()
+    # Same stack as the GUI server: GZip(CORS(ETag(app)))
+    app.add_middleware(ETagMiddleware)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://127.0.0.1"],
+        expose_headers=["ETag"],
+    )
+    app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+
+    @app.get("/api/indices")
+    def indices():
+        return {"indices": ["logs-000001"]}
+
+    @app.get("/api/documents")
+    def documents():
+        return {"documents": ["x" * GZIP_MINIMUM_SIZE]}
+
+    @app.post("/api/indices")
+    def create():
+        return {"created": True}
+
+    return app
+
+
+class TestETags:
+    """Tests for ETag helpers and the ETag middleware."""
+
+    def test_etag_matching(self):
+        """Test weak comparison, lists and the wildcard."""
+        etag = strong_etag("findings", "session-1")
+
+        assert etag.startswith('"') and etag != strong_etag("findings", "session-2")
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+
+    def test_middleware_tags_json_and_returns_304(self):
+        """Test that GET JSON responses get a body ETag and honour If-None-Match."""
+        client = TestClient(_app())
+
+        first = client.get("/api/indices")
+        second = client.get(
+            "/api/indices", headers={"If-None-Match": first.headers["etag"]}
+        )
+        posted = client.post("/api/indices")
+
+        assert first.json() == {"indices": ["logs-000001"]}
+        assert second.status_code == 304
+        assert "etag" not in posted.headers
+
+    def test_not_modified_carries_cors_and_vary(self):
+        """Test that a 304 passes back through CORS and varies on encoding."""
+        client = TestClient(_app())
+        origin = {"Origin": "http://127.0.0.1"}
+
+        etag = client.get("/api/indices", headers=origin).headers["etag"]
+        response = client.get("/api/indices", headers={**origin, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["access-control-allow-origin"] == "http://127.0.0.1"
+        assert response.headers["vary"].count("Accept-Encoding") == 1
+
+    def test_vary_is_not_doubled_by_gzip(self):
+        """Test that small and gzipped responses name Accept-Encoding once."""
+        client = TestClient(_app())
+
+        small = client.get("/api/indices")
+        large = client.get("/api/documents", headers={"Accept-Encoding": "gzip"})
+
+        assert large.headers["content-encoding"] == "gzip"
+        for response in (small, large):
+            assert response.headers["vary"].count("Accept-Encoding") == 1